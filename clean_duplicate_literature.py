@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 清理数据库中重复的文献记录
-使用修复后的去重逻辑来识别和合并重复文献
+使用 MinHash-LSH 生成候选对，再用修复后的去重逻辑确认并合并重复文献
 """
 
 import asyncio
@@ -17,9 +17,12 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from literature_parser_backend.worker.execution.data_pipeline import DataPipeline
 from literature_parser_backend.db.dao import LiteratureDAO
 from literature_parser_backend.db.neo4j import connect_to_mongodb, get_database
+from literature_parser_backend.services.near_duplicates import find_duplicate_groups as find_lsh_duplicate_groups
+from literature_parser_backend.services.near_duplicates import signature_for_match_keys
+from literature_parser_backend.utils.match_keys import match_keys_for_literature
 
 async def find_duplicate_groups() -> List[List[Dict]]:
-    """找到所有重复文献组"""
+    """找到所有重复文献组（MinHash-LSH 分桶，只比较同桶的文献对）"""
     print("🔍 查找重复文献组...")
     
     dao = LiteratureDAO()
@@ -33,57 +36,42 @@ async def find_duplicate_groups() -> List[List[Dict]]:
         print("⚠️ 文献数量不足，无需去重")
         return []
     
-    # 用于存储重复组
-    duplicate_groups = []
-    processed_lids = set()
-    
-    for i, lit1 in enumerate(all_literature):
-        if lit1.lid in processed_lids:
-            continue
-            
-        if not lit1.metadata or not lit1.metadata.title:
-            print(f"⚠️ 跳过无效文献: {lit1.lid}")
+    by_lid = {}
+    records = []
+    for lit in all_literature:
+        if not lit.metadata or not lit.metadata.title:
+            print(f"⚠️ 跳过无效文献: {lit.lid}")
             continue
-        
-        # 当前文献的重复组
-        current_group = [lit1]
-        processed_lids.add(lit1.lid)
-        
-        # 与后续文献比较
-        for j, lit2 in enumerate(all_literature[i+1:], i+1):
-            if lit2.lid in processed_lids:
-                continue
-                
-            if not lit2.metadata or not lit2.metadata.title:
-                continue
-            
-            # 检查是否为重复
-            try:
-                title_match = pipeline._is_title_match(lit1.metadata.title, lit2.metadata.title)
-                author_match = pipeline._is_author_match(
-                    getattr(lit1.metadata, 'authors', []), 
-                    getattr(lit2.metadata, 'authors', [])
-                )
-                
-                if title_match and author_match:
-                    current_group.append(lit2)
-                    processed_lids.add(lit2.lid)
-                    print(f"🔗 发现重复: {lit1.lid} <-> {lit2.lid}")
-                    print(f"   标题1: {lit1.metadata.title[:50]}...")
-                    print(f"   标题2: {lit2.metadata.title[:50]}...")
-                    
-            except Exception as e:
-                print(f"❌ 比较异常 {lit1.lid} vs {lit2.lid}: {e}")
-                continue
-        
-        # 如果找到重复，添加到重复组
-        if len(current_group) > 1:
-            duplicate_groups.append(current_group)
-            print(f"📋 重复组 {len(duplicate_groups)}: {len(current_group)} 篇文献")
-        
-        # 显示进度
-        if (i + 1) % 10 == 0:
-            print(f"📊 已处理: {i + 1}/{len(all_literature)} ({(i + 1)/len(all_literature)*100:.1f}%)")
+        signature = signature_for_match_keys(match_keys_for_literature(lit))
+        if signature:
+            by_lid[lit.lid] = lit
+            records.append((lit.lid, signature))
+    
+    def verify(lid1: str, lid2: str) -> bool:
+        """用原有的标题+作者规则确认候选对"""
+        lit1, lit2 = by_lid[lid1], by_lid[lid2]
+        try:
+            title_match = pipeline._is_title_match(lit1.metadata.title, lit2.metadata.title)
+            author_match = pipeline._is_author_match(
+                getattr(lit1.metadata, 'authors', []), 
+                getattr(lit2.metadata, 'authors', [])
+            )
+        except Exception as e:
+            print(f"❌ 比较异常 {lid1} vs {lid2}: {e}")
+            return False
+        
+        if title_match and author_match:
+            print(f"🔗 发现重复: {lid1} <-> {lid2}")
+            print(f"   标题1: {lit1.metadata.title[:50]}...")
+            print(f"   标题2: {lit2.metadata.title[:50]}...")
+            return True
+        return False
+    
+    lid_groups = find_lsh_duplicate_groups(records, verify=verify)
+    duplicate_groups = [[by_lid[lid] for lid in group] for group in lid_groups]
+    
+    for i, group in enumerate(duplicate_groups, 1):
+        print(f"📋 重复组 {i}: {len(group)} 篇文献")
     
     print(f"\n🎯 总结: 找到 {len(duplicate_groups)} 个重复组")
     return duplicate_groups
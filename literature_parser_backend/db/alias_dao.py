@@ -18,6 +18,7 @@ from literature_parser_backend.models.alias import (
     extract_aliases_from_source,
     normalize_alias_value,
 )
+from ..services.known_identifiers import alias_filter_key
 from .base_dao import BaseNeo4jDAO
 
 logger = logging.getLogger(__name__)
@@ -79,6 +80,9 @@ class AliasDAO(BaseNeo4jDAO):
         try:
             normalized_value = normalize_alias_value(alias_type, alias_value)
             
+            if not await self._might_exist(alias_filter_key(alias_type.value, normalized_value)):
+                return None
+            
             async with self._get_session() as session:
                 query = """
                 MATCH (alias:Alias {alias_type: $alias_type, alias_value: $alias_value})
@@ -221,6 +225,7 @@ class AliasDAO(BaseNeo4jDAO):
                 
                 if record:
                     alias_id = record["alias"].element_id
+                    self._record_known_identifiers([alias_filter_key(alias_type.value, normalized_value)])
                     logger.info(f"Created alias mapping: {alias_type}={normalized_value} -> {lid}")
                     return str(alias_id)
                 else:
@@ -247,6 +252,7 @@ class AliasDAO(BaseNeo4jDAO):
         :return: List of created alias node IDs
         """
         created_ids = []
+        created_keys = []
         
         try:
             async with self._get_session() as session:
@@ -290,12 +296,14 @@ class AliasDAO(BaseNeo4jDAO):
                             
                             if record:
                                 created_ids.append(str(record["alias"].element_id))
+                                created_keys.append(alias_filter_key(alias_type.value, normalized_value))
                                 
                         except Exception as e:
                             logger.error(f"Failed to create mapping {alias_type}={alias_value}: {e}")
                             # Continue with other mappings
                 
                     await tx.commit()
+                    self._record_known_identifiers(created_keys)
                     logger.info(f"Batch created {len(created_ids)} alias mappings for LID {lid}")
                     
                 except Exception as e:
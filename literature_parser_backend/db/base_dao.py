@@ -9,7 +9,7 @@ and common query patterns.
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from neo4j import AsyncDriver, AsyncSession
 from pydantic import BaseModel
@@ -17,6 +17,39 @@ from pydantic import BaseModel
 logger = logging.getLogger(__name__)
 
 
+def citation_counter_set(var: str) -> str:
+    """
+    Cypher clause recomputing the materialized citation counters of a node.
+    
+    Literature nodes carry ``cites_resolved_count`` (CITES to :Literature),
+    ``cites_unresolved_count`` (CITES to :Unresolved), ``cites_count`` and
+    ``cited_by_count``; on :Unresolved nodes only ``cited_by_count`` is
+    non-zero. Incoming counts are relationship degree lookups, so refreshing
+    a highly cited node stays cheap.
+    
+    :param var: Cypher variable bound to the node
+    :return: SET clause
+    """
+    return f"""
+    SET {var}.cites_resolved_count = COUNT {{ ({var})-[:CITES]->(:Literature) }},
+        {var}.cites_unresolved_count = COUNT {{ ({var})-[:CITES]->(:Unresolved) }},
+        {var}.cited_by_count = COUNT {{ ({var})<-[:CITES]-() }}
+    SET {var}.cites_count = {var}.cites_resolved_count + {var}.cites_unresolved_count
+    """
+
+
+REFRESH_LITERATURE_COUNTERS = """
+UNWIND $lids AS counter_lid
+MATCH (counted:Literature {lid: counter_lid})
+""" + citation_counter_set("counted")
+
+REFRESH_UNRESOLVED_COUNTERS = """
+UNWIND $lids AS counter_lid
+MATCH (counted:Unresolved {lid: counter_lid})
+SET counted.cited_by_count = COUNT { (counted)<-[:CITES]-() }
+"""
+
+
 class BaseNeo4jDAO:
     """
     Base class for all Neo4j Data Access Objects.
@@ -119,6 +152,84 @@ class BaseNeo4jDAO:
             logger.warning(f"Failed to parse JSON field: {e}")
             return {}
     
+    async def _might_exist(self, *keys: str) -> bool:
+        """
+        Check the known identifier filter before querying.
+        
+        :param keys: Filter keys (e.g. "doi:10.1000/xyz")
+        :return: False only if none of the identifiers can exist in the database
+        """
+        try:
+            from ..services.known_identifiers import get_known_identifier_filter
+            return await get_known_identifier_filter().might_contain_any(list(keys), self.driver)
+        except Exception as e:
+            logger.debug(f"Known identifier filter unavailable: {e}")
+            return True
+    
+    def _record_known_identifiers(self, keys: list) -> None:
+        """
+        Publish newly written identifiers to the known identifier filter.
+        
+        :param keys: Filter keys for the committed write
+        """
+        try:
+            from ..services.known_identifiers import get_known_identifier_filter
+            get_known_identifier_filter().record(keys)
+        except Exception as e:
+            logger.warning(f"Failed to record known identifiers: {e}")
+    
+    async def _refresh_citation_counters(
+        self,
+        tx: Any,
+        literature_lids: Any = (),
+        unresolved_lids: Any = ()
+    ) -> None:
+        """
+        Recompute citation counters of the endpoints touched by a CITES write.
+        
+        Must run in the transaction that changed the relationships, so the
+        counters commit (or roll back) together with them.
+        
+        :param tx: Transaction (or session) the write ran in
+        :param literature_lids: :Literature endpoints
+        :param unresolved_lids: :Unresolved endpoints
+        """
+        literature_lids = [lid for lid in dict.fromkeys(literature_lids) if lid]
+        unresolved_lids = [lid for lid in dict.fromkeys(unresolved_lids) if lid]
+        if literature_lids:
+            result = await tx.run(REFRESH_LITERATURE_COUNTERS, lids=literature_lids)
+            await result.consume()
+        if unresolved_lids:
+            result = await tx.run(REFRESH_UNRESOLVED_COUNTERS, lids=unresolved_lids)
+            await result.consume()
+    
+    async def _citation_neighbors(self, tx: Any, lid: str) -> Tuple[List[str], List[str]]:
+        """
+        Nodes linked to a literature by CITES in either direction.
+        
+        Collect these before deleting the literature (or its relationships)
+        to know whose counters change.
+        
+        :param tx: Transaction (or session)
+        :param lid: Literature LID
+        :return: Tuple of (:Literature LIDs, :Unresolved LIDs)
+        """
+        result = await tx.run(
+            """
+            MATCH (lit:Literature {lid: $lid})
+            OPTIONAL MATCH (lit)-[:CITES]-(neighbor:Literature)
+            WHERE neighbor <> lit
+            WITH lit, collect(DISTINCT neighbor.lid) AS literature_lids
+            OPTIONAL MATCH (lit)-[:CITES]->(placeholder:Unresolved)
+            RETURN literature_lids, collect(DISTINCT placeholder.lid) AS unresolved_lids
+            """,
+            lid=lid
+        )
+        record = await result.single()
+        if not record:
+            return [], []
+        return list(record["literature_lids"]), list(record["unresolved_lids"])
+    
     async def _execute_cypher(
         self,
         query: str,
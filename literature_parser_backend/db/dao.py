@@ -8,16 +8,40 @@ the same interface for transparent replacement.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from neo4j import AsyncDriver, AsyncSession
 
 from ..models.literature import (
+    GraphMetricsModel,
     LiteratureModel,
     LiteratureSummaryDTO,
+    RelatedLiteratureModel,
     literature_to_summary_dto,
 )
-from .base_dao import BaseNeo4jDAO
+from ..services.graph_cache import get_citation_graph_cache
+from ..services.known_identifiers import literature_filter_keys
+from ..services.near_duplicates import get_near_duplicate_index, signature_for_match_keys
+from ..services.search import (
+    SearchDocument,
+    SearchPage,
+    SearchQuery,
+    build_search_document,
+    get_search_backend,
+    search_node_properties,
+    tokenize_query,
+)
+from ..services.search.neo4j_backend import SEARCH_INDEX, build_lucene_query
+from ..utils.match_keys import (
+    MATCH_KEY_FIELDS,
+    build_match_keys,
+    get_title_tokens,
+    match_keys_for_literature,
+    normalize_arxiv_id,
+    normalize_doi,
+)
+from ..utils.title_normalization import normalize_title_for_matching
+from .base_dao import BaseNeo4jDAO, citation_counter_set
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +69,20 @@ class LiteratureDAO(BaseNeo4jDAO):
                     "raw_data": self._clean_for_neo4j(literature.raw_data or {}),
                     "task_info": self._clean_for_neo4j(literature.task_info.model_dump() if literature.task_info else {})
                 }
+                # 预计算匹配键，匹配器直接读取扁平属性而无需解析JSON
+                match_keys = match_keys_for_literature(literature)
+                node_props.update(match_keys)
+                node_props["match_minhash"] = self._near_duplicate_signature(match_keys)
+                node_props["display_title"] = getattr(literature.metadata, "title", None) or ""
+                search_document = build_search_document(literature.lid, literature.metadata)
+                node_props.update(search_node_properties(search_document))
                 
                 node_props = {k: v for k, v in node_props.items() if v is not None}
                 
                 query = """
                 MERGE (lit:Literature {lid: $lid})
                 SET lit += $props
+                """ + citation_counter_set("lit") + """
                 RETURN lit.lid as lid
                 """
                 
@@ -59,6 +91,10 @@ class LiteratureDAO(BaseNeo4jDAO):
                 
                 if record:
                     logger.info(f"Created Literature node with LID: {record['lid']}")
+                    self._invalidate_reference_cache(match_keys)
+                    self._record_known_identifiers(literature_filter_keys(match_keys))
+                    self._index_near_duplicate(record["lid"], node_props["match_minhash"])
+                    await self._index_search_documents([search_document])
                     return record["lid"]
                 else:
                     raise RuntimeError("Failed to create Literature node")
@@ -129,6 +165,9 @@ class LiteratureDAO(BaseNeo4jDAO):
     async def find_by_doi(self, doi: str) -> Optional[LiteratureModel]:
         """Find literature by DOI."""
         try:
+            if not await self._might_exist(f"doi:{normalize_doi(doi)}"):
+                return None
+            
             async with self._get_session() as session:
                 query = """
                 MATCH (lit:Literature)
@@ -150,6 +189,9 @@ class LiteratureDAO(BaseNeo4jDAO):
     async def find_by_arxiv_id(self, arxiv_id: str) -> Optional[LiteratureModel]:
         """Find literature by ArXiv ID."""
         try:
+            if not await self._might_exist(f"arxiv:{normalize_arxiv_id(arxiv_id)}"):
+                return None
+            
             async with self._get_session() as session:
                 query = """
                 MATCH (lit:Literature)
@@ -246,12 +288,24 @@ class LiteratureDAO(BaseNeo4jDAO):
                 RETURN count(*) as deleted_count
                 """
                 
-                result = await session.run(query, lid=literature_id)
-                record = await result.single()
+                async def work(tx):
+                    literature_lids, unresolved_lids = await self._citation_neighbors(tx, literature_id)
+                    result = await tx.run(query, lid=literature_id)
+                    record = await result.single()
+                    await self._refresh_citation_counters(
+                        tx, literature_lids=literature_lids, unresolved_lids=unresolved_lids
+                    )
+                    return record
+                
+                record = await session.execute_write(work)
                 
                 success = record and record["deleted_count"] > 0
             if success:
                 logger.info(f"Deleted literature {literature_id}")
+                self._record_graph_detached(literature_id)
+                self._remove_near_duplicate(literature_id)
+                self._invalidate_reference_cache_lid(literature_id)
+                await self._delete_search_document(literature_id)
             else:
                     logger.warning(f"No literature found with LID {literature_id}")
 
@@ -261,29 +315,41 @@ class LiteratureDAO(BaseNeo4jDAO):
             logger.error(f"Failed to delete literature {literature_id}: {e}")
             return False
 
-    async def search_literature(self, query: str, limit: int = 20, offset: int = 0) -> List[LiteratureSummaryDTO]:
-        """Search literature using fulltext index."""
+    async def search(self, query: SearchQuery) -> SearchPage:
+        """
+        Search literature through the configured search backend.
+
+        Args:
+            query: Search text, filters, page size and cursor
+
+        Returns:
+            One page of hits with the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        return await get_search_backend().search(query, driver=self.driver)
+
+    async def search_literature(self, query: str, limit: int = 20, cursor: Optional[str] = None) -> List[LiteratureSummaryDTO]:
+        """Search literature and return full summaries of the first (or cursor) page."""
         try:
+            page = await self.search(SearchQuery(text=query, limit=limit, cursor=cursor))
+            if not page.hits:
+                return []
+
             async with self._get_session() as session:
-                cypher_query = """
-                CALL db.index.fulltext.queryNodes("literature_fulltext", $query)
-                YIELD node, score
-                RETURN node
-                ORDER BY score DESC
-                SKIP $offset
-                LIMIT $limit
-                """
-                
-                result = await session.run(cypher_query, query=query, offset=offset, limit=limit)
-                
-                results = []
+                result = await session.run(
+                    "MATCH (lit:Literature) WHERE lit.lid IN $lids RETURN lit",
+                    lids=[hit.lid for hit in page.hits],
+                )
+                by_lid = {}
                 async for record in result:
-                    literature = self._neo4j_node_to_literature_model(record["node"])
+                    literature = self._neo4j_node_to_literature_model(record["lit"])
                     if literature:
-                        results.append(literature_to_summary_dto(literature))
-                
-                return results
-                
+                        by_lid[literature.lid] = literature_to_summary_dto(literature)
+
+            return [by_lid[hit.lid] for hit in page.hits if hit.lid in by_lid]
+
         except Exception as e:
             logger.error(f"Failed to search literature: {e}")
             return []
@@ -304,6 +370,9 @@ class LiteratureDAO(BaseNeo4jDAO):
     async def find_by_title(self, title: str) -> Optional[LiteratureModel]:
         """Find literature by exact title."""
         try:
+            if not await self._might_exist(f"title:{normalize_title_for_matching(title)}"):
+                return None
+            
             async with self._get_session() as session:
                 query = """
                 MATCH (lit:Literature)
@@ -323,52 +392,390 @@ class LiteratureDAO(BaseNeo4jDAO):
             return None
 
     async def find_by_title_fuzzy(self, title: str, limit: int = 10) -> List[LiteratureModel]:
-        """Find literature by fuzzy title match using fulltext search on metadata."""
+        """Find literature by fuzzy title match using the title field of the search index."""
         try:
+            # A fuzzy match needs at least one shared title word; skip the
+            # query when none of the words occurs in any known title.
+            title_tokens = get_title_tokens(normalize_title_for_matching(title))
+            if title_tokens and not await self._might_exist(*[f"tok:{token}" for token in title_tokens]):
+                return []
+            
             async with self._get_session() as session:
-                # Try fulltext search first (best performance)
-                query = """
-                CALL db.index.fulltext.queryNodes("literature_fulltext", $title)
-                YIELD node, score
-                RETURN node
-                ORDER BY score DESC
-                LIMIT $limit
-                """
-                
-                result = await session.run(query, title=title, limit=limit)
-                
                 results = []
-                async for record in result:
-                    literature = self._neo4j_node_to_literature_model(record["node"])
-                    if literature:
-                        results.append(literature)
-                
-                # If fulltext search returns no results, fallback to keyword search
-                if not results:
-                    title_words = title.lower().split()
-                    if title_words:
-                        query = """
-                        MATCH (n:Literature)
-                        WHERE n.metadata IS NOT NULL
-                        WITH n, toLower(n.metadata) as metadata_lower
-                        WHERE """ + " AND ".join([f"metadata_lower CONTAINS '{word}'" for word in title_words]) + """
-                        RETURN n
-                        LIMIT $limit
-                        """
-                        
-                        result = await session.run(query, limit=limit)
-                        
+                # Title-only query against the native search index
+                lucene = build_lucene_query(tokenize_query(title), {"title": 1.0})
+                if lucene:
+                    try:
+                        result = await session.run(
+                            """
+                            CALL db.index.fulltext.queryNodes($index, $lucene)
+                            YIELD node, score
+                            RETURN node
+                            ORDER BY score DESC
+                            LIMIT $limit
+                            """,
+                            index=SEARCH_INDEX, lucene=lucene, limit=limit,
+                        )
                         async for record in result:
-                            literature = self._neo4j_node_to_literature_model(record["n"])
+                            literature = self._neo4j_node_to_literature_model(record["node"])
                             if literature:
                                 results.append(literature)
+                    except Exception as e:
+                        logger.warning(f"Full-text title search failed, using keyword fallback: {e}")
+
+                # Keyword fallback over normalized titles, with the words as a parameter
+                if not results and title_tokens:
+                    result = await session.run(
+                        """
+                        MATCH (n:Literature)
+                        WHERE n.match_title IS NOT NULL
+                          AND all(word IN $words WHERE n.match_title CONTAINS word)
+                        RETURN n
+                        LIMIT $limit
+                        """,
+                        words=title_tokens, limit=limit,
+                    )
+                    async for record in result:
+                        literature = self._neo4j_node_to_literature_model(record["n"])
+                        if literature:
+                            results.append(literature)
                 
                 return results
                 
         except Exception as e:
             logger.error(f"Fuzzy title search failed for '{title}': {e}")
             return []
-    
+
+    async def find_near_duplicates(
+        self,
+        title: str,
+        authors: Optional[List[Any]] = None,
+        limit: int = 5,
+        exclude_lid: Optional[str] = None,
+        confirm: Optional[Callable[[LiteratureModel], bool]] = None
+    ) -> List[LiteratureModel]:
+        """
+        Find near-duplicate candidates by MinHash-LSH over title and authors.
+
+        The index only knows literature written by other processes since its
+        last refresh, so the live ``find_by_title_fuzzy`` query is added
+        unless the fresh index already yields a candidate the caller's
+        matching rules (``confirm``) accept. Without ``confirm`` the live
+        query always runs, since any index candidate may still be rejected.
+
+        Args:
+            title: Raw title
+            authors: Author list
+            limit: Maximum number of candidates
+            exclude_lid: LID of the record being checked, never a candidate
+            confirm: The caller's duplicate check; only accepted candidates
+                are returned when given
+
+        Returns:
+            Candidate literature, index hits first, then live query hits
+        """
+        index = get_near_duplicate_index()
+        try:
+            candidates = await index.find_candidates(
+                title, authors, driver=self.driver, limit=limit
+            )
+        except Exception as e:
+            logger.warning(f"Near-duplicate index unavailable: {e}")
+            candidates = None
+
+        index_ready = candidates is not None
+
+        found: List[LiteratureModel] = []
+        if candidates:
+            try:
+                async with self._get_session() as session:
+                    result = await session.run(
+                        "MATCH (lit:Literature) WHERE lit.lid IN $lids RETURN lit",
+                        lids=[lid for lid, _ in candidates],
+                    )
+                    by_lid = {}
+                    async for record in result:
+                        literature = self._neo4j_node_to_literature_model(record["lit"])
+                        if literature:
+                            by_lid[literature.lid] = literature
+
+                for lid, _ in candidates:
+                    if lid == exclude_lid:
+                        continue
+                    if lid in by_lid:
+                        found.append(by_lid[lid])
+                    else:
+                        # Deleted or merged by another process
+                        self._remove_near_duplicate(lid)
+
+            except Exception as e:
+                logger.error(f"Near-duplicate lookup failed for '{title}': {e}")
+
+        if confirm is not None:
+            found = [literature for literature in found if confirm(literature)]
+            if found and index_ready and not index.stale:
+                return found
+
+        # No confirmed index hit: the live query also sees other processes' recent writes
+        seen = {literature.lid for literature in found} | {exclude_lid}
+        for literature in await self.find_by_title_fuzzy(title, limit=limit):
+            if literature.lid in seen or len(found) >= limit:
+                continue
+            if confirm is None or confirm(literature):
+                found.append(literature)
+                seen.add(literature.lid)
+        return found
+
+    # ========== Match Key Operations ==========
+
+    async def get_match_candidates(
+        self,
+        doi: str = "",
+        arxiv_id: str = "",
+        title_tokens: Optional[List[str]] = None,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get pre-filtered matching candidates using precomputed match keys.
+
+        Only the flat match_* properties are returned, so no JSON metadata
+        has to be parsed for candidates. Nodes created before match keys
+        existed are still returned (with keys computed on the fly) until
+        they are backfilled.
+
+        Args:
+            doi: Normalized DOI of the source
+            arxiv_id: Normalized ArXiv ID of the source
+            title_tokens: Meaningful title tokens of the source
+            limit: Maximum number of candidates to return
+
+        Returns:
+            List of candidate dicts with lid and match_* keys
+        """
+        try:
+            async with self._get_session() as session:
+                query = """
+                MATCH (lit:Literature)
+                WHERE lit.lid IS NOT NULL AND (
+                    lit.match_title IS NULL
+                    OR ($doi <> '' AND lit.match_doi = $doi)
+                    OR ($arxiv_id <> '' AND lit.match_arxiv_id = $arxiv_id)
+                    OR any(token IN lit.match_title_tokens WHERE token IN $title_tokens)
+                )
+                WITH lit,
+                     CASE WHEN $doi <> '' AND lit.match_doi = $doi THEN 1 ELSE 0 END AS doi_hit,
+                     size([token IN coalesce(lit.match_title_tokens, []) WHERE token IN $title_tokens]) AS overlap
+                RETURN lit.lid AS lid,
+                       lit.match_title AS match_title,
+                       lit.match_title_tokens AS match_title_tokens,
+                       lit.match_author_signatures AS match_author_signatures,
+                       lit.match_doi AS match_doi,
+                       lit.match_arxiv_id AS match_arxiv_id,
+                       lit.match_year AS match_year,
+                       CASE WHEN lit.match_title IS NULL THEN lit.metadata END AS metadata,
+                       CASE WHEN lit.match_title IS NULL THEN lit.identifiers END AS identifiers
+                ORDER BY doi_hit DESC, overlap DESC
+                LIMIT $limit
+                """
+
+                result = await session.run(
+                    query,
+                    doi=doi or "",
+                    arxiv_id=arxiv_id or "",
+                    title_tokens=title_tokens or [],
+                    limit=limit,
+                )
+
+                candidates = []
+                async for record in result:
+                    if record["match_title"] is None:
+                        # Legacy node without match keys: compute them from JSON fields
+                        metadata = self._parse_json_field(record["metadata"])
+                        identifiers = self._parse_json_field(record["identifiers"])
+                        keys = build_match_keys(
+                            title=metadata.get("title"),
+                            authors=metadata.get("authors"),
+                            doi=identifiers.get("doi"),
+                            year=metadata.get("year"),
+                            arxiv_id=identifiers.get("arxiv_id"),
+                        )
+                    else:
+                        keys = {field: record[field] for field in MATCH_KEY_FIELDS}
+
+                    keys["lid"] = record["lid"]
+                    candidates.append(keys)
+
+                logger.debug(f"Retrieved {len(candidates)} match-key candidates")
+                return candidates
+
+        except Exception as e:
+            logger.error(f"Error getting match candidates: {e}")
+            return []
+
+    async def backfill_match_keys(self, batch_size: int = 500) -> int:
+        """
+        Compute and store match keys (plus MinHash signatures, display titles
+        and search fields) for literature nodes created before they existed.
+
+        Args:
+            batch_size: Number of nodes processed per round trip
+
+        Returns:
+            Number of nodes updated
+        """
+        total_updated = 0
+        try:
+            async with self._get_session() as session:
+                while True:
+                    result = await session.run(
+                        """
+                        MATCH (lit:Literature)
+                        WHERE (lit.match_title IS NULL OR lit.match_minhash IS NULL
+                               OR lit.display_title IS NULL OR lit.search_authors IS NULL)
+                          AND lit.lid IS NOT NULL
+                        RETURN lit.lid AS lid, lit.metadata AS metadata, lit.identifiers AS identifiers
+                        LIMIT $batch_size
+                        """,
+                        batch_size=batch_size,
+                    )
+
+                    batch = []
+                    documents = []
+                    async for record in result:
+                        metadata = self._parse_json_field(record["metadata"])
+                        identifiers = self._parse_json_field(record["identifiers"])
+                        keys = build_match_keys(
+                            title=metadata.get("title"),
+                            authors=metadata.get("authors"),
+                            doi=identifiers.get("doi"),
+                            year=metadata.get("year"),
+                            arxiv_id=identifiers.get("arxiv_id"),
+                        )
+                        keys["match_minhash"] = self._near_duplicate_signature(keys)
+                        keys["display_title"] = metadata.get("title") or ""
+                        document = build_search_document(record["lid"], metadata)
+                        keys.update(search_node_properties(document))
+                        documents.append(document)
+                        batch.append({"lid": record["lid"], "keys": keys})
+
+                    if not batch:
+                        break
+
+                    await session.run(
+                        """
+                        UNWIND $batch AS item
+                        MATCH (lit:Literature {lid: item.lid})
+                        SET lit += item.keys
+                        """,
+                        batch=batch,
+                    )
+                    await self._index_search_documents(documents)
+                    total_updated += len(batch)
+                    logger.info(f"Backfilled match keys for {total_updated} literature nodes")
+
+            return total_updated
+
+        except Exception as e:
+            logger.error(f"Failed to backfill match keys: {e}")
+            return total_updated
+
+    async def reindex_search(self, batch_size: int = 500) -> int:
+        """
+        Push every literature to the search backend, e.g. after switching to
+        Elasticsearch or recreating its index.
+
+        Args:
+            batch_size: Number of nodes read per round trip
+
+        Returns:
+            Number of documents indexed
+        """
+        total_indexed = 0
+        after_lid = ""
+        try:
+            async with self._get_session() as session:
+                while True:
+                    result = await session.run(
+                        """
+                        MATCH (lit:Literature)
+                        WHERE lit.lid > $after_lid
+                        RETURN lit.lid AS lid, lit.metadata AS metadata
+                        ORDER BY lit.lid
+                        LIMIT $batch_size
+                        """,
+                        after_lid=after_lid, batch_size=batch_size,
+                    )
+                    documents = [
+                        build_search_document(record["lid"], self._parse_json_field(record["metadata"]))
+                        async for record in result
+                    ]
+                    if not documents:
+                        break
+
+                    total_indexed += await get_search_backend().index_documents(documents)
+                    after_lid = documents[-1].lid
+                    logger.info(f"Reindexed {total_indexed} literature for search")
+
+            return total_indexed
+
+        except Exception as e:
+            logger.error(f"Failed to reindex search: {e}")
+            return total_indexed
+
+    async def write_graph_metrics(self, rows: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        Store graph analytics results as ``graph_*`` node properties.
+
+        Args:
+            rows: ``{"lid": ..., "props": {...}}`` dicts
+            batch_size: Number of nodes written per round trip
+
+        Returns:
+            Number of nodes updated
+        """
+        updated = 0
+        async with self._get_session() as session:
+            for start in range(0, len(rows), batch_size):
+                result = await session.run(
+                    """
+                    UNWIND $rows AS row
+                    MATCH (lit:Literature {lid: row.lid})
+                    SET lit += row.props
+                    RETURN count(lit) AS updated
+                    """,
+                    rows=rows[start:start + batch_size],
+                )
+                record = await result.single()
+                updated += record["updated"] if record else 0
+        return updated
+
+    async def clear_stale_graph_metrics(self, computed_at: str) -> int:
+        """
+        Remove graph metrics left over from earlier analytics runs.
+
+        Args:
+            computed_at: Timestamp of the current run
+
+        Returns:
+            Number of nodes cleared
+        """
+        async with self._get_session() as session:
+            result = await session.run(
+                """
+                MATCH (lit:Literature)
+                WHERE lit.graph_analytics_at IS NOT NULL AND lit.graph_analytics_at < $computed_at
+                REMOVE lit.graph_pagerank, lit.graph_pagerank_percentile,
+                       lit.graph_in_degree, lit.graph_in_degree_percentile,
+                       lit.graph_co_cited_lids, lit.graph_co_cited_counts,
+                       lit.graph_coupled_lids, lit.graph_coupled_counts,
+                       lit.graph_analytics_at
+                RETURN count(lit) AS cleared
+                """,
+                computed_at=computed_at,
+            )
+            record = await result.single()
+            return record["cleared"] if record else 0
+
     # ========== Task Management Methods ==========
     
     async def create_placeholder(self, task_id: str, identifiers: Any) -> str:
@@ -426,6 +833,12 @@ class LiteratureDAO(BaseNeo4jDAO):
                     "raw_data": self._clean_for_neo4j(literature.raw_data or {}),
                     "task_info": self._clean_for_neo4j(literature.task_info.model_dump() if literature.task_info else {})
                 }
+                match_keys = match_keys_for_literature(literature)
+                node_props.update(match_keys)
+                node_props["match_minhash"] = self._near_duplicate_signature(match_keys)
+                node_props["display_title"] = getattr(literature.metadata, "title", None) or ""
+                search_document = build_search_document(literature.lid, literature.metadata)
+                node_props.update(search_node_properties(search_document))
                 
                 # Remove placeholder flag from raw_data
                 raw_data = literature.raw_data or {}
@@ -434,9 +847,11 @@ class LiteratureDAO(BaseNeo4jDAO):
                     del raw_data_copy["placeholder"]
                     node_props["raw_data"] = self._clean_for_neo4j(raw_data_copy)
                 
+                # 整体替换属性后重新计算引用计数
                 query = """
                 MATCH (placeholder:Literature {lid: $placeholder_lid})
                 SET placeholder = $props
+                """ + citation_counter_set("placeholder") + """
                 RETURN placeholder.lid as new_lid
                 """
                 
@@ -445,6 +860,13 @@ class LiteratureDAO(BaseNeo4jDAO):
                 
                 if record:
                     logger.info(f"✅ Finalized literature: {literature_id} -> {literature.lid}")
+                    self._invalidate_reference_cache(match_keys)
+                    self._record_known_identifiers(literature_filter_keys(match_keys))
+                    if literature.lid != literature_id:
+                        self._remove_near_duplicate(literature_id)
+                        self._invalidate_reference_cache_lid(literature_id)
+                    self._index_near_duplicate(literature.lid, node_props["match_minhash"])
+                    await self._index_search_documents([search_document])
                 else:
                     logger.warning(f"❌ Failed to finalize literature {literature_id} -> {literature.lid}")
                     
@@ -453,7 +875,87 @@ class LiteratureDAO(BaseNeo4jDAO):
             raise
     
     # ========== Helper Methods ==========
+
+    def _near_duplicate_signature(self, match_keys: Dict[str, Any]) -> List[int]:
+        """MinHash signature persisted as ``match_minhash`` for the near-duplicate index."""
+        try:
+            return signature_for_match_keys(match_keys, get_near_duplicate_index().num_perm)
+        except Exception as e:
+            logger.warning(f"Failed to compute near-duplicate signature: {e}")
+            return []
+
+    def _index_near_duplicate(self, lid: str, signature: List[int]) -> None:
+        """Add a committed literature to this process's near-duplicate index."""
+        try:
+            get_near_duplicate_index().add(lid, signature)
+        except Exception as e:
+            logger.warning(f"Failed to index literature {lid} for near-duplicate detection: {e}")
+
+    def _remove_near_duplicate(self, lid: str) -> None:
+        """Drop a deleted or merged literature from this process's near-duplicate index."""
+        try:
+            get_near_duplicate_index().remove(lid)
+        except Exception as e:
+            logger.warning(f"Failed to remove literature {lid} from the near-duplicate index: {e}")
+
+    async def _index_search_documents(self, documents: List[SearchDocument]) -> None:
+        """Push committed literature to the search backend (no-op for neo4j)."""
+        try:
+            await get_search_backend().index_documents(documents)
+        except Exception as e:
+            logger.warning(f"Failed to index {len(documents)} literature for search: {e}")
+
+    async def _delete_search_document(self, lid: str) -> None:
+        """Remove a deleted literature from the search backend."""
+        try:
+            await get_search_backend().delete_document(lid)
+        except Exception as e:
+            logger.warning(f"Failed to remove literature {lid} from search: {e}")
+
+    def _record_graph_detached(self, lid: str) -> None:
+        """Publish that a deleted literature's citation edges are gone."""
+        try:
+            get_citation_graph_cache().record_detached([lid])
+        except Exception as e:
+            logger.warning(f"Failed to record deleted literature {lid} in graph cache: {e}")
+
+    def _invalidate_reference_cache(self, match_keys: Dict[str, Any]) -> None:
+        """Drop cached reference resolutions this literature could now satisfy."""
+        try:
+            from ..services.resolution_cache import get_reference_cache
+            get_reference_cache().invalidate_for_target(match_keys)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate reference cache: {e}")
+
+    def _invalidate_reference_cache_lid(self, lid: str) -> None:
+        """Drop cached reference resolutions pointing at a LID that no longer exists."""
+        try:
+            from ..services.resolution_cache import get_reference_cache
+            get_reference_cache().invalidate_lid(lid)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate reference cache for {lid}: {e}")
     
+    def _graph_metrics_from_node(self, node) -> Optional[GraphMetricsModel]:
+        """Build graph metrics from the flat ``graph_*`` node properties."""
+        if not node.get("graph_analytics_at"):
+            return None
+
+        def related(lids_key: str, counts_key: str) -> List[RelatedLiteratureModel]:
+            return [
+                RelatedLiteratureModel(lid=lid, count=count)
+                for lid, count in zip(node.get(lids_key) or [], node.get(counts_key) or [])
+            ]
+
+        return GraphMetricsModel(
+            pagerank=node.get("graph_pagerank") or 0.0,
+            pagerank_percentile=node.get("graph_pagerank_percentile") or 0.0,
+            in_degree=node.get("graph_in_degree") or 0,
+            in_degree_percentile=node.get("graph_in_degree_percentile") or 0.0,
+            co_cited=related("graph_co_cited_lids", "graph_co_cited_counts"),
+            coupled=related("graph_coupled_lids", "graph_coupled_counts"),
+            computed_at=node.get("graph_analytics_at"),
+        )
+
     def _neo4j_node_to_literature_model(self, node) -> Optional[LiteratureModel]:
         """Convert Neo4j node to LiteratureModel."""
         import json
@@ -514,6 +1016,8 @@ class LiteratureDAO(BaseNeo4jDAO):
             else:
                 data["references"] = []
             
+            data["graph_metrics"] = self._graph_metrics_from_node(node)
+            
             return LiteratureModel(**data)
             
         except Exception as e:
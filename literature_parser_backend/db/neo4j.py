@@ -162,12 +162,25 @@ async def create_indexes() -> None:
                 "CREATE INDEX literature_title_index IF NOT EXISTS FOR (n:Literature) ON (n.`metadata.title`)",
                 "CREATE INDEX literature_year_index IF NOT EXISTS FOR (n:Literature) ON (n.`metadata.year`)",
                 "CREATE INDEX literature_created_index IF NOT EXISTS FOR (n:Literature) ON (n.created_at)",
+                "CREATE INDEX literature_updated_index IF NOT EXISTS FOR (n:Literature) ON (n.updated_at)",
                 
-                # Full-text search index for metadata JSON string
-                "CREATE FULLTEXT INDEX literature_fulltext IF NOT EXISTS FOR (n:Literature) ON EACH [n.metadata]",
+                # Full-text search index on native title/author/venue/abstract properties
+                "CREATE FULLTEXT INDEX literature_search IF NOT EXISTS FOR (n:Literature) "
+                "ON EACH [n.display_title, n.search_authors, n.search_venue, n.search_abstract]",
+                "CREATE INDEX literature_match_year_index IF NOT EXISTS FOR (n:Literature) ON (n.match_year)",
+                
+                # Precomputed match key indexes
+                "CREATE INDEX literature_match_title_index IF NOT EXISTS FOR (n:Literature) ON (n.match_title)",
+                "CREATE INDEX literature_match_doi_index IF NOT EXISTS FOR (n:Literature) ON (n.match_doi)",
+                "CREATE INDEX literature_match_arxiv_index IF NOT EXISTS FOR (n:Literature) ON (n.match_arxiv_id)",
+                "CREATE INDEX literature_pagerank_index IF NOT EXISTS FOR (n:Literature) ON (n.graph_pagerank)",
+                "CREATE INDEX literature_cited_by_count_index IF NOT EXISTS FOR (n:Literature) ON (n.cited_by_count)",
+                "CREATE INDEX literature_cites_count_index IF NOT EXISTS FOR (n:Literature) ON (n.cites_count)",
                 
                 # Unresolved node indexes (for Phase 2)
                 "CREATE INDEX unresolved_status_index IF NOT EXISTS FOR (n:Unresolved) ON (n.resolution_status)",
+                "CREATE INDEX unresolved_match_title_index IF NOT EXISTS FOR (n:Unresolved) ON (n.match_title)",
+                "CREATE INDEX unresolved_match_doi_index IF NOT EXISTS FOR (n:Unresolved) ON (n.match_doi)",
                 
                 # Relationship indexes
                 "CREATE INDEX cites_confidence_index IF NOT EXISTS FOR ()-[r:CITES]-() ON (r.confidence)"
@@ -295,6 +308,8 @@ async def create_task_indexes(database: AsyncDriver) -> None:
                 "CREATE INDEX literature_doi_index IF NOT EXISTS FOR (n:Literature) ON (n.`identifiers.doi`)",
                 "CREATE INDEX literature_arxiv_index IF NOT EXISTS FOR (n:Literature) ON (n.`identifiers.arxiv_id`)",
                 "CREATE INDEX literature_fingerprint_index IF NOT EXISTS FOR (n:Literature) ON (n.`identifiers.fingerprint`)",
+                "CREATE INDEX literature_match_title_index IF NOT EXISTS FOR (n:Literature) ON (n.match_title)",
+                "CREATE INDEX unresolved_match_title_index IF NOT EXISTS FOR (n:Unresolved) ON (n.match_title)",
             ]
             
             for index in essential_indexes:
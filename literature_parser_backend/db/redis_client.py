@@ -0,0 +1,61 @@
+"""
+Redis connection management.
+
+This module provides a shared, lazily created Redis client for
+application-level caching and coordination (separate from the Celery
+broker connection, but pointing at the same Redis instance by default).
+"""
+
+import logging
+from typing import Optional
+
+import redis
+
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Global client instance (one connection pool per process)
+_client: Optional[redis.Redis] = None
+
+
+def get_redis_client(settings: Optional[Settings] = None) -> redis.Redis:
+    """
+    Get the shared Redis client, creating it on first use.
+
+    The client is synchronous on purpose: worker tasks run each job in a
+    fresh event loop (``asyncio.run``), so an asyncio client bound to one
+    loop could not be reused across tasks.
+
+    :param settings: Application settings (optional)
+    :return: Redis client instance
+    """
+    global _client
+
+    if _client is not None:
+        return _client
+
+    if settings is None:
+        settings = Settings()
+
+    _client = redis.Redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_timeout=2,
+        socket_connect_timeout=2,
+        health_check_interval=30,
+    )
+    logger.info(f"Redis client configured for {settings.redis_host}:{settings.redis_port}")
+    return _client
+
+
+def close_redis_client() -> None:
+    """Close the shared Redis client and release its connection pool."""
+    global _client
+
+    if _client is not None:
+        try:
+            _client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Redis client: {e}")
+        _client = None
@@ -8,7 +8,7 @@ Replaces the original MongoDB implementation with enhanced graph capabilities.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from neo4j import AsyncDriver, AsyncSession
 
@@ -17,6 +17,9 @@ from literature_parser_backend.models.relationship import (
     RelationshipType,
     CitationGraphNode,
 )
+from ..services.graph_cache import get_citation_graph_cache
+from ..services.near_duplicates import get_near_duplicate_index
+from ..utils.match_keys import match_keys_for_reference
 from .base_dao import BaseNeo4jDAO
 
 logger = logging.getLogger(__name__)
@@ -68,23 +71,35 @@ class RelationshipDAO(BaseNeo4jDAO):
                 RETURN elementId(rel) as relationship_id
                 """
                 
-                result = await session.run(
-                    query,
-                    from_lid=relationship.from_lid,
-                    to_lid=relationship.to_lid,
-                    relationship_type=relationship.relationship_type.value,
-                    confidence=relationship.confidence,
-                    source=relationship.source,
-                    created_at=relationship.created_at.isoformat(),
-                    updated_at=relationship.updated_at.isoformat(),
-                    metadata=relationship.metadata or {},
-                    verified=relationship.verified
-                )
-                record = await result.single()
+                async def work(tx):
+                    result = await tx.run(
+                        query,
+                        from_lid=relationship.from_lid,
+                        to_lid=relationship.to_lid,
+                        relationship_type=relationship.relationship_type.value,
+                        confidence=relationship.confidence,
+                        source=relationship.source,
+                        created_at=relationship.created_at.isoformat(),
+                        updated_at=relationship.updated_at.isoformat(),
+                        metadata=relationship.metadata or {},
+                        verified=relationship.verified
+                    )
+                    record = await result.single()
+                    if record:
+                        await self._refresh_citation_counters(
+                            tx, literature_lids=[relationship.from_lid, relationship.to_lid]
+                        )
+                    return record
+                
+                record = await session.execute_write(work)
                 
                 if record:
                     relationship_id = record["relationship_id"]
                     logger.info(f"Created/updated relationship: {relationship.from_lid} -> {relationship.to_lid}")
+                    self._record_graph_edges([(
+                        relationship.from_lid, relationship.to_lid,
+                        relationship.confidence, relationship.source
+                    )])
                     return relationship_id
                 else:
                     raise RuntimeError("Failed to create/update relationship")
@@ -294,11 +309,21 @@ class RelationshipDAO(BaseNeo4jDAO):
                 RETURN count(*) as deleted_count
                 """
                 
-                result = await session.run(query, lid=lid)
-                record = await result.single()
+                async def work(tx):
+                    literature_lids, unresolved_lids = await self._citation_neighbors(tx, lid)
+                    result = await tx.run(query, lid=lid)
+                    record = await result.single()
+                    await self._refresh_citation_counters(
+                        tx, literature_lids=literature_lids + [lid], unresolved_lids=unresolved_lids
+                    )
+                    return record
+                
+                record = await session.execute_write(work)
                 
                 deleted_count = record["deleted_count"] if record else 0
                 logger.info(f"Deleted {deleted_count} relationships for literature {lid}")
+                if deleted_count:
+                    self._record_graph_detached([lid])
                 return deleted_count
                 
         except Exception as e:
@@ -309,35 +334,48 @@ class RelationshipDAO(BaseNeo4jDAO):
         """
         Get relationship statistics for a literature.
         
+        Reads the materialized citation counters, counting relationships only
+        for nodes written before the counters existed.
+        
         :param lid: Literature ID
         :return: Dictionary with outgoing and incoming relationship counts
         """
         try:
             async with self._get_session() as session:
-                # Get outgoing count
-                outgoing_query = """
-                MATCH (lit:Literature {lid: $lid})-[:CITES]->()
-                RETURN count(*) as outgoing_count
-                """
-                
-                result = await session.run(outgoing_query, lid=lid)
-                outgoing_record = await result.single()
-                outgoing_count = outgoing_record["outgoing_count"] if outgoing_record else 0
+                result = await session.run(
+                    """
+                    MATCH (lit:Literature {lid: $lid})
+                    RETURN lit.cites_count as outgoing_count,
+                           lit.cited_by_count as incoming_count,
+                           lit.cites_resolved_count as resolved_count,
+                           lit.cites_unresolved_count as unresolved_count
+                    """,
+                    lid=lid
+                )
+                record = await result.single()
                 
-                # Get incoming count
-                incoming_query = """
-                MATCH ()-[:CITES]->(lit:Literature {lid: $lid})
-                RETURN count(*) as incoming_count
-                """
+                if record and record["outgoing_count"] is None:
+                    result = await session.run(
+                        """
+                        MATCH (lit:Literature {lid: $lid})
+                        RETURN COUNT { (lit)-[:CITES]->() } as outgoing_count,
+                               COUNT { ()-[:CITES]->(lit) } as incoming_count,
+                               COUNT { (lit)-[:CITES]->(:Literature) } as resolved_count,
+                               COUNT { (lit)-[:CITES]->(:Unresolved) } as unresolved_count
+                        """,
+                        lid=lid
+                    )
+                    record = await result.single()
                 
-                result = await session.run(incoming_query, lid=lid)
-                incoming_record = await result.single()
-                incoming_count = incoming_record["incoming_count"] if incoming_record else 0
+                if not record:
+                    return {"outgoing_count": 0, "incoming_count": 0, "total_count": 0}
                 
                 return {
-                    "outgoing_count": outgoing_count,
-                    "incoming_count": incoming_count,
-                    "total_count": outgoing_count + incoming_count
+                    "outgoing_count": record["outgoing_count"],
+                    "incoming_count": record["incoming_count"],
+                    "outgoing_resolved_count": record["resolved_count"],
+                    "outgoing_unresolved_count": record["unresolved_count"],
+                    "total_count": record["outgoing_count"] + record["incoming_count"]
                 }
                 
         except Exception as e:
@@ -353,11 +391,22 @@ class RelationshipDAO(BaseNeo4jDAO):
         """
         Get a citation graph centered on given literatures.
         
+        Served from the in-memory CSR graph cache when it is ready, falling
+        back to a Cypher variable-length match otherwise.
+        
         :param center_lids: Central literature LIDs
         :param max_depth: Maximum depth to traverse
         :param min_confidence: Minimum confidence threshold
         :return: Graph data with nodes and edges
         """
+        neighborhood = await get_citation_graph_cache().k_hop(
+            center_lids, max_depth, min_confidence, driver=self.driver
+        )
+        if neighborhood is not None:
+            return await self._build_cached_graph(
+                neighborhood, center_lids, max_depth, min_confidence
+            )
+
         try:
             async with self._get_session() as session:
                 query = f"""
@@ -425,6 +474,112 @@ class RelationshipDAO(BaseNeo4jDAO):
             logger.error(f"Error getting citation graph: {e}")
             raise
     
+    async def _build_cached_graph(
+        self,
+        neighborhood: Dict[str, Any],
+        center_lids: List[str],
+        max_depth: int,
+        min_confidence: float
+    ) -> Dict[str, Any]:
+        """
+        Attach node metadata to a k-hop neighborhood from the graph cache.
+        
+        :param neighborhood: Result of ``CitationGraphCache.k_hop``
+        :param center_lids: Central literature LIDs
+        :param max_depth: Maximum depth traversed
+        :param min_confidence: Minimum confidence threshold
+        :return: Graph data with nodes and edges
+        """
+        edges = neighborhood["edges"]
+        in_degree: Dict[str, int] = {}
+        out_degree: Dict[str, int] = {}
+        for from_lid, to_lid, _, _ in edges:
+            out_degree[from_lid] = out_degree.get(from_lid, 0) + 1
+            in_degree[to_lid] = in_degree.get(to_lid, 0) + 1
+
+        lids = [lid for lid in neighborhood["distances"] if lid in in_degree or lid in out_degree]
+        nodes = {}
+        try:
+            async with self._get_session() as session:
+                result = await session.run(
+                    """
+                    MATCH (lit:Literature)
+                    WHERE lit.lid IN $lids
+                    RETURN lit.lid as lid, lit.metadata as metadata
+                    """,
+                    lids=lids
+                )
+                async for record in result:
+                    metadata = self._parse_json_field(record["metadata"])
+                    nodes[record["lid"]] = metadata
+        except Exception as e:
+            logger.warning(f"Failed to load metadata for cached citation graph: {e}")
+
+        graph_nodes = []
+        for lid in lids:
+            metadata = nodes.get(lid, {})
+            year = metadata.get("year")
+            graph_nodes.append(CitationGraphNode(
+                lid=lid,
+                title=metadata.get("title") or "Unknown Title",
+                year=int(year) if str(year or "").isdigit() else None,
+                in_degree=in_degree.get(lid, 0),
+                out_degree=out_degree.get(lid, 0)
+            ).model_dump())
+
+        return {
+            "nodes": graph_nodes,
+            "edges": [
+                {"from_lid": from_lid, "to_lid": to_lid, "confidence": confidence, "source": source}
+                for from_lid, to_lid, confidence, source in edges
+            ],
+            "center_lids": center_lids,
+            "max_depth": max_depth,
+            "min_confidence": min_confidence,
+            "truncated": neighborhood["truncated"]
+        }
+
+    async def iter_internal_citation_graph(
+        self,
+        target_lids: List[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the internal citation structure of a set of literatures.
+        
+        Runs a single ``UNWIND`` query that projects only lid, title and year
+        for each node, with its outgoing edges to other nodes in the set
+        collected on the same row, so memory stays proportional to one node's
+        citations rather than the whole result.
+        
+        :param target_lids: Literature LIDs (duplicates are ignored)
+        :return: Async iterator of ``{"lid", "title", "year", "cites"}`` dicts,
+            one per existing literature, where ``cites`` holds
+            ``[to_lid, confidence, source, created_at]`` lists
+        """
+        target_lids = list(dict.fromkeys(target_lids))
+        async with self._get_session() as session:
+            result = await session.run(
+                """
+                UNWIND $target_lids AS target_lid
+                MATCH (lit:Literature {lid: target_lid})
+                OPTIONAL MATCH (lit)-[rel:CITES]->(cited:Literature)
+                WHERE cited.lid IN $target_lids
+                RETURN lit.lid AS lid,
+                       coalesce(lit.display_title, apoc.convert.fromJsonMap(lit.metadata).title) AS title,
+                       lit.match_year AS year,
+                       collect(CASE WHEN cited IS NULL THEN NULL
+                               ELSE [cited.lid, rel.confidence, rel.source, rel.created_at] END) AS cites
+                """,
+                target_lids=target_lids
+            )
+            async for record in result:
+                yield {
+                    "lid": record["lid"],
+                    "title": record["title"] or "Unknown Title",
+                    "year": record["year"],
+                    "cites": record["cites"],
+                }
+
     async def get_internal_citation_graph(
         self,
         target_lids: List[str]
@@ -439,76 +594,65 @@ class RelationshipDAO(BaseNeo4jDAO):
         :return: Graph data with nodes and internal edges only
         """
         try:
-            async with self._get_session() as session:
-                # Query for relationships where both from and to nodes are in target_lids
-                query = """
-                MATCH (from_lit:Literature)-[rel:CITES]->(to_lit:Literature)
-                WHERE from_lit.lid IN $target_lids 
-                  AND to_lit.lid IN $target_lids
-                
-                RETURN DISTINCT
-                    from_lit.lid as from_lid,
-                    to_lit.lid as to_lid,
-                    from_lit.metadata as from_metadata,
-                    to_lit.metadata as to_metadata,
-                    rel.confidence as confidence,
-                    rel.source as source,
-                    rel.created_at as created_at
-                """
-                
-                result = await session.run(
-                    query,
-                    target_lids=target_lids
-                )
-                
-                nodes = {}
-                edges = []
-                
-                # First, add all requested nodes (even if they have no relationships)
-                node_query = """
-                MATCH (lit:Literature)
-                WHERE lit.lid IN $target_lids
-                RETURN lit.lid as lid, lit.metadata as metadata
-                """
-                
-                node_result = await session.run(node_query, target_lids=target_lids)
-                async for record in node_result:
-                    lid = record["lid"]
-                    # Parse metadata JSON string
-                    metadata = self._parse_json_field(record["metadata"])
-                    title = metadata.get("title", "Unknown Title")
-                    
-                    nodes[lid] = CitationGraphNode(
-                        lid=lid,
-                        title=title,
-                        is_center=True  # All nodes are "center" in internal graph
-                    )
-                
-                # Then add relationships
-                async for record in result:
-                    from_lid = record["from_lid"]
-                    to_lid = record["to_lid"]
-                    
-                    # Add edge (nodes should already exist from above)
+            nodes = []
+            edges = []
+            async for row in self.iter_internal_citation_graph(target_lids):
+                nodes.append(CitationGraphNode(
+                    lid=row["lid"], title=row["title"], year=row["year"], out_degree=len(row["cites"])
+                ).model_dump())
+                for to_lid, confidence, source, created_at in row["cites"]:
                     edges.append({
-                        "from_lid": from_lid,
+                        "from_lid": row["lid"],
                         "to_lid": to_lid,
-                        "confidence": record["confidence"],
-                        "source": record["source"],
-                        "created_at": record["created_at"] if isinstance(record["created_at"], str) else (record["created_at"].isoformat() if record["created_at"] else None)
+                        "confidence": confidence,
+                        "source": source,
+                        "created_at": created_at if isinstance(created_at, str) else (created_at.isoformat() if created_at else None)
                     })
-                
-                return {
-                    "nodes": [node.model_dump() for node in nodes.values()],
-                    "edges": edges,
-                    "target_lids": target_lids,
-                    "relationship_type": "internal_only"
-                }
+            
+            in_degree: Dict[str, int] = {}
+            for edge in edges:
+                in_degree[edge["to_lid"]] = in_degree.get(edge["to_lid"], 0) + 1
+            for node in nodes:
+                node["in_degree"] = in_degree.get(node["lid"], 0)
+
+            return {
+                "nodes": nodes,
+                "edges": edges,
+                "target_lids": target_lids,
+                "relationship_type": "internal_only"
+            }
                 
         except Exception as e:
             logger.error(f"Failed to get citation graph: {e}")
             return {"nodes": [], "edges": [], "target_lids": target_lids}
     
+    async def export_citation_graph(self) -> Tuple[List[str], List[Tuple[str, str, Optional[float], Optional[str]]]]:
+        """
+        Export every literature LID and Literature→Literature CITES edge.
+        
+        Used by offline jobs that analyze the whole graph in memory.
+        
+        :return: Tuple of (all literature LIDs, (from_lid, to_lid, confidence, source) edges)
+        """
+        async with self._get_session() as session:
+            result = await session.run("MATCH (lit:Literature) RETURN lit.lid AS lid")
+            lids = [record["lid"] async for record in result if record["lid"]]
+
+            result = await session.run(
+                """
+                MATCH (a:Literature)-[r:CITES]->(b:Literature)
+                RETURN a.lid AS from_lid, b.lid AS to_lid,
+                       r.confidence AS confidence, r.source AS source
+                """
+            )
+            edges = [
+                (record["from_lid"], record["to_lid"], record["confidence"], record["source"])
+                async for record in result
+            ]
+
+        logger.info(f"Exported citation graph: {len(lids)} literatures, {len(edges)} edges")
+        return lids, edges
+
     # ========== Batch Operations ==========
     
     async def batch_create_relationships(
@@ -524,57 +668,60 @@ class RelationshipDAO(BaseNeo4jDAO):
         if not relationships:
             return []
         
-        created_ids = []
+        now = datetime.now()
+        batch_data = []
+        for relationship in relationships:
+            # Update timestamps
+            relationship.updated_at = now
+            if not relationship.created_at:
+                relationship.created_at = now
+            batch_data.append({
+                "from_lid": relationship.from_lid,
+                "to_lid": relationship.to_lid,
+                "relationship_type": relationship.relationship_type.value,
+                "confidence": relationship.confidence,
+                "source": relationship.source,
+                "created_at": relationship.created_at.isoformat(),
+                "metadata": relationship.metadata or {},
+                "verified": relationship.verified
+            })
+        
+        query = """
+        UNWIND $batch_data AS item
+        MATCH (from_lit:Literature {lid: item.from_lid})
+        MATCH (to_lit:Literature {lid: item.to_lid})
+        
+        MERGE (from_lit)-[rel:CITES]->(to_lit)
+        ON CREATE SET
+            rel.relationship_type = item.relationship_type,
+            rel.confidence = item.confidence,
+            rel.source = item.source,
+            rel.created_at = item.created_at,
+            rel.metadata = item.metadata,
+            rel.verified = item.verified
+        
+        RETURN elementId(rel) as relationship_id,
+               item.from_lid as from_lid, item.to_lid as to_lid,
+               rel.confidence as confidence, rel.source as source
+        """
         
         try:
             async with self._get_session() as session:
-                async with session.begin_transaction() as tx:
-                    for relationship in relationships:
-                        try:
-                            # Update timestamps
-                            relationship.updated_at = datetime.now()
-                            if not relationship.created_at:
-                                relationship.created_at = datetime.now()
-                            
-                            query = """
-                            MATCH (from_lit:Literature {lid: $from_lid})
-                            MATCH (to_lit:Literature {lid: $to_lid})
-                            
-                            MERGE (from_lit)-[rel:CITES]->(to_lit)
-                            ON CREATE SET
-                                rel.relationship_type = $relationship_type,
-                                rel.confidence = $confidence,
-                                rel.source = $source,
-                                rel.created_at = $created_at,
-                                rel.metadata = $metadata,
-                                rel.verified = $verified
-                            
-                            RETURN elementId(rel) as relationship_id
-                            """
-                            
-                            result = await tx.run(
-                                query,
-                                from_lid=relationship.from_lid,
-                                to_lid=relationship.to_lid,
-                                relationship_type=relationship.relationship_type.value,
-                                confidence=relationship.confidence,
-                                source=relationship.source,
-                                created_at=relationship.created_at.isoformat(),
-                                metadata=relationship.metadata or {},
-                                verified=relationship.verified
-                            )
-                            record = await result.single()
-                            
-                            if record:
-                                created_ids.append(record["relationship_id"])
-                                
-                        except Exception as e:
-                            logger.error(f"Failed to create relationship in batch: {e}")
-                            # Continue with other relationships
-                
-                await tx.commit()
-                
+                async def work(tx):
+                    result = await tx.run(query, batch_data=batch_data)
+                    records = [record async for record in result]
+                    touched = [lid for record in records for lid in (record["from_lid"], record["to_lid"])]
+                    await self._refresh_citation_counters(tx, literature_lids=touched)
+                    return records
+                
+                records = await session.execute_write(work)
+            
+            created_ids = [record["relationship_id"] for record in records]
             logger.info(f"Batch created {len(created_ids)} relationships")
+            self._record_graph_edges([
+                (record["from_lid"], record["to_lid"], record["confidence"], record["source"])
+                for record in records
+            ])
             return created_ids
             
         except Exception as e:
@@ -648,19 +795,27 @@ class RelationshipDAO(BaseNeo4jDAO):
                 MATCH (cited:Literature {lid: $cited_lid})
                 MERGE (citing)-[r:CITES]->(cited)
                 ON CREATE SET r += $props
-                RETURN r.created_at as created_at
+                RETURN r.created_at as created_at, r.confidence as confidence, r.source as source
                 """
                 
-                result = await session.run(
-                    query,
-                    citing_lid=citing_lid,
-                    cited_lid=cited_lid,
-                    props=props
-                )
+                async def work(tx):
+                    result = await tx.run(
+                        query,
+                        citing_lid=citing_lid,
+                        cited_lid=cited_lid,
+                        props=props
+                    )
+                    record = await result.single()
+                    if record:
+                        await self._refresh_citation_counters(tx, literature_lids=[citing_lid, cited_lid])
+                    return record
                 
-                record = await result.single()
+                record = await session.execute_write(work)
                 if record:
                     logger.debug(f"✅ Created CITES relationship: {citing_lid} → {cited_lid}")
+                    self._record_graph_edges([
+                        (citing_lid, cited_lid, record["confidence"], record["source"])
+                    ])
                     return True
                 else:
                     logger.warning(f"❌ Failed to create CITES relationship: {citing_lid} → {cited_lid}")
@@ -715,6 +870,8 @@ class RelationshipDAO(BaseNeo4jDAO):
                         # Store full parsed data as JSON string
                         import json
                         node_props["parsed_data_json"] = json.dumps(parsed_data, ensure_ascii=False)
+                        # 预计算匹配键
+                        node_props.update(self._unresolved_match_keys(parsed_data))
                 
                 # No additional cleaning needed - all values are now primitive types
                 cleaned_props = node_props
@@ -729,15 +886,22 @@ class RelationshipDAO(BaseNeo4jDAO):
                 RETURN unresolved.lid as placeholder_lid, r.created_at as rel_created
                 """
                 
-                result = await session.run(
-                    query,
-                    citing_lid=citing_lid,
-                    placeholder_lid=placeholder_lid,
-                    node_props=cleaned_props,
-                    created_at=datetime.now().isoformat()
-                )
+                async def work(tx):
+                    result = await tx.run(
+                        query,
+                        citing_lid=citing_lid,
+                        placeholder_lid=placeholder_lid,
+                        node_props=cleaned_props,
+                        created_at=datetime.now().isoformat()
+                    )
+                    record = await result.single()
+                    if record:
+                        await self._refresh_citation_counters(
+                            tx, literature_lids=[citing_lid], unresolved_lids=[placeholder_lid]
+                        )
+                    return record
                 
-                record = await result.single()
+                record = await session.execute_write(work)
                 if record:
                     logger.debug(f"✅ Created unresolved placeholder: {citing_lid} → {placeholder_lid}")
                     return True
@@ -749,6 +913,63 @@ class RelationshipDAO(BaseNeo4jDAO):
             logger.error(f"Error creating unresolved citation {citing_lid} → {placeholder_lid}: {e}")
             return False
 
+    def _invalidate_reference_cache(self, lid: str) -> None:
+        """Drop cached reference resolutions pointing at the given LID."""
+        try:
+            from ..services.resolution_cache import get_reference_cache
+            get_reference_cache().invalidate_lid(lid)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate reference cache for {lid}: {e}")
+
+    def _remove_near_duplicate(self, lid: str) -> None:
+        """Drop a deleted literature from this process's near-duplicate index."""
+        try:
+            get_near_duplicate_index().remove(lid)
+        except Exception as e:
+            logger.warning(f"Failed to remove literature {lid} from the near-duplicate index: {e}")
+
+    def _record_graph_edges(self, edges: List[Tuple[str, str, Optional[float], Optional[str]]]) -> None:
+        """Publish created or updated Literature→Literature edges to the graph cache."""
+        try:
+            if edges:
+                get_citation_graph_cache().record_edges(edges)
+        except Exception as e:
+            logger.warning(f"Failed to record citation graph edges: {e}")
+
+    def _record_graph_detached(self, lids: List[str]) -> None:
+        """Publish that all edges of the given literatures were deleted."""
+        try:
+            if lids:
+                get_citation_graph_cache().record_detached(lids)
+        except Exception as e:
+            logger.warning(f"Failed to record detached graph nodes: {e}")
+
+    async def _fetch_upgraded_edges(self, session, pairs: List[Dict[str, str]]) -> None:
+        """Publish the Literature→Literature edges created by a placeholder upgrade."""
+        try:
+            result = await session.run(
+                """
+                UNWIND $pairs AS pair
+                MATCH (citing:Literature)-[r:CITES]->(lit:Literature {lid: pair.literature_lid})
+                WHERE r.upgraded_from = pair.placeholder_lid
+                RETURN citing.lid AS from_lid, lit.lid AS to_lid,
+                       r.confidence AS confidence, r.source AS source
+                """,
+                pairs=pairs
+            )
+            edges = [
+                (record["from_lid"], record["to_lid"], record["confidence"], record["source"])
+                async for record in result
+            ]
+            self._record_graph_edges(edges)
+        except Exception as e:
+            logger.warning(f"Failed to collect upgraded citation edges: {e}")
+
+    def _unresolved_match_keys(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute match keys for an Unresolved node, dropping empty values."""
+        keys = match_keys_for_reference(parsed_data)
+        return {k: v for k, v in keys.items() if v is not None}
+
     async def batch_create_unresolved_citations(
         self,
         citing_lid: str,
@@ -766,6 +987,9 @@ class RelationshipDAO(BaseNeo4jDAO):
                     "placeholder_lid": str,
                     "reference_data": Dict[str, Any]
                 }
+                On success each item's ``placeholder_lid`` is replaced by the
+                LID actually linked, which is an existing node's when the
+                reference was deduplicated.
             
         Returns:
             Number of successfully created placeholders
@@ -775,24 +999,29 @@ class RelationshipDAO(BaseNeo4jDAO):
             
         try:
             async with self._get_session() as session:
-                # 🆕 Step 1: 智能去重 - 查找现有的未解析节点进行标题匹配
+                # 🆕 Step 1: 智能去重 - 基于预计算的 match_title 查找现有未解析节点
                 from ..utils.title_normalization import normalize_title_for_matching
                 
-                # 获取现有未解析节点的标题信息
-                existing_unresolved = {}  # {normalized_title: existing_lid}
-                existing_query = """
-                MATCH (u:Unresolved)
-                WHERE u.parsed_title IS NOT NULL
-                RETURN u.lid as lid, u.parsed_title as title
-                """
-                
-                result = await session.run(existing_query)
-                async for record in result:
-                    title = record["title"]
-                    if title:
-                        normalized = normalize_title_for_matching(title)
+                candidate_titles = set()
+                for citation in unresolved_citations:
+                    parsed_data = citation["reference_data"].get("parsed_data")
+                    if isinstance(parsed_data, dict) and parsed_data.get("title"):
+                        normalized = normalize_title_for_matching(parsed_data["title"])
                         if normalized:
-                            existing_unresolved[normalized] = record["lid"]
+                            candidate_titles.add(normalized)
+                
+                # 只查询本批次涉及的标题（走 match_title 索引），不再全量扫描
+                existing_unresolved = {}  # {normalized_title: existing_lid}
+                if candidate_titles:
+                    existing_query = """
+                    MATCH (u:Unresolved)
+                    WHERE u.match_title IN $titles
+                    RETURN u.lid as lid, u.match_title as match_title
+                    """
+                    
+                    result = await session.run(existing_query, titles=list(candidate_titles))
+                    async for record in result:
+                        existing_unresolved.setdefault(record["match_title"], record["lid"])
                 
                 logger.debug(f"Found {len(existing_unresolved)} existing unresolved nodes for deduplication")
                 
@@ -898,6 +1127,11 @@ class RelationshipDAO(BaseNeo4jDAO):
                             # Store full parsed data as JSON string
                             import json
                             node_props["parsed_data_json"] = json.dumps(parsed_data, ensure_ascii=False)
+                            s2_paper_id = (parsed_data.get("identifiers") or {}).get("s2_paper_id")
+                            if s2_paper_id:
+                                node_props["s2_paper_id"] = s2_paper_id
+                            # 预计算匹配键
+                            node_props.update(self._unresolved_match_keys(parsed_data))
                     
                     batch_nodes.append({
                         "lid": final_lid,
@@ -907,54 +1141,63 @@ class RelationshipDAO(BaseNeo4jDAO):
                 # Step 4: 执行批量创建
                 created_count = 0
                 
-                # 4.1 批量创建新的未解析节点
-                if batch_nodes:
-                    node_query = """
-                    UNWIND $batch_data as item
-                    MERGE (unresolved:Unresolved {lid: item.placeholder_lid})
-                    ON CREATE SET unresolved = item.node_props
-                    RETURN count(unresolved) as created_count
-                    """
-                    
-                    node_batch_data = []
-                    for node in batch_nodes:
-                        node_batch_data.append({
-                            "placeholder_lid": node["lid"],
-                            "node_props": node["props"]
-                        })
-                    
-                    result = await session.run(node_query, batch_data=node_batch_data)
-                    record = await result.single()
-                    node_created = record["created_count"] if record else 0
-                    logger.debug(f"Created {node_created} new unresolved nodes")
-                
-                # 4.2 批量创建引用关系
-                if batch_relationships:
-                    relationship_query = """
-                    MATCH (citing:Literature {lid: $citing_lid})
-                    UNWIND $batch_data as item
-                    MATCH (unresolved:Unresolved {lid: item.placeholder_lid})
-                    MERGE (citing)-[r:CITES]->(unresolved)
-                    ON CREATE SET r.created_at = item.created_at, r.source = 'citation_resolver'
-                    RETURN count(r) as relationship_count
-                    """
-                    
-                    relationship_batch_data = []
-                    for rel in batch_relationships:
-                        relationship_batch_data.append({
-                            "placeholder_lid": rel["placeholder_lid"],
-                            "created_at": rel["created_at"]
-                        })
-                    
-                    result = await session.run(
-                        relationship_query,
-                        citing_lid=citing_lid,
-                        batch_data=relationship_batch_data
-                    )
+                node_query = """
+                UNWIND $batch_data as item
+                MERGE (unresolved:Unresolved {lid: item.placeholder_lid})
+                ON CREATE SET unresolved = item.node_props
+                RETURN count(unresolved) as created_count
+                """
+                node_batch_data = [
+                    {"placeholder_lid": node["lid"], "node_props": node["props"]}
+                    for node in batch_nodes
+                ]
+                
+                relationship_query = """
+                MATCH (citing:Literature {lid: $citing_lid})
+                UNWIND $batch_data as item
+                MATCH (unresolved:Unresolved {lid: item.placeholder_lid})
+                MERGE (citing)-[r:CITES]->(unresolved)
+                ON CREATE SET r.created_at = item.created_at, r.source = 'citation_resolver'
+                RETURN count(r) as relationship_count
+                """
+                # 同一占位符只需一条关系（批次内去重后可能重复）
+                relationship_batch_data = list({
+                    rel["placeholder_lid"]: {
+                        "placeholder_lid": rel["placeholder_lid"],
+                        "created_at": rel["created_at"]
+                    }
+                    for rel in reversed(batch_relationships)
+                }.values())
+                
+                async def work(tx):
+                    # 4.1 批量创建新的未解析节点
+                    if node_batch_data:
+                        result = await tx.run(node_query, batch_data=node_batch_data)
+                        record = await result.single()
+                        node_created = record["created_count"] if record else 0
+                        logger.debug(f"Created {node_created} new unresolved nodes")
                     
-                    record = await result.single()
-                    relationship_created = record["relationship_count"] if record else 0
-                    logger.debug(f"Created {relationship_created} citation relationships")
+                    # 4.2 批量创建引用关系，并在同一事务中更新引用计数
+                    if relationship_batch_data:
+                        result = await tx.run(
+                            relationship_query,
+                            citing_lid=citing_lid,
+                            batch_data=relationship_batch_data
+                        )
+                        record = await result.single()
+                        relationship_created = record["relationship_count"] if record else 0
+                        logger.debug(f"Created {relationship_created} citation relationships")
+                        await self._refresh_citation_counters(
+                            tx,
+                            literature_lids=[citing_lid],
+                            unresolved_lids=[rel["placeholder_lid"] for rel in relationship_batch_data]
+                        )
+                
+                await session.execute_write(work)
+                
+                # 回写实际关联的LID（可能是复用的现有节点）
+                for citation in unresolved_citations:
+                    citation["placeholder_lid"] = current_batch_lid_mapping[citation["placeholder_lid"]]
                 
                 # 计算总的创建数量 (去重后的实际节点数)
                 total_created = len(deduplicated_citations)
@@ -971,6 +1214,16 @@ class RelationshipDAO(BaseNeo4jDAO):
             logger.error(f"Error batch creating unresolved citations for {citing_lid}: {e}")
             return 0
 
+    async def _delete_with_counters(self, tx, query: str, literature_lid: str):
+        """Run a literature delete and refresh the counters of its former neighbors."""
+        literature_lids, unresolved_lids = await self._citation_neighbors(tx, literature_lid)
+        result = await tx.run(query, literature_lid=literature_lid)
+        record = await result.single()
+        await self._refresh_citation_counters(
+            tx, literature_lids=literature_lids, unresolved_lids=unresolved_lids
+        )
+        return record
+
     async def safe_delete_literature(
         self,
         literature_lid: str,
@@ -1023,14 +1276,18 @@ class RelationshipDAO(BaseNeo4jDAO):
                            count(DISTINCT unresolved_to_delete) as unresolved_count
                     """
                     
-                    result = await session.run(cascade_query, literature_lid=literature_lid)
-                    record = await result.single()
+                    record = await session.execute_write(
+                        self._delete_with_counters, cascade_query, literature_lid
+                    )
                     
                     if record:
                         stats["literature_deleted"] = 1
                         stats["aliases_deleted"] = record.get("aliases_count", 0)
                         stats["unresolved_deleted"] = record.get("unresolved_count", 0)
                         
+                        self._invalidate_reference_cache(literature_lid)
+                        self._record_graph_detached([literature_lid])
+                        self._remove_near_duplicate(literature_lid)
                         logger.info(
                             f"✅ Safely deleted literature {literature_lid}: "
                             f"{stats['aliases_deleted']} aliases, "
@@ -1044,11 +1301,15 @@ class RelationshipDAO(BaseNeo4jDAO):
                     RETURN count(lit) as deleted_count
                     """
                     
-                    result = await session.run(simple_query, literature_lid=literature_lid)
-                    record = await result.single()
+                    record = await session.execute_write(
+                        self._delete_with_counters, simple_query, literature_lid
+                    )
                     
                     if record and record["deleted_count"] > 0:
                         stats["literature_deleted"] = 1
+                        self._invalidate_reference_cache(literature_lid)
+                        self._record_graph_detached([literature_lid])
+                        self._remove_near_duplicate(literature_lid)
                         logger.info(f"✅ Deleted literature {literature_lid} (no cascade)")
                 
                 return stats
@@ -1124,17 +1385,29 @@ class RelationshipDAO(BaseNeo4jDAO):
                 RETURN deleted_count
                 """
                 
-                upgrade_result = await session.run(
-                    upgrade_query,
-                    placeholder_lid=placeholder_lid,
-                    literature_lid=literature_lid,
-                    upgraded_at=datetime.now().isoformat()
-                )
+                async def work(tx):
+                    result = await tx.run(
+                        upgrade_query,
+                        placeholder_lid=placeholder_lid,
+                        literature_lid=literature_lid,
+                        upgraded_at=datetime.now().isoformat()
+                    )
+                    record = await result.single()
+                    await self._refresh_citation_counters(
+                        tx,
+                        literature_lids=citing_lids + [literature_lid],
+                        unresolved_lids=[placeholder_lid]
+                    )
+                    return record
                 
-                upgrade_record = await upgrade_result.single()
+                upgrade_record = await session.execute_write(work)
                 deleted_count = upgrade_record["deleted_count"] if upgrade_record else 0
                 
                 logger.info(f"✅ Upgraded {len(citing_lids)} relationships from placeholder {placeholder_lid} to literature {literature_lid}")
+                self._invalidate_reference_cache(placeholder_lid)
+                await self._fetch_upgraded_edges(session, [
+                    {"placeholder_lid": placeholder_lid, "literature_lid": literature_lid}
+                ])
                 
                 return {
                     "upgraded_relationships": len(citing_lids),
@@ -1146,6 +1419,344 @@ class RelationshipDAO(BaseNeo4jDAO):
             logger.error(f"Error upgrading unresolved citation {placeholder_lid} → {literature_lid}: {e}")
             return {"upgraded_relationships": 0, "citing_lids": [], "error": str(e)}
 
+    async def find_reconcilable_unresolved(
+        self,
+        after_lid: str = "",
+        batch_size: int = 500
+    ) -> Tuple[List[Dict[str, str]], Optional[str], int]:
+        """
+        Join a keyset page of :Unresolved nodes to :Literature by match keys.
+
+        A placeholder matches a literature with the same ``match_doi``, or,
+        failing that, exactly one literature with the same non-empty
+        ``match_title`` and a year within ±1 (or no year on either side).
+        Ambiguous title matches are left for manual review, and placeholders
+        without a usable title are only ever matched by DOI.
+
+        Args:
+            after_lid: Only consider placeholders with a LID greater than this
+            batch_size: Maximum number of placeholders scanned
+
+        Returns:
+            Tuple of (placeholder/literature pairs, last scanned LID or None
+            when the page is empty, number of placeholders scanned)
+        """
+        try:
+            async with self._get_session() as session:
+                result = await session.run(
+                    """
+                    MATCH (u:Unresolved)
+                    WHERE u.lid > $after_lid
+                    WITH u ORDER BY u.lid LIMIT $batch_size
+                    OPTIONAL MATCH (d:Literature)
+                    WHERE u.match_doi IS NOT NULL AND d.match_doi = u.match_doi
+                    WITH u, head(collect(d.lid)) AS doi_lid
+                    OPTIONAL MATCH (t:Literature {match_title: u.match_title})
+                    WHERE doi_lid IS NULL
+                      AND u.match_title IS NOT NULL AND u.match_title <> ''
+                      AND (u.match_year IS NULL OR t.match_year IS NULL
+                           OR abs(t.match_year - u.match_year) <= 1)
+                    WITH u, doi_lid, collect(t.lid) AS title_lids
+                    RETURN u.lid AS placeholder_lid,
+                           u.match_title AS match_title,
+                           doi_lid IS NOT NULL AS by_doi,
+                           coalesce(doi_lid, CASE WHEN size(title_lids) = 1 THEN title_lids[0] END) AS literature_lid
+                    ORDER BY placeholder_lid
+                    """,
+                    after_lid=after_lid,
+                    batch_size=batch_size
+                )
+
+                pairs = []
+                last_lid = None
+                scanned = 0
+                async for record in result:
+                    scanned += 1
+                    last_lid = record["placeholder_lid"]
+                    if not record["literature_lid"]:
+                        continue
+                    if not record["by_doi"] and not (record["match_title"] or "").strip():
+                        # An empty title key would merge unrelated citations into one node
+                        continue
+                    pairs.append({
+                        "placeholder_lid": record["placeholder_lid"],
+                        "literature_lid": record["literature_lid"]
+                    })
+
+                return pairs, last_lid, scanned
+
+        except Exception as e:
+            logger.error(f"Error finding reconcilable unresolved nodes after '{after_lid}': {e}")
+            raise
+
+    async def bulk_upgrade_unresolved(self, pairs: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Upgrade many placeholders in one statement.
+
+        Re-points every CITES edge from each placeholder to its literature
+        (skipping self-citations), then deletes the placeholders.
+
+        Args:
+            pairs: Dicts with ``placeholder_lid`` and ``literature_lid``
+
+        Returns:
+            Dictionary with ``merged_lids`` and ``upgraded_relationships``
+        """
+        if not pairs:
+            return {"merged_lids": [], "upgraded_relationships": 0}
+
+        try:
+            async with self._get_session() as session:
+                query = """
+                UNWIND $pairs AS pair
+                MATCH (u:Unresolved {lid: pair.placeholder_lid})
+                MATCH (lit:Literature {lid: pair.literature_lid})
+                OPTIONAL MATCH (citing:Literature)-[old_rel:CITES]->(u)
+                FOREACH (_ IN CASE WHEN old_rel IS NOT NULL AND citing <> lit THEN [1] ELSE [] END |
+                    MERGE (citing)-[new_rel:CITES]->(lit)
+                    ON CREATE SET
+                        new_rel.created_at = old_rel.created_at,
+                        new_rel.source = old_rel.source,
+                        new_rel.confidence = old_rel.confidence,
+                        new_rel.upgraded_from = u.lid,
+                        new_rel.upgraded_at = $upgraded_at
+                )
+                WITH u, u.lid AS placeholder_lid, count(old_rel) AS moved,
+                     collect(DISTINCT citing.lid) AS citing_lids
+                DETACH DELETE u
+                RETURN collect(placeholder_lid) AS merged_lids, sum(moved) AS upgraded_relationships,
+                       reduce(acc = [], lids IN collect(citing_lids) | acc + lids) AS citing_lids
+                """
+                
+                async def work(tx):
+                    result = await tx.run(
+                        query,
+                        pairs=pairs,
+                        upgraded_at=datetime.now().isoformat()
+                    )
+                    record = await result.single()
+                    if record:
+                        await self._refresh_citation_counters(
+                            tx,
+                            literature_lids=record["citing_lids"] + [pair["literature_lid"] for pair in pairs]
+                        )
+                    return record
+                
+                record = await session.execute_write(work)
+
+                merged_lids = record["merged_lids"] if record else []
+                for lid in merged_lids:
+                    self._invalidate_reference_cache(lid)
+                if record and record["upgraded_relationships"]:
+                    await self._fetch_upgraded_edges(session, pairs)
+
+                return {
+                    "merged_lids": merged_lids,
+                    "upgraded_relationships": (record["upgraded_relationships"] or 0) if record else 0
+                }
+
+        except Exception as e:
+            logger.error(f"Error bulk upgrading {len(pairs)} unresolved nodes: {e}")
+            raise
+
+    async def recompute_citation_counters(self, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Recompute the materialized citation counters of every node.
+        
+        Repairs drift (e.g. after manual edits or relationships written by
+        older code) and initializes counters on nodes created before they
+        existed. Pages through nodes by LID, one transaction per page.
+        
+        Args:
+            batch_size: Number of nodes refreshed per transaction
+            
+        Returns:
+            Number of :Literature and :Unresolved nodes refreshed
+        """
+        counts = {"literature": 0, "unresolved": 0}
+        async with self._get_session() as session:
+            for label, key in (("Literature", "literature"), ("Unresolved", "unresolved")):
+                after_lid = ""
+                while True:
+                    result = await session.run(
+                        f"""
+                        MATCH (n:{label})
+                        WHERE n.lid > $after_lid
+                        RETURN n.lid AS lid
+                        ORDER BY lid
+                        LIMIT $batch_size
+                        """,
+                        after_lid=after_lid,
+                        batch_size=batch_size
+                    )
+                    lids = [record["lid"] async for record in result]
+                    if not lids:
+                        break
+                    
+                    if key == "literature":
+                        await session.execute_write(self._refresh_citation_counters, literature_lids=lids)
+                    else:
+                        await session.execute_write(self._refresh_citation_counters, unresolved_lids=lids)
+                    counts[key] += len(lids)
+                    after_lid = lids[-1]
+                
+                logger.info(f"Recomputed citation counters for {counts[key]} {label} nodes")
+        
+        return counts
+
+    async def backfill_unresolved_match_keys(self, batch_size: int = 500) -> int:
+        """
+        Compute and store match keys for :Unresolved nodes created before they existed.
+        
+        Args:
+            batch_size: Number of nodes processed per round trip
+            
+        Returns:
+            Number of nodes updated
+        """
+        total_updated = 0
+        try:
+            async with self._get_session() as session:
+                while True:
+                    result = await session.run(
+                        """
+                        MATCH (u:Unresolved)
+                        WHERE u.match_title IS NULL
+                        RETURN u.lid as lid, u.parsed_title as title,
+                               u.parsed_year as year, u.parsed_data_json as parsed_data_json
+                        LIMIT $batch_size
+                        """,
+                        batch_size=batch_size
+                    )
+                    
+                    batch = []
+                    async for record in result:
+                        parsed_data = self._parse_json_field(record["parsed_data_json"])
+                        if not parsed_data:
+                            parsed_data = {"title": record["title"], "year": record["year"]}
+                        keys = self._unresolved_match_keys(parsed_data)
+                        batch.append({"lid": record["lid"], "keys": keys})
+                    
+                    if not batch:
+                        break
+                    
+                    await session.run(
+                        """
+                        UNWIND $batch as item
+                        MATCH (u:Unresolved {lid: item.lid})
+                        SET u += item.keys
+                        """,
+                        batch=batch
+                    )
+                    total_updated += len(batch)
+                    logger.info(f"Backfilled match keys for {total_updated} unresolved nodes")
+                
+                return total_updated
+                
+        except Exception as e:
+            logger.error(f"Error backfilling unresolved match keys: {e}")
+            return total_updated
+
+    async def find_enrichable_unresolved(
+        self,
+        after_lid: str = "",
+        batch_size: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Find a keyset page of :Unresolved nodes that carry an external id.
+
+        Only placeholders with a DOI, arXiv id or Semantic Scholar paper id
+        that have not been enriched yet are returned.
+
+        Args:
+            after_lid: Only consider placeholders with a LID greater than this
+            batch_size: Maximum number of placeholders returned
+
+        Returns:
+            List of dicts with ``lid``, ``doi``, ``arxiv_id``, ``s2_paper_id``
+            and ``parsed_data``
+        """
+        try:
+            async with self._get_session() as session:
+                result = await session.run(
+                    """
+                    MATCH (u:Unresolved)
+                    WHERE u.lid > $after_lid
+                      AND u.enriched_at IS NULL
+                      AND (coalesce(u.match_doi, '') <> '' OR coalesce(u.match_arxiv_id, '') <> ''
+                           OR u.s2_paper_id IS NOT NULL)
+                    RETURN u.lid AS lid, u.match_doi AS doi, u.match_arxiv_id AS arxiv_id,
+                           u.s2_paper_id AS s2_paper_id, u.parsed_data_json AS parsed_data_json
+                    ORDER BY u.lid
+                    LIMIT $batch_size
+                    """,
+                    after_lid=after_lid,
+                    batch_size=batch_size
+                )
+                return [
+                    {
+                        "lid": record["lid"],
+                        "doi": record["doi"] or None,
+                        "arxiv_id": record["arxiv_id"] or None,
+                        "s2_paper_id": record["s2_paper_id"],
+                        "parsed_data": self._parse_json_field(record["parsed_data_json"]) or {},
+                    }
+                    async for record in result
+                ]
+
+        except Exception as e:
+            logger.error(f"Error finding enrichable unresolved nodes after '{after_lid}': {e}")
+            raise
+
+    async def apply_unresolved_enrichment(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Store enriched reference data on :Unresolved nodes.
+
+        Args:
+            updates: Items with ``lid`` and ``parsed_data`` (None when the
+                lookup found nothing; the node is then only marked as enriched)
+
+        Returns:
+            Number of nodes updated with new data
+        """
+        if not updates:
+            return 0
+
+        import json
+        enriched_at = datetime.now().isoformat()
+        batch = []
+        for update in updates:
+            props = {"enriched_at": enriched_at}
+            parsed_data = update.get("parsed_data")
+            if parsed_data:
+                props.update({
+                    "parsed_title": str(parsed_data.get("title") or ""),
+                    "parsed_authors": str(parsed_data["authors"]) if parsed_data.get("authors") else "",
+                    "parsed_year": str(parsed_data["year"]) if parsed_data.get("year") else "",
+                    "parsed_data_json": json.dumps(parsed_data, ensure_ascii=False),
+                })
+                s2_paper_id = (parsed_data.get("identifiers") or {}).get("s2_paper_id")
+                if s2_paper_id:
+                    props["s2_paper_id"] = s2_paper_id
+                props.update(self._unresolved_match_keys(parsed_data))
+            batch.append({"lid": update["lid"], "props": props})
+
+        try:
+            async with self._get_session() as session:
+                await session.run(
+                    """
+                    UNWIND $batch AS item
+                    MATCH (u:Unresolved {lid: item.lid})
+                    SET u += item.props
+                    """,
+                    batch=batch
+                )
+            return sum(1 for update in updates if update.get("parsed_data"))
+
+        except Exception as e:
+            logger.error(f"Error applying enrichment to {len(updates)} unresolved nodes: {e}")
+            raise
+
     async def get_unresolved_count(self) -> int:
         """
         Get the total number of unresolved placeholder nodes.
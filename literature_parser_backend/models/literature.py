@@ -231,6 +231,31 @@ class TaskInfoModel(BaseModel):
         return "任务正在队列中等待"
 
 
+class RelatedLiteratureModel(BaseModel):
+    """A literature related to another through shared citations."""
+
+    lid: str = Field(..., description="Related literature LID")
+    count: int = Field(..., description="Number of shared citing papers or references")
+
+
+class GraphMetricsModel(BaseModel):
+    """Citation graph signals computed by the offline analytics job."""
+
+    pagerank: float = Field(0.0, description="PageRank score")
+    pagerank_percentile: float = Field(0.0, description="PageRank percentile (0-100)")
+    in_degree: int = Field(0, description="Number of citing literatures")
+    in_degree_percentile: float = Field(0.0, description="In-degree percentile (0-100)")
+    co_cited: List[RelatedLiteratureModel] = Field(
+        default_factory=list,
+        description="Literatures most often cited together with this one",
+    )
+    coupled: List[RelatedLiteratureModel] = Field(
+        default_factory=list,
+        description="Literatures sharing the most references with this one",
+    )
+    computed_at: Optional[str] = Field(None, description="Analytics run timestamp")
+
+
 # ===============================
 # Main MongoDB Document Model
 # ===============================
@@ -285,6 +310,10 @@ class LiteratureModel(BaseModel):
         default_factory=dict,
         description="Raw data from various sources, for debugging.",
     )
+    graph_metrics: Optional[GraphMetricsModel] = Field(
+        None,
+        description="Citation graph signals (read-only, maintained by the analytics job)",
+    )
 
     class Config:
         populate_by_name = True
@@ -436,6 +465,9 @@ class LiteratureSummaryDTO(BaseModel):
     doi: Optional[str] = None
     abstract: Optional[str] = None
 
+    # 引用图分析指标（离线任务计算）
+    graph_metrics: Optional[GraphMetricsModel] = None
+
     def model_post_init(self, __context: Any) -> None:
         """
         Populate convenience fields after the model is initialized.
@@ -546,6 +578,48 @@ class LiteratureFulltextDTO(BaseModel):
         }
 
 
+class LiteratureSearchHitDTO(BaseModel):
+    """One ranked result of GET /literatures/search."""
+
+    lid: str = Field(..., description="Literature ID")
+    score: float = Field(..., description="Relevance score (comparable within one query only)")
+    title: str = Field("", description="Literature title")
+    authors: List[str] = Field(default_factory=list, description="Author names")
+    year: Optional[int] = Field(None, description="Publication year")
+    venue: str = Field("", description="Journal or venue name")
+
+
+class LiteratureSearchResponseDTO(BaseModel):
+    """
+    Page of search results.
+
+    Pass ``next_cursor`` back as ``cursor`` to get the next page; it is null
+    on the last page.
+    """
+
+    query: str = Field(..., description="Search text")
+    results: List[LiteratureSearchHitDTO] = Field(default_factory=list, description="Ranked results")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page")
+
+    class Config:
+        json_schema_extra: ClassVar[Dict[str, Any]] = {
+            "example": {
+                "query": "attention transformer",
+                "results": [
+                    {
+                        "lid": "2017-vaswani-aayn-6a05",
+                        "score": 7.42,
+                        "title": "Attention Is All You Need",
+                        "authors": ["Ashish Vaswani", "Noam Shazeer"],
+                        "year": 2017,
+                        "venue": "Advances in Neural Information Processing Systems",
+                    },
+                ],
+                "next_cursor": "WzcuNDIsIjIwMTctdmFzd2FuaS1hYXluLTZhMDUiXQ",
+            },
+        }
+
+
 # ===============================
 # Utility Functions
 # ===============================
@@ -565,6 +639,7 @@ def literature_to_summary_dto(literature: LiteratureModel) -> LiteratureSummaryD
             "task_info",
             "created_at",
             "updated_at",
+            "graph_metrics",
         },
     )
     # Pydantic v2 needs the 'id' as a string.
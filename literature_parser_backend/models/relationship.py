@@ -7,7 +7,7 @@ between literatures in the 0.2 system.
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -196,3 +196,11 @@ class CitationGraphResponse(BaseModel):
         }
 
 
+class InternalGraphRequest(BaseModel):
+    """Request body for internal relationship graphs over large LID sets."""
+    
+    lids: list[str] = Field(..., description="Literature LIDs to analyze internal relationships for")
+    format: Literal["full", "edgelist"] = Field(
+        default="full",
+        description="'full' returns edge/node objects; 'edgelist' returns compact arrays"
+    )
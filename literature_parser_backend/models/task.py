@@ -153,6 +153,13 @@ class TaskResultType(str, Enum):
     INVALID_URL = "invalid_url"        # URL格式错误
 
 
+class TaskPriority(str, Enum):
+    """任务优先级 - 决定任务进入的队列通道"""
+    INTERACTIVE = "interactive"  # 用户同步等待结果（如 /by-doi）
+    NORMAL = "normal"            # 普通异步提交
+    BULK = "bulk"                # 批量导入，可被其他通道插队
+
+
 
 class ComponentStage(str, Enum):
     """Enumeration of detailed processing stages for each component."""
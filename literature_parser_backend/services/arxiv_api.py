@@ -6,17 +6,23 @@ ArXiv Official API Client
 
 import re
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from loguru import logger
 
 from literature_parser_backend.models.literature import AuthorModel, MetadataModel
 from literature_parser_backend.services.request_manager import ExternalRequestManager, RequestType
 from literature_parser_backend.settings import Settings
+from literature_parser_backend.utils.match_keys import normalize_arxiv_id
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
 
 
 class ArXivAPIClient:
     """arXiv官方API客户端"""
     
+    # 单次 id_list 查询的最大ID数量（保持URL长度合理）
+    ID_LIST_BATCH_SIZE = 100
+    
     def __init__(self, settings: Optional[Settings] = None):
         """初始化arXiv API客户端"""
         self.settings = settings or Settings()
@@ -35,30 +41,75 @@ class ArXivAPIClient:
             包含论文元数据的字典，如果失败则返回None
         """
         logger.info(f"Fetching metadata from arXiv API for ID: {arxiv_id}")
+        return self.get_metadata_batch([arxiv_id]).get(arxiv_id)
+    
+    def get_metadata_batch(self, arxiv_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        批量获取arXiv论文元数据
         
-        try:
-            # 构建API请求URL
-            params = {
-                "id_list": arxiv_id,
-                "max_results": 1
-            }
-            
-            response = self.request_manager.get(
-                url=self.base_url,
-                request_type=RequestType.EXTERNAL,
-                params=params,
-                timeout=self.timeout
-            )
+        多个ID合并为一次 id_list 查询（每批最多 ID_LIST_BATCH_SIZE 个），
+        响应按流式增量解析，逐条处理entry。请求间隔由限流器的 arxiv
+        配额保证（默认3秒一次）。
+        
+        Args:
+            arxiv_ids: arXiv ID列表（可带 arXiv: 前缀或版本号）
             
-            if response.status_code == 200:
-                return self._parse_arxiv_response(response.text, arxiv_id)
-            else:
-                logger.warning(f"arXiv API returned status {response.status_code}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error fetching from arXiv API: {e}")
-            return None
+        Returns:
+            {请求的ID: 元数据字典}，未找到的ID不包含在结果中
+        """
+        requested: Dict[str, List[str]] = {}
+        for arxiv_id in arxiv_ids:
+            normalized = normalize_arxiv_id(arxiv_id)
+            if normalized:
+                requested.setdefault(normalized, []).append(arxiv_id)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        ids = list(requested)
+        for start in range(0, len(ids), self.ID_LIST_BATCH_SIZE):
+            chunk = ids[start:start + self.ID_LIST_BATCH_SIZE]
+            try:
+                response = self.request_manager.get(
+                    url=self.base_url,
+                    request_type=RequestType.EXTERNAL,
+                    params={"id_list": ",".join(chunk), "max_results": len(chunk)},
+                    timeout=self.timeout,
+                    stream=True,
+                )
+                try:
+                    if response.status_code != 200:
+                        logger.warning(f"arXiv API returned status {response.status_code}")
+                        continue
+                    
+                    response.raw.decode_content = True
+                    for entry in self._iter_entries(response.raw):
+                        id_elem = entry.find(f"{ATOM_NS}id")
+                        entry_id = self.extract_arxiv_id_from_url(id_elem.text or "") if id_elem is not None else None
+                        normalized = normalize_arxiv_id(entry_id)
+                        if normalized not in requested:
+                            # 无效ID时arXiv返回一个错误entry
+                            continue
+                        for original_id in requested[normalized]:
+                            paper_data = self._parse_entry(entry, original_id)
+                            if paper_data:
+                                results[original_id] = paper_data
+                finally:
+                    response.close()
+                    
+            except ET.ParseError as e:
+                logger.error(f"XML parsing error for arXiv batch response: {e}")
+            except Exception as e:
+                logger.error(f"Error fetching batch from arXiv API: {e}")
+        
+        if len(ids) > 1:
+            logger.info(f"arXiv batch: found {len(results)}/{len(ids)} papers")
+        return results
+    
+    def _iter_entries(self, stream) -> Iterator[ET.Element]:
+        """增量解析Atom feed，逐个产出entry元素并在处理后释放"""
+        for _, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag == f"{ATOM_NS}entry":
+                yield elem
+                elem.clear()
     
     def search_by_title(self, title: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
@@ -117,20 +168,36 @@ class ArXivAPIClient:
             # 解析XML
             root = ET.fromstring(xml_content)
             
-            # 定义命名空间
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
-            
             # 查找entry元素
-            entries = root.findall('atom:entry', namespaces)
+            entries = root.findall(f"{ATOM_NS}entry")
             
             if not entries:
                 logger.warning(f"No entries found for arXiv ID: {arxiv_id}")
                 return None
             
-            entry = entries[0]  # 取第一个结果
+            return self._parse_entry(entries[0], arxiv_id)  # 取第一个结果
+            
+        except ET.ParseError as e:
+            logger.error(f"XML parsing error for arXiv response: {e}")
+            return None
+    
+    def _parse_entry(self, entry: ET.Element, arxiv_id: str) -> Optional[Dict[str, Any]]:
+        """
+        解析单个Atom entry
+        
+        Args:
+            entry: entry元素
+            arxiv_id: 对应的arXiv ID
+            
+        Returns:
+            解析后的元数据字典
+        """
+        try:
+            # 定义命名空间
+            namespaces = {
+                'atom': 'http://www.w3.org/2005/Atom',
+                'arxiv': 'http://arxiv.org/schemas/atom'
+            }
             
             # 提取基本信息
             title_elem = entry.find('atom:title', namespaces)
@@ -208,9 +275,6 @@ class ArXivAPIClient:
             
             return result
             
-        except ET.ParseError as e:
-            logger.error(f"XML parsing error for arXiv response: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error parsing arXiv response: {e}")
             return None
@@ -259,14 +323,7 @@ class ArXivAPIClient:
                     continue
                 
                 # 使用现有的解析逻辑解析单个entry
-                entry_xml = ET.tostring(entry, encoding='unicode')
-                # 创建一个临时的根元素包装这个entry
-                temp_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
-{entry_xml}
-</feed>'''
-                
-                paper_data = self._parse_arxiv_response(temp_xml, arxiv_id)
+                paper_data = self._parse_entry(entry, arxiv_id)
                 if paper_data:
                     results.append(paper_data)
             
@@ -0,0 +1,281 @@
+"""
+Circuit breakers and adaptive timeouts per external upstream.
+
+Each upstream (see ``services.upstreams``) gets:
+
+- a circuit breaker: after ``circuit_breaker_failure_threshold`` consecutive
+  failures (timeouts, connection errors, 5xx) the circuit opens and calls
+  fail immediately. After ``circuit_breaker_reset_timeout`` seconds one
+  probe call is let through (half-open); its outcome closes or re-opens
+  the circuit.
+- a latency window: recent successful call durations, whose percentile
+  (times a safety multiplier) becomes the read timeout once enough samples
+  exist. A healthy upstream answering in 300 ms then times out after
+  seconds rather than the full ``external_api_timeout``.
+
+State is per process: each worker learns an outage from its own calls
+within a few requests, without a shared-store round trip per call.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from requests.exceptions import RequestException
+
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RequestException):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, upstream: str, retry_in: float):
+        self.upstream = upstream
+        self.retry_in = retry_in
+        super().__init__(f"Circuit for {upstream} is open, next probe in {retry_in:.1f}s")
+
+
+def percentile(values, fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of a sequence (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Upstream name
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit allows a probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.probe_started = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may be made now (claims the probe when half-open)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.time() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_pending():
+                self.probe_in_flight = True
+                self.probe_started = time.time()
+                logger.info(f"Circuit {self.name}: half-open, probing")
+                return True
+            self.rejected += 1
+            return False
+
+    def is_available(self) -> bool:
+        """Whether a call would currently be allowed, without claiming the probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                return time.time() - self.opened_at >= self.reset_timeout
+            return not self._probe_pending()
+
+    def _probe_pending(self) -> bool:
+        # A probe that never reported back (e.g. abandoned before sending)
+        # stops blocking after another reset_timeout
+        return self.probe_in_flight and time.time() - self.probe_started < self.reset_timeout
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.time() - self.opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit {self.name}: closed")
+            self.state = CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.time()
+                self.probe_in_flight = False
+                self.times_opened += 1
+                logger.warning(
+                    f"Circuit {self.name}: opened after {self.failures} consecutive failures, "
+                    f"probing again in {self.reset_timeout:.0f}s"
+                )
+
+
+class LatencyWindow:
+    """Sliding window of recent successful call durations."""
+
+    def __init__(self, size: int):
+        self.samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self._lock:
+            return percentile(list(self.samples), fraction)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+
+class UpstreamHealth:
+    """Circuit breakers and latency windows for all upstreams of this process."""
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """
+        Initialize from settings.
+
+        Args:
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.breakers_enabled = self.settings.circuit_breaker_enabled
+        self.adaptive_enabled = self.settings.adaptive_timeout_enabled
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, upstream: str) -> CircuitBreaker:
+        with self._lock:
+            if upstream not in self.breakers:
+                self.breakers[upstream] = CircuitBreaker(
+                    upstream,
+                    self.settings.circuit_breaker_failure_threshold,
+                    self.settings.circuit_breaker_reset_timeout,
+                )
+            return self.breakers[upstream]
+
+    def latency(self, upstream: str) -> LatencyWindow:
+        with self._lock:
+            if upstream not in self.latencies:
+                self.latencies[upstream] = LatencyWindow(self.settings.adaptive_timeout_window)
+            return self.latencies[upstream]
+
+    def before_call(self, upstream: str) -> None:
+        """
+        Check the circuit before calling an upstream.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or its probe is taken)
+        """
+        if not self.breakers_enabled:
+            return
+        breaker = self.breaker(upstream)
+        if not breaker.allow():
+            raise CircuitOpenError(upstream, breaker.retry_in())
+
+    def record_success(self, upstream: str, seconds: float) -> None:
+        """Record a call that reached a healthy upstream (any non-5xx answer)."""
+        self.latency(upstream).add(seconds)
+        if self.breakers_enabled:
+            self.breaker(upstream).record_success()
+
+    def record_failure(self, upstream: str, timed_out_after: Optional[float] = None) -> None:
+        """
+        Record a timeout, connection error or 5xx.
+
+        Args:
+            upstream: Upstream name
+            timed_out_after: For timeouts, the elapsed time; it is added as a
+                latency sample so a genuinely slower upstream raises its own
+                adaptive timeout instead of timing out forever
+        """
+        if timed_out_after is not None:
+            self.latency(upstream).add(timed_out_after)
+        if self.breakers_enabled:
+            self.breaker(upstream).record_failure()
+
+    def is_available(self, upstream: Optional[str]) -> bool:
+        """Whether calls to an upstream would currently be attempted."""
+        if not upstream or not self.breakers_enabled:
+            return True
+        return self.breaker(upstream).is_available()
+
+    def timeout_for(self, upstream: str, requested: float) -> float:
+        """
+        Read timeout for the next call.
+
+        Args:
+            upstream: Upstream name
+            requested: Timeout asked for by the caller (the upper bound)
+
+        Returns:
+            ``percentile × multiplier`` of recent latencies clamped to
+            ``[adaptive_timeout_min, requested]``, or ``requested`` while
+            there are too few samples
+        """
+        if not self.adaptive_enabled:
+            return requested
+        window = self.latency(upstream)
+        if len(window) < self.settings.adaptive_timeout_min_samples:
+            return requested
+        observed = window.percentile(self.settings.adaptive_timeout_percentile)
+        adaptive = observed * self.settings.adaptive_timeout_multiplier
+        return min(requested, max(self.settings.adaptive_timeout_min, adaptive))
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Breaker state and latency percentiles per upstream."""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for upstream in sorted(set(self.breakers) | set(self.latencies)):
+            window = self.latency(upstream)
+            breaker = self.breaker(upstream)
+            p50, p90, p99 = (window.percentile(f) for f in (0.5, 0.9, 0.99))
+            stats[upstream] = {
+                "state": breaker.state,
+                "consecutive_failures": breaker.failures,
+                "times_opened": breaker.times_opened,
+                "rejected": breaker.rejected,
+                "samples": len(window),
+                "p50_seconds": round(p50, 3) if p50 is not None else None,
+                "p90_seconds": round(p90, 3) if p90 is not None else None,
+                "p99_seconds": round(p99, 3) if p99 is not None else None,
+                "timeout_seconds": round(self.timeout_for(upstream, self.settings.external_api_timeout), 3),
+            }
+        return stats
+
+
+_health: Optional[UpstreamHealth] = None
+
+
+def get_upstream_health() -> UpstreamHealth:
+    """Get the per-process upstream health registry."""
+    global _health
+    if _health is None:
+        _health = UpstreamHealth()
+    return _health
@@ -6,7 +6,7 @@ to retrieve metadata for publications by DOI and other identifiers.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import quote
 
 from requests.exceptions import RequestException
@@ -329,12 +329,19 @@ class CrossRefClient:
             logger.error(f"Could not retrieve work types from CrossRef: {e}")
             return []
 
-    def get_references(self, doi: str) -> List[Dict[str, Any]]:
+    def get_references(
+        self,
+        doi: str,
+        doi_resolver: Optional[Callable[[List[str]], Dict[str, Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         获取论文的参考文献列表
 
         Args:
             doi: 论文的DOI
+            doi_resolver: 可选的批量DOI补全函数，接收DOI列表，返回
+                {小写DOI: 补全数据}（格式同 _enhance_reference_with_doi）。
+                提供时只有DOI的参考文献一次性批量补全，未命中的再逐个查询CrossRef
 
         Returns:
             List[Dict]: 参考文献列表，每个元素包含解析后的参考文献信息
@@ -356,11 +363,26 @@ class CrossRefClient:
 
             logger.info(f"找到 {len(references)} 个参考文献")
 
+            # 批量补全只有DOI的参考文献
+            enhanced_by_doi: Dict[str, Dict[str, Any]] = {}
+            if doi_resolver:
+                doi_only = [ref["DOI"] for ref in references if ref.get("DOI") and not ref.get("article-title")]
+                if doi_only:
+                    try:
+                        enhanced_by_doi = doi_resolver(doi_only)
+                        logger.info(f"批量补全DOI参考文献: {len(enhanced_by_doi)}/{len(doi_only)}")
+                    except Exception as e:
+                        logger.warning(f"批量补全DOI参考文献失败，改为逐个补全: {e}")
+
             # 处理每个参考文献
             processed_refs = []
             for i, ref in enumerate(references):
                 try:
-                    processed_ref = self._process_reference(ref, i + 1)
+                    processed_ref = self._process_reference(
+                        ref,
+                        i + 1,
+                        enhanced_data=enhanced_by_doi.get(str(ref.get("DOI", "")).lower()),
+                    )
                     if processed_ref:
                         processed_refs.append(processed_ref)
                 except Exception as e:
@@ -405,13 +427,19 @@ class CrossRefClient:
             logger.error(f"获取CrossRef work数据失败: {e}")
             return None
 
-    def _process_reference(self, ref: Dict[str, Any], ref_number: int) -> Optional[Dict[str, Any]]:
+    def _process_reference(
+        self,
+        ref: Dict[str, Any],
+        ref_number: int,
+        enhanced_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
         处理单个参考文献
 
         Args:
             ref: CrossRef原始参考文献数据
             ref_number: 参考文献编号
+            enhanced_data: 已批量获取的补全数据（没有时按DOI单独查询）
 
         Returns:
             Dict: 处理后的参考文献数据，如果质量不合格返回None
@@ -428,7 +456,8 @@ class CrossRefClient:
             doi = ref["DOI"]
             logger.debug(f"参考文献 {ref_number} 只有DOI，尝试补全: {doi}")
 
-            enhanced_data = self._enhance_reference_with_doi(doi)
+            if not (enhanced_data and enhanced_data.get("title")):
+                enhanced_data = self._enhance_reference_with_doi(doi)
             if enhanced_data and enhanced_data.get("title"):
                 logger.debug(f"参考文献 {ref_number} DOI补全成功")
                 # 合并原始数据和补全数据
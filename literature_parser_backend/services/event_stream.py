@@ -0,0 +1,125 @@
+"""
+Sequenced Event Stream.
+
+A Redis stream whose entries carry a gap-free sequence number, used to keep
+per-process in-memory replicas (the known identifier filter, the citation
+graph cache) in sync with writes made by other processes.
+
+Each entry is assigned ``seq = INCR(seq_key)`` atomically with its XADD, so a
+reader that sees a sequence jump knows entries were trimmed before it read
+them and its replica is incomplete.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Atomically assign a sequence number and append to the stream, so readers can
+# detect gaps caused by trimming.
+_PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[2])
+redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[2], '*', 'seq', seq, 'payload', ARGV[1])
+return seq
+"""
+
+
+class StreamGapError(Exception):
+    """Raised when entries were trimmed before the reader consumed them."""
+
+
+class SequencedStream:
+    """Append-only Redis stream with gap detection."""
+
+    def __init__(
+        self,
+        stream_key: str,
+        seq_key: str,
+        maxlen: int,
+        redis_client=None,
+        settings: Optional[Settings] = None,
+    ):
+        """
+        Initialize the stream handle.
+
+        Args:
+            stream_key: Redis key of the stream
+            seq_key: Redis key of the sequence counter
+            maxlen: Approximate maximum stream length
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.stream_key = stream_key
+        self.seq_key = seq_key
+        self.maxlen = maxlen
+        self.settings = settings or Settings()
+        self._redis = redis_client
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    def position(self) -> Tuple[str, int]:
+        """
+        Current end of the stream.
+
+        Capture this before building a replica from the database, then
+        replay from it afterwards so concurrent writes are not lost.
+
+        Returns:
+            (last entry ID, last sequence number)
+        """
+        latest = self.redis.xrevrange(self.stream_key, count=1)
+        seq = int(self.redis.get(self.seq_key) or 0)
+        last_id = latest[0][0] if latest else "0-0"
+        return last_id, seq
+
+    def publish(self, payload: str) -> int:
+        """
+        Append an entry.
+
+        Args:
+            payload: Serialized event
+
+        Returns:
+            Sequence number assigned to the entry
+        """
+        return int(self.redis.eval(
+            _PUBLISH_SCRIPT, 2, self.stream_key, self.seq_key, payload, self.maxlen
+        ))
+
+    def read_after(self, last_id: str, last_seq: int, count: int) -> List[Tuple[str, int, str]]:
+        """
+        Read entries after a position.
+
+        Args:
+            last_id: Last entry ID consumed
+            last_seq: Last sequence number consumed
+            count: Maximum number of entries
+
+        Returns:
+            (entry ID, sequence number, payload) tuples in order
+
+        Raises:
+            StreamGapError: If an entry between ``last_seq`` and the first
+                returned entry was trimmed
+        """
+        response = self.redis.xread({self.stream_key: last_id}, count=count)
+        if not response:
+            return []
+
+        entries = []
+        expected = last_seq
+        for entry_id, fields in response[0][1]:
+            seq = int(fields.get("seq", 0))
+            if seq > expected + 1:
+                raise StreamGapError(f"{self.stream_key}: sequence gap {expected} -> {seq}")
+            expected = max(expected, seq)
+            entries.append((entry_id, seq, fields.get("payload", "")))
+        return entries
@@ -0,0 +1,247 @@
+"""
+Citation Graph Analytics Service.
+
+Graph-level signals over the Literature→Literature ``CITES`` graph, computed
+offline on sparse matrices instead of on demand in Cypher:
+
+- PageRank (power iteration, dangling mass redistributed uniformly)
+- in-degree and PageRank percentiles over all literature
+- co-citation top-k: papers most often cited together with a paper (AᵀA)
+- bibliographic-coupling top-k: papers sharing the most references (AAᵀ)
+
+NumPy and SciPy are optional dependencies; they are only needed by the
+analytics job, not by the API or ingestion workers.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.stats import rankdata
+except ImportError:  # pragma: no cover - exercised only without the extras
+    np = None
+    sparse = None
+    rankdata = None
+
+logger = logging.getLogger(__name__)
+
+EdgeTuple = Tuple[str, str, Optional[float], Optional[str]]
+
+
+def analytics_available() -> bool:
+    """Whether NumPy and SciPy are installed."""
+    return np is not None and sparse is not None
+
+
+def build_adjacency(
+    lids: Sequence[str],
+    edges: Iterable[EdgeTuple],
+    min_confidence: float = 0.0,
+):
+    """
+    Build the citation adjacency matrix.
+
+    Args:
+        lids: All literature LIDs (nodes without edges included)
+        edges: (from_lid, to_lid, confidence, source) tuples
+        min_confidence: Edges below this confidence are ignored; edges without
+            a confidence are kept only when this is 0
+
+    Returns:
+        Tuple of (LID list, CSR matrix with ``A[i, j] = 1`` if i cites j)
+    """
+    lids = list(dict.fromkeys(lids))
+    index = {lid: i for i, lid in enumerate(lids)}
+
+    rows: List[int] = []
+    cols: List[int] = []
+    for from_lid, to_lid, confidence, _ in edges:
+        if from_lid == to_lid:
+            continue
+        if min_confidence > 0 and (confidence is None or confidence < min_confidence):
+            continue
+        for lid in (from_lid, to_lid):
+            if lid not in index:
+                index[lid] = len(lids)
+                lids.append(lid)
+        rows.append(index[from_lid])
+        cols.append(index[to_lid])
+
+    n = len(lids)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (rows, cols)), shape=(n, n)
+    )
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    return lids, matrix
+
+
+def pagerank(adjacency, damping: float = 0.85, tol: float = 1e-10, max_iter: int = 100):
+    """
+    PageRank by power iteration.
+
+    Args:
+        adjacency: CSR adjacency matrix (row cites column)
+        damping: Damping factor
+        tol: L1 convergence tolerance
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Scores summing to 1
+    """
+    n = adjacency.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    out_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inverse_out = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    incoming = adjacency.T.tocsr()
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = incoming @ (scores * inverse_out)
+        updated = damping * spread + (damping * scores[dangling].sum() + 1.0 - damping) / n
+        converged = np.abs(updated - scores).sum() < tol
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def percentile_ranks(values) -> Any:
+    """
+    Percentile of each value: share of other nodes strictly below it (0-100).
+
+    Ties share the lowest rank, so the many uncited papers all get 0 rather
+    than a misleadingly high percentile.
+    """
+    n = len(values)
+    if n == 0:
+        return np.zeros(0)
+    if n == 1:
+        return np.zeros(1)
+    return (rankdata(values, method="min") - 1) / (n - 1) * 100.0
+
+
+def top_k_shared(left, right, k: int, min_count: int = 1, block_size: int = 2048) -> List[List[Tuple[int, int]]]:
+    """
+    Top-k entries per row of ``left @ right``, excluding the diagonal.
+
+    The product is computed in row blocks so a hub paper never materializes
+    the full (possibly dense) similarity matrix.
+
+    Args:
+        left: CSR matrix (n × m)
+        right: CSR matrix (m × n)
+        k: Entries kept per row
+        min_count: Minimum shared count
+        block_size: Rows multiplied per block
+
+    Returns:
+        For each row, (column index, shared count) pairs, highest count first
+        (ties broken by column index)
+    """
+    n = left.shape[0]
+    result: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    if k <= 0:
+        return result
+
+    for start in range(0, n, block_size):
+        block = (left[start:start + block_size] @ right).tocsr()
+        for offset in range(block.shape[0]):
+            row = start + offset
+            lo, hi = block.indptr[offset], block.indptr[offset + 1]
+            columns = block.indices[lo:hi]
+            counts = block.data[lo:hi]
+            keep = (columns != row) & (counts >= min_count)
+            columns, counts = columns[keep], counts[keep]
+            if not len(columns):
+                continue
+            order = np.lexsort((columns, -counts))[:k]
+            result[row] = [(int(columns[i]), int(counts[i])) for i in order]
+    return result
+
+
+def compute_graph_analytics(
+    lids: Sequence[str],
+    edges: Iterable[EdgeTuple],
+    top_k: int = 10,
+    min_confidence: float = 0.0,
+    damping: float = 0.85,
+) -> Dict[str, Any]:
+    """
+    Compute all graph signals.
+
+    Args:
+        lids: All literature LIDs
+        edges: (from_lid, to_lid, confidence, source) tuples
+        top_k: Co-citation / coupling neighbours kept per paper
+        min_confidence: Minimum edge confidence
+        damping: PageRank damping factor
+
+    Returns:
+        Dict of per-node arrays aligned with ``lids``: ``pagerank``,
+        ``pagerank_percentile``, ``in_degree``, ``in_degree_percentile``,
+        ``out_degree``, ``co_cited`` and ``coupled`` ((lid, count) lists)
+
+    Raises:
+        RuntimeError: If NumPy/SciPy are not installed
+    """
+    if not analytics_available():
+        raise RuntimeError("Graph analytics requires numpy and scipy")
+
+    lids, adjacency = build_adjacency(lids, edges, min_confidence)
+    incoming = adjacency.T.tocsr()
+
+    scores = pagerank(adjacency, damping=damping)
+    in_degree = np.asarray(adjacency.sum(axis=0)).ravel().astype(int)
+    out_degree = np.asarray(adjacency.sum(axis=1)).ravel().astype(int)
+
+    def named(pairs: List[List[Tuple[int, int]]]) -> List[List[Tuple[str, int]]]:
+        return [[(lids[j], count) for j, count in row] for row in pairs]
+
+    return {
+        "lids": lids,
+        "pagerank": scores,
+        "pagerank_percentile": percentile_ranks(scores),
+        "in_degree": in_degree,
+        "in_degree_percentile": percentile_ranks(in_degree),
+        "out_degree": out_degree,
+        # AᵀA: papers cited by the same citing papers
+        "co_cited": named(top_k_shared(incoming, adjacency, top_k)),
+        # AAᵀ: papers citing the same references
+        "coupled": named(top_k_shared(adjacency, incoming, top_k)),
+    }
+
+
+def iter_node_properties(analytics: Dict[str, Any], computed_at: str) -> Iterator[Dict[str, Any]]:
+    """
+    Flatten analytics into Neo4j node properties.
+
+    Args:
+        analytics: Result of ``compute_graph_analytics``
+        computed_at: Run timestamp (ISO format)
+
+    Yields:
+        ``{"lid": ..., "props": {...}}`` dicts with ``graph_*`` properties
+    """
+    for i, lid in enumerate(analytics["lids"]):
+        co_cited = analytics["co_cited"][i]
+        coupled = analytics["coupled"][i]
+        yield {
+            "lid": lid,
+            "props": {
+                "graph_pagerank": float(analytics["pagerank"][i]),
+                "graph_pagerank_percentile": round(float(analytics["pagerank_percentile"][i]), 2),
+                "graph_in_degree": int(analytics["in_degree"][i]),
+                "graph_in_degree_percentile": round(float(analytics["in_degree_percentile"][i]), 2),
+                "graph_co_cited_lids": [other for other, _ in co_cited],
+                "graph_co_cited_counts": [count for _, count in co_cited],
+                "graph_coupled_lids": [other for other, _ in coupled],
+                "graph_coupled_counts": [count for _, count in coupled],
+                "graph_analytics_at": computed_at,
+            },
+        }
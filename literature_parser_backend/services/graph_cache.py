@@ -0,0 +1,345 @@
+"""
+Citation Graph Cache Service.
+
+An in-process copy of the Literature→Literature ``CITES`` graph in CSR form
+(see ``utils.csr_graph``), so k-hop neighborhood queries run as an in-memory
+BFS instead of Cypher variable-length path enumeration, which explodes
+combinatorially around hub papers.
+
+Lifecycle:
+- ``load`` bulk-exports all edges once (API startup), and again every
+  ``graph_cache_reload_interval`` seconds in the background
+- writes in any process call ``record_edges`` / ``record_detached``, which
+  append the change to a Redis stream
+- before each query, every process (the writer included) applies pending
+  stream entries, in order, to an overlay on top of the immutable CSR
+  arrays; a large overlay triggers an early reload
+
+If the stream was trimmed past our position or Redis is unreachable, the
+cache reports itself not ready and callers fall back to Cypher until the
+background reload completes. Placeholder (:Unresolved) nodes are not cached.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..settings import Settings
+from ..utils.csr_graph import CSRGraph, EdgeTuple
+from .event_stream import SequencedStream, StreamGapError
+
+logger = logging.getLogger(__name__)
+
+EdgeKey = Tuple[str, str]
+
+
+class CitationGraphCache:
+    """CSR citation graph with an incremental overlay, synced via a Redis stream."""
+
+    STREAM_KEY = "graph:cites:stream"
+    SEQ_KEY = "graph:cites:seq"
+    SYNC_BATCH = 1000
+    RELOAD_COOLDOWN = 60
+
+    def __init__(self, redis_client=None, settings: Optional[Settings] = None):
+        """
+        Initialize an empty (not ready) cache.
+
+        Args:
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.graph_cache_enabled
+        self.stream = SequencedStream(
+            self.STREAM_KEY,
+            self.SEQ_KEY,
+            self.settings.graph_cache_stream_maxlen,
+            redis_client=redis_client,
+            settings=self.settings,
+        )
+        self._graph: Optional[CSRGraph] = None
+        self._reset_overlay()
+        self._ready = False
+        self._loading = False
+        self._reload_task: Optional[asyncio.Task] = None
+        self._last_load_attempt = 0.0
+        self._loaded_at = 0.0
+        self._last_id = "0-0"
+        self._last_seq = 0
+        self._unpublished: List[Dict[str, Any]] = []
+        self.stats = {"queries": 0, "bypassed": 0, "synced": 0, "reloads": 0}
+
+    def _reset_overlay(self) -> None:
+        # Edges added or updated since the CSR snapshot (override the snapshot)
+        self._added: Dict[EdgeKey, Tuple[Optional[float], Optional[str]]] = {}
+        self._added_by_node: Dict[str, Set[EdgeKey]] = {}
+        # Nodes whose snapshot edges were all deleted
+        self._detached: Set[str] = set()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the cache reflects every committed edge change."""
+        return self.enabled and self._ready and self._graph is not None
+
+    @property
+    def overlay_size(self) -> int:
+        return len(self._added) + len(self._detached)
+
+    # ========== Loading ==========
+
+    async def load(self, driver) -> bool:
+        """
+        Build the CSR snapshot from a bulk export of all CITES edges.
+
+        The stream position is captured before exporting, so changes made
+        while loading are replayed afterwards.
+
+        Args:
+            driver: Neo4j driver
+
+        Returns:
+            True if the cache is ready
+        """
+        if not self.enabled or self._loading:
+            return self.ready
+
+        self._loading = True
+        self._last_load_attempt = time.monotonic()
+        try:
+            last_id, last_seq = self.stream.position()
+
+            edges: List[EdgeTuple] = []
+            async with driver.session() as session:
+                result = await session.run(
+                    """
+                    MATCH (a:Literature)-[r:CITES]->(b:Literature)
+                    RETURN a.lid AS from_lid, b.lid AS to_lid,
+                           r.confidence AS confidence, r.source AS source
+                    """
+                )
+                async for record in result:
+                    edges.append((
+                        record["from_lid"], record["to_lid"], record["confidence"], record["source"]
+                    ))
+
+            graph = CSRGraph(edges)
+
+            self._graph = graph
+            self._reset_overlay()
+            self._last_id, self._last_seq = last_id, last_seq
+            self._loaded_at = time.monotonic()
+            self._ready = True
+            self.stats["reloads"] += 1
+            self._sync()
+
+            logger.info(
+                f"Citation graph cache loaded: {graph.node_count} nodes, {graph.edge_count} edges"
+            )
+            return self.ready
+
+        except Exception as e:
+            logger.warning(f"Failed to load citation graph cache: {e}")
+            self._ready = False
+            return False
+        finally:
+            self._loading = False
+
+    def _schedule_reload(self, driver) -> None:
+        """Reload in the background, serving the current snapshot (or Cypher) meanwhile."""
+        if driver is None or self._loading or (self._reload_task and not self._reload_task.done()):
+            return
+        if time.monotonic() - self._last_load_attempt < self.RELOAD_COOLDOWN:
+            return
+        try:
+            self._reload_task = asyncio.get_running_loop().create_task(self.load(driver))
+        except RuntimeError:
+            pass
+
+    def _ensure_ready(self, driver) -> bool:
+        if not self.enabled:
+            return False
+        if not self.ready:
+            self._schedule_reload(driver)
+            return False
+        if (
+            time.monotonic() - self._loaded_at >= self.settings.graph_cache_reload_interval
+            or self.overlay_size >= self.settings.graph_cache_overlay_limit
+        ):
+            self._schedule_reload(driver)
+        return self._sync()
+
+    # ========== Incremental Updates ==========
+
+    def _sync(self) -> bool:
+        """
+        Apply pending edge changes from the stream.
+
+        Returns:
+            False if the cache can no longer be trusted
+        """
+        try:
+            while True:
+                entries = self.stream.read_after(self._last_id, self._last_seq, self.SYNC_BATCH)
+                for entry_id, seq, payload in entries:
+                    self._apply(json.loads(payload or "{}"))
+                    self._last_id = entry_id
+                    self._last_seq = max(self._last_seq, seq)
+                    self.stats["synced"] += 1
+
+                if len(entries) < self.SYNC_BATCH:
+                    return True
+
+        except StreamGapError as e:
+            logger.warning(f"Citation graph cache disabled until reload: {e}")
+            self._ready = False
+            return False
+        except Exception as e:
+            logger.debug(f"Citation graph cache sync failed: {e}")
+            return False
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        if self._graph is None:
+            return
+
+        for from_lid, to_lid, confidence, source in event.get("added", []):
+            key = (from_lid, to_lid)
+            self._added[key] = (confidence, source)
+            self._added_by_node.setdefault(from_lid, set()).add(key)
+            self._added_by_node.setdefault(to_lid, set()).add(key)
+
+        for lid in event.get("detached", []):
+            self._detached.add(lid)
+            for key in self._added_by_node.pop(lid, set()):
+                self._added.pop(key, None)
+                other = key[1] if key[0] == lid else key[0]
+                self._added_by_node.get(other, set()).discard(key)
+
+    def record_edges(self, edges: Iterable[EdgeTuple]) -> None:
+        """
+        Record created or updated Literature→Literature edges.
+
+        Args:
+            edges: (from_lid, to_lid, confidence, source) tuples
+        """
+        edges = [list(edge) for edge in edges if edge[0] and edge[1]]
+        if edges:
+            self._record({"added": edges})
+
+    def record_detached(self, lids: Iterable[str]) -> None:
+        """
+        Record that every edge touching these nodes was deleted.
+
+        Args:
+            lids: Deleted (or fully disconnected) literature LIDs
+        """
+        lids = [lid for lid in lids if lid]
+        if lids:
+            self._record({"detached": lids})
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        # Events that failed to publish earlier are retried with this one
+        pending = self._unpublished + [event]
+        try:
+            for item in pending:
+                self.stream.publish(json.dumps(item, ensure_ascii=False))
+            self._unpublished = []
+        except Exception as e:
+            # Readers cannot sync while Redis is down either, so they bypass
+            # their caches; retry on the next write.
+            logger.error(f"Failed to publish citation graph change: {e}")
+            self._unpublished = pending[-self.SYNC_BATCH:]
+
+    # ========== Query ==========
+
+    def _incident(self, lid: str, min_confidence: float) -> Iterator[Tuple[str, EdgeTuple]]:
+        """Edges touching a node (both directions), with the overlay applied."""
+        graph = self._graph
+        index = graph.index_of(lid) if lid not in self._detached else None
+        if index is not None:
+            for _, edge_id in graph.incident_edges(index, min_confidence):
+                edge = graph.edge(edge_id)
+                key = (edge[0], edge[1])
+                if key in self._added:
+                    continue
+                other = edge[1] if edge[0] == lid else edge[0]
+                if other in self._detached:
+                    continue
+                yield other, edge
+
+        for key in self._added_by_node.get(lid, ()):
+            confidence, source = self._added[key]
+            if confidence is not None and confidence >= min_confidence:
+                yield (key[1] if key[0] == lid else key[0]), (key[0], key[1], confidence, source)
+
+    async def k_hop(
+        self,
+        center_lids: List[str],
+        max_depth: int,
+        min_confidence: float,
+        max_nodes: Optional[int] = None,
+        driver=None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Undirected k-hop neighborhood with confidence pruning.
+
+        Returns every edge with confidence >= ``min_confidence`` that lies on
+        a path of at most ``max_depth`` hops from a center, i.e. the edges
+        ``MATCH (center)-[:CITES*1..max_depth]-(x)`` with an
+        ``ALL(rel.confidence >= min)`` filter would return.
+
+        Args:
+            center_lids: Center literature LIDs
+            max_depth: Maximum number of hops
+            min_confidence: Minimum edge confidence
+            max_nodes: Stop expanding once this many nodes were reached
+            driver: Neo4j driver used to (re)load the cache in the background
+
+        Returns:
+            Dict with ``distances`` (lid -> hops), ``edges`` (tuples) and
+            ``truncated``, or None if the cache is not ready
+        """
+        if not self._ensure_ready(driver):
+            self.stats["bypassed"] += 1
+            return None
+
+        self.stats["queries"] += 1
+        max_nodes = max_nodes or self.settings.graph_cache_max_nodes
+        distances: Dict[str, int] = {lid: 0 for lid in center_lids}
+        edges: Dict[EdgeKey, EdgeTuple] = {}
+        truncated = False
+
+        frontier = list(distances)
+        for depth in range(max_depth):
+            next_frontier = []
+            for lid in frontier:
+                for other, edge in self._incident(lid, min_confidence):
+                    if other not in distances:
+                        if len(distances) >= max_nodes:
+                            truncated = True
+                            continue
+                        distances[other] = depth + 1
+                        next_frontier.append(other)
+                    edges[(edge[0], edge[1])] = edge
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        return {"distances": distances, "edges": list(edges.values()), "truncated": truncated}
+
+
+# Per-process singleton
+_cache: Optional[CitationGraphCache] = None
+
+
+def get_citation_graph_cache() -> CitationGraphCache:
+    """Get the per-process citation graph cache."""
+    global _cache
+    if _cache is None:
+        _cache = CitationGraphCache()
+    return _cache
@@ -0,0 +1,250 @@
+"""
+Hedged requests for latency-sensitive external calls.
+
+When an idempotent call to an upstream has not answered within the
+upstream's observed p90 latency, a duplicate request is sent and the first
+valid answer wins; the loser is discarded (and its response closed) when it
+finishes. Only about 10% of calls exceed p90, so hedging roughly bounds
+tail latency at the cost of a few percent extra traffic.
+
+Hedging is opt-in per execution context (``hedged_requests()``), used for
+tasks started by interactive endpoints, and capped by a budget: every
+eligible call earns ``hedging_budget_ratio`` tokens and each hedge spends
+one. Counters are kept in Redis so the API can report fleet-wide hedge
+rates.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ..settings import Settings
+from .circuit_breaker import UpstreamHealth, get_upstream_health
+from .upstreams import PROCESSOR_UPSTREAMS
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "hedge:metrics:"
+
+_hedging_active: contextvars.ContextVar[bool] = contextvars.ContextVar("hedging_active", default=False)
+
+
+@contextmanager
+def hedged_requests(active: bool = True) -> Iterator[None]:
+    """
+    Enable hedging for external calls made in this context.
+
+    Worker code that hands sync processors to threads must propagate the
+    context (``asyncio.to_thread`` does).
+    """
+    token = _hedging_active.set(active)
+    try:
+        yield
+    finally:
+        _hedging_active.reset(token)
+
+
+def hedging_active() -> bool:
+    """Whether the current context asked for hedged requests."""
+    return _hedging_active.get()
+
+
+def _is_valid(future) -> bool:
+    if future.exception() is not None:
+        return False
+    return future.result().status_code < 500 and future.result().status_code != 429
+
+
+def _discard(future) -> None:
+    if future.cancel():
+        return
+
+    def close(done):
+        if done.exception() is None:
+            try:
+                done.result().close()
+            except Exception:
+                pass
+
+    future.add_done_callback(close)
+
+
+class RequestHedger:
+    """Sends a duplicate request when the first exceeds the upstream's p90."""
+
+    # Seconds to skip Redis metrics after a Redis failure
+    REDIS_RETRY_INTERVAL = 30
+
+    def __init__(self, health: UpstreamHealth, settings: Optional[Settings] = None, redis_client=None):
+        """
+        Initialize the hedger.
+
+        Args:
+            health: Upstream health registry providing latency percentiles
+            settings: Application settings
+            redis_client: Redis client for metrics (defaults to the shared client)
+        """
+        self.settings = settings or Settings()
+        self.health = health
+        self.enabled = self.settings.hedging_enabled
+        self._redis = redis_client
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._budget: Dict[str, float] = {}
+        self._redis_down_until = 0.0
+        self.local_stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.settings.hedging_max_workers,
+                    thread_name_prefix="hedge",
+                )
+            return self._executor
+
+    def delay_for(self, upstream: Optional[str]) -> Optional[float]:
+        """
+        Time after which a call to ``upstream`` would be hedged.
+
+        Returns:
+            Observed p90 latency (at least ``hedging_min_delay``), or None when
+            hedging is off, inactive in this context, or latency is unknown
+        """
+        if not (self.enabled and upstream and hedging_active()):
+            return None
+        window = self.health.latency(upstream)
+        if len(window) < self.settings.adaptive_timeout_min_samples:
+            return None
+        return max(self.settings.hedging_min_delay, window.percentile(0.9))
+
+    def call(
+        self,
+        upstream: str,
+        delay: float,
+        send: Callable[[], Any],
+        can_send_hedge: Callable[[], bool] = lambda: True,
+    ):
+        """
+        Run ``send`` with a hedge after ``delay`` seconds.
+
+        Args:
+            upstream: Upstream name (budget and metrics key)
+            delay: Seconds to wait for the primary before hedging
+            send: Performs one request and returns the response
+            can_send_hedge: Last-moment check, e.g. a non-blocking rate-limit token
+
+        Returns:
+            The first valid response, or the primary's outcome when neither is valid
+
+        Raises:
+            Exception: The primary's exception when no valid response arrives
+        """
+        self._earn_budget(upstream)
+        primary = self.executor.submit(contextvars.copy_context().run, send)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            self._count(upstream, "requests")
+            return primary.result()
+
+        if not self._spend_budget(upstream):
+            self._count(upstream, "requests", "budget_denied")
+            return primary.result()
+        if not can_send_hedge():
+            self._count(upstream, "requests", "rate_limited")
+            return primary.result()
+
+        self._count(upstream, "requests", "hedged")
+        logger.debug(f"Hedging {upstream} request after {delay:.2f}s")
+        hedge = self.executor.submit(contextvars.copy_context().run, send)
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if _is_valid(future):
+                    if future is hedge:
+                        self._count(upstream, "hedge_wins")
+                    for other in pending:
+                        _discard(other)
+                    return future.result()
+
+        # Neither answer is usable: surface the primary's outcome
+        if hedge.exception() is None:
+            _discard(hedge)
+        return primary.result()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Fleet-wide hedge counters and rates per upstream."""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for upstream in sorted(set(PROCESSOR_UPSTREAMS.values()) | set(self.local_stats)):
+            try:
+                if time.time() < self._redis_down_until:
+                    raise ConnectionError("Redis marked unavailable")
+                raw = {k: int(v) for k, v in self.redis.hgetall(METRICS_PREFIX + upstream).items()}
+            except Exception:
+                raw = self.local_stats.get(upstream, {})
+            requests = raw.get("requests", 0)
+            hedged = raw.get("hedged", 0)
+            stats[upstream] = {
+                "requests": requests,
+                "hedged": hedged,
+                "hedge_wins": raw.get("hedge_wins", 0),
+                "budget_denied": raw.get("budget_denied", 0),
+                "rate_limited": raw.get("rate_limited", 0),
+                "hedge_rate": round(hedged / requests, 4) if requests else 0.0,
+            }
+        return stats
+
+    def _earn_budget(self, upstream: str) -> None:
+        with self._lock:
+            balance = self._budget.get(upstream, self.settings.hedging_budget_burst)
+            self._budget[upstream] = min(
+                self.settings.hedging_budget_burst, balance + self.settings.hedging_budget_ratio
+            )
+
+    def _spend_budget(self, upstream: str) -> bool:
+        with self._lock:
+            if self._budget.get(upstream, 0.0) < 1.0:
+                return False
+            self._budget[upstream] -= 1.0
+            return True
+
+    def _count(self, upstream: str, *fields: str) -> None:
+        stats = self.local_stats.setdefault(upstream, {})
+        for field in fields:
+            stats[field] = stats.get(field, 0) + 1
+        if time.time() < self._redis_down_until:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for field in fields:
+                pipe.hincrby(METRICS_PREFIX + upstream, field, 1)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record hedge metrics, pausing Redis metrics: {e}")
+            self._redis_down_until = time.time() + self.REDIS_RETRY_INTERVAL
+
+
+_hedger: Optional[RequestHedger] = None
+
+
+def get_request_hedger() -> RequestHedger:
+    """Get the per-process request hedger."""
+    global _hedger
+    if _hedger is None:
+        _hedger = RequestHedger(get_upstream_health())
+    return _hedger
@@ -0,0 +1,310 @@
+"""
+Known Identifier Filter Service.
+
+A per-process Bloom filter over every identifier the database knows
+(DOIs, arXiv IDs, normalized titles, title tokens and alias values), so that
+lookups for papers we do not have can skip the Neo4j round trip.
+
+Lifecycle:
+- ``load`` scans Neo4j once (at worker / API startup, or lazily on first use)
+- writes call ``record``, which updates the local filter and appends the new
+  keys to a Redis stream
+- every membership check first applies pending stream entries, so additions
+  made by other processes are visible before a miss is trusted
+
+Safety rules: a Bloom filter has no false negatives, so a "not present"
+answer is only trusted while the filter is known to be complete. If Redis
+is unreachable or the stream was trimmed past our position, the filter
+reports "maybe present" for everything until it is reloaded.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..settings import Settings
+from ..utils.bloom_filter import BloomFilter
+from .event_stream import SequencedStream, StreamGapError
+from ..utils.match_keys import build_match_keys
+
+logger = logging.getLogger(__name__)
+
+def literature_filter_keys(match_keys: Dict[str, Any]) -> List[str]:
+    """
+    Filter keys for a literature, from its precomputed match keys.
+
+    Args:
+        match_keys: Output of ``build_match_keys``
+
+    Returns:
+        Namespaced keys (doi:, arxiv:, title:, tok:)
+    """
+    keys = []
+    if match_keys.get("match_doi"):
+        keys.append(f"doi:{match_keys['match_doi']}")
+    if match_keys.get("match_arxiv_id"):
+        keys.append(f"arxiv:{match_keys['match_arxiv_id']}")
+    if match_keys.get("match_title"):
+        keys.append(f"title:{match_keys['match_title']}")
+    keys.extend(f"tok:{token}" for token in match_keys.get("match_title_tokens") or [])
+    return keys
+
+
+def alias_filter_key(alias_type: str, normalized_value: str) -> str:
+    """Filter key for an alias mapping."""
+    return f"alias:{alias_type}:{normalized_value}"
+
+
+class KnownIdentifierFilter:
+    """Bloom filter of known identifiers, kept in sync through a Redis stream."""
+
+    STREAM_KEY = "known_identifiers:stream"
+    SEQ_KEY = "known_identifiers:seq"
+    SYNC_BATCH = 1000
+    RELOAD_COOLDOWN = 60
+
+    def __init__(self, redis_client=None, settings: Optional[Settings] = None):
+        """
+        Initialize an empty (not ready) filter.
+
+        Args:
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.bloom_filter_enabled
+        self.stream = SequencedStream(
+            self.STREAM_KEY,
+            self.SEQ_KEY,
+            self.settings.bloom_filter_stream_maxlen,
+            redis_client=redis_client,
+            settings=self.settings,
+        )
+        self._filter: Optional[BloomFilter] = None
+        self._ready = False
+        self._loading = False
+        self._last_load_attempt = 0.0
+        self._last_id = "0-0"
+        self._last_seq = 0
+        self._unpublished: List[str] = []
+        self.stats = {"checks": 0, "skipped": 0, "bypassed": 0, "synced": 0}
+
+    @property
+    def ready(self) -> bool:
+        """Whether negative answers can currently be trusted."""
+        return self.enabled and self._ready and self._filter is not None
+
+    # ========== Loading ==========
+
+    async def load(self, driver) -> bool:
+        """
+        Build the filter from Neo4j.
+
+        The stream position is captured before scanning, so writes made while
+        loading are replayed afterwards.
+
+        Args:
+            driver: Neo4j driver
+
+        Returns:
+            True if the filter is ready
+        """
+        if not self.enabled or self._loading:
+            return self.ready
+
+        self._loading = True
+        self._last_load_attempt = time.monotonic()
+        try:
+            last_id, last_seq = self.stream.position()
+
+            keys = set()
+            async with driver.session() as session:
+                result = await session.run(
+                    """
+                    MATCH (lit:Literature)
+                    RETURN lit.match_title AS match_title,
+                           lit.match_title_tokens AS match_title_tokens,
+                           lit.match_doi AS match_doi,
+                           lit.match_arxiv_id AS match_arxiv_id,
+                           CASE WHEN lit.match_title IS NULL THEN lit.metadata END AS metadata,
+                           CASE WHEN lit.match_title IS NULL THEN lit.identifiers END AS identifiers
+                    """
+                )
+                async for record in result:
+                    if record["match_title"] is None:
+                        metadata = _parse_json(record["metadata"])
+                        identifiers = _parse_json(record["identifiers"])
+                        match_keys = build_match_keys(
+                            title=metadata.get("title"),
+                            doi=identifiers.get("doi"),
+                            arxiv_id=identifiers.get("arxiv_id"),
+                        )
+                    else:
+                        match_keys = dict(record)
+                    keys.update(literature_filter_keys(match_keys))
+
+                result = await session.run(
+                    "MATCH (alias:Alias) RETURN alias.alias_type AS alias_type, alias.alias_value AS alias_value"
+                )
+                async for record in result:
+                    if record["alias_type"] and record["alias_value"]:
+                        keys.add(alias_filter_key(record["alias_type"], record["alias_value"]))
+
+            capacity = max(self.settings.bloom_filter_capacity, len(keys) * 2)
+            bloom = BloomFilter(
+                capacity=capacity,
+                error_rate=self.settings.bloom_filter_error_rate,
+                max_bytes=self.settings.bloom_filter_max_memory_mb * 1024 * 1024,
+            )
+            bloom.update(keys)
+
+            self._filter = bloom
+            self._last_id, self._last_seq = last_id, last_seq
+            self._ready = True
+            self._sync()
+
+            logger.info(
+                f"Known identifier filter loaded: {len(keys)} keys, "
+                f"{bloom.size_bytes / 1024 / 1024:.1f} MB, k={bloom.hash_count}, "
+                f"estimated FP rate {bloom.estimated_error_rate():.4f}"
+            )
+            if bloom.estimated_error_rate() > self.settings.bloom_filter_error_rate * 2:
+                logger.warning(
+                    "Known identifier filter exceeds its false-positive target; "
+                    "raise bloom_filter_max_memory_mb"
+                )
+            return self.ready
+
+        except Exception as e:
+            logger.warning(f"Failed to load known identifier filter: {e}")
+            self._ready = False
+            return False
+        finally:
+            self._loading = False
+
+    async def ensure_loaded(self, driver) -> bool:
+        """Load the filter on first use (rate limited after failures)."""
+        if self.ready or not self.enabled or driver is None:
+            return self.ready
+        if time.monotonic() - self._last_load_attempt < self.RELOAD_COOLDOWN:
+            return False
+        return await self.load(driver)
+
+    # ========== Incremental Updates ==========
+
+    def _sync(self) -> bool:
+        """
+        Apply stream entries written by other processes.
+
+        Returns:
+            False if the filter can no longer be trusted
+        """
+        try:
+            while True:
+                entries = self.stream.read_after(self._last_id, self._last_seq, self.SYNC_BATCH)
+                for entry_id, seq, payload in entries:
+                    self._filter.update(json.loads(payload or "[]"))
+                    self._last_id = entry_id
+                    self._last_seq = max(self._last_seq, seq)
+                    self.stats["synced"] += 1
+
+                if len(entries) < self.SYNC_BATCH:
+                    return True
+
+        except StreamGapError as e:
+            logger.warning(f"Known identifier filter disabled until reload: {e}")
+            self._ready = False
+            return False
+        except Exception as e:
+            logger.debug(f"Known identifier filter sync failed: {e}")
+            return False
+
+    def record(self, keys: Iterable[str]) -> None:
+        """
+        Record newly written identifiers locally and for other processes.
+
+        Args:
+            keys: Filter keys (see ``literature_filter_keys`` / ``alias_filter_key``)
+        """
+        keys = [key for key in keys if key]
+        if not self.enabled or not keys:
+            return
+
+        if self._filter is not None:
+            self._filter.update(keys)
+
+        # Keys that failed to publish earlier are retried with this batch
+        keys = self._unpublished + keys
+        try:
+            self.stream.publish(json.dumps(keys, ensure_ascii=False))
+            self._unpublished = []
+        except Exception as e:
+            # Other processes cannot sync while Redis is down either, so they
+            # bypass their filters; retry on the next write.
+            logger.error(f"Failed to publish {len(keys)} known identifiers: {e}")
+            self._unpublished = keys
+
+    # ========== Membership ==========
+
+    async def might_contain(self, key: str, driver=None) -> bool:
+        """
+        Check whether an identifier may exist in the database.
+
+        Args:
+            key: Filter key
+            driver: Neo4j driver used to load the filter on first use
+
+        Returns:
+            False only if the identifier is definitely unknown
+        """
+        return await self.might_contain_any([key], driver)
+
+    async def might_contain_any(self, keys: List[str], driver=None) -> bool:
+        """
+        Check whether any of the identifiers may exist in the database.
+
+        Args:
+            keys: Filter keys
+            driver: Neo4j driver used to load the filter on first use
+
+        Returns:
+            False only if every identifier is definitely unknown
+        """
+        if not self.enabled or not keys:
+            return True
+
+        self.stats["checks"] += 1
+        await self.ensure_loaded(driver)
+
+        if not self.ready or not self._sync():
+            self.stats["bypassed"] += 1
+            return True
+
+        if any(key in self._filter for key in keys):
+            return True
+
+        self.stats["skipped"] += 1
+        return False
+
+
+def _parse_json(value: Optional[str]) -> Dict[str, Any]:
+    if not value:
+        return {}
+    try:
+        parsed = json.loads(value)
+        return parsed if isinstance(parsed, dict) else {}
+    except (TypeError, ValueError):
+        return {}
+
+
+# Per-process singleton
+_filter: Optional[KnownIdentifierFilter] = None
+
+
+def get_known_identifier_filter() -> KnownIdentifierFilter:
+    """Get the per-process known identifier filter."""
+    global _filter
+    if _filter is None:
+        _filter = KnownIdentifierFilter()
+    return _filter
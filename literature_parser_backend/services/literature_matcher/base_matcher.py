@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from ...utils.match_keys import MATCH_KEY_FIELDS, build_match_keys, has_match_keys
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,6 +103,10 @@ class LiteratureMatcher(ABC):
         """
         normalized = {}
         
+        # Keep LID so candidates can be identified in match results
+        if source.get("lid"):
+            normalized["lid"] = source["lid"]
+        
         # Extract title
         normalized["title"] = (
             source.get("title") 
@@ -150,6 +156,29 @@ class LiteratureMatcher(ABC):
             or ""
         ).strip()
         
+        # Attach precomputed match keys (reuse stored keys, compute otherwise)
+        if has_match_keys(source):
+            match_keys = {field: source.get(field) for field in MATCH_KEY_FIELDS}
+        else:
+            match_keys = build_match_keys(
+                title=normalized["title"],
+                authors=normalized["authors"],
+                doi=normalized["doi"],
+                year=normalized["year"],
+                arxiv_id=normalized["arxiv_id"],
+            )
+        match_keys["match_title_tokens"] = match_keys.get("match_title_tokens") or []
+        match_keys["match_author_signatures"] = match_keys.get("match_author_signatures") or []
+        match_keys["match_doi"] = match_keys.get("match_doi") or ""
+        match_keys["match_arxiv_id"] = match_keys.get("match_arxiv_id") or ""
+        normalized.update(match_keys)
+        
+        # Candidates loaded from match keys only carry the normalized identifiers
+        normalized["doi"] = normalized["doi"] or normalized["match_doi"]
+        normalized["arxiv_id"] = normalized["arxiv_id"] or normalized["match_arxiv_id"]
+        if normalized["year"] is None:
+            normalized["year"] = normalized["match_year"]
+        
         return normalized
     
     def _get_match_config(self, match_type: MatchType) -> Dict[str, Any]:
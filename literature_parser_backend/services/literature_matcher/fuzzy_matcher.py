@@ -105,10 +105,15 @@ class FuzzyMatcher(LiteratureMatcher):
             List of candidate literature data
         """
         try:
-            # For now, get all literature (we can optimize this later with pre-filtering)
-            # In a production system, we'd want to pre-filter by DOI, title keywords, etc.
-            
-            if hasattr(self.dao, 'get_all_literature'):
+            # Prefer pre-filtered candidates based on precomputed match keys
+            if hasattr(self.dao, 'get_match_candidates'):
+                candidates = await self.dao.get_match_candidates(
+                    doi=source.get("match_doi", ""),
+                    arxiv_id=source.get("match_arxiv_id", ""),
+                    title_tokens=source.get("match_title_tokens", []),
+                )
+                return [self._normalize_source_data(candidate) for candidate in candidates]
+            elif hasattr(self.dao, 'get_all_literature'):
                 candidates = await self.dao.get_all_literature()
                 return [self._normalize_candidate_data(lit) for lit in candidates]
             else:
@@ -156,6 +156,27 @@ class AuthorStrategy(MatchStrategy):
         max_authors = max(len(source_authors), len(candidate_authors))
         return total_similarity / max_authors if max_authors > 0 else 0.0
     
+    def _compare_signatures(self, source_signatures: Set[str], candidate_signatures: Set[str]) -> float:
+        """
+        Compare two sets of precomputed author signatures.
+        
+        Uses the same matched / max(len) formula as the name-based comparison.
+        
+        Args:
+            source_signatures: Source author signatures
+            candidate_signatures: Candidate author signatures
+            
+        Returns:
+            Author similarity score between 0.0 and 1.0
+        """
+        if not source_signatures and not candidate_signatures:
+            return 1.0
+        if not source_signatures or not candidate_signatures:
+            return 0.0
+        
+        matched = len(source_signatures & candidate_signatures)
+        return matched / max(len(source_signatures), len(candidate_signatures))
+    
     async def calculate_similarity(
         self, 
         source: Dict[str, Any], 
@@ -171,6 +192,13 @@ class AuthorStrategy(MatchStrategy):
         Returns:
             Author similarity score between 0.0 and 1.0
         """
+        # Fast path: compare precomputed author signatures (last name + first initial)
+        if "match_author_signatures" in source and "match_author_signatures" in candidate:
+            return self._compare_signatures(
+                set(source["match_author_signatures"] or []),
+                set(candidate["match_author_signatures"] or []),
+            )
+        
         source_authors = self._extract_author_names(source.get("authors", []))
         candidate_authors = self._extract_author_names(candidate.get("authors", []))
         
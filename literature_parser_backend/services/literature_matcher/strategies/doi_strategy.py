@@ -53,8 +53,9 @@ class DOIStrategy(MatchStrategy):
         Returns:
             1.0 if DOIs match exactly, 0.0 otherwise
         """
-        source_doi = self._normalize_doi(source.get("doi", ""))
-        candidate_doi = self._normalize_doi(candidate.get("doi", ""))
+        # Use precomputed match keys when available
+        source_doi = source.get("match_doi") or self._normalize_doi(source.get("doi", ""))
+        candidate_doi = candidate.get("match_doi") or self._normalize_doi(candidate.get("doi", ""))
         
         # Both must have DOI for comparison
         if not source_doi or not candidate_doi:
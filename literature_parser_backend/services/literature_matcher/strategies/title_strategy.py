@@ -97,6 +97,19 @@ class TitleStrategy(MatchStrategy):
         words1 = self._get_title_words(title1)
         words2 = self._get_title_words(title2)
         
+        return self._calculate_token_jaccard(words1, words2)
+    
+    def _calculate_token_jaccard(self, words1: Set[str], words2: Set[str]) -> float:
+        """
+        Calculate Jaccard similarity between two precomputed word sets.
+        
+        Args:
+            words1: First word set
+            words2: Second word set
+            
+        Returns:
+            Jaccard similarity between 0.0 and 1.0
+        """
         if not words1 and not words2:
             return 1.0
         if not words1 or not words2:
@@ -122,6 +135,17 @@ class TitleStrategy(MatchStrategy):
         Returns:
             Combined similarity score between 0.0 and 1.0
         """
+        # Fast path: both sides carry precomputed match keys
+        if source.get("match_title") and candidate.get("match_title"):
+            source_title = source["match_title"]
+            candidate_title = candidate["match_title"]
+            sequence_sim = self._calculate_sequence_similarity(source_title, candidate_title)
+            jaccard_sim = self._calculate_token_jaccard(
+                set(source.get("match_title_tokens") or []),
+                set(candidate.get("match_title_tokens") or []),
+            )
+            return min((0.6 * sequence_sim) + (0.4 * jaccard_sim), 1.0)
+        
         source_title = self._normalize_title(source.get("title", ""))
         candidate_title = self._normalize_title(candidate.get("title", ""))
         
@@ -26,7 +26,9 @@ class YearStrategy(MatchStrategy):
         Returns:
             Publication year as integer, or 0 if not found
         """
-        year = data.get("year")
+        year = data.get("match_year")
+        if year is None:
+            year = data.get("year")
         
         if year is None:
             return 0
@@ -0,0 +1,360 @@
+"""
+Near-Duplicate Detection Service.
+
+MinHash-LSH over title and author shingles (see ``utils.minhash``), used in
+two ways:
+
+- Online: a per-process index of every literature, queried during ingest
+  deduplication to get near-duplicate candidates in constant time instead of
+  a fuzzy title scan. Candidates are still verified by the existing title and
+  author matching rules, so the index only affects recall, never precision.
+  Literature written by other processes only reaches the index on the next
+  refresh, so ``LiteratureDAO.find_near_duplicates`` still runs the live
+  fulltext query unless the fresh index yields a candidate the caller
+  confirms.
+- Offline: ``find_duplicate_groups`` bands a whole corpus and only compares
+  pairs that share a bucket, giving a roughly O(n) duplicate sweep.
+
+Signatures are persisted on Literature nodes (``match_minhash``) when they
+are written, so building the index only reads integer lists.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from ..settings import Settings
+from ..utils.match_keys import build_match_keys
+from ..utils.minhash import MinHasher, MinHashLSH, record_shingles
+
+logger = logging.getLogger(__name__)
+
+
+# Titles of nodes still being processed; they say nothing about the paper
+PLACEHOLDER_TITLES = ("Processing...", "Unknown Title")
+_PLACEHOLDER_MATCH_TITLES = frozenset(build_match_keys(title=title)["match_title"] for title in PLACEHOLDER_TITLES)
+
+
+@lru_cache(maxsize=4)
+def _get_hasher(num_perm: int) -> MinHasher:
+    return MinHasher(num_perm=num_perm)
+
+
+def signature_for_match_keys(match_keys: Dict[str, Any], num_perm: Optional[int] = None) -> List[int]:
+    """
+    Compute the MinHash signature of a record from its match keys.
+
+    Args:
+        match_keys: Output of ``build_match_keys``
+        num_perm: Signature length (defaults to the configured value)
+
+    Returns:
+        Signature, or an empty list when the record has no title (or only a
+        placeholder title)
+    """
+    if not match_keys.get("match_title") or match_keys["match_title"] in _PLACEHOLDER_MATCH_TITLES:
+        return []
+    num_perm = num_perm or Settings().near_duplicate_num_perm
+    shingles = record_shingles(match_keys["match_title"], match_keys.get("match_author_signatures"))
+    return _get_hasher(num_perm).signature(shingles)
+
+
+class NearDuplicateIndex:
+    """Per-process MinHash-LSH index of all literature."""
+
+    RELOAD_COOLDOWN = 60
+    # Overlap between incremental refreshes, to cover clock skew between writers
+    REFRESH_OVERLAP = 60
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """
+        Initialize an empty (not ready) index.
+
+        Args:
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.near_duplicate_enabled
+        self.num_perm = self.settings.near_duplicate_num_perm
+        self.threshold = self.settings.near_duplicate_threshold
+        self.lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
+        self._ready = False
+        self._loading = False
+        self._last_load_attempt = 0.0
+        self._last_refresh = 0.0
+        self._since = ""
+        self.stats = {"queries": 0, "candidates": 0, "refreshed": 0, "refresh_failures": 0, "removed": 0}
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index covers the whole corpus."""
+        return self.enabled and self._ready
+
+    @property
+    def stale(self) -> bool:
+        """Whether refreshes have been failing, so other processes' writes are missing."""
+        return time.monotonic() - self._last_refresh > 2 * self.settings.near_duplicate_refresh_interval
+
+    # ========== Loading ==========
+
+    async def load(self, driver) -> bool:
+        """
+        Build the index from Neo4j.
+
+        Args:
+            driver: Neo4j driver
+
+        Returns:
+            True if the index is ready
+        """
+        if not self.enabled or self._loading:
+            return self.ready
+
+        self._loading = True
+        self._last_load_attempt = time.monotonic()
+        try:
+            lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm,
+                             params=(self.lsh.bands, self.lsh.rows))
+            started = _now_iso()
+            count = await self._scan(driver, lsh, since=None)
+
+            self.lsh = lsh
+            self._since = started
+            self._last_refresh = time.monotonic()
+            self._ready = True
+            logger.info(
+                f"Near-duplicate index loaded: {count} records, "
+                f"{lsh.bands} bands x {lsh.rows} rows, threshold {self.threshold}"
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to load near-duplicate index: {e}")
+            self._ready = False
+            return False
+        finally:
+            self._loading = False
+
+    async def refresh(self, driver) -> int:
+        """
+        Add literature written by other processes since the last refresh.
+
+        Args:
+            driver: Neo4j driver
+
+        Returns:
+            Number of records (re)indexed
+        """
+        started = _now_iso()
+        try:
+            count = await self._scan(driver, self.lsh, since=_shift_iso(self._since, -self.REFRESH_OVERLAP))
+            self._since = started
+            self._last_refresh = time.monotonic()
+            self.stats["refreshed"] += count
+            return count
+        except Exception as e:
+            self.stats["refresh_failures"] += 1
+            logger.warning(f"Near-duplicate index refresh failed: {e}")
+            return 0
+
+    async def ensure_fresh(self, driver) -> bool:
+        """Load on first use and refresh when the refresh interval has passed."""
+        if not self.enabled or driver is None:
+            return self.ready
+        if not self._ready:
+            if time.monotonic() - self._last_load_attempt < self.RELOAD_COOLDOWN:
+                return False
+            return await self.load(driver)
+        if time.monotonic() - self._last_refresh >= self.settings.near_duplicate_refresh_interval:
+            await self.refresh(driver)
+        return True
+
+    async def _scan(self, driver, lsh: MinHashLSH, since: Optional[str]) -> int:
+        count = 0
+        async with driver.session() as session:
+            where = "WHERE lit.updated_at >= $since" if since else ""
+            result = await session.run(
+                f"""
+                MATCH (lit:Literature)
+                {where}
+                RETURN lit.lid AS lid,
+                       lit.match_minhash AS match_minhash,
+                       lit.match_title AS match_title,
+                       lit.match_author_signatures AS match_author_signatures
+                """,
+                since=since,
+            )
+            async for record in result:
+                signature = record["match_minhash"]
+                if not signature or len(signature) != self.num_perm:
+                    signature = signature_for_match_keys(dict(record), self.num_perm)
+                if record["lid"] and signature:
+                    lsh.insert(record["lid"], signature)
+                    count += 1
+        return count
+
+    # ========== Updates ==========
+
+    def add(self, lid: str, signature: Sequence[int]) -> None:
+        """Index a literature written by this process."""
+        if self.enabled and lid and signature:
+            self.lsh.insert(lid, signature)
+
+    def remove(self, lid: str) -> None:
+        """Drop a deleted or merged literature."""
+        if lid in self.lsh:
+            self.lsh.remove(lid)
+            self.stats["removed"] += 1
+
+    # ========== Query ==========
+
+    async def find_candidates(
+        self,
+        title: Optional[str],
+        authors: Optional[Iterable[Any]] = None,
+        driver=None,
+        limit: int = 10,
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Get near-duplicate candidates for a record.
+
+        Args:
+            title: Raw title
+            authors: Author list (strings, dicts or AuthorModel)
+            driver: Neo4j driver used to load the index on first use
+            limit: Maximum number of candidates
+
+        Returns:
+            (lid, estimated Jaccard) pairs, best first, or None if the index
+            is not ready and the caller should fall back to a database search
+        """
+        if not await self.ensure_fresh(driver):
+            return None
+
+        signature = signature_for_match_keys(build_match_keys(title=title, authors=authors), self.num_perm)
+        if not signature:
+            return []
+
+        candidates = self.lsh.query_ranked(signature)[:limit]
+        self.stats["queries"] += 1
+        self.stats["candidates"] += len(candidates)
+        return candidates
+
+
+def find_duplicate_groups(
+    records: Iterable[Tuple[Hashable, Sequence[int]]],
+    threshold: float = 0.5,
+    num_perm: Optional[int] = None,
+    verify: Optional[Callable[[Hashable, Hashable], bool]] = None,
+) -> List[List[Hashable]]:
+    """
+    Group a corpus into near-duplicate clusters.
+
+    Only pairs sharing an LSH bucket are compared, so the sweep is roughly
+    linear in the corpus size.
+
+    Args:
+        records: (key, signature) pairs
+        threshold: Estimated Jaccard threshold for a candidate pair
+        num_perm: Signature length (defaults to the configured value)
+        verify: Optional exact check applied to each candidate pair
+
+    Returns:
+        Groups with at least two members, each sorted by key
+    """
+    num_perm = num_perm or Settings().near_duplicate_num_perm
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    for key, signature in records:
+        lsh.insert(key, signature)
+
+    parent: Dict[Hashable, Hashable] = {}
+
+    def find(key):
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for key in lsh.keys():
+        for other, _ in lsh.query_ranked(lsh.signature_of(key)):
+            if other == key or find(other) == find(key):
+                continue
+            if verify is None or verify(key, other):
+                parent[find(other)] = find(key)
+
+    groups: Dict[Hashable, List[Hashable]] = {}
+    for key in lsh.keys():
+        groups.setdefault(find(key), []).append(key)
+    return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+def evaluate_pairs(
+    labeled_pairs: Iterable[Dict[str, Any]],
+    threshold: float,
+    num_perm: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Precision/recall of LSH candidate generation on labeled record pairs.
+
+    Args:
+        labeled_pairs: Dicts with ``a`` and ``b`` (each with ``title`` and
+            optional ``authors``) and a boolean ``duplicate`` label
+        threshold: LSH / estimated Jaccard threshold
+        num_perm: Signature length (defaults to the configured value)
+
+    Returns:
+        Dict with tp/fp/fn/tn counts, precision and recall
+    """
+    num_perm = num_perm or Settings().near_duplicate_num_perm
+    counts = {"tp": 0, "fp": 0, "fn": 0, "tn": 0}
+
+    for pair in labeled_pairs:
+        sig_a = signature_for_match_keys(build_match_keys(**_record_fields(pair["a"])), num_perm)
+        sig_b = signature_for_match_keys(build_match_keys(**_record_fields(pair["b"])), num_perm)
+
+        lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        lsh.insert("b", sig_b)
+        predicted = bool(sig_a) and bool(lsh.query_ranked(sig_a))
+
+        if pair["duplicate"]:
+            counts["tp" if predicted else "fn"] += 1
+        else:
+            counts["fp" if predicted else "tn"] += 1
+
+    predicted_positive = counts["tp"] + counts["fp"]
+    actual_positive = counts["tp"] + counts["fn"]
+    return {
+        **counts,
+        "threshold": threshold,
+        "precision": counts["tp"] / predicted_positive if predicted_positive else 1.0,
+        "recall": counts["tp"] / actual_positive if actual_positive else 1.0,
+    }
+
+
+def _record_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {"title": record.get("title"), "authors": record.get("authors")}
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
+def _shift_iso(value: str, seconds: int) -> Optional[str]:
+    if not value:
+        return None
+    return (datetime.fromisoformat(value) + timedelta(seconds=seconds)).isoformat()
+
+
+# Per-process singleton
+_index: Optional[NearDuplicateIndex] = None
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Get the per-process near-duplicate index."""
+    global _index
+    if _index is None:
+        _index = NearDuplicateIndex()
+    return _index
@@ -0,0 +1,322 @@
+"""
+Per-host rate limiting for external APIs.
+
+Each rate-limited upstream (CrossRef, Semantic Scholar, arXiv) has a token
+bucket in Redis shared by every worker process:
+
+- ``acquire`` reserves a token and returns how long the caller must sleep
+  before sending. Reservations may drive the bucket negative, so concurrent
+  callers get consecutive slots instead of racing for the same token.
+- ``block`` records a ``Retry-After`` from a 429/503, pausing the host for
+  all workers rather than only for the one that got throttled.
+
+Wait times and throttles are accumulated in Redis as well, so the API
+process can report metrics for the whole fleet. When Redis is unreachable
+the limiter falls back to an in-process bucket with the same semantics.
+"""
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from requests.exceptions import RequestException
+
+from ..settings import Settings
+from .upstreams import ARXIV, CROSSREF, SEMANTIC_SCHOLAR, upstream_for_url
+
+logger = logging.getLogger(__name__)
+
+BUCKET_PREFIX = "ratelimit:bucket:"
+METRICS_PREFIX = "ratelimit:metrics:"
+
+# KEYS[1]=bucket, KEYS[2]=metrics; ARGV = rate, burst, max_wait
+# Returns the wait in seconds, or -wait when it would exceed max_wait
+# (nothing is reserved in that case).
+ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'blocked_until')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+local blocked_until = tonumber(state[3]) or 0
+
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+end
+if blocked_until > now + wait then
+    wait = blocked_until - now
+end
+if wait > max_wait then
+    redis.call('HINCRBY', KEYS[2], 'rejected', 1)
+    return tostring(-wait)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate + wait) + 60)
+redis.call('HINCRBY', KEYS[2], 'acquired', 1)
+if wait > 0 then
+    redis.call('HINCRBY', KEYS[2], 'waited', 1)
+    redis.call('HINCRBYFLOAT', KEYS[2], 'wait_seconds', wait)
+    local max_seen = tonumber(redis.call('HGET', KEYS[2], 'max_wait_seconds')) or 0
+    if wait > max_seen then
+        redis.call('HSET', KEYS[2], 'max_wait_seconds', wait)
+    end
+end
+return tostring(wait)
+"""
+
+# KEYS[1]=bucket, KEYS[2]=metrics; ARGV = seconds
+BLOCK_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local blocked_until = now + tonumber(ARGV[1])
+local current = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+if blocked_until > current then
+    redis.call('HSET', KEYS[1], 'blocked_until', blocked_until)
+    redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[1])) + 60)
+end
+redis.call('HINCRBY', KEYS[2], 'throttled', 1)
+return tostring(blocked_until - now)
+"""
+
+
+class RateLimitExceeded(RequestException):
+    """Raised when a host cannot be called within the allowed wait."""
+
+    def __init__(self, host: str, wait: float):
+        self.host = host
+        self.wait = wait
+        super().__init__(f"Rate limit for {host} requires waiting {wait:.1f}s")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header (delta seconds or HTTP date).
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class _LocalBucket:
+    """In-process token bucket used while Redis is unavailable."""
+
+    def __init__(self):
+        self.tokens: Optional[float] = None
+        self.ts = 0.0
+        self.blocked_until = 0.0
+
+
+class HostRateLimiter:
+    """Redis token buckets per upstream host, shared by all workers."""
+
+    # Seconds to use the local bucket after a Redis failure before retrying Redis
+    REDIS_RETRY_INTERVAL = 30
+
+    def __init__(self, settings: Optional[Settings] = None, redis_client=None):
+        """
+        Initialize the limiter from settings.
+
+        Args:
+            settings: Application settings
+            redis_client: Redis client (defaults to the shared client)
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.rate_limit_enabled
+        self.max_wait = self.settings.rate_limit_max_wait
+        self._redis = redis_client
+        self._acquire_script = None
+        self._block_script = None
+        self._lock = threading.Lock()
+        self._redis_down_until = 0.0
+        self._local: Dict[str, _LocalBucket] = {}
+        self.local_stats: Dict[str, Dict[str, float]] = {}
+
+        s2_rate = (
+            self.settings.rate_limit_semantic_scholar_key_rps
+            if self.settings.semantic_scholar_api_key
+            else self.settings.rate_limit_semantic_scholar_rps
+        )
+        # name -> (rate per second, burst)
+        self.limits: Dict[str, Tuple[float, float]] = {
+            CROSSREF: (self.settings.rate_limit_crossref_rps, self.settings.rate_limit_crossref_burst),
+            SEMANTIC_SCHOLAR: (s2_rate, 1.0),
+            ARXIV: (1.0 / self.settings.rate_limit_arxiv_interval, 1.0),
+        }
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    def limit_for_url(self, url: str) -> Optional[str]:
+        """
+        Name of the rate limit governing a URL.
+
+        Returns:
+            Limit name, or None if the host is not rate-limited
+        """
+        name = upstream_for_url(url)
+        return name if name in self.limits else None
+
+    def acquire(self, name: str, max_wait: Optional[float] = None) -> float:
+        """
+        Wait until a request to ``name`` may be sent.
+
+        Args:
+            name: Limit name (see ``limit_for_url``)
+            max_wait: Longest acceptable wait (defaults to ``rate_limit_max_wait``)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed ``max_wait``
+        """
+        if not self.enabled or name not in self.limits:
+            return 0.0
+        max_wait = self.max_wait if max_wait is None else max_wait
+        rate, burst = self.limits[name]
+
+        wait = self._reserve(name, rate, burst, max_wait)
+        if wait < 0:
+            raise RateLimitExceeded(name, -wait)
+        if wait > 0:
+            logger.debug(f"Rate limit {name}: waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def block(self, name: str, seconds: float) -> None:
+        """
+        Pause a host for every worker, e.g. after a 429 with ``Retry-After``.
+
+        Args:
+            name: Limit name
+            seconds: Pause duration
+        """
+        if name not in self.limits or seconds <= 0:
+            return
+        logger.warning(f"Rate limit {name}: upstream asked to back off for {seconds:.1f}s")
+        try:
+            if time.time() < self._redis_down_until:
+                raise ConnectionError("Redis marked unavailable")
+            if self._block_script is None:
+                self._block_script = self.redis.register_script(BLOCK_SCRIPT)
+            self._block_script(keys=[BUCKET_PREFIX + name, METRICS_PREFIX + name], args=[seconds])
+        except Exception as e:
+            self._mark_redis_down(e)
+            with self._lock:
+                bucket = self._local.setdefault(name, _LocalBucket())
+                bucket.blocked_until = max(bucket.blocked_until, time.time() + seconds)
+                self._count(name, "throttled", 1)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fleet-wide limiter metrics per upstream (falls back to this process's).
+
+        Returns:
+            Per-limit dict with rate, acquired/waited/rejected/throttled counts,
+            total and average wait seconds and the largest single wait
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for name, (rate, burst) in self.limits.items():
+            try:
+                if time.time() < self._redis_down_until:
+                    raise ConnectionError("Redis marked unavailable")
+                raw = self.redis.hgetall(METRICS_PREFIX + name)
+            except Exception:
+                raw = self.local_stats.get(name, {})
+            acquired = int(float(raw.get("acquired", 0)))
+            waited = int(float(raw.get("waited", 0)))
+            wait_seconds = float(raw.get("wait_seconds", 0.0))
+            stats[name] = {
+                "rate_per_second": rate,
+                "burst": burst,
+                "acquired": acquired,
+                "waited": waited,
+                "rejected": int(float(raw.get("rejected", 0))),
+                "throttled": int(float(raw.get("throttled", 0))),
+                "wait_seconds": round(wait_seconds, 3),
+                "avg_wait_seconds": round(wait_seconds / acquired, 3) if acquired else 0.0,
+                "max_wait_seconds": round(float(raw.get("max_wait_seconds", 0.0)), 3),
+            }
+        return stats
+
+    def _reserve(self, name: str, rate: float, burst: float, max_wait: float) -> float:
+        try:
+            if time.time() < self._redis_down_until:
+                raise ConnectionError("Redis marked unavailable")
+            if self._acquire_script is None:
+                self._acquire_script = self.redis.register_script(ACQUIRE_SCRIPT)
+            return float(self._acquire_script(
+                keys=[BUCKET_PREFIX + name, METRICS_PREFIX + name],
+                args=[rate, burst, max_wait],
+            ))
+        except Exception as e:
+            self._mark_redis_down(e)
+            return self._reserve_local(name, rate, burst, max_wait)
+
+    def _mark_redis_down(self, error: Exception) -> None:
+        if time.time() >= self._redis_down_until:
+            logger.warning(f"Rate limiter Redis unavailable, using local buckets: {error}")
+            self._redis_down_until = time.time() + self.REDIS_RETRY_INTERVAL
+
+    def _reserve_local(self, name: str, rate: float, burst: float, max_wait: float) -> float:
+        with self._lock:
+            bucket = self._local.setdefault(name, _LocalBucket())
+            now = time.time()
+            tokens = burst if bucket.tokens is None else bucket.tokens
+            tokens = min(burst, tokens + max(0.0, now - bucket.ts) * rate)
+
+            wait = (1 - tokens) / rate if tokens < 1 else 0.0
+            wait = max(wait, bucket.blocked_until - now)
+            if wait > max_wait:
+                bucket.tokens, bucket.ts = tokens, now
+                self._count(name, "rejected", 1)
+                return -wait
+
+            bucket.tokens, bucket.ts = tokens - 1, now
+            self._count(name, "acquired", 1)
+            if wait > 0:
+                self._count(name, "waited", 1)
+                self._count(name, "wait_seconds", wait)
+                stats = self.local_stats[name]
+                stats["max_wait_seconds"] = max(stats.get("max_wait_seconds", 0.0), wait)
+            return wait
+
+    def _count(self, name: str, field: str, amount: float) -> None:
+        stats = self.local_stats.setdefault(name, {})
+        stats[field] = stats.get(field, 0) + amount
+
+
+_limiter: Optional[HostRateLimiter] = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Get the per-process host rate limiter."""
+    global _limiter
+    if _limiter is None:
+        _limiter = HostRateLimiter()
+    return _limiter
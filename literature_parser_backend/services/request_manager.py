@@ -17,6 +17,10 @@ from requests.exceptions import RequestException, Timeout
 from urllib3.util.retry import Retry
 
 from ..settings import Settings
+from .circuit_breaker import get_upstream_health
+from .hedging import get_request_hedger
+from .rate_limiter import RateLimitExceeded, get_rate_limiter, parse_retry_after
+from .upstreams import upstream_for_url
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,10 @@ class ExternalRequestManager:
     - Separate sessions for internal and external requests
     - Automatic proxy configuration for external requests
     - Unified retry, timeout, and error handling
+    - Per-host rate limiting of external APIs shared across workers, with
+      ``Retry-After`` on 429 honored by every worker
+    - Per-upstream circuit breakers and latency-percentile read timeouts
+    - Optional hedging of slow GETs for interactive work (see ``services.hedging``)
     - Request monitoring and logging
     """
 
@@ -49,6 +57,9 @@ class ExternalRequestManager:
         self.settings = settings or Settings()
         self.internal_session = requests.Session()
         self.external_session = requests.Session()
+        self.rate_limiter = get_rate_limiter()
+        self.upstream_health = get_upstream_health()
+        self.hedger = get_request_hedger()
         self._configure_sessions()
 
         logger.info("ExternalRequestManager initialized")
@@ -66,6 +77,15 @@ class ExternalRequestManager:
         # Create HTTP adapter with retry strategy
         adapter = HTTPAdapter(max_retries=retry_strategy)
 
+        # 429 on external requests is handled in request() so that Retry-After
+        # pauses the host in the shared rate limiter instead of one session
+        external_adapter = HTTPAdapter(max_retries=Retry(
+            total=self.settings.external_api_max_retries,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
+        ))
+
         # Configure internal session (no proxy)
         self.internal_session.proxies = {"http": "", "https": ""}
         self.internal_session.mount("http://", adapter)
@@ -93,8 +113,8 @@ class ExternalRequestManager:
             else:
                 logger.info("External session configured without proxy")
 
-        self.external_session.mount("http://", adapter)
-        self.external_session.mount("https://", adapter)
+        self.external_session.mount("http://", external_adapter)
+        self.external_session.mount("https://", external_adapter)
 
         # Set common headers
         common_headers = {
@@ -143,20 +163,55 @@ class ExternalRequestManager:
 
         Raises:
             RequestException: If request fails after retries
+            CircuitOpenError: If the upstream's circuit is open
         """
         session = self.get_session(request_type)
         request_timeout = timeout or self.settings.external_api_timeout
+        upstream = upstream_for_url(url) if request_type == RequestType.EXTERNAL else None
+        rate_limit = self.rate_limiter.limit_for_url(url) if upstream else None
+
+        if upstream:
+            self.upstream_health.before_call(upstream)
+            if isinstance(request_timeout, (int, float)):
+                request_timeout = self.upstream_health.timeout_for(upstream, request_timeout)
 
         start_time = time.time()
 
         try:
             logger.debug(f"Making {request_type.value} {method} request to {url}")
-            response = session.request(
-                method=method,
-                url=url,
-                timeout=request_timeout,
-                **kwargs,
-            )
+            hedge_delay = self.hedger.delay_for(upstream) if method.upper() == "GET" else None
+            attempt = 0
+            while True:
+                if rate_limit:
+                    self.rate_limiter.acquire(rate_limit)
+                if hedge_delay is None:
+                    response = self._send(session, method, url, request_timeout, upstream, **kwargs)
+                else:
+                    response = self.hedger.call(
+                        upstream,
+                        hedge_delay,
+                        lambda: self._send(session, method, url, request_timeout, upstream, **kwargs),
+                        can_send_hedge=lambda: self._try_acquire_now(rate_limit),
+                    )
+                if (
+                    response.status_code != 429
+                    or request_type != RequestType.EXTERNAL
+                    or attempt >= self.settings.external_api_max_retries
+                ):
+                    break
+
+                attempt += 1
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = float(2 ** attempt)
+                logger.warning(f"{method} {url} -> 429, retry {attempt} after {delay:.1f}s")
+                if rate_limit:
+                    # The next acquire() waits out the block (or fails fast)
+                    self.rate_limiter.block(rate_limit, delay)
+                elif delay <= self.settings.rate_limit_max_wait:
+                    time.sleep(delay)
+                else:
+                    break
 
             elapsed_time = time.time() - start_time
             logger.debug(
@@ -183,6 +238,45 @@ class ExternalRequestManager:
             )
             raise
 
+    def _try_acquire_now(self, rate_limit: Optional[str]) -> bool:
+        """Take a rate-limit token only if one is available without waiting."""
+        if not rate_limit:
+            return True
+        try:
+            self.rate_limiter.acquire(rate_limit, max_wait=0)
+            return True
+        except RateLimitExceeded:
+            return False
+
+    def _send(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        timeout: Any,
+        upstream: Optional[str],
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send one request and record its outcome for the upstream's breaker."""
+        call_start = time.time()
+        try:
+            response = session.request(method=method, url=url, timeout=timeout, **kwargs)
+        except Timeout:
+            if upstream:
+                self.upstream_health.record_failure(upstream, timed_out_after=time.time() - call_start)
+            raise
+        except Exception:
+            if upstream:
+                self.upstream_health.record_failure(upstream)
+            raise
+
+        if upstream:
+            if response.status_code >= 500:
+                self.upstream_health.record_failure(upstream)
+            else:
+                self.upstream_health.record_success(upstream, time.time() - call_start)
+        return response
+
     def get(
         self,
         url: str,
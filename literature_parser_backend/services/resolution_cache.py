@@ -0,0 +1,342 @@
+"""
+Reference Resolution Cache Service.
+
+Caches the outcome of citation resolution across tasks so that the same
+reference (very common for highly cited papers) is fuzzy-matched only once.
+
+Two tiers:
+- Redis (shared by all workers): reference key -> resolution, with TTLs
+- Per-worker LRU: short-lived copy of Redis entries to skip the round trip
+
+Reference keys are built from precomputed match keys:
+- ``doi:{normalized_doi}`` when the reference has a DOI
+- ``title:{normalized_title}:{year}`` otherwise
+
+Entries are either positive (resolved to a Literature LID) or negative
+(unresolved, pointing at the placeholder LID). Negative entries are
+invalidated when a literature that could satisfy them is written, and
+entries pointing at a LID are invalidated when that LID is upgraded or
+deleted.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from ..settings import Settings
+from ..utils.match_keys import build_match_keys
+
+logger = logging.getLogger(__name__)
+
+RESOLVED = "resolved"
+UNRESOLVED = "unresolved"
+
+
+class LocalLRUCache:
+    """Thread-safe LRU cache with per-entry expiry."""
+
+    def __init__(self, max_size: int = 10000, ttl: int = 300):
+        """
+        Initialize the LRU cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Entry lifetime in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (ttl or self.ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate) -> int:
+        """Remove all entries whose value matches the predicate."""
+        with self._lock:
+            keys = [key for key, (value, _) in self._data.items() if predicate(value)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ReferenceResolutionCache:
+    """Two-tier cache mapping normalized reference keys to resolutions."""
+
+    KEY_PREFIX = "refcache:"
+    LID_INDEX_PREFIX = "refcache:lid:"
+    # Seconds to stop using Redis after an error, so an outage does not add
+    # a socket timeout to every lookup
+    REDIS_BACKOFF = 30
+
+    def __init__(
+        self,
+        redis_client=None,
+        settings: Optional[Settings] = None,
+        use_redis: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+            use_redis: Set to False to run with the local tier only
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.reference_cache_enabled
+        self.positive_ttl = self.settings.reference_cache_ttl
+        self.negative_ttl = self.settings.reference_cache_negative_ttl
+        self.local = LocalLRUCache(
+            max_size=self.settings.reference_cache_local_size,
+            ttl=self.settings.reference_cache_local_ttl,
+        )
+
+        self._redis = redis_client
+        self._use_redis = use_redis
+        self._redis_retry_at = 0.0
+        self.stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "errors": 0}
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client (None while backing off)."""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None and self._use_redis:
+            try:
+                from ..db.redis_client import get_redis_client
+                self._redis = get_redis_client(self.settings)
+            except Exception as e:
+                logger.warning(f"Reference cache running without Redis: {e}")
+                self._use_redis = False
+        return self._redis
+
+    def _redis_failed(self) -> None:
+        """Record a Redis error and back off for a while."""
+        self.stats["errors"] += 1
+        self._redis_retry_at = time.monotonic() + self.REDIS_BACKOFF
+
+    # ========== Key Construction ==========
+
+    @staticmethod
+    def reference_key(parsed_reference: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the cache key for a parsed reference.
+
+        Args:
+            parsed_reference: Parsed reference data (title/doi/year/...)
+
+        Returns:
+            Cache key, or None if the reference carries no usable identity
+        """
+        if not parsed_reference:
+            return None
+
+        keys = build_match_keys(
+            title=parsed_reference.get("title"),
+            doi=parsed_reference.get("doi"),
+            year=parsed_reference.get("year"),
+        )
+        return ReferenceResolutionCache.key_from_match_keys(keys)
+
+    @staticmethod
+    def key_from_match_keys(match_keys: Dict[str, Any]) -> Optional[str]:
+        """Build the cache key from precomputed match keys."""
+        if match_keys.get("match_doi"):
+            return f"doi:{match_keys['match_doi']}"
+        if match_keys.get("match_title"):
+            return f"title:{match_keys['match_title']}:{match_keys.get('match_year') or ''}"
+        return None
+
+    @staticmethod
+    def keys_for_target(match_keys: Dict[str, Any]) -> List[str]:
+        """
+        All reference keys a literature with these match keys could satisfy.
+
+        References often carry a year that is off by one (preprint vs.
+        proceedings), or no year at all, so neighbouring years are included.
+        """
+        keys = []
+        if match_keys.get("match_doi"):
+            keys.append(f"doi:{match_keys['match_doi']}")
+
+        title = match_keys.get("match_title")
+        if title:
+            keys.append(f"title:{title}:")
+            year = match_keys.get("match_year")
+            if year:
+                keys.extend(f"title:{title}:{y}" for y in (year - 1, year, year + 1))
+        return keys
+
+    # ========== Lookup / Store ==========
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached resolution.
+
+        Args:
+            key: Reference key from ``reference_key``
+
+        Returns:
+            Dict with ``status`` (resolved/unresolved), ``lid`` and
+            ``confidence``, or None on a miss
+        """
+        if not self.enabled or not key:
+            return None
+
+        value = self.local.get(key)
+        if value is not None:
+            self.stats["local_hits"] += 1
+            return value
+
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(self.KEY_PREFIX + key)
+                if raw:
+                    value = json.loads(raw)
+                    self.local.set(key, value)
+                    self.stats["redis_hits"] += 1
+                    return value
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"Reference cache lookup failed for {key}: {e}")
+
+        self.stats["misses"] += 1
+        return None
+
+    def set_resolved(self, key: Optional[str], lid: str, confidence: float) -> None:
+        """Cache a positive resolution."""
+        self._store(key, {"status": RESOLVED, "lid": lid, "confidence": confidence}, self.positive_ttl)
+
+    def set_unresolved(self, key: Optional[str], placeholder_lid: Optional[str]) -> None:
+        """Cache a negative resolution pointing at its placeholder."""
+        self._store(key, {"status": UNRESOLVED, "lid": placeholder_lid, "confidence": 0.0}, self.negative_ttl)
+
+    def _store(self, key: Optional[str], value: Dict[str, Any], ttl: int) -> None:
+        if not self.enabled or not key:
+            return
+
+        self.local.set(key, value)
+
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline()
+                pipe.set(self.KEY_PREFIX + key, json.dumps(value), ex=ttl)
+                if value.get("lid"):
+                    index_key = self.LID_INDEX_PREFIX + value["lid"]
+                    pipe.sadd(index_key, key)
+                    pipe.expire(index_key, max(self.positive_ttl, self.negative_ttl))
+                pipe.execute()
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"Reference cache store failed for {key}: {e}")
+
+    # ========== Invalidation ==========
+
+    def invalidate_for_target(self, match_keys: Dict[str, Any]) -> int:
+        """
+        Drop negative entries a newly written literature could now satisfy.
+
+        Args:
+            match_keys: Match keys of the new/updated literature
+
+        Returns:
+            Number of keys invalidated
+        """
+        if not self.enabled:
+            return 0
+
+        keys = self.keys_for_target(match_keys)
+        if not keys:
+            return 0
+
+        for key in keys:
+            self.local.delete(key)
+
+        if self.redis is not None:
+            try:
+                self.redis.delete(*[self.KEY_PREFIX + key for key in keys])
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"Reference cache invalidation failed: {e}")
+
+        return len(keys)
+
+    def invalidate_lid(self, lid: str) -> int:
+        """
+        Drop every entry that resolves to the given LID.
+
+        Used when a placeholder is upgraded or a literature is deleted.
+
+        Args:
+            lid: Literature or placeholder LID
+
+        Returns:
+            Number of keys invalidated
+        """
+        if not self.enabled or not lid:
+            return 0
+
+        removed = self.local.delete_where(lambda value: value.get("lid") == lid)
+
+        if self.redis is not None:
+            try:
+                index_key = self.LID_INDEX_PREFIX + lid
+                keys = self.redis.smembers(index_key)
+                if keys:
+                    self.redis.delete(*[self.KEY_PREFIX + key for key in keys])
+                self.redis.delete(index_key)
+                removed = max(removed, len(keys))
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"Reference cache invalidation failed for {lid}: {e}")
+
+        return removed
+
+
+# Per-process singleton
+_cache: Optional[ReferenceResolutionCache] = None
+
+
+def get_reference_cache() -> ReferenceResolutionCache:
+    """Get the per-process reference resolution cache."""
+    global _cache
+    if _cache is None:
+        _cache = ReferenceResolutionCache()
+    return _cache
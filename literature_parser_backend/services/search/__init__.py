@@ -0,0 +1,95 @@
+"""
+文献检索服务模块
+
+在标题/作者/摘要/期刊等原生字段上提供带字段权重、年份与期刊过滤、
+游标（keyset）分页的全文检索。后端可插拔:
+
+- neo4j: 基于 Literature 节点原生属性上的 ``literature_search`` 全文索引（默认）
+- elasticsearch: 使用 ``es_*`` 配置的外部索引，由DAO写入时同步
+- memory: 进程内实现，用于测试与本地开发
+
+使用示例:
+    from literature_parser_backend.services.search import SearchQuery, get_search_backend
+
+    page = await get_search_backend().search(SearchQuery(text="attention"), driver=driver)
+    next_page = await get_search_backend().search(
+        SearchQuery(text="attention", cursor=page.next_cursor), driver=driver
+    )
+"""
+
+import logging
+from typing import Optional
+
+from ...settings import Settings
+from .base import (
+    InvalidCursorError,
+    SearchBackend,
+    SearchDocument,
+    SearchHit,
+    SearchPage,
+    SearchQuery,
+    build_search_document,
+    search_node_properties,
+    tokenize_query,
+)
+from .memory_backend import InMemorySearchBackend
+from .neo4j_backend import Neo4jSearchBackend, build_lucene_query
+
+logger = logging.getLogger(__name__)
+
+_backend: Optional[SearchBackend] = None
+
+
+def create_search_backend(name: str, settings: Optional[Settings] = None) -> SearchBackend:
+    """
+    Create a search backend by name.
+
+    Args:
+        name: ``neo4j``, ``elasticsearch`` or ``memory``
+        settings: Application settings
+
+    Returns:
+        Search backend
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name == "neo4j":
+        return Neo4jSearchBackend()
+    if name == "memory":
+        return InMemorySearchBackend()
+    if name == "elasticsearch":
+        from .elasticsearch_backend import ElasticsearchSearchBackend
+        return ElasticsearchSearchBackend(settings)
+    raise ValueError(f"Unknown search backend: {name}")
+
+
+def get_search_backend() -> SearchBackend:
+    """Get the per-process search backend selected by ``search_backend``."""
+    global _backend
+    if _backend is None:
+        settings = Settings()
+        try:
+            _backend = create_search_backend(settings.search_backend, settings)
+        except Exception as e:
+            logger.error(f"Search backend '{settings.search_backend}' unavailable, using neo4j: {e}")
+            _backend = Neo4jSearchBackend()
+    return _backend
+
+
+__all__ = [
+    "InvalidCursorError",
+    "SearchBackend",
+    "SearchDocument",
+    "SearchHit",
+    "SearchPage",
+    "SearchQuery",
+    "InMemorySearchBackend",
+    "Neo4jSearchBackend",
+    "build_lucene_query",
+    "build_search_document",
+    "create_search_backend",
+    "get_search_backend",
+    "search_node_properties",
+    "tokenize_query",
+]
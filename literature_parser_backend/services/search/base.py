@@ -0,0 +1,233 @@
+"""
+Search backend interface and shared helpers.
+
+Documents are flat records built from literature metadata (title, author
+names, abstract, venue, year). Every backend ranks hits by ``score`` desc
+then ``lid`` asc, which makes ``(score, lid)`` of the last hit a stable
+keyset cursor for the next page.
+"""
+
+import base64
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ...utils.match_keys import normalize_year
+
+# Relative weight of each field in the ranking
+FIELD_BOOSTS: Dict[str, float] = {
+    "title": 3.0,
+    "authors": 2.0,
+    "venue": 1.0,
+    "abstract": 1.0,
+}
+
+MAX_QUERY_TERMS = 32
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class SearchDocument:
+    """Flat searchable representation of one literature."""
+
+    lid: str
+    title: str = ""
+    authors: List[str] = field(default_factory=list)
+    abstract: str = ""
+    venue: str = ""
+    year: Optional[int] = None
+
+
+@dataclass
+class SearchQuery:
+    """Search request: free text, filters and page position."""
+
+    text: str
+    limit: int = 20
+    cursor: Optional[str] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    venue: Optional[str] = None
+
+
+@dataclass
+class SearchHit:
+    """One ranked result."""
+
+    lid: str
+    score: float
+    title: str = ""
+    authors: List[str] = field(default_factory=list)
+    year: Optional[int] = None
+    venue: str = ""
+
+
+@dataclass
+class SearchPage:
+    """A page of results plus the cursor of the next page (None on the last)."""
+
+    hits: List[SearchHit]
+    next_cursor: Optional[str] = None
+
+
+class SearchBackend(ABC):
+    """Pluggable full-text search backend."""
+
+    name = "base"
+
+    @abstractmethod
+    async def search(self, query: SearchQuery, driver: Any = None) -> SearchPage:
+        """
+        Run a search.
+
+        Args:
+            query: Search request
+            driver: Neo4j driver, for backends that read the graph directly
+
+        Returns:
+            One page of hits
+
+        Raises:
+            InvalidCursorError: If ``query.cursor`` is malformed
+        """
+
+    async def index_documents(self, documents: List[SearchDocument]) -> int:
+        """
+        Add or replace documents. Backends that read the native node
+        properties directly have nothing to do here.
+
+        Returns:
+            Number of documents indexed
+        """
+        return 0
+
+    async def delete_document(self, lid: str) -> None:
+        """Remove a document."""
+        return None
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        return None
+
+
+def _author_names(authors: Any) -> List[str]:
+    if not authors or isinstance(authors, str):
+        return [authors] if isinstance(authors, str) and authors else []
+    names = []
+    for author in authors:
+        if isinstance(author, str):
+            name = author
+        elif isinstance(author, dict):
+            name = author.get("name") or author.get("full_name") or ""
+        else:
+            name = getattr(author, "name", "") or ""
+        name = name.strip()
+        if name:
+            names.append(name)
+    return names
+
+
+def build_search_document(lid: str, metadata: Any) -> SearchDocument:
+    """
+    Build the search document of a literature.
+
+    Args:
+        lid: Literature ID
+        metadata: ``MetadataModel`` or its dict form
+
+    Returns:
+        Search document
+    """
+    if metadata is None:
+        return SearchDocument(lid=lid)
+    if not isinstance(metadata, dict):
+        metadata = metadata.model_dump() if hasattr(metadata, "model_dump") else {}
+    return SearchDocument(
+        lid=lid,
+        title=(metadata.get("title") or "").strip(),
+        authors=_author_names(metadata.get("authors")),
+        abstract=(metadata.get("abstract") or "").strip(),
+        venue=(metadata.get("journal") or "").strip(),
+        year=normalize_year(metadata.get("year")),
+    )
+
+
+def normalize_venue(venue: Optional[str]) -> str:
+    """Lowercase a venue and collapse whitespace, for substring filtering."""
+    return " ".join((venue or "").lower().split())
+
+
+def search_node_properties(document: SearchDocument) -> Dict[str, Any]:
+    """
+    Native Literature node properties backing the ``literature_search`` index.
+
+    The title is indexed through ``display_title``; the year filter reads the
+    existing ``match_year`` key.
+    """
+    return {
+        "search_authors": "; ".join(document.authors),
+        "search_abstract": document.abstract,
+        "search_venue": document.venue,
+        "search_venue_key": normalize_venue(document.venue),
+    }
+
+
+def tokenize_query(text: str) -> List[str]:
+    """
+    Split free text into lowercase word terms.
+
+    Everything that is not a word character is dropped, so the terms can be
+    embedded in a Lucene query without escaping and operators such as
+    ``AND``/``OR`` lose their meaning.
+    """
+    terms = _TERM_PATTERN.findall((text or "").lower())
+    return list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+
+
+def encode_cursor(score: float, lid: str) -> str:
+    """Encode the position after a hit as an opaque cursor."""
+    raw = json.dumps([score, lid], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[float, str]]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, lid = json.loads(raw)
+        return float(score), str(lid)
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid search cursor: {cursor}") from e
+
+
+def paginate(hits: Iterable[SearchHit], limit: int) -> SearchPage:
+    """
+    Cut a ranked hit list fetched with ``limit + 1`` rows into a page.
+
+    Args:
+        hits: Hits ordered by score desc, lid asc, at most ``limit + 1``
+        limit: Page size
+
+    Returns:
+        Page with ``next_cursor`` set when more hits exist
+    """
+    hits = list(hits)
+    if len(hits) <= limit:
+        return SearchPage(hits=hits)
+    page = hits[:limit]
+    last = page[-1]
+    return SearchPage(hits=page, next_cursor=encode_cursor(last.score, last.lid))
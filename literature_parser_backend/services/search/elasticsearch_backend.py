@@ -0,0 +1,152 @@
+"""
+Elasticsearch search backend.
+
+Documents live in the ``{es_index_prefix}_literature`` index and are written
+by the DAO alongside the Neo4j node. Pagination uses ``search_after`` on
+``(_score, lid)``, matching the cursor format of the other backends.
+"""
+
+import logging
+from typing import Any, List, Optional
+
+from elasticsearch import AsyncElasticsearch, NotFoundError
+from elasticsearch.helpers import async_bulk
+
+from ...settings import Settings
+from .base import (
+    FIELD_BOOSTS,
+    SearchBackend,
+    SearchDocument,
+    SearchHit,
+    SearchPage,
+    SearchQuery,
+    decode_cursor,
+    normalize_venue,
+    paginate,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAPPINGS = {
+    "properties": {
+        "lid": {"type": "keyword"},
+        "title": {"type": "text"},
+        "authors": {"type": "text"},
+        "abstract": {"type": "text"},
+        "venue": {"type": "text"},
+        "venue_key": {"type": "keyword"},
+        "year": {"type": "integer"},
+    }
+}
+
+
+class ElasticsearchSearchBackend(SearchBackend):
+    """Search backend backed by an Elasticsearch index."""
+
+    name = "elasticsearch"
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """
+        Initialize the client from the ``es_*`` settings.
+
+        Args:
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.index = f"{self.settings.es_index_prefix}_literature"
+        self.client = AsyncElasticsearch(
+            hosts=[f"http://{self.settings.es_host}:{self.settings.es_port}"],
+            basic_auth=(self.settings.es_username, self.settings.es_password),
+        )
+        self._index_ready = False
+
+    async def _ensure_index(self) -> None:
+        if self._index_ready:
+            return
+        if not await self.client.indices.exists(index=self.index):
+            await self.client.indices.create(index=self.index, mappings=INDEX_MAPPINGS)
+            logger.info(f"Created Elasticsearch index {self.index}")
+        self._index_ready = True
+
+    def _source(self, document: SearchDocument) -> dict:
+        return {
+            "lid": document.lid,
+            "title": document.title,
+            "authors": document.authors,
+            "abstract": document.abstract,
+            "venue": document.venue,
+            "venue_key": normalize_venue(document.venue),
+            "year": document.year,
+        }
+
+    async def index_documents(self, documents: List[SearchDocument]) -> int:
+        if not documents:
+            return 0
+        await self._ensure_index()
+        actions = [
+            {"_index": self.index, "_id": document.lid, "_source": self._source(document)}
+            for document in documents
+        ]
+        indexed, _ = await async_bulk(self.client, actions, raise_on_error=False)
+        return indexed
+
+    async def delete_document(self, lid: str) -> None:
+        try:
+            await self.client.delete(index=self.index, id=lid)
+        except NotFoundError:
+            pass
+
+    async def search(self, query: SearchQuery, driver: Any = None) -> SearchPage:
+        after = decode_cursor(query.cursor)
+
+        filters = []
+        if query.year_from is not None or query.year_to is not None:
+            year_range = {}
+            if query.year_from is not None:
+                year_range["gte"] = query.year_from
+            if query.year_to is not None:
+                year_range["lte"] = query.year_to
+            filters.append({"range": {"year": year_range}})
+        venue = normalize_venue(query.venue)
+        if venue:
+            filters.append({"wildcard": {"venue_key": {"value": f"*{venue}*"}}})
+
+        if query.text and query.text.strip():
+            must = {
+                "multi_match": {
+                    "query": query.text,
+                    "fields": [f"{name}^{boost}" for name, boost in FIELD_BOOSTS.items()],
+                }
+            }
+        else:
+            must = {"match_all": {}}
+
+        body = {
+            "query": {"bool": {"must": [must], "filter": filters}},
+            "sort": [{"_score": "desc"}, {"lid": "asc"}],
+            "size": query.limit + 1,
+            "track_scores": True,
+        }
+        if after is not None:
+            body["search_after"] = list(after)
+
+        try:
+            response = await self.client.search(index=self.index, **body)
+        except NotFoundError:
+            return SearchPage(hits=[])
+
+        hits = []
+        for hit in response["hits"]["hits"]:
+            source = hit["_source"]
+            hits.append(SearchHit(
+                lid=source["lid"],
+                score=float(hit["sort"][0]),
+                title=source.get("title") or "",
+                authors=source.get("authors") or [],
+                year=source.get("year"),
+                venue=source.get("venue") or "",
+            ))
+        return paginate(hits, query.limit)
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -0,0 +1,87 @@
+"""
+In-process search backend.
+
+Keeps documents in a dict and scores them by boosted term matches. Meant for
+tests and single-process development; nothing is shared between processes.
+"""
+
+from typing import Any, Dict, List
+
+from .base import (
+    FIELD_BOOSTS,
+    SearchBackend,
+    SearchDocument,
+    SearchHit,
+    SearchPage,
+    SearchQuery,
+    decode_cursor,
+    normalize_venue,
+    paginate,
+    tokenize_query,
+)
+
+
+class InMemorySearchBackend(SearchBackend):
+    """Dict-backed search backend with the same ranking contract as the others."""
+
+    name = "memory"
+
+    def __init__(self):
+        self.documents: Dict[str, SearchDocument] = {}
+        self._terms: Dict[str, Dict[str, set]] = {}
+
+    async def index_documents(self, documents: List[SearchDocument]) -> int:
+        for document in documents:
+            self.documents[document.lid] = document
+            self._terms[document.lid] = {
+                "title": set(tokenize_query(document.title)),
+                "authors": set(tokenize_query(" ".join(document.authors))),
+                "venue": set(tokenize_query(document.venue)),
+                "abstract": set(tokenize_query(document.abstract)),
+            }
+        return len(documents)
+
+    async def delete_document(self, lid: str) -> None:
+        self.documents.pop(lid, None)
+        self._terms.pop(lid, None)
+
+    async def search(self, query: SearchQuery, driver: Any = None) -> SearchPage:
+        after = decode_cursor(query.cursor)
+        terms = tokenize_query(query.text)
+        venue = normalize_venue(query.venue)
+
+        hits = []
+        for lid, document in self.documents.items():
+            if query.year_from is not None and (document.year is None or document.year < query.year_from):
+                continue
+            if query.year_to is not None and (document.year is None or document.year > query.year_to):
+                continue
+            if venue and venue not in normalize_venue(document.venue):
+                continue
+
+            fields = self._terms[lid]
+            score = sum(
+                boost
+                for term in terms
+                for field_name, boost in FIELD_BOOSTS.items()
+                if term in fields[field_name]
+            )
+            if terms and score <= 0:
+                continue
+            hits.append(SearchHit(
+                lid=lid,
+                score=float(score),
+                title=document.title,
+                authors=list(document.authors),
+                year=document.year,
+                venue=document.venue,
+            ))
+
+        hits.sort(key=lambda hit: (-hit.score, hit.lid))
+        if after is not None:
+            after_score, after_lid = after
+            hits = [
+                hit for hit in hits
+                if hit.score < after_score or (hit.score == after_score and hit.lid > after_lid)
+            ]
+        return paginate(hits[:query.limit + 1], query.limit)
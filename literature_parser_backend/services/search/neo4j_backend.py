@@ -0,0 +1,136 @@
+"""
+Neo4j full-text search backend.
+
+Queries the ``literature_search`` full-text index over the native
+``display_title`` / ``search_authors`` / ``search_venue`` /
+``search_abstract`` properties with per-field boosts. Filters and the keyset
+condition are applied to the index hits, so no page ever needs ``SKIP``.
+
+When the query has no usable terms, or the index is missing (e.g. before
+``create_indexes`` has run), a parameterized ``CONTAINS`` scan over
+``match_title`` is used instead, ordered by LID with a constant score.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from ...utils.title_normalization import normalize_title_for_matching
+from .base import (
+    FIELD_BOOSTS,
+    SearchBackend,
+    SearchHit,
+    SearchPage,
+    SearchQuery,
+    decode_cursor,
+    normalize_venue,
+    paginate,
+    tokenize_query,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX = "literature_search"
+
+# Index fields per document field
+INDEX_FIELDS = {
+    "title": "display_title",
+    "authors": "search_authors",
+    "venue": "search_venue",
+    "abstract": "search_abstract",
+}
+
+_FILTERS = """
+      ($year_from IS NULL OR node.match_year >= $year_from)
+  AND ($year_to IS NULL OR node.match_year <= $year_to)
+  AND ($venue IS NULL OR node.search_venue_key CONTAINS $venue)
+"""
+
+_RETURN = """
+RETURN node.lid AS lid, score,
+       node.display_title AS title,
+       node.search_authors AS authors,
+       node.match_year AS year,
+       node.search_venue AS venue
+ORDER BY score DESC, lid ASC
+LIMIT $fetch
+"""
+
+FULLTEXT_QUERY = """
+CALL db.index.fulltext.queryNodes($index, $lucene) YIELD node, score
+WHERE """ + _FILTERS + """
+  AND ($after_score IS NULL OR score < $after_score
+       OR (score = $after_score AND node.lid > $after_lid))
+""" + _RETURN
+
+FALLBACK_QUERY = """
+MATCH (node:Literature)
+WHERE node.lid IS NOT NULL
+  AND ($after_lid IS NULL OR node.lid > $after_lid)
+  AND all(word IN $words WHERE node.match_title CONTAINS word)
+  AND """ + _FILTERS + """
+WITH node, 0.0 AS score
+""" + _RETURN
+
+
+def build_lucene_query(terms: List[str], fields: Optional[Dict[str, float]] = None) -> str:
+    """
+    Build a boosted Lucene query, e.g. ``display_title:(deep learning)^3.0 ...``.
+
+    Args:
+        terms: Word terms from ``tokenize_query`` (no escaping needed)
+        fields: Document field → boost (defaults to ``FIELD_BOOSTS``)
+
+    Returns:
+        Lucene query string, empty when there are no terms
+    """
+    if not terms:
+        return ""
+    fields = fields or FIELD_BOOSTS
+    group = " ".join(terms)
+    return " ".join(f"{INDEX_FIELDS[name]}:({group})^{boost}" for name, boost in fields.items())
+
+
+class Neo4jSearchBackend(SearchBackend):
+    """Search backend reading the native properties of Literature nodes."""
+
+    name = "neo4j"
+
+    async def search(self, query: SearchQuery, driver: Any = None) -> SearchPage:
+        if driver is None:
+            raise ValueError("Neo4jSearchBackend requires a driver")
+
+        after = decode_cursor(query.cursor)
+        params = {
+            "year_from": query.year_from,
+            "year_to": query.year_to,
+            "venue": normalize_venue(query.venue) or None,
+            "fetch": query.limit + 1,
+            "after_score": after[0] if after else None,
+            "after_lid": after[1] if after else None,
+        }
+
+        lucene = build_lucene_query(tokenize_query(query.text))
+        async with driver.session() as session:
+            if lucene:
+                try:
+                    result = await session.run(FULLTEXT_QUERY, index=SEARCH_INDEX, lucene=lucene, **params)
+                    return paginate([self._hit(record) async for record in result], query.limit)
+                except Exception as e:
+                    logger.warning(f"Full-text search failed, using CONTAINS fallback: {e}")
+
+            # The fallback has a constant score, so only the LID part of a
+            # full-text cursor is meaningful here
+            words = tokenize_query(normalize_title_for_matching(query.text))
+            result = await session.run(FALLBACK_QUERY, words=words, **params)
+            return paginate([self._hit(record) async for record in result], query.limit)
+
+    def _hit(self, record) -> SearchHit:
+        authors = record["authors"] or ""
+        return SearchHit(
+            lid=record["lid"],
+            score=float(record["score"]),
+            title=record["title"] or "",
+            authors=[name for name in authors.split("; ") if name],
+            year=record["year"],
+            venue=record["venue"] or "",
+        )
@@ -25,6 +25,38 @@ class SemanticScholarClient:
     including citations, references, and semantic information.
     """
 
+    # Maximum ids per /paper/batch request
+    BATCH_SIZE = 500
+    # Maximum references per page of /paper/{id}/references
+    REFERENCES_PAGE_SIZE = 1000
+
+    # Fields requested for each cited paper
+    REFERENCE_FIELDS = [
+        "paperId",
+        "title",
+        "abstract",
+        "venue",
+        "year",
+        "authors",
+        "externalIds",
+        "url",
+        "citationCount",
+        "isOpenAccess",
+    ]
+
+    # Fields requested for batch lookups (bulk enrichment)
+    BATCH_FIELDS = [
+        "paperId",
+        "title",
+        "venue",
+        "year",
+        "authors",
+        "externalIds",
+        "url",
+        "publicationDate",
+        "citationCount",
+    ]
+
     def __init__(self, settings: Optional[Settings] = None):
         """Initialize Semantic Scholar client with configuration."""
         self.settings = settings or Settings()
@@ -166,20 +198,73 @@ class SemanticScholarClient:
             raise Exception(f"Semantic Scholar API request failed: {e!s}")
         return None
 
+    def get_papers_batch(
+        self,
+        identifiers: List[str],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for many papers with the ``/paper/batch`` endpoint.
+
+        Identifiers are sent in chunks of ``BATCH_SIZE`` (the API maximum),
+        so a few hundred papers cost one request instead of one each.
+
+        Args:
+            identifiers: DOIs, ArXiv IDs or Semantic Scholar paper IDs
+            fields: Fields to return (defaults to ``BATCH_FIELDS``)
+
+        Returns:
+            Mapping of input identifier to parsed paper data; identifiers
+            Semantic Scholar does not know are omitted
+        """
+        url = f"{self.base_url}/graph/v1/paper/batch"
+        params = {"fields": ",".join(fields or self.BATCH_FIELDS)}
+
+        unique_ids = list(dict.fromkeys(i for i in identifiers if i))
+        papers: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(unique_ids), self.BATCH_SIZE):
+            chunk = unique_ids[start:start + self.BATCH_SIZE]
+            clean_ids = [self._clean_and_detect_id(identifier)[0] for identifier in chunk]
+            try:
+                response = self.request_manager.post(
+                    url=url,
+                    request_type=RequestType.EXTERNAL,
+                    params=params,
+                    json={"ids": clean_ids},
+                    timeout=self.timeout,
+                )
+                if response.status_code != 200:
+                    response.raise_for_status()
+                # The response is aligned with the request, null for unknown ids
+                for identifier, paper_data in zip(chunk, response.json()):
+                    if paper_data:
+                        papers[identifier] = self._parse_paper_data(paper_data)
+            except RequestException as e:
+                logger.error(f"Semantic Scholar batch API error for {len(chunk)} papers: {e}")
+                raise
+
+        logger.info(f"Semantic Scholar batch: found {len(papers)}/{len(unique_ids)} papers")
+        return papers
+
     def get_references(
         self,
         identifier: str,
         id_type: str = "auto",
         fields: Optional[List[str]] = None,
-        limit: int = 100,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get references for a paper.
 
+        References are paged with ``offset`` until the API reports no
+        further page, so long reference lists are not truncated.
+
         Args:
             identifier: Paper identifier
             id_type: Type of identifier ('doi', 'arxiv', 'paper_id', 'auto')
-            limit: Maximum number of references to return
+            fields: Fields to return for each cited paper
+            limit: Maximum number of references to return (None for all)
 
         Returns:
             list: List of referenced papers
@@ -194,41 +279,38 @@ class SemanticScholarClient:
         encoded_id = quote(clean_id, safe=":")
         url = f"{self.base_url}/graph/v1/paper/{encoded_id}/references"
 
-        params = {
-            "fields": ",".join(
-                [
-                    "paperId",
-                    "title",
-                    "abstract",
-                    "venue",
-                    "year",
-                    "authors",
-                    "externalIds",
-                    "url",
-                    "citationCount",
-                    "isOpenAccess",
-                ],
-            ),
-            "limit": str(limit),
-        }
+        references: List[Dict[str, Any]] = []
+        offset = 0
 
         try:
-            response = self.request_manager.get(
-                url=url,
-                request_type=RequestType.EXTERNAL,
-                params=params,
-                timeout=self.timeout,
-            )
-            if response.status_code == 200:
+            while limit is None or len(references) < limit:
+                page_size = self.REFERENCES_PAGE_SIZE
+                if limit is not None:
+                    page_size = min(page_size, limit - len(references))
+                params = {
+                    "fields": ",".join(fields or self.REFERENCE_FIELDS),
+                    "offset": str(offset),
+                    "limit": str(page_size),
+                }
+                response = self.request_manager.get(
+                    url=url,
+                    request_type=RequestType.EXTERNAL,
+                    params=params,
+                    timeout=self.timeout,
+                )
+                if response.status_code == 404:
+                    logger.info(f"No references found for paper: {identifier}")
+                    return references
+                if response.status_code != 200:
+                    response.raise_for_status()
                 data = response.json()
-                references = []
 
                 # 检查data字段是否存在且不为None
                 data_list = data.get("data")
                 if data_list is None:
                     # 检查是否有出版商限制的提示信息
-                    citing_info = data.get("citingPaperInfo", {})
-                    open_access_pdf = citing_info.get("openAccessPdf", {})
+                    citing_info = data.get("citingPaperInfo") or {}
+                    open_access_pdf = citing_info.get("openAccessPdf") or {}
                     disclaimer = open_access_pdf.get("disclaimer", "")
 
                     if "elided by the publisher" in disclaimer:
@@ -236,7 +318,7 @@ class SemanticScholarClient:
                         logger.info(f"Publisher restriction details: {disclaimer}")
                     else:
                         logger.warning(f"No references data available for {identifier}")
-                    return []
+                    return references
 
                 # 正常处理references数据
                 for ref_item in data_list:
@@ -245,16 +327,18 @@ class SemanticScholarClient:
                         parsed_ref = self._parse_paper_data(cited_paper)
                         if parsed_ref:
                             references.append(parsed_ref)
-                return references
-            elif response.status_code == 404:
-                logger.info(f"No references found for paper: {identifier}")
-                return []
-            else:
-                response.raise_for_status()
+
+                # The API omits "next" on the last page
+                if data.get("next") is None or not data_list:
+                    break
+                offset = data["next"]
         except RequestException as e:
             logger.error(f"Semantic Scholar API error for {identifier}: {e}")
             raise
-        return []
+
+        if offset:
+            logger.info(f"Fetched {len(references)} references for {identifier} in pages")
+        return references[:limit] if limit is not None else references
 
     def _clean_and_detect_id(self, identifier: str) -> Tuple[str, Optional[str]]:
         """Clean identifier and detect its type."""
@@ -0,0 +1,300 @@
+"""
+Task Status Hub.
+
+Per-process fan-out of task status to SSE and polling clients. Every SSE
+connection used to run its own one-second polling loop, so N clients watching
+the same task issued N status queries per second for data that rarely
+changes. The hub instead tracks each task_id once:
+
+- one tracker per task_id queries the status, and every subscriber of that
+  task receives the result; unchanged statuses are not re-sent
+- the worker publishes a tiny event on ``task_status:<task_id>`` whenever
+  the task's progress changes (``publish_task_status``), and a single
+  background listener per process wakes the matching tracker
+- trackers still refresh every ``task_status_fallback_interval`` seconds in
+  case an event is lost, and poll every ``task_status_poll_interval``
+  seconds while the listener is not connected to Redis
+- a tracker whose status query fails ``task_status_max_failures`` times in
+  a row gives up, and a subscriber that sees no final status within
+  ``task_status_stream_timeout`` seconds stops waiting; in both cases
+  ``subscribe`` raises ``TaskStatusUnavailable`` so the stream can report
+  the error and close instead of waiting forever
+
+The listener uses the synchronous shared Redis client in a daemon thread, in
+line with the rest of the code base (see ``db.redis_client``).
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "task_status:"
+
+
+def publish_task_status(task_id: str, redis_client=None, **fields: Any) -> None:
+    """
+    Notify status subscribers that a task changed.
+
+    Best effort: a lost event only delays subscribers until their next
+    fallback refresh, so errors are logged and swallowed.
+
+    Args:
+        task_id: Celery task ID
+        redis_client: Redis client (defaults to the shared client)
+        **fields: Optional hints included in the event (stage, progress, ...)
+    """
+    if not task_id:
+        return
+    try:
+        if redis_client is None:
+            from ..db.redis_client import get_redis_client
+            redis_client = get_redis_client()
+        redis_client.publish(CHANNEL_PREFIX + task_id, json.dumps({"task_id": task_id, **fields}, default=str))
+    except Exception as e:
+        logger.debug(f"Failed to publish status event for task {task_id}: {e}")
+
+
+class TaskStatusUnavailable(Exception):
+    """Raised to subscribers when a task's status can no longer be followed."""
+
+
+class _TrackedTask:
+    """Subscribers and the latest status of one task."""
+
+    def __init__(self, task_id: str, loop: asyncio.AbstractEventLoop):
+        self.task_id = task_id
+        self.loop = loop
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.status: Any = None
+        self.wake = asyncio.Event()
+        self.runner: Optional[asyncio.Task] = None
+
+
+class TaskStatusHub:
+    """Tracks each task once and fans status changes out to all subscribers."""
+
+    RECONNECT_DELAY = 5.0
+
+    def __init__(
+        self,
+        fetch_status: Callable[[str], Awaitable[Any]],
+        is_final: Callable[[Any], bool],
+        redis_client=None,
+        settings: Optional[Settings] = None,
+    ):
+        """
+        Initialize the hub.
+
+        Args:
+            fetch_status: Coroutine returning the current status of a task
+            is_final: Whether a status is terminal (the stream then ends)
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.fetch_status = fetch_status
+        self.is_final = is_final
+        self.use_events = self.settings.task_status_hub_enabled
+        self.poll_interval = self.settings.task_status_poll_interval
+        self.fallback_interval = self.settings.task_status_fallback_interval
+        self.max_failures = max(1, self.settings.task_status_max_failures)
+        self.stream_timeout = self.settings.task_status_stream_timeout
+
+        self._redis = redis_client
+        self._tracked: Dict[str, _TrackedTask] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._listening = False
+        self._stop = threading.Event()
+        self.stats = {"fetches": 0, "events": 0, "failed": 0}
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    def latest(self, task_id: str) -> Optional[Any]:
+        """
+        Latest status of a task that is currently tracked.
+
+        Tracked tasks are kept current by events, so polling clients can be
+        answered without another status query.
+
+        Args:
+            task_id: Celery task ID
+
+        Returns:
+            The status, or None if the task is not tracked yet
+        """
+        with self._lock:
+            tracked = self._tracked.get(task_id)
+        return tracked.status if tracked else None
+
+    async def subscribe(self, task_id: str) -> AsyncIterator[Any]:
+        """
+        Stream status changes of a task until it reaches a final status.
+
+        The current status is yielded first, then each distinct new status.
+
+        Args:
+            task_id: Celery task ID
+
+        Yields:
+            Task statuses as returned by ``fetch_status``
+
+        Raises:
+            TaskStatusUnavailable: The status query keeps failing, or no final
+                status arrived within ``task_status_stream_timeout``
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        tracked = self._track(task_id, queue)
+        deadline = asyncio.get_running_loop().time() + self.stream_timeout
+        try:
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                try:
+                    status = await asyncio.wait_for(queue.get(), max(remaining, 0))
+                except asyncio.TimeoutError:
+                    raise TaskStatusUnavailable(
+                        f"No final status for task {task_id} within {self.stream_timeout:.0f}s"
+                    ) from None
+                if isinstance(status, TaskStatusUnavailable):
+                    raise status
+                yield status
+                if self.is_final(status):
+                    break
+        finally:
+            self._untrack(tracked, queue)
+
+    def _track(self, task_id: str, queue: asyncio.Queue) -> _TrackedTask:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tracked = self._tracked.get(task_id)
+            if tracked is None or tracked.loop is not loop:
+                tracked = _TrackedTask(task_id, loop)
+                self._tracked[task_id] = tracked
+            tracked.subscribers.add(queue)
+            if tracked.status is not None:
+                queue.put_nowait(tracked.status)
+            if tracked.runner is None:
+                tracked.runner = loop.create_task(self._run(tracked))
+
+        self._ensure_listener()
+        return tracked
+
+    def _untrack(self, tracked: _TrackedTask, queue: asyncio.Queue):
+        with self._lock:
+            tracked.subscribers.discard(queue)
+            if tracked.subscribers:
+                return
+            if self._tracked.get(tracked.task_id) is tracked:
+                del self._tracked[tracked.task_id]
+        if tracked.runner and not tracked.runner.done():
+            tracked.runner.cancel()
+
+    async def _run(self, tracked: _TrackedTask):
+        """Refresh one task's status on events (or timeouts) and fan it out."""
+        failures = 0
+        while True:
+            tracked.wake.clear()
+            try:
+                self.stats["fetches"] += 1
+                status = await self.fetch_status(tracked.task_id)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logger.warning(
+                    f"Status refresh failed for task {tracked.task_id} ({failures}/{self.max_failures}): {e}"
+                )
+                if failures >= self.max_failures:
+                    self._fail(tracked, TaskStatusUnavailable(
+                        f"Status of task {tracked.task_id} unavailable after {failures} failed queries: {e}"
+                    ))
+                    return
+                status = None
+
+            if status is not None and status != tracked.status:
+                tracked.status = status
+                for queue in list(tracked.subscribers):
+                    queue.put_nowait(status)
+            if status is not None and self.is_final(status):
+                return
+
+            timeout = self.fallback_interval if self._listening else self.poll_interval
+            try:
+                await asyncio.wait_for(tracked.wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _fail(self, tracked: _TrackedTask, error: TaskStatusUnavailable):
+        """Pass the error to every subscriber and stop tracking the task."""
+        with self._lock:
+            # A later subscriber starts a fresh tracker instead of joining this one
+            if self._tracked.get(tracked.task_id) is tracked:
+                del self._tracked[tracked.task_id]
+            subscribers = list(tracked.subscribers)
+        self.stats["failed"] += 1
+        for queue in subscribers:
+            queue.put_nowait(error)
+
+    def _ensure_listener(self):
+        if not self.use_events:
+            return
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._stop.clear()
+            self._listener = threading.Thread(target=self._listen, name="task-status-hub", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        """Background thread: wake trackers on ``task_status:*`` events."""
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(CHANNEL_PREFIX + "*")
+                self._listening = True
+                logger.info("Task status hub listening for status events")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "pmessage":
+                        self._on_event(str(message.get("channel", ""))[len(CHANNEL_PREFIX):])
+            except Exception as e:
+                logger.warning(f"Task status hub lost Redis pub/sub, polling instead: {e}")
+            finally:
+                self._listening = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop.wait(self.RECONNECT_DELAY)
+
+    def _on_event(self, task_id: str):
+        with self._lock:
+            tracked = self._tracked.get(task_id)
+        if tracked is None:
+            return
+        self.stats["events"] += 1
+        try:
+            tracked.loop.call_soon_threadsafe(tracked.wake.set)
+        except RuntimeError:
+            # The tracker's event loop has already closed
+            pass
+
+    def close(self):
+        """Stop the listener thread."""
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout=2 * self.RECONNECT_DELAY)
+            self._listener = None
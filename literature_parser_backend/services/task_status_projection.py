@@ -0,0 +1,279 @@
+"""
+Task Status Projection.
+
+A compact status record per task, kept in a Redis hash by the worker so the
+status API can answer with a single ``HGETALL`` instead of combining Celery
+meta with the ``task_info`` of a fully loaded Literature node.
+
+Record fields (all strings in Redis):
+- ``state``: Celery-style state (PROGRESS / SUCCESS / FAILURE)
+- ``stage``, ``progress``: the latest ``update_task_progress`` values
+- ``literature_id``, ``result_type``, ``error``
+- ``components`` (JSON), ``overall_status`` and ``components_literature_id``:
+  component statuses as last written to that Literature node
+- ``url_validation_status``, ``url_validation_error``, ``original_url``
+- ``created_at``, ``updated_at``: ISO timestamps
+
+Writes are coalesced per task: at most one write every
+``task_status_coalesce_interval`` seconds, with a trailing write for the
+latest fields, and final records written immediately. Each write publishes a
+status event (see ``task_status_hub``) so subscribers refresh right away.
+
+Fields are taken from the pending state under a lock, but the Redis round
+trip happens outside it, so a slow or unreachable Redis never blocks other
+tasks' updates. Each task has at most one write in flight: batches are
+numbered per task, and fields updated during a write go out in the next
+batch, so a record never goes back to older values. A failed final write is
+retried ``task_status_final_retries`` times before it is given up.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..settings import Settings
+from .task_status_hub import publish_task_status
+
+logger = logging.getLogger(__name__)
+
+# Fields stored as JSON rather than plain strings
+JSON_FIELDS = ("components", "error")
+
+
+class _PendingWrite:
+    """Fields waiting to be written for one task."""
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.last_write = 0.0
+        self.timer: Optional[threading.Timer] = None
+        self.created = False
+        self.final = False
+        # Number of batches taken for writing, and whether one is in flight
+        self.seq = 0
+        self.writing = False
+        self.final_attempts = 0
+
+
+class _Batch:
+    """Fields taken for one write, with the Redis mapping built from them."""
+
+    def __init__(self, seq: int, fields: Dict[str, Any], mapping: Dict[str, str], created: bool, final: bool):
+        self.seq = seq
+        self.fields = fields
+        self.mapping = mapping
+        self.created = created
+        self.final = final
+
+
+class TaskStatusProjection:
+    """Per-task status records in Redis hashes, with coalesced writes."""
+
+    KEY_PREFIX = "task_status_record:"
+
+    def __init__(self, redis_client=None, settings: Optional[Settings] = None):
+        """
+        Initialize the projection.
+
+        Args:
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.ttl = self.settings.task_status_record_ttl
+        self.coalesce_interval = self.settings.task_status_coalesce_interval
+        self._redis = redis_client
+        self._pending: Dict[str, _PendingWrite] = {}
+        # Guards the pending state only; Redis is never called while it is held
+        self._lock = threading.Lock()
+        self.final_retries = self.settings.task_status_final_retries
+        self.stats = {"updates": 0, "writes": 0, "errors": 0, "dropped": 0}
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    def update(self, task_id: str, final: bool = False, **fields: Any) -> None:
+        """
+        Merge fields into a task's record.
+
+        Args:
+            task_id: Celery task ID
+            final: Write immediately and forget the task's pending state
+                once written
+            **fields: Record fields to set (None values are ignored)
+        """
+        if not task_id:
+            return
+        fields = {key: value for key, value in fields.items() if value is not None}
+
+        with self._lock:
+            self.stats["updates"] += 1
+            entry = self._pending.setdefault(task_id, _PendingWrite())
+            entry.fields.update(fields)
+            entry.final = entry.final or final
+            batch = self._schedule_locked(task_id, entry)
+        self._write(task_id, entry, batch)
+
+    def flush(self, task_id: str) -> None:
+        """Write a task's pending fields now (used by the trailing-write timer)."""
+        with self._lock:
+            entry = self._pending.get(task_id)
+            if entry is None:
+                return
+            entry.timer = None
+            batch = self._take_locked(entry)
+        self._write(task_id, entry, batch)
+
+    def _schedule_locked(self, task_id: str, entry: _PendingWrite) -> Optional[_Batch]:
+        """Take a batch if one is due, otherwise make sure a trailing write is scheduled."""
+        wait = entry.last_write + self.coalesce_interval - time.monotonic()
+        if entry.final or wait <= 0:
+            return self._take_locked(entry)
+        self._start_timer_locked(task_id, entry, wait)
+        return None
+
+    def _start_timer_locked(self, task_id: str, entry: _PendingWrite, wait: float) -> None:
+        if entry.timer is None:
+            entry.timer = threading.Timer(wait, self.flush, args=(task_id,))
+            entry.timer.daemon = True
+            entry.timer.start()
+
+    def _take_locked(self, entry: _PendingWrite) -> Optional[_Batch]:
+        """Move the pending fields into a numbered batch, unless a write is in flight."""
+        if entry.writing or not entry.fields:
+            # The write in flight takes the fields when it finishes
+            return None
+        if entry.timer is not None:
+            entry.timer.cancel()
+            entry.timer = None
+        entry.last_write = time.monotonic()
+        entry.seq += 1
+        entry.writing = True
+
+        fields, entry.fields = entry.fields, {}
+        mapping = {"updated_at": datetime.now().isoformat()}
+        for key, value in fields.items():
+            value = getattr(value, "value", value)
+            mapping[key] = json.dumps(value, default=str) if key in JSON_FIELDS else str(value)
+        return _Batch(entry.seq, fields, mapping, entry.created, entry.final)
+
+    def _write(self, task_id: str, entry: _PendingWrite, batch: Optional[_Batch]) -> None:
+        """Write batches for a task, outside the lock, until none is due."""
+        while batch is not None:
+            ok = self._execute(task_id, batch)
+            with self._lock:
+                batch = self._finish_locked(task_id, entry, batch, ok)
+
+    def _execute(self, task_id: str, batch: _Batch) -> bool:
+        key = self.KEY_PREFIX + task_id
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            if not batch.created:
+                pipe.hsetnx(key, "created_at", batch.mapping["updated_at"])
+            pipe.hset(key, mapping=batch.mapping)
+            pipe.expire(key, self.ttl)
+            publish_task_status(task_id, redis_client=pipe, stage=batch.fields.get("stage"))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to write status record for task {task_id} (batch {batch.seq}): {e}")
+            return False
+
+    def _finish_locked(self, task_id: str, entry: _PendingWrite, batch: _Batch, ok: bool) -> Optional[_Batch]:
+        """Settle a finished write and return the next batch, if one is due."""
+        entry.writing = False
+        if ok:
+            self.stats["writes"] += 1
+            entry.created = True
+            if entry.final and not entry.fields:
+                self._pending.pop(task_id, None)
+                return None
+            return self._schedule_locked(task_id, entry) if entry.fields else None
+
+        self.stats["errors"] += 1
+        # Keep the failed fields for a retry, unless a later update replaced them
+        entry.fields = {**batch.fields, **entry.fields}
+        if not entry.final:
+            # The next update retries them
+            return None
+        if entry.final_attempts >= self.final_retries:
+            logger.warning(f"Giving up on the final status record of task {task_id} after {entry.final_attempts} retries")
+            self.stats["dropped"] += 1
+            self._pending.pop(task_id, None)
+            return None
+        entry.final_attempts += 1
+        self._start_timer_locked(task_id, entry, self.coalesce_interval * 2 ** entry.final_attempts)
+        return None
+
+    def record_final(self, task_id: str, state: Optional[str], retval: Any) -> None:
+        """
+        Write the final record from a Celery task's state and return value.
+
+        Args:
+            task_id: Celery task ID
+            state: Final Celery state (SUCCESS / FAILURE / ...)
+            retval: Task return value, or the exception for failed tasks
+        """
+        fields: Dict[str, Any] = {"state": state or "SUCCESS"}
+        if isinstance(retval, dict):
+            fields["result_type"] = retval.get("result_type")
+            fields["literature_id"] = retval.get("literature_id") or retval.get("lid")
+            fields["error"] = retval.get("error") or retval.get("error_message")
+        elif isinstance(retval, BaseException):
+            fields["error"] = str(retval)
+        elif state == "SUCCESS":
+            fields["state"] = "FAILURE"
+            fields["error"] = f"任务成功，但返回了意外的结果类型: {type(retval).__name__}"
+        self.update(task_id, final=True, **fields)
+
+    def read(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a task's record.
+
+        Args:
+            task_id: Celery task ID
+
+        Returns:
+            Decoded record, or None if there is none (or Redis is unavailable)
+        """
+        try:
+            raw = self.redis.hgetall(self.KEY_PREFIX + task_id)
+        except Exception as e:
+            logger.debug(f"Failed to read status record for task {task_id}: {e}")
+            return None
+        if not raw:
+            return None
+
+        record: Dict[str, Any] = dict(raw)
+        for key in JSON_FIELDS:
+            if key in record:
+                try:
+                    record[key] = json.loads(record[key])
+                except (TypeError, ValueError):
+                    pass
+        if "progress" in record:
+            try:
+                record["progress"] = int(float(record["progress"]))
+            except (TypeError, ValueError):
+                record["progress"] = 0
+        return record
+
+
+# One instance per process
+_projection: Optional[TaskStatusProjection] = None
+
+
+def get_task_status_projection() -> TaskStatusProjection:
+    """Get the process-wide task status projection."""
+    global _projection
+    if _projection is None:
+        _projection = TaskStatusProjection()
+    return _projection
@@ -0,0 +1,47 @@
+"""
+External API upstreams.
+
+Maps request URLs and metadata processors to the upstream they depend on,
+so rate limits, circuit breakers and latency statistics are kept per
+upstream rather than per client class.
+"""
+
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+CROSSREF = "crossref"
+SEMANTIC_SCHOLAR = "semantic_scholar"
+ARXIV = "arxiv"
+
+# Host (or parent domain) -> upstream
+UPSTREAM_HOSTS: Dict[str, str] = {
+    "api.crossref.org": CROSSREF,
+    "api.semanticscholar.org": SEMANTIC_SCHOLAR,
+    "arxiv.org": ARXIV,
+}
+
+# Metadata processor name -> upstream
+PROCESSOR_UPSTREAMS: Dict[str, str] = {
+    "CrossRef": CROSSREF,
+    "Semantic Scholar": SEMANTIC_SCHOLAR,
+    "ArXiv Official API": ARXIV,
+}
+
+
+def upstream_for_url(url: str) -> Optional[str]:
+    """
+    Upstream serving a URL.
+
+    Returns:
+        Upstream name, or None for hosts that are not tracked
+    """
+    host = (urlparse(url).hostname or "").lower()
+    for suffix, name in UPSTREAM_HOSTS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return name
+    return None
+
+
+def upstream_for_processor(processor_name: str) -> Optional[str]:
+    """Upstream a metadata processor depends on (None for local processors)."""
+    return PROCESSOR_UPSTREAMS.get(processor_name)
@@ -4,6 +4,7 @@
 处理未知期刊的备选方案。
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 
@@ -34,8 +35,11 @@ async def generic_doi_extraction_func(url: str, context: Dict[str, Any]) -> Opti
             result.confidence = 0.7  # 中等置信度
             return result
         
-        # 方法2: 尝试页面解析提取DOI
-        fetch_result = PageParser.fetch_page_with_details(url)
+        # 方法2: 尝试页面解析提取DOI（先只读取<head>中的meta标签，未找到再下载完整页面）
+        page_cache = context.get('page_cache')
+        fetch_result = await asyncio.to_thread(PageParser.fetch_page_with_details, url, page_cache=page_cache, head_only=True)
+        if fetch_result.success and fetch_result.truncated and not DOIExtractor.extract_from_content(fetch_result.content):
+            fetch_result = await asyncio.to_thread(PageParser.fetch_page_with_details, url, page_cache=page_cache)
         if fetch_result.success and fetch_result.content:
             doi = DOIExtractor.extract_from_content(fetch_result.content)
             if doi:
@@ -4,6 +4,7 @@ IEEE适配器
 处理IEEE Xplore网站的URL映射。
 """
 
+import asyncio
 import re
 import logging
 from typing import List, Dict, Any, Optional
@@ -35,7 +36,7 @@ async def process_ieee_match(match: re.Match, result: URLMappingResult,
 
 async def ieee_scraping_func(url: str, context: Dict[str, Any]) -> Optional[URLMappingResult]:
     """IEEE页面解析函数 - 提取真实DOI"""
-    return IEEEExtractor.extract_from_page(url)
+    return await asyncio.to_thread(IEEEExtractor.extract_from_page, url, page_cache=context.get('page_cache'))
 
 
 async def ieee_semantic_scholar_func(url: str, context: Dict[str, Any]) -> Optional[URLMappingResult]:
@@ -153,7 +154,7 @@ class IEEEAdapter(URLAdapter):
         
         # 备选方案1: 直接使用IEEE提取器
         try:
-            fallback_result = IEEEExtractor.extract_from_page(url)
+            fallback_result = await asyncio.to_thread(IEEEExtractor.extract_from_page, url)
             if fallback_result and fallback_result.is_successful():
                 fallback_result.source_adapter = self.name
                 fallback_result.strategy_used = "ieee_fallback_extractor"
@@ -6,13 +6,12 @@ NeurIPS适配器
 
 import re
 import logging
-import aiohttp
 from typing import List, Dict, Any
 
 from ..core.base import URLAdapter
 from ..core.result import URLMappingResult
+from ..extractors.page_cache import PageCache
 from ..strategies.regex_strategy import RegexStrategy
-from bs4 import BeautifulSoup
 from ..strategies.scraping_strategy import ScrapingStrategy
 
 logger = logging.getLogger(__name__)
@@ -43,16 +42,15 @@ async def scrape_neurips_page(url: str, context: Dict[str, Any]) -> URLMappingRe
             
         logger.debug(f"开始抓取NeurIPS页面: {url}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                if response.status != 200:
-                    logger.warning(f"NeurIPS页面访问失败，状态码: {response.status}")
-                    return result
-                    
-                html_content = await response.text()
+        # 通过任务级页面缓存获取，后续处理器可复用同一页面和DOM
+        page_cache = context.get('page_cache') or PageCache()
+        page = await page_cache.fetch_async(url, timeout=15)
+        if not page.success:
+            logger.warning(f"NeurIPS页面访问失败，状态码: {page.status_code}")
+            return result
         
         # 解析HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = page.soup
         
         # 优先级1: 提取结构化meta标签 (Dublin Core, Citation等)
         title = None
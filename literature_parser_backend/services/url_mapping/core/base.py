@@ -8,6 +8,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 
+from ..extractors.page_cache import PageCache
 from .result import URLMappingResult
 
 logger = logging.getLogger(__name__)
@@ -86,7 +87,8 @@ class URLAdapter(ABC):
             "supported_domains": self.supported_domains,
         }
 
-    async def extract_identifiers(self, url: str, enable_validation: bool = False, strict_validation: bool = False) -> URLMappingResult:
+    async def extract_identifiers(self, url: str, enable_validation: bool = False, strict_validation: bool = False,
+                                  page_cache: Optional[PageCache] = None) -> URLMappingResult:
         """
         使用多策略瀑布流提取标识符
         按优先级尝试各种策略，直到成功或全部失败
@@ -95,6 +97,7 @@ class URLAdapter(ABC):
             url: 要处理的URL
             enable_validation: 是否启用标识符验证
             strict_validation: 是否使用严格验证模式（验证失败时不返回结果）
+            page_cache: 任务级页面缓存，各策略通过 context['page_cache'] 共享页面
         """
         logger.debug(f"开始使用 {self.name} 适配器处理URL: {url}")
 
@@ -103,6 +106,7 @@ class URLAdapter(ABC):
             'enable_doi_validation': enable_validation,
             'enable_arxiv_validation': enable_validation,
             'strict_validation': strict_validation,
+            'page_cache': page_cache if page_cache is not None else PageCache(),
         })
 
         available_strategies = [
@@ -0,0 +1,186 @@
+"""
+URL映射缓存
+
+map_url 的完整流程（PDF重定向检查、直接提取、适配器策略，可能还有页面抓取和HTTP验证）
+往往是URL提交中最慢的一步。同一篇论文的URL经常以不同变体重复提交，
+这里以规范化URL（utils.url_canonical）为键缓存映射结果，在任何网络请求之前查询。
+
+两级缓存，与引用解析缓存相同：
+- Redis（所有worker共享）：规范化URL → 映射结果JSON，带TTL
+- 进程内LRU：Redis条目的短期副本，省去往返
+
+只缓存成功的映射结果；重定向信息（original_url/canonical_url/redirect_reason）
+与具体请求的URL相关，不写入缓存，命中时按本次URL重新计算。
+"""
+
+import json
+import logging
+import time
+from typing import Optional
+
+from ....settings import Settings
+from ....utils.url_canonical import canonicalize_url
+from ...resolution_cache import LocalLRUCache
+from .result import URLMappingResult
+
+logger = logging.getLogger(__name__)
+
+# 与具体请求相关、不写入缓存的字段
+REQUEST_SPECIFIC_FIELDS = ("original_url", "canonical_url", "redirect_reason")
+
+
+class URLMappingCache:
+    """规范化URL → URLMappingResult 的两级缓存"""
+
+    KEY_PREFIX = "urlmap:"
+    # Redis出错后暂停使用的秒数，避免故障期间每次查询都等待socket超时
+    REDIS_BACKOFF = 30
+
+    def __init__(self, redis_client=None, settings: Optional[Settings] = None, use_redis: bool = True):
+        """
+        初始化缓存
+
+        Args:
+            redis_client: Redis客户端（默认使用共享客户端）
+            settings: 应用配置
+            use_redis: 为False时只使用进程内缓存
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.url_mapping_cache_enabled
+        self.ttl = self.settings.url_mapping_cache_ttl
+        self.local = LocalLRUCache(
+            max_size=self.settings.url_mapping_cache_local_size,
+            ttl=self.settings.url_mapping_cache_local_ttl,
+        )
+
+        self._redis = redis_client
+        self._use_redis = use_redis
+        self._redis_retry_at = 0.0
+        self.stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "errors": 0}
+
+    @property
+    def redis(self):
+        """延迟获取共享Redis客户端（退避期间返回None）"""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None and self._use_redis:
+            try:
+                from ....db.redis_client import get_redis_client
+                self._redis = get_redis_client(self.settings)
+            except Exception as e:
+                logger.warning(f"URL映射缓存无法使用Redis: {e}")
+                self._use_redis = False
+        return self._redis
+
+    def _redis_failed(self):
+        self.stats["errors"] += 1
+        self._redis_retry_at = time.monotonic() + self.REDIS_BACKOFF
+
+    @staticmethod
+    def cache_key(url: str, enable_validation: bool = False, strict_validation: bool = False) -> Optional[str]:
+        """
+        构建缓存键
+
+        启用标识符验证时结果可能不同，因此验证模式也是键的一部分。
+
+        Args:
+            url: 请求的URL
+            enable_validation: 是否启用标识符验证
+            strict_validation: 是否使用严格验证模式
+
+        Returns:
+            缓存键，URL无法规范化时返回None
+        """
+        canonical = canonicalize_url(url)
+        if not canonical:
+            return None
+        if enable_validation:
+            canonical += "#strict" if strict_validation else "#validated"
+        return canonical
+
+    def get(self, key: Optional[str]) -> Optional[URLMappingResult]:
+        """
+        查询缓存的映射结果
+
+        Args:
+            key: cache_key 生成的缓存键
+
+        Returns:
+            新的 URLMappingResult 实例，未命中时返回None
+        """
+        if not self.enabled or not key:
+            return None
+
+        data = self.local.get(key)
+        if data is not None:
+            self.stats["local_hits"] += 1
+            return URLMappingResult.from_dict(data)
+
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(self.KEY_PREFIX + key)
+                if raw:
+                    data = json.loads(raw)
+                    self.local.set(key, data)
+                    self.stats["redis_hits"] += 1
+                    return URLMappingResult.from_dict(data)
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"URL映射缓存查询失败 {key}: {e}")
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: Optional[str], result: URLMappingResult):
+        """
+        缓存成功的映射结果
+
+        Args:
+            key: cache_key 生成的缓存键
+            result: 映射结果
+        """
+        if not self.enabled or not key or not result or not result.is_successful():
+            return
+
+        data = result.to_dict()
+        for field_name in REQUEST_SPECIFIC_FIELDS:
+            data.pop(field_name, None)
+        try:
+            payload = json.dumps(data)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"URL映射结果无法序列化，跳过缓存 {key}: {e}")
+            return
+
+        self.local.set(key, data)
+
+        if self.redis is not None:
+            try:
+                self.redis.set(self.KEY_PREFIX + key, payload, ex=self.ttl)
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"URL映射缓存写入失败 {key}: {e}")
+
+    def invalidate(self, url: str) -> None:
+        """删除某个URL（及其所有变体）的缓存条目"""
+        keys = [self.cache_key(url), self.cache_key(url, True), self.cache_key(url, True, True)]
+        keys = [key for key in keys if key]
+        for key in keys:
+            self.local.delete(key)
+        if keys and self.redis is not None:
+            try:
+                self.redis.delete(*[self.KEY_PREFIX + key for key in keys])
+            except Exception as e:
+                self._redis_failed()
+                logger.debug(f"URL映射缓存删除失败 {url}: {e}")
+
+
+# 每个进程一个实例
+_cache: Optional[URLMappingCache] = None
+
+
+def get_url_mapping_cache() -> URLMappingCache:
+    """获取进程内的URL映射缓存"""
+    global _cache
+    if _cache is None:
+        _cache = URLMappingCache()
+    return _cache
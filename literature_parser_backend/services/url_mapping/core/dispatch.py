@@ -0,0 +1,95 @@
+"""
+主机名后缀分派表
+
+启动时把适配器的 supported_domains 和路由模式编入以主机名为键的字典，
+查询时只需解析一次URL并按主机名后缀逐级查找（如 a.b.example.com →
+a.b.example.com、b.example.com、example.com），不再对每个适配器/路由
+做线性的子串扫描。
+
+模式可以带路径前缀（如 "arxiv.org/abs"），此时还要求URL路径以该前缀开头。
+"""
+
+from functools import lru_cache
+from typing import Dict, Generic, List, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+
+
+def url_host_and_path(url: str) -> Tuple[str, str]:
+    """
+    解析URL的主机名和路径（小写）
+
+    Args:
+        url: URL，可以省略协议头
+
+    Returns:
+        (主机名, 路径)，无法解析时主机名为空字符串
+    """
+    url = url.strip().lower()
+    if "://" not in url:
+        url = "//" + url
+    try:
+        parts = urlsplit(url)
+        return parts.hostname or "", parts.path or "/"
+    except ValueError:
+        return "", "/"
+
+
+def host_suffixes(host: str) -> List[str]:
+    """主机名自身及其所有上级域名后缀"""
+    labels = host.split(".")
+    return [".".join(labels[i:]) for i in range(len(labels) - 1)] or [host]
+
+
+class HostSuffixIndex(Generic[T]):
+    """按主机名后缀索引的分派表，值按注册顺序返回"""
+
+    def __init__(self, host_cache_size: int = 4096):
+        self._entries: Dict[str, List[Tuple[str, int, T]]] = {}
+        self._size = 0
+        # 主机名 → 按注册顺序排好的候选条目，热门主机无需重复逐级查找
+        self._host_entries = lru_cache(maxsize=host_cache_size)(self._collect_host_entries)
+
+    def add(self, pattern: str, value: T):
+        """
+        注册一个模式
+
+        Args:
+            pattern: 域名或 "域名/路径前缀"，例如 "ieee.org"、"nature.com/articles"
+            value: 命中时返回的值
+        """
+        host, _, path = pattern.lower().partition("/")
+        self._entries.setdefault(host, []).append(("/" + path if path else "", self._size, value))
+        self._size += 1
+        self._host_entries.cache_clear()
+
+    def _collect_host_entries(self, host: str) -> Tuple[Tuple[str, T], ...]:
+        entries = [entry for suffix in host_suffixes(host) for entry in self._entries.get(suffix, ())]
+        entries.sort(key=lambda entry: entry[1])
+        return tuple((path_prefix, value) for path_prefix, _, value in entries)
+
+    def lookup(self, url: str) -> List[T]:
+        """
+        查找URL命中的所有值
+
+        Args:
+            url: 要查找的URL
+
+        Returns:
+            命中的值（去重，按注册顺序）
+        """
+        host, path = url_host_and_path(url)
+        if not host:
+            return []
+
+        hits: List[T] = []
+        for path_prefix, value in self._host_entries(host):
+            if path_prefix and not path.startswith(path_prefix):
+                continue
+            if not any(hit is value for hit in hits):
+                hits.append(value)
+        return hits
+
+    def __len__(self) -> int:
+        return self._size
@@ -4,7 +4,8 @@ URL映射结果模型
 定义URL映射操作的结果数据结构。
 """
 
-from dataclasses import dataclass, field
+import copy
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, Optional
 
 
@@ -44,6 +45,9 @@ class URLMappingResult:
     # 额外标识符和元数据
     identifiers: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+
+    # 任务级页面缓存（PageCache），供后续处理器复用已抓取的页面，不参与序列化
+    page_cache: Optional[Any] = field(default=None, repr=False, compare=False)
     
     def has_identifiers(self) -> bool:
         """检查是否有有效的标识符"""
@@ -86,6 +90,13 @@ class URLMappingResult:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "URLMappingResult":
+        """从 to_dict 的输出重建结果（字典字段深拷贝，不与来源共享）"""
+        data = copy.deepcopy(data)
+        names = {f.name for f in fields(cls)} - {"page_cache"}
+        return cls(**{k: v for k, v in data.items() if k in names and v is not None})
+
     def should_use_canonical(self) -> bool:
         """检查是否应该使用标准URL"""
         return self.canonical_url is not None
@@ -6,11 +6,14 @@ URL映射服务
 
 import asyncio
 import logging
-import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
+from ..extractors.page_cache import PageCache
 from .base import URLAdapter
+from .cache import URLMappingCache, get_url_mapping_cache
+from .dispatch import HostSuffixIndex
 from .result import URLMappingResult
+from .validation import get_url_validation_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +21,61 @@ logger = logging.getLogger(__name__)
 class URLMappingService:
     """URL映射服务主类"""
 
-    def __init__(self, adapters: Optional[List[URLAdapter]] = None, enable_url_validation: bool = False):
+    def __init__(self, adapters: Optional[List[URLAdapter]] = None, enable_url_validation: bool = False,
+                 cache: Optional[URLMappingCache] = None):
         """
         初始化URL映射服务
 
         Args:
             adapters: 适配器列表，如果为None则使用默认适配器
             enable_url_validation: 是否启用URL有效性验证
+            cache: URL映射缓存，如果为None则使用进程内共享缓存
         """
         self.adapters = adapters or []
         self.enable_url_validation = enable_url_validation
+        self.cache = cache if cache is not None else get_url_mapping_cache()
         if not self.adapters:
             self._register_default_adapters()
+        self._build_dispatch_table()
+
+    def _build_dispatch_table(self):
+        """
+        构建主机名分派表
+
+        专门适配器按 supported_domains 编入主机名后缀索引，map_url 只需一次查表即可得到候选适配器；
+        没有声明域名的专门适配器仍逐个调用 can_handle。适配器列表变化后需重新构建。
+        """
+        self._dispatch: HostSuffixIndex[URLAdapter] = HostSuffixIndex()
+        self._unindexed_adapters: List[URLAdapter] = []
+        self._generic_adapters: List[URLAdapter] = []
+        self._adapter_order = {id(adapter): i for i, adapter in enumerate(self.adapters)}
+
+        for adapter in self.adapters:
+            if adapter.name == "generic":
+                self._generic_adapters.append(adapter)
+            elif adapter.supported_domains:
+                for domain in adapter.supported_domains:
+                    self._dispatch.add(domain, adapter)
+            else:
+                self._unindexed_adapters.append(adapter)
+
+        logger.debug(f"URL分派表: {len(self._dispatch)} 个域名, {len(self._unindexed_adapters)} 个未索引适配器")
+
+    def candidate_adapters(self, url: str) -> Tuple[List[URLAdapter], List[URLAdapter]]:
+        """
+        查表获取可以处理该URL的适配器
+
+        Args:
+            url: 要处理的URL
+
+        Returns:
+            (专门适配器列表, 通用适配器列表)，专门适配器保持注册顺序
+        """
+        specialized = self._dispatch.lookup(url)
+        if self._unindexed_adapters:
+            specialized += [a for a in self._unindexed_adapters if a.can_handle(url)]
+            specialized.sort(key=lambda a: self._adapter_order[id(a)])
+        return specialized, self._generic_adapters
 
     def _register_default_adapters(self):
         """注册默认适配器"""
@@ -55,6 +101,8 @@ class URLMappingService:
         """
         验证URL是否可访问
 
+        通过进程内共享的验证服务执行（复用连接池，按规范化URL缓存结论）。
+
         Args:
             url: 要验证的URL
             timeout: 超时时间（秒）
@@ -62,47 +110,7 @@ class URLMappingService:
         Returns:
             URL是否可访问
         """
-        try:
-            logger.debug(f"验证URL可访问性: {url}")
-
-            # 设置请求头，模拟浏览器访问
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-
-            # 发送HEAD请求（更快，只获取响应头）
-            response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
-
-            # 检查状态码
-            if response.status_code == 200:
-                logger.debug(f"✅ URL验证成功: {url}")
-                return True
-            elif response.status_code == 405:  # Method Not Allowed，尝试GET请求
-                logger.debug(f"HEAD请求被拒绝，尝试GET请求: {url}")
-                response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-                if response.status_code == 200:
-                    logger.debug(f"✅ URL验证成功(GET): {url}")
-                    return True
-
-            logger.warning(f"❌ URL验证失败，状态码: {response.status_code}, URL: {url}")
-            return False
-
-        except requests.exceptions.Timeout:
-            logger.warning(f"❌ URL验证超时: {url}")
-            return False
-        except requests.exceptions.ConnectionError:
-            logger.warning(f"❌ URL连接失败: {url}")
-            return False
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"❌ URL验证请求异常: {e}, URL: {url}")
-            return False
-        except Exception as e:
-            logger.error(f"❌ URL验证未知错误: {e}, URL: {url}")
-            return False
+        return get_url_validation_service().validate_url(url, timeout)
 
     def _check_pdf_redirect(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -122,38 +130,64 @@ class URLMappingService:
             logger.warning(f"PDF重定向检查失败: {e}")
             return None
 
-    async def map_url(self, url: str, enable_validation: bool = False, strict_validation: bool = False, skip_url_validation: bool = False) -> URLMappingResult:
+    async def map_url(self, url: str, enable_validation: bool = False, strict_validation: bool = False, skip_url_validation: bool = False,
+                      page_cache: Optional[PageCache] = None, use_cache: bool = True) -> URLMappingResult:
         """
         将URL映射为标识符和相关信息（异步版本）
 
+        先按规范化URL查询映射缓存，命中时不发起任何网络请求。
+
         Args:
             url: 要解析的URL
             enable_validation: 是否启用标识符验证
             strict_validation: 是否使用严格验证模式
             skip_url_validation: 是否跳过URL有效性验证
+            page_cache: 任务级页面缓存，为None时为本次映射新建
+            use_cache: 是否使用URL映射缓存
 
         Returns:
-            URLMappingResult: 映射结果
+            URLMappingResult: 映射结果，page_cache 字段携带本次抓取的页面供后续处理器复用
         """
+        if page_cache is None:
+            page_cache = PageCache()
+
+        cache_key = self.cache.cache_key(url, enable_validation, strict_validation) if use_cache else None
+        result = self.cache.get(cache_key)
+        if result is not None:
+            logger.info(f"⚡ URL映射缓存命中: {url} -> DOI:{result.doi}, ArXiv:{result.arxiv_id}")
+            redirect_info = self._check_pdf_redirect(url)
+            if redirect_info:
+                result.original_url = url
+                result.canonical_url = redirect_info['canonical_url']
+                result.redirect_reason = redirect_info['redirect_reason']
+        else:
+            result = await self._map_url(url, enable_validation, strict_validation, skip_url_validation, page_cache)
+            self.cache.set(cache_key, result)
+
+        result.page_cache = page_cache
+        return result
+
+    async def _map_url(self, url: str, enable_validation: bool, strict_validation: bool, skip_url_validation: bool,
+                       page_cache: PageCache) -> URLMappingResult:
+        """map_url 的实现，所有适配器共享同一个 page_cache"""
         logger.debug(f"开始映射URL: {url}")
         original_url = url
 
-        # 1. 提前分离专门适配器和通用适配器（修复变量未定义bug）
-        specialized_adapters = [a for a in self.adapters if a.name != "generic"]
-        generic_adapters = [a for a in self.adapters if a.name == "generic"]
-
-        # 2. PDF智能重定向检查
+        # 1. PDF智能重定向检查
         redirect_info = self._check_pdf_redirect(url)
         if redirect_info:
             logger.info(f"🔄 PDF重定向: {url} → {redirect_info['canonical_url']}")
             logger.info(f"📝 重定向原因: {redirect_info['redirect_reason']}")
             url = redirect_info['canonical_url']  # 使用重定向后的URL继续处理
 
+        # 2. 查分派表得到候选的专门适配器和通用适配器
+        specialized_adapters, generic_adapters = self.candidate_adapters(url)
+
         # 3. URL有效性验证
         # 对于某些适配器（如ACM），我们可能希望直接从URL提取标识符，而不是进行HTTP验证
         # 检查适配器是否有优先的 extract_identifier_from_url 方法
         for adapter in specialized_adapters + generic_adapters:
-            if adapter.can_handle(url) and hasattr(adapter, 'extract_identifier_from_url'):
+            if hasattr(adapter, 'extract_identifier_from_url'):
                 logger.debug(f"尝试使用适配器 {adapter.name} 的 extract_identifier_from_url 方法")
                 direct_extraction_result = await adapter.extract_identifier_from_url(url)
                 if direct_extraction_result and direct_extraction_result.is_successful():
@@ -168,7 +202,7 @@ class URLMappingService:
 
         if self.enable_url_validation and not skip_url_validation:
             logger.info(f"🔍 验证URL有效性: {url}")
-            if not self._validate_url(url):
+            if not await asyncio.to_thread(self._validate_url, url):
                 logger.warning(f"❌ URL验证失败，返回空结果: {url}")
                 result = URLMappingResult()
                 result.metadata['url_validation_failed'] = True
@@ -184,38 +218,37 @@ class URLMappingService:
 
         # 4. 首先尝试专门适配器
         for adapter in specialized_adapters:
-            if adapter.can_handle(url):
-                logger.debug(f"使用专门适配器 {adapter.name} 处理URL")
-                try:
-                    result = await adapter.extract_identifiers(url, enable_validation, strict_validation)
+            logger.debug(f"使用专门适配器 {adapter.name} 处理URL")
+            try:
+                result = await adapter.extract_identifiers(url, enable_validation, strict_validation, page_cache=page_cache)
 
-                    if result and result.is_successful():
-                        # 如果有重定向信息，添加到结果中
-                        if redirect_info:
-                            result.original_url = original_url
-                            result.canonical_url = redirect_info['canonical_url']
-                            result.redirect_reason = redirect_info['redirect_reason']
+                if result and result.is_successful():
+                    # 如果有重定向信息，添加到结果中
+                    if redirect_info:
+                        result.original_url = original_url
+                        result.canonical_url = redirect_info['canonical_url']
+                        result.redirect_reason = redirect_info['redirect_reason']
 
-                        logger.info(f"成功映射URL: {url} -> DOI:{result.doi}, ArXiv:{result.arxiv_id}, Venue:{result.venue}, 策略:{result.strategy_used}")
-                        if redirect_info:
-                            logger.info(f"🔄 包含重定向信息: {original_url} → {redirect_info['canonical_url']}")
-                        return result
-                    else:
-                        logger.debug(f"适配器 {adapter.name} 未找到有效标识符或有用信息")
-                except Exception as e:
-                    # 导入自定义异常类型
-                    try:
-                        from ....worker.execution.exceptions import URLNotFoundException, URLAccessFailedException, ParsingFailedException
-                        # 如果是特定的错误类型，应该向上传递而不是继续尝试其他适配器
-                        if isinstance(e, (URLNotFoundException, URLAccessFailedException, ParsingFailedException)):
-                            logger.error(f"适配器 {adapter.name} 遇到特定错误，向上传递: {e}")
-                            raise e
-                    except ImportError:
-                        # 如果无法导入异常类型，继续原有逻辑
-                        pass
-                    
-                    logger.warning(f"适配器 {adapter.name} 处理URL失败: {e}")
-                    continue
+                    logger.info(f"成功映射URL: {url} -> DOI:{result.doi}, ArXiv:{result.arxiv_id}, Venue:{result.venue}, 策略:{result.strategy_used}")
+                    if redirect_info:
+                        logger.info(f"🔄 包含重定向信息: {original_url} → {redirect_info['canonical_url']}")
+                    return result
+                else:
+                    logger.debug(f"适配器 {adapter.name} 未找到有效标识符或有用信息")
+            except Exception as e:
+                # 导入自定义异常类型
+                try:
+                    from ....worker.execution.exceptions import URLNotFoundException, URLAccessFailedException, ParsingFailedException
+                    # 如果是特定的错误类型，应该向上传递而不是继续尝试其他适配器
+                    if isinstance(e, (URLNotFoundException, URLAccessFailedException, ParsingFailedException)):
+                        logger.error(f"适配器 {adapter.name} 遇到特定错误，向上传递: {e}")
+                        raise e
+                except ImportError:
+                    # 如果无法导入异常类型，继续原有逻辑
+                    pass
+                
+                logger.warning(f"适配器 {adapter.name} 处理URL失败: {e}")
+                continue
 
         # 5. 如果专门适配器都失败，尝试通用适配器作为备选方案
         if generic_adapters:
@@ -223,7 +256,7 @@ class URLMappingService:
             for adapter in generic_adapters:
                 logger.debug(f"使用通用适配器 {adapter.name} 处理URL")
                 try:
-                    result = await adapter.extract_identifiers(url, enable_validation, strict_validation)
+                    result = await adapter.extract_identifiers(url, enable_validation, strict_validation, page_cache=page_cache)
 
                     if result and result.is_successful():
                         # 如果有重定向信息，添加到结果中
@@ -367,6 +400,7 @@ class URLMappingService:
             adapter: 要添加的适配器
         """
         self.adapters.append(adapter)
+        self._build_dispatch_table()
         logger.info(f"添加适配器: {adapter.name}")
 
     def remove_adapter(self, adapter_name: str):
@@ -377,6 +411,7 @@ class URLMappingService:
             adapter_name: 要移除的适配器名称
         """
         self.adapters = [a for a in self.adapters if a.name != adapter_name]
+        self._build_dispatch_table()
         logger.info(f"移除适配器: {adapter_name}")
 
     def get_supported_domains(self) -> dict:
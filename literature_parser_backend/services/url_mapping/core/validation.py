@@ -0,0 +1,230 @@
+"""
+URL与标识符验证服务
+
+启用验证时，每次提交都要确认URL可访问、DOI/ArXiv ID真实存在。原先每次验证都
+新建连接（裸 requests 调用、每次检查一个新的 aiohttp.ClientSession），同一个URL
+或DOI在不同任务中反复验证。这里把验证集中到一个进程内共享的服务：
+
+- 连接池：所有验证共用一个 requests.Session，按主机复用连接
+- 结论缓存：按规范化URL（utils.url_canonical）、小写DOI、规范化ArXiv ID缓存验证结论，
+  通过的结论缓存较久，失败的结论只短期缓存，网络错误不缓存
+- 并发：一次请求携带多个URL或标识符时，validate_many 在线程池中并发验证
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ....settings import Settings
+from ....utils.match_keys import normalize_arxiv_id
+from ....utils.url_canonical import canonicalize_url
+from ...resolution_cache import LocalLRUCache
+
+logger = logging.getLogger(__name__)
+
+# 模拟浏览器访问的请求头（部分站点拒绝非浏览器的HEAD请求）
+VALIDATION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+CROSSREF_WORKS_URL = "https://api.crossref.org/works/{doi}"
+ARXIV_QUERY_URL = "http://export.arxiv.org/api/query?id_list={arxiv_id}"
+
+
+class URLValidationService:
+    """共享连接池和结论缓存的URL/标识符验证服务"""
+
+    def __init__(self, settings: Optional[Settings] = None, session: Optional[requests.Session] = None):
+        """
+        初始化验证服务
+
+        Args:
+            settings: 应用配置
+            session: HTTP会话（默认新建带连接池的会话）
+        """
+        self.settings = settings or Settings()
+        self.verdicts = LocalLRUCache(
+            max_size=self.settings.url_validation_cache_size,
+            ttl=self.settings.url_validation_cache_ttl,
+        )
+        self.negative_ttl = self.settings.url_validation_negative_ttl
+        self.max_concurrency = max(1, self.settings.url_validation_max_concurrency)
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.settings.url_validation_pool_size,
+                                  pool_maxsize=self.settings.url_validation_pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.stats = {"hits": 0, "checks": 0}
+
+    def _cached(self, key: str, check) -> bool:
+        """
+        查询缓存的结论，未命中时执行检查并缓存
+
+        check 返回 (结论, 是否可缓存)；网络错误等不确定的结论不缓存。
+        """
+        verdict = self.verdicts.get(key)
+        if verdict is not None:
+            self.stats["hits"] += 1
+            return verdict
+
+        self.stats["checks"] += 1
+        verdict, cacheable = check()
+        if cacheable:
+            self.verdicts.set(key, verdict, None if verdict else self.negative_ttl)
+        return verdict
+
+    def validate_url(self, url: str, timeout: int = 10) -> bool:
+        """
+        验证URL是否可访问
+
+        先发送HEAD请求，被拒绝（405）时回退到只读取响应头的GET请求。
+
+        Args:
+            url: 要验证的URL
+            timeout: 超时时间（秒）
+
+        Returns:
+            URL是否可访问
+        """
+        key = "url:" + (canonicalize_url(url) or url)
+        return self._cached(key, lambda: self._check_url(url, timeout))
+
+    def _check_url(self, url: str, timeout: int) -> Tuple[bool, bool]:
+        try:
+            logger.debug(f"验证URL可访问性: {url}")
+            response = self.session.head(url, headers=VALIDATION_HEADERS, timeout=timeout, allow_redirects=True)
+            if response.status_code == 405:
+                logger.debug(f"HEAD请求被拒绝，尝试GET请求: {url}")
+                response = self.session.get(url, headers=VALIDATION_HEADERS, timeout=timeout,
+                                            allow_redirects=True, stream=True)
+                response.close()
+
+            if response.status_code == 200:
+                logger.debug(f"✅ URL验证成功: {url}")
+                return True, True
+
+            logger.warning(f"❌ URL验证失败，状态码: {response.status_code}, URL: {url}")
+            # 5xx/429 可能是暂时性的，不缓存
+            return False, response.status_code < 500 and response.status_code != 429
+
+        except requests.exceptions.Timeout:
+            logger.warning(f"❌ URL验证超时: {url}")
+        except requests.exceptions.ConnectionError:
+            logger.warning(f"❌ URL连接失败: {url}")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"❌ URL验证请求异常: {e}, URL: {url}")
+        except Exception as e:
+            logger.error(f"❌ URL验证未知错误: {e}, URL: {url}")
+        return False, False
+
+    def validate_doi(self, doi: str, timeout: int = 5) -> bool:
+        """
+        通过CrossRef验证DOI是否存在
+
+        Args:
+            doi: 要验证的DOI
+            timeout: 超时时间（秒）
+
+        Returns:
+            DOI是否存在（网络错误时视为存在，避免因网络问题误判）
+        """
+        return self._cached("doi:" + doi.strip().lower(), lambda: self._check_doi(doi, timeout))
+
+    def _check_doi(self, doi: str, timeout: int) -> Tuple[bool, bool]:
+        try:
+            response = self.session.get(CROSSREF_WORKS_URL.format(doi=doi), timeout=timeout)
+            if response.status_code >= 500 or response.status_code == 429:
+                return True, False
+            return response.status_code == 200, True
+        except Exception as e:
+            logger.warning(f"DOI验证请求失败: {e}")
+            return True, False
+
+    def validate_arxiv_id(self, arxiv_id: str, timeout: int = 5) -> bool:
+        """
+        通过ArXiv API验证ID是否存在
+
+        Args:
+            arxiv_id: 要验证的ArXiv ID
+            timeout: 超时时间（秒）
+
+        Returns:
+            ID是否存在（网络错误时视为存在）
+        """
+        key = "arxiv:" + (normalize_arxiv_id(arxiv_id) or arxiv_id)
+        return self._cached(key, lambda: self._check_arxiv_id(arxiv_id, timeout))
+
+    def _check_arxiv_id(self, arxiv_id: str, timeout: int) -> Tuple[bool, bool]:
+        try:
+            response = self.session.get(ARXIV_QUERY_URL.format(arxiv_id=arxiv_id), timeout=timeout)
+            if response.status_code == 200:
+                return "No papers found" not in response.text, True
+            return False, response.status_code < 500 and response.status_code != 429
+        except Exception as e:
+            logger.warning(f"ArXiv ID验证请求失败: {e}")
+            return True, False
+
+    def validate_many(self, urls: Iterable[str] = (), dois: Iterable[str] = (),
+                      arxiv_ids: Iterable[str] = ()) -> Dict[str, Dict[str, bool]]:
+        """
+        并发验证多个URL和标识符
+
+        Args:
+            urls: 要验证的URL
+            dois: 要验证的DOI
+            arxiv_ids: 要验证的ArXiv ID
+
+        Returns:
+            {"urls": {url: 结论}, "dois": {...}, "arxiv_ids": {...}}
+        """
+        jobs: List[Tuple[str, str, object]] = []
+        jobs += [("urls", value, self.validate_url) for value in dict.fromkeys(urls) if value]
+        jobs += [("dois", value, self.validate_doi) for value in dict.fromkeys(dois) if value]
+        jobs += [("arxiv_ids", value, self.validate_arxiv_id) for value in dict.fromkeys(arxiv_ids) if value]
+
+        results: Dict[str, Dict[str, bool]] = {"urls": {}, "dois": {}, "arxiv_ids": {}}
+        if len(jobs) <= 1:
+            for kind, value, validate in jobs:
+                results[kind][value] = validate(value)
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(jobs))) as executor:
+            futures = [(kind, value, executor.submit(validate, value)) for kind, value, validate in jobs]
+            for kind, value, future in futures:
+                results[kind][value] = future.result()
+        return results
+
+    async def validate_url_async(self, url: str, timeout: int = 10) -> bool:
+        """validate_url 的异步版本，在线程池中执行"""
+        return await asyncio.to_thread(self.validate_url, url, timeout)
+
+    async def validate_doi_async(self, doi: str, timeout: int = 5) -> bool:
+        """validate_doi 的异步版本，在线程池中执行"""
+        return await asyncio.to_thread(self.validate_doi, doi, timeout)
+
+    async def validate_arxiv_id_async(self, arxiv_id: str, timeout: int = 5) -> bool:
+        """validate_arxiv_id 的异步版本，在线程池中执行"""
+        return await asyncio.to_thread(self.validate_arxiv_id, arxiv_id, timeout)
+
+
+# 每个进程一个实例
+_validation_service: Optional[URLValidationService] = None
+
+
+def get_url_validation_service() -> URLValidationService:
+    """获取进程内的验证服务"""
+    global _validation_service
+    if _validation_service is None:
+        _validation_service = URLValidationService()
+    return _validation_service
@@ -6,12 +6,14 @@ URL映射提取器模块
 
 from .doi_extractor import DOIExtractor
 from .page_parser import PageParser
+from .page_cache import PageCache
 from .meta_extractor import MetaExtractor
 from .ieee_extractor import IEEEExtractor
 
 __all__ = [
     "DOIExtractor",
     "PageParser", 
+    "PageCache",
     "MetaExtractor",
     "IEEEExtractor",
 ]
@@ -38,12 +38,13 @@ class IEEEExtractor:
         return None
     
     @classmethod
-    def extract_from_page(cls, url: str) -> Optional[URLMappingResult]:
+    def extract_from_page(cls, url: str, page_cache=None) -> Optional[URLMappingResult]:
         """
         通过页面解析提取IEEE文献信息
         
         Args:
             url: IEEE页面URL
+            page_cache: 任务级页面缓存（可选）
             
         Returns:
             提取结果，如果失败则返回None
@@ -58,7 +59,7 @@ class IEEEExtractor:
             logger.info(f"尝试通过页面解析获取IEEE文档 {doc_id} 的信息")
             
             # 获取页面内容
-            fetch_result = PageParser.fetch_page_with_details(url)
+            fetch_result = PageParser.fetch_page_with_details(url, page_cache=page_cache)
             if not fetch_result.success:
                 logger.warning(f"无法获取IEEE页面内容: {fetch_result.error_message} (错误类型: {fetch_result.error_type})")
                 return None
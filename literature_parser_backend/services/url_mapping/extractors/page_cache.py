@@ -0,0 +1,143 @@
+"""
+请求级页面缓存
+
+同一个任务中，URL适配器、抓取策略和 Site Parser V2 往往会请求同一个页面。
+PageCache 在任务范围内保存每个URL的抓取结果（HTML、重定向后的最终URL、状态码），
+并在首次访问时才解析DOM，使所有使用者共享一次抓取和一次解析。
+
+只需要meta标签的使用者可以请求 head_only 页面（只读取到</head>）；之后若有使用者
+需要完整页面，再下载完整页面并替换缓存条目。已有完整页面时 head_only 请求直接复用。
+
+缓存随 URLMappingResult / IdentifierData 在一次任务中传递，不跨任务共享。
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from .page_parser import PageFetchResult, PageParser
+
+logger = logging.getLogger(__name__)
+
+# <head>前缀在 lxml 可用时使用更快的 lxml 解析器；完整页面仍用 html.parser，
+# 保持站点CSS选择器规则的解析结果不变
+try:
+    import lxml  # noqa: F401
+    HEAD_HTML_PARSER = "lxml"
+except ImportError:
+    HEAD_HTML_PARSER = "html.parser"
+
+
+@dataclass
+class CachedPage:
+    """缓存的页面"""
+    url: str
+    result: PageFetchResult
+    _soup: Optional[BeautifulSoup] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def success(self) -> bool:
+        return self.result.success
+
+    @property
+    def html(self) -> Optional[str]:
+        return self.result.content
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.result.status_code
+
+    @property
+    def head_only(self) -> bool:
+        """是否只包含<head>部分"""
+        return self.result.truncated
+
+    @property
+    def final_url(self) -> str:
+        """重定向后的最终URL"""
+        return self.result.final_url or self.url
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """首次访问时解析的DOM，页面获取失败时为None"""
+        if self._soup is None and self.result.content:
+            with self._lock:
+                if self._soup is None:
+                    parser = HEAD_HTML_PARSER if self.head_only else 'html.parser'
+                    self._soup = BeautifulSoup(self.result.content, parser)
+        return self._soup
+
+
+class PageCache:
+    """单个任务内共享的页面缓存（线程安全）"""
+
+    def __init__(self):
+        self._pages: Dict[str, CachedPage] = {}
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self.fetches = 0
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        获取已缓存的页面，不发起请求
+
+        Args:
+            url: 请求的URL或重定向后的最终URL
+
+        Returns:
+            缓存的页面，未缓存时返回None
+        """
+        with self._lock:
+            return self._pages.get(url)
+
+    def fetch(self, url: str, timeout: int = 10, headers: Optional[Dict[str, str]] = None,
+              head_only: bool = False) -> CachedPage:
+        """
+        获取页面，同一URL在缓存生命周期内只请求一次
+
+        失败结果同样缓存，避免同一任务内对不可访问的页面重复请求。
+
+        Args:
+            url: 页面URL
+            timeout: 超时时间（秒）
+            headers: 自定义请求头
+            head_only: 只需要<head>部分（meta标签、JSON-LD）
+
+        Returns:
+            CachedPage 包含抓取结果和延迟解析的DOM
+        """
+        page = self.get(url)
+        if page and (head_only or not page.head_only):
+            logger.debug(f"页面缓存命中: {url}")
+            return page
+
+        with self._lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+
+        # 同一URL的并发请求等待第一个请求完成
+        with url_lock:
+            page = self.get(url)
+            if page and (head_only or not page.head_only):
+                return page
+
+            result = PageParser.fetch_page_with_details(url, timeout, headers, head_only=head_only)
+            page = CachedPage(url=url, result=result)
+            with self._lock:
+                self.fetches += 1
+                previous = self._pages.get(url)
+                self._pages[url] = page
+                if result.final_url and result.final_url != url:
+                    existing = self._pages.get(result.final_url)
+                    if existing is None or existing is previous or (existing.head_only and not page.head_only):
+                        self._pages[result.final_url] = page
+            return page
+
+    async def fetch_async(self, url: str, timeout: int = 10, headers: Optional[Dict[str, str]] = None,
+                          head_only: bool = False) -> CachedPage:
+        """fetch 的异步版本，在线程池中执行请求"""
+        return await asyncio.to_thread(self.fetch, url, timeout, headers, head_only)
@@ -22,6 +22,8 @@ class PageFetchResult:
     status_code: Optional[int] = None
     error_message: Optional[str] = None
     error_type: Optional[str] = None
+    final_url: Optional[str] = None  # 重定向后的最终URL
+    truncated: bool = False  # 只读取了<head>部分（或达到字节上限）
 
 
 class PageParser:
@@ -36,6 +38,12 @@ class PageParser:
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
     }
+
+    # 只读取<head>时的字节上限和分块大小
+    HEAD_MAX_BYTES = 256 * 1024
+    HEAD_CHUNK_SIZE = 16 * 1024
+    HEAD_END_PATTERN = re.compile(rb"</head\s*>", re.IGNORECASE)
+    META_CHARSET_PATTERN = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
     
     @classmethod
     def fetch_page(cls, url: str, timeout: int = 10, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
@@ -54,7 +62,8 @@ class PageParser:
         return result.content if result.success else None
     
     @classmethod
-    def fetch_page_with_details(cls, url: str, timeout: int = 10, headers: Optional[Dict[str, str]] = None) -> PageFetchResult:
+    def fetch_page_with_details(cls, url: str, timeout: int = 10, headers: Optional[Dict[str, str]] = None,
+                                page_cache=None, head_only: bool = False) -> PageFetchResult:
         """
         获取页面内容，包含详细的错误信息
         
@@ -62,22 +71,44 @@ class PageParser:
             url: 页面URL
             timeout: 超时时间（秒）
             headers: 自定义请求头
+            page_cache: 任务级页面缓存，提供时复用同一任务内已获取的页面
+            head_only: 流式读取，读到</head>或 HEAD_MAX_BYTES 即停止（只需要meta标签时使用）
             
         Returns:
             PageFetchResult 包含成功状态、内容和错误信息
         """
+        if page_cache is not None:
+            return page_cache.fetch(url, timeout, headers, head_only=head_only).result
+
         try:
             request_headers = headers or cls.DEFAULT_HEADERS
             
-            logger.debug(f"正在获取页面: {url}")
-            response = requests.get(url, headers=request_headers, timeout=timeout)
+            logger.debug(f"正在获取页面: {url}{' (仅<head>)' if head_only else ''}")
+            response = requests.get(url, headers=request_headers, timeout=timeout, stream=head_only)
             
+            if response.status_code == 200 and head_only:
+                try:
+                    content, truncated = cls._read_head(response)
+                finally:
+                    response.close()
+                logger.debug(f"页面<head>获取成功: {len(content)} 字符")
+                return PageFetchResult(
+                    success=True,
+                    content=content,
+                    status_code=200,
+                    final_url=response.url,
+                    truncated=truncated
+                )
+            if head_only:
+                response.close()
+
             if response.status_code == 200:
                 logger.debug(f"页面获取成功: {len(response.text)} 字符")
                 return PageFetchResult(
                     success=True,
                     content=response.text,
-                    status_code=200
+                    status_code=200,
+                    final_url=response.url
                 )
             elif response.status_code == 404:
                 error_msg = f"页面不存在: {url}"
@@ -86,7 +117,8 @@ class PageParser:
                     success=False,
                     status_code=404,
                     error_message=error_msg,
-                    error_type="url_not_found"
+                    error_type="url_not_found",
+                    final_url=response.url
                 )
             else:
                 error_msg = f"HTTP错误 {response.status_code}: {url}"
@@ -95,7 +127,8 @@ class PageParser:
                     success=False,
                     status_code=response.status_code,
                     error_message=error_msg,
-                    error_type="http_error"
+                    error_type="http_error",
+                    final_url=response.url
                 )
                 
         except requests.exceptions.Timeout:
@@ -123,6 +156,42 @@ class PageParser:
                 error_type="network_error"
             )
     
+    @classmethod
+    def _read_head(cls, response) -> Tuple[str, bool]:
+        """
+        从流式响应中读取到</head>为止
+
+        Returns:
+            (HTML前缀, 是否截断)，整个页面在</head>之前就读完时不算截断
+        """
+        buffer = bytearray()
+        truncated = False
+        for chunk in response.iter_content(chunk_size=cls.HEAD_CHUNK_SIZE):
+            search_from = max(0, len(buffer) - 16)
+            buffer.extend(chunk)
+            match = cls.HEAD_END_PATTERN.search(buffer, search_from)
+            if match:
+                del buffer[match.end():]
+                truncated = True
+                break
+            if len(buffer) >= cls.HEAD_MAX_BYTES:
+                del buffer[cls.HEAD_MAX_BYTES:]
+                truncated = True
+                break
+
+        # 编码：Content-Type 中的charset > <meta charset> > UTF-8
+        encoding = None
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset=' in content_type.lower():
+            encoding = response.encoding
+        if not encoding:
+            match = cls.META_CHARSET_PATTERN.search(buffer)
+            encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            return bytes(buffer).decode(encoding, errors='replace'), truncated
+        except LookupError:
+            return bytes(buffer).decode('utf-8', errors='replace'), truncated
+
     @classmethod
     def extract_title(cls, content: str) -> Optional[str]:
         """
@@ -6,7 +6,8 @@
 
 import re
 import logging
-from typing import Dict, Optional, Any, Callable
+from functools import lru_cache
+from typing import Dict, Optional, Any, Callable, Pattern
 
 from ..core.base import IdentifierStrategy
 from ..core.result import URLMappingResult
@@ -14,6 +15,12 @@ from ..core.result import URLMappingResult
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> Pattern:
+    """编译正则表达式（忽略大小写），同一模式在所有策略实例间共享"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class RegexStrategy(IdentifierStrategy):
     """基于正则表达式的标识符提取策略"""
 
@@ -29,6 +36,7 @@ class RegexStrategy(IdentifierStrategy):
         """
         self._name = name
         self.patterns = patterns
+        self._compiled = {pattern_name: compile_pattern(pattern) for pattern_name, pattern in patterns.items()}
         self.processor_func = processor_func
         self._priority = priority
 
@@ -44,8 +52,8 @@ class RegexStrategy(IdentifierStrategy):
         """使用正则表达式提取标识符"""
         result = URLMappingResult()
 
-        for pattern_name, pattern in self.patterns.items():
-            match = re.search(pattern, url, re.IGNORECASE)
+        for pattern_name, pattern in self._compiled.items():
+            match = pattern.search(url)
             if match:
                 logger.debug(f"正则模式 {pattern_name} 匹配成功")
 
@@ -100,6 +108,7 @@ class RegexStrategy(IdentifierStrategy):
             pattern: 正则表达式
         """
         self.patterns[pattern_name] = pattern
+        self._compiled[pattern_name] = compile_pattern(pattern)
         logger.debug(f"添加正则模式: {pattern_name}")
 
     def remove_pattern(self, pattern_name: str):
@@ -111,6 +120,7 @@ class RegexStrategy(IdentifierStrategy):
         """
         if pattern_name in self.patterns:
             del self.patterns[pattern_name]
+            del self._compiled[pattern_name]
             logger.debug(f"移除正则模式: {pattern_name}")
 
     def get_patterns(self) -> Dict[str, str]:
@@ -5,11 +5,11 @@
 """
 
 import logging
-import requests
 from typing import Dict, Optional, Any
 
 from ..core.base import IdentifierStrategy
 from ..core.result import URLMappingResult
+from ..core.validation import get_url_validation_service
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +80,7 @@ class DOIValidationStrategy(IdentifierStrategy):
 
     async def _validate_doi(self, doi: str) -> bool:
         """
-        通过CrossRef API验证DOI是否存在
+        通过CrossRef API验证DOI是否存在（共享验证服务，结论有缓存）
         
         Args:
             doi: 要验证的DOI
@@ -88,24 +88,7 @@ class DOIValidationStrategy(IdentifierStrategy):
         Returns:
             DOI是否存在
         """
-        try:
-            url = f"https://api.crossref.org/works/{doi}"
-            
-            # 使用异步请求（如果可用）或同步请求
-            try:
-                import aiohttp
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                    async with session.get(url) as response:
-                        return response.status == 200
-            except ImportError:
-                # 回退到同步请求
-                response = requests.get(url, timeout=self.timeout)
-                return response.status_code == 200
-                
-        except Exception as e:
-            logger.warning(f"DOI验证请求失败: {e}")
-            # 网络错误时，假设DOI有效（避免因网络问题误判）
-            return True
+        return await get_url_validation_service().validate_doi_async(doi, self.timeout)
 
     def can_handle(self, url: str, context: Dict[str, Any]) -> bool:
         """
@@ -164,28 +147,8 @@ class ArXivValidationStrategy(IdentifierStrategy):
             return None if strict_mode else existing_result
 
     async def _validate_arxiv_id(self, arxiv_id: str) -> bool:
-        """通过ArXiv API验证ID是否存在"""
-        try:
-            url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
-            
-            try:
-                import aiohttp
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            # 检查是否包含错误信息
-                            return "No papers found" not in content
-                        return False
-            except ImportError:
-                response = requests.get(url, timeout=self.timeout)
-                if response.status_code == 200:
-                    return "No papers found" not in response.text
-                return False
-                
-        except Exception as e:
-            logger.warning(f"ArXiv ID验证请求失败: {e}")
-            return True  # 网络错误时假设有效
+        """通过ArXiv API验证ID是否存在（共享验证服务，结论有缓存）"""
+        return await get_url_validation_service().validate_arxiv_id_async(arxiv_id, self.timeout)
 
     def can_handle(self, url: str, context: Dict[str, Any]) -> bool:
         """判断是否需要验证ArXiv ID"""
@@ -62,6 +62,9 @@ class Settings(BaseSettings):
     es_password: str = "literature_parser_elastic"
     es_index_prefix: str = "literature_parser"
 
+    # Literature search backend
+    search_backend: str = "neo4j"  # neo4j | elasticsearch | memory
+
     # External API settings
     grobid_base_url: str = "http://localhost:8070"
     crossref_api_base_url: str = "https://api.crossref.org"
@@ -75,6 +78,33 @@ class Settings(BaseSettings):
     external_api_timeout: int = 40  # 调整为40秒
     external_api_max_retries: int = 3
 
+    # Per-host token buckets shared across workers (Redis)
+    rate_limit_enabled: bool = True
+    rate_limit_crossref_rps: float = 10.0  # CrossRef polite pool（需配置crossref_mailto）
+    rate_limit_crossref_burst: float = 5.0
+    rate_limit_semantic_scholar_rps: float = 0.3  # 无API key时的共享配额（约100次/5分钟）
+    rate_limit_semantic_scholar_key_rps: float = 1.0  # 有API key时的配额
+    rate_limit_arxiv_interval: float = 3.0  # arXiv要求两次请求间隔至少3秒
+    rate_limit_max_wait: float = 60.0  # 单次请求最长排队等待(秒)，超过则直接失败
+
+    # Per-upstream circuit breakers and latency-based timeouts (per process)
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_threshold: int = 5  # 连续失败次数达到后熔断
+    circuit_breaker_reset_timeout: float = 30.0  # 熔断后等待多久放行一次探测请求(秒)
+    adaptive_timeout_enabled: bool = True
+    adaptive_timeout_percentile: float = 0.99  # 基于近期成功请求耗时的分位数
+    adaptive_timeout_multiplier: float = 2.0  # 分位数耗时的放大倍数
+    adaptive_timeout_min: float = 3.0  # 自适应超时下限(秒)
+    adaptive_timeout_min_samples: int = 20  # 样本数不足时使用调用方给定的超时
+    adaptive_timeout_window: int = 200  # 每个上游保留的最近耗时样本数
+
+    # Hedged requests for interactive lookups (/by-doi, /by-title)
+    hedging_enabled: bool = True
+    hedging_budget_ratio: float = 0.05  # 对冲请求占流量的上限比例
+    hedging_budget_burst: float = 5.0  # 对冲预算的最大积累量
+    hedging_min_delay: float = 0.2  # 发出对冲请求前的最短等待(秒)
+    hedging_max_workers: int = 8  # 每个进程用于对冲的线程数
+
     # Proxy settings
     http_proxy: str = ""
     https_proxy: str = ""
@@ -85,6 +115,74 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_password: str = ""
 
+    # Reference resolution cache (Redis shared + per-worker LRU)
+    reference_cache_enabled: bool = True
+    reference_cache_ttl: int = 7 * 24 * 3600  # 已解析引用缓存7天
+    reference_cache_negative_ttl: int = 6 * 3600  # 未解析引用缓存6小时
+    reference_cache_local_size: int = 10000  # 每个worker本地LRU条目数
+    reference_cache_local_ttl: int = 300  # 本地LRU条目有效期(秒)
+
+    # URL mapping cache (canonical URL -> URLMappingResult, Redis shared + per-worker LRU)
+    url_mapping_cache_enabled: bool = True
+    url_mapping_cache_ttl: int = 7 * 24 * 3600  # 映射结果缓存7天
+    url_mapping_cache_local_size: int = 5000  # 每个worker本地LRU条目数
+    url_mapping_cache_local_ttl: int = 600  # 本地LRU条目有效期(秒)
+
+    # URL / identifier validation (pooled connections + per-worker verdict cache)
+    url_validation_cache_size: int = 10000  # 每个worker缓存的验证结论条目数
+    url_validation_cache_ttl: int = 24 * 3600  # 验证通过的结论缓存1天
+    url_validation_negative_ttl: int = 600  # 验证失败的结论只缓存10分钟
+    url_validation_pool_size: int = 20  # 每个主机的连接池大小
+    url_validation_max_concurrency: int = 8  # 同一请求内并发验证的数量
+
+    # Task status hub (one status tracker per task per API process, woken by Redis pub/sub)
+    task_status_hub_enabled: bool = True  # False时不订阅事件，只按poll间隔轮询
+    task_status_poll_interval: float = 1.0  # 未连接Redis事件时的轮询间隔(秒)
+    task_status_fallback_interval: float = 10.0  # 已订阅事件时的兜底刷新间隔(秒)，防止事件丢失
+    task_status_max_failures: int = 5  # 连续查询状态失败该次数后，向订阅者推送错误并结束跟踪
+    task_status_stream_timeout: float = 3600.0  # 单个SSE流等待最终状态的最长时间(秒)
+    task_status_record_ttl: int = 24 * 3600  # Redis中任务状态记录的保留时间(秒)
+    task_status_coalesce_interval: float = 0.5  # 同一任务两次状态写入的最小间隔(秒)
+    task_status_final_retries: int = 5  # 最终状态记录写入失败后的重试次数（间隔按写入间隔指数增长）
+
+    # Known identifier Bloom filter (DOI / arXiv / title / alias membership)
+    bloom_filter_enabled: bool = True
+    bloom_filter_capacity: int = 2_000_000  # 预期元素数量
+    bloom_filter_error_rate: float = 0.01  # 目标假阳性率
+    bloom_filter_max_memory_mb: int = 32  # 每个进程位数组内存上限
+    bloom_filter_stream_maxlen: int = 100_000  # 增量更新流的最大长度
+
+    # MinHash-LSH near-duplicate detection (title + author shingles)
+    near_duplicate_enabled: bool = True
+    near_duplicate_threshold: float = 0.5  # 候选对的估算Jaccard阈值（候选仍需标题/作者规则确认）
+    near_duplicate_num_perm: int = 64  # MinHash签名长度
+    near_duplicate_refresh_interval: int = 30  # 增量刷新其他进程写入的间隔(秒)
+
+    # In-memory CSR citation graph cache (API process)
+    graph_cache_enabled: bool = True
+    graph_cache_reload_interval: int = 3600  # 后台全量重建间隔(秒)
+    graph_cache_overlay_limit: int = 50_000  # 增量覆盖层超过该规模时提前重建
+    graph_cache_max_nodes: int = 5000  # 单次邻域查询最多返回的节点数
+    graph_cache_stream_maxlen: int = 100_000  # 边变更流的最大长度
+
+    # Internal relationship graph endpoint (GET/POST /api/graphs)
+    graph_max_lids: int = 5000  # 单次请求最多分析的LID数量
+
+    # Unresolved → Literature reconciliation job
+    unresolved_upgrade_inline: bool = True  # 入库任务中逐篇升级占位符；False时仅由对账任务处理
+    unresolved_reconcile_interval: int = 15 * 60  # 对账任务调度间隔(秒)，0表示不调度
+    unresolved_reconcile_batch_size: int = 500  # 每批扫描的占位符数量
+    unresolved_reconcile_batch_budget: int = 300  # 单批对账允许的最长耗时(秒)，对账锁TTL为其两倍并逐批续期
+    unresolved_enrich_interval: int = 6 * 3600  # 占位符批量补全(Semantic Scholar batch)调度间隔(秒)，0表示不调度
+    unresolved_enrich_batch_size: int = 500  # 每批补全的占位符数量（S2 batch接口上限500）
+
+    # Offline citation graph analytics job (requires numpy + scipy on the worker)
+    graph_analytics_interval: int = 24 * 3600  # 调度间隔(秒)，0表示不调度；未安装numpy/scipy时也不调度
+    graph_analytics_top_k: int = 10  # 共被引/文献耦合每篇保留的数量
+    graph_analytics_min_confidence: float = 0.0  # 参与计算的最低边置信度
+    graph_analytics_damping: float = 0.85  # PageRank阻尼系数
+    graph_analytics_phase_budget: int = 30 * 60  # 导出/计算/写回每个阶段允许的最长耗时(秒)，分析锁TTL为其两倍并逐阶段续期
+
     # Celery settings
     celery_broker_url: str = ""  # Will be computed from redis settings
     celery_result_backend: str = ""  # Will be computed from redis settings
@@ -109,6 +207,30 @@ class Settings(BaseSettings):
     celery_task_time_limit: int = 35 * 60  # 35 minutes (增加5分钟缓冲)
     celery_task_soft_time_limit: int = 30 * 60  # 30 minutes (增加5分钟缓冲)
     celery_worker_prefetch_multiplier: int = 2  # 每个worker预取2个任务提高效率
+    celery_result_expires: int = 3600  # 任务结果保留时间(秒)
+
+    # 任务优先级通道：interactive / normal / bulk 三个队列按权重消费
+    task_queue_interactive_weight: int = 6  # 交互式通道（用户同步等待）的消费权重
+    task_queue_normal_weight: int = 3  # 普通通道的消费权重
+    task_queue_bulk_weight: int = 1  # 批量导入/定时维护通道的消费权重
+    task_submission_ttl: int = 3600  # 待处理任务登记的有效期(秒)，用于合并同一文献的重复提交
+    task_submission_pending_grace: int = 30  # PENDING任务仅在提交后该时间(秒)内复用；Celery对丢失的任务也报告PENDING
+
+    # 任务入口准入控制：按队列深度与worker吞吐量拒绝过载提交（429/503 + Retry-After）
+    admission_control_enabled: bool = True  # 是否启用准入控制
+    admission_max_interactive_depth: int = 200  # 交互式队列最大排队任务数，超过返回429
+    admission_max_normal_depth: int = 2000  # 普通队列最大排队任务数，超过返回429
+    admission_max_bulk_depth: int = 50000  # 批量队列最大排队任务数，超过返回429
+    admission_max_wait: int = 1800  # 预计等待时间上限(秒)，超过返回503；不超过结果保留时间的一半
+    admission_stalled_depth: int = 100  # 窗口内无任务完成且排队数达到该值时视为worker停滞，返回503
+    admission_throughput_window: int = 300  # 统计worker吞吐量的时间窗口(秒)
+    admission_snapshot_ttl: float = 1.0  # 队列状态本地缓存时间(秒)
+    admission_default_retry_after: int = 30  # 无法估算时返回的Retry-After(秒)
+
+    # 异步worker模式：threads池 + 进程内共享事件循环，单进程并发处理多个文献任务
+    worker_async_mode: bool = False  # 是否启用异步worker模式
+    worker_async_concurrency: int = 32  # 单进程同时处理的文献任务数
+    worker_async_max_memory_mb: int = 0  # 进程RSS超过该值(MiB)时暂缓开始新任务，0表示不限制
 
     # MongoDB db_url method removed - using Neo4j only
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+布隆过滤器 - Paper Parser 0.2
+
+紧凑的概率集合成员判断结构：
+- 判断"不存在"是确定的（无假阴性）
+- 判断"可能存在"有可配置的假阳性率
+- 支持按内存预算限制位数组大小
+"""
+
+import hashlib
+import math
+from typing import Iterable, Optional
+
+
+class BloomFilter:
+    """基于 bytearray 的布隆过滤器（双重哈希）"""
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.01,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        创建布隆过滤器。
+
+        Args:
+            capacity: 预期元素数量
+            error_rate: 目标假阳性率 (0, 1)
+            max_bytes: 位数组最大字节数，超出时按预算截断（假阳性率会升高）
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+
+        bit_size = self.optimal_bit_size(self.capacity, error_rate)
+        if max_bytes:
+            bit_size = min(bit_size, max(int(max_bytes), 1) * 8)
+
+        self.bit_size = max(bit_size, 8)
+        self.hash_count = self.optimal_hash_count(self.bit_size, self.capacity)
+        self.count = 0
+        self._bits = bytearray((self.bit_size + 7) // 8)
+
+    @staticmethod
+    def optimal_bit_size(capacity: int, error_rate: float) -> int:
+        """m = -n·ln(p) / (ln 2)²"""
+        return int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+
+    @staticmethod
+    def optimal_hash_count(bit_size: int, capacity: int) -> int:
+        """k = (m / n)·ln 2"""
+        return max(1, int(round(bit_size / capacity * math.log(2))))
+
+    @property
+    def size_bytes(self) -> int:
+        """位数组占用的字节数"""
+        return len(self._bits)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.bit_size
+
+    def add(self, item: str) -> None:
+        """添加元素"""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """批量添加元素"""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def estimated_error_rate(self) -> float:
+        """按当前元素数量估算的实际假阳性率"""
+        if self.count == 0:
+            return 0.0
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_size)) ** self.hash_count
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+CSR 引用图 - Paper Parser 0.2
+
+以压缩稀疏行（CSR）格式在内存中保存 CITES 边：
+- 节点 LID 映射为连续整数下标
+- 出边：out_offsets[i]..out_offsets[i+1] 为节点 i 的出边在 out_targets 中的区间
+- 入边：同样的结构，入边条目保存出边数组中的边下标，置信度等属性只存一份
+- 使用 array 模块存储，每条边约 22 字节
+
+结构本身不可变；增量修改由上层缓存以覆盖层（overlay）的形式维护，
+累积到一定量后重新构建。
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 置信度缺失时的存储值（总是低于任何置信度阈值）
+MISSING_CONFIDENCE = -1.0
+
+EdgeTuple = Tuple[str, str, Optional[float], Optional[str]]
+
+
+class CSRGraph:
+    """不可变的 CSR 有向图（带边置信度和来源）"""
+
+    def __init__(self, edges: Iterable[EdgeTuple]):
+        """
+        从边列表构建图。
+
+        Args:
+            edges: (from_lid, to_lid, confidence, source) 元组；重复边保留最后一条
+        """
+        self.lids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.sources: List[Optional[str]] = [None]
+        source_index: Dict[Optional[str], int] = {None: 0}
+
+        unique: Dict[Tuple[int, int], Tuple[float, int]] = {}
+        for from_lid, to_lid, confidence, source in edges:
+            if not from_lid or not to_lid:
+                continue
+            src = self._intern(from_lid)
+            dst = self._intern(to_lid)
+            if source not in source_index:
+                source_index[source] = len(self.sources)
+                self.sources.append(source)
+            unique[(src, dst)] = (
+                MISSING_CONFIDENCE if confidence is None else float(confidence),
+                source_index[source],
+            )
+
+        node_count = len(self.lids)
+        ordered = sorted(unique.items())
+
+        # 出边
+        self.out_offsets = array("i", [0] * (node_count + 1))
+        self.out_targets = array("i")
+        self.out_confidence = array("d")
+        self.out_source = array("H")
+        for (src, dst), (confidence, source_id) in ordered:
+            self.out_offsets[src + 1] += 1
+            self.out_targets.append(dst)
+            self.out_confidence.append(confidence)
+            self.out_source.append(source_id)
+        for i in range(node_count):
+            self.out_offsets[i + 1] += self.out_offsets[i]
+
+        # 入边（保存出边下标）
+        in_counts = [0] * (node_count + 1)
+        for (_, dst), _ in ordered:
+            in_counts[dst + 1] += 1
+        for i in range(node_count):
+            in_counts[i + 1] += in_counts[i]
+        self.in_offsets = array("i", in_counts)
+        self.in_edges = array("i", [0] * len(ordered))
+        cursor = list(in_counts[:-1])
+        for edge_id, ((_, dst), _) in enumerate(ordered):
+            self.in_edges[cursor[dst]] = edge_id
+            cursor[dst] += 1
+
+        self._edge_sources = array("i")
+        for src in range(node_count):
+            self._edge_sources.extend([src] * (self.out_offsets[src + 1] - self.out_offsets[src]))
+
+    def _intern(self, lid: str) -> int:
+        index = self._index.get(lid)
+        if index is None:
+            index = len(self.lids)
+            self._index[lid] = index
+            self.lids.append(lid)
+        return index
+
+    # ========== 查询 ==========
+
+    @property
+    def node_count(self) -> int:
+        return len(self.lids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.out_targets)
+
+    def index_of(self, lid: str) -> Optional[int]:
+        """LID 对应的节点下标"""
+        return self._index.get(lid)
+
+    def edge(self, edge_id: int) -> Tuple[str, str, Optional[float], Optional[str]]:
+        """边下标对应的 (from_lid, to_lid, confidence, source)"""
+        confidence = self.out_confidence[edge_id]
+        return (
+            self.lids[self._edge_sources[edge_id]],
+            self.lids[self.out_targets[edge_id]],
+            None if confidence == MISSING_CONFIDENCE else confidence,
+            self.sources[self.out_source[edge_id]],
+        )
+
+    def out_degree(self, index: int) -> int:
+        return self.out_offsets[index + 1] - self.out_offsets[index]
+
+    def in_degree(self, index: int) -> int:
+        return self.in_offsets[index + 1] - self.in_offsets[index]
+
+    def incident_edges(self, index: int, min_confidence: float) -> Iterator[Tuple[int, int]]:
+        """
+        遍历节点的出边和入边（无向视图）。
+
+        Args:
+            index: 节点下标
+            min_confidence: 置信度下限
+
+        Yields:
+            (邻居下标, 边下标)
+        """
+        for edge_id in range(self.out_offsets[index], self.out_offsets[index + 1]):
+            if self.out_confidence[edge_id] >= min_confidence:
+                yield self.out_targets[edge_id], edge_id
+        for position in range(self.in_offsets[index], self.in_offsets[index + 1]):
+            edge_id = self.in_edges[position]
+            if self.out_confidence[edge_id] >= min_confidence:
+                yield self._edge_sources[edge_id], edge_id
+
+    def iter_edges(self) -> Iterator[EdgeTuple]:
+        """遍历全部边"""
+        for edge_id in range(self.edge_count):
+            yield self.edge(edge_id)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+预计算匹配键工具模块 - Paper Parser 0.2
+
+在写入时为 Literature / Unresolved 节点计算一次匹配键，并作为扁平属性
+存储在节点上，避免匹配器每次比较时重新解析 JSON 和重复标准化：
+- match_title: 标准化标题（normalize_title_for_matching）
+- match_title_tokens: 标题有意义词汇（去停用词，已排序）
+- match_author_signatures: 作者签名（姓_名首字母，已排序去重）
+- match_doi: 标准化DOI（小写，去除 doi.org / doi: 前缀）
+- match_arxiv_id: 标准化ArXiv ID（小写，去除 arXiv: 前缀和版本号）
+- match_year: 整数年份
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from .author_matching import AuthorMatchingUtils
+from .title_matching import TitleMatchingUtils
+from .title_normalization import normalize_title_for_matching
+
+# 节点上存储的所有匹配键字段
+MATCH_KEY_FIELDS = (
+    "match_title",
+    "match_title_tokens",
+    "match_author_signatures",
+    "match_doi",
+    "match_arxiv_id",
+    "match_year",
+)
+
+
+def normalize_doi(doi: Optional[str]) -> str:
+    """
+    标准化DOI用于精确比较。
+
+    Args:
+        doi: 原始DOI字符串（可能带 https://doi.org/ 或 doi: 前缀）
+
+    Returns:
+        小写的裸DOI，无效时返回空字符串
+    """
+    if not doi or not isinstance(doi, str):
+        return ""
+
+    doi = doi.strip()
+    doi = re.sub(r'^(https?://)?(dx\.)?doi\.org/', '', doi, flags=re.IGNORECASE)
+    doi = re.sub(r'^doi:\s*', '', doi, flags=re.IGNORECASE)
+
+    return doi.strip().lower()
+
+
+def normalize_arxiv_id(arxiv_id: Optional[str]) -> str:
+    """
+    标准化ArXiv ID，去除前缀和版本号。
+
+    Args:
+        arxiv_id: 原始ArXiv ID（如 "arXiv:1706.03762v5"）
+
+    Returns:
+        小写的裸ArXiv ID（如 "1706.03762"），无效时返回空字符串
+    """
+    if not arxiv_id or not isinstance(arxiv_id, str):
+        return ""
+
+    arxiv_id = arxiv_id.strip()
+    arxiv_id = re.sub(r'^(https?://)?(www\.)?arxiv\.org/(abs|pdf)/', '', arxiv_id, flags=re.IGNORECASE)
+    arxiv_id = re.sub(r'^arxiv:\s*', '', arxiv_id, flags=re.IGNORECASE)
+    arxiv_id = re.sub(r'\.pdf$', '', arxiv_id, flags=re.IGNORECASE)
+    arxiv_id = re.sub(r'v\d+$', '', arxiv_id)
+
+    return arxiv_id.strip().lower()
+
+
+def normalize_year(year: Any) -> Optional[int]:
+    """
+    将各种格式的年份转换为整数。
+
+    Args:
+        year: 年份（int、"2017"、"2017-06-12" 等）
+
+    Returns:
+        整数年份，无法解析时返回None
+    """
+    if year is None or isinstance(year, bool):
+        return None
+    if isinstance(year, int):
+        return year if year > 0 else None
+
+    match = re.match(r'^\s*(\d{4})', str(year))
+    return int(match.group(1)) if match else None
+
+
+def get_title_tokens(normalized_title: str) -> List[str]:
+    """
+    提取标准化标题的有意义词汇，返回排序后的列表（便于Neo4j存储）。
+
+    Args:
+        normalized_title: 已标准化的标题
+
+    Returns:
+        排序后的词汇列表
+    """
+    return sorted(TitleMatchingUtils.get_title_words(normalized_title))
+
+
+def _author_name(author: Any) -> str:
+    """从字符串或字典格式的作者数据中提取姓名。"""
+    if isinstance(author, str):
+        return author
+    if isinstance(author, dict):
+        return (
+            author.get("name")
+            or author.get("full_name")
+            or f"{author.get('given', '')} {author.get('family', '')}".strip()
+            or ""
+        )
+    if hasattr(author, "name"):
+        return getattr(author, "name") or ""
+    return ""
+
+
+def get_author_signatures(authors: Optional[Iterable[Any]]) -> List[str]:
+    """
+    为作者列表生成签名（与 AuthorMatchingUtils.match_authors 使用相同规则）。
+
+    Args:
+        authors: 作者列表（字符串、字典或 AuthorModel）
+
+    Returns:
+        排序去重后的签名列表
+    """
+    if not authors or isinstance(authors, str):
+        return []
+
+    signatures = set()
+    for author in authors:
+        parsed = AuthorMatchingUtils.parse_author_name(_author_name(author))
+        if not parsed["last"]:
+            continue
+        signature = AuthorMatchingUtils.create_author_signature(parsed)
+        if signature and signature != "unknown":
+            signatures.add(signature)
+
+    return sorted(signatures)
+
+
+def build_match_keys(
+    title: Optional[str] = None,
+    authors: Optional[Iterable[Any]] = None,
+    doi: Optional[str] = None,
+    year: Any = None,
+    arxiv_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    计算一条文献/引用的全部匹配键。
+
+    返回值只包含Neo4j原生类型（字符串、整数、字符串列表），可直接
+    合并到节点属性中。缺失字段为空字符串、空列表或None。
+
+    Args:
+        title: 原始标题
+        authors: 作者列表
+        doi: DOI
+        year: 发表年份
+        arxiv_id: ArXiv ID
+
+    Returns:
+        匹配键字典，键名见 MATCH_KEY_FIELDS
+    """
+    match_title = normalize_title_for_matching(title or "")
+
+    return {
+        "match_title": match_title,
+        "match_title_tokens": get_title_tokens(match_title),
+        "match_author_signatures": get_author_signatures(authors),
+        "match_doi": normalize_doi(doi),
+        "match_arxiv_id": normalize_arxiv_id(arxiv_id),
+        "match_year": normalize_year(year),
+    }
+
+
+def match_keys_for_literature(literature: Any) -> Dict[str, Any]:
+    """
+    为 LiteratureModel 计算匹配键。
+
+    Args:
+        literature: LiteratureModel 实例
+
+    Returns:
+        匹配键字典
+    """
+    metadata = getattr(literature, "metadata", None)
+    identifiers = getattr(literature, "identifiers", None)
+
+    return build_match_keys(
+        title=getattr(metadata, "title", None) if metadata else None,
+        authors=getattr(metadata, "authors", None) if metadata else None,
+        doi=getattr(identifiers, "doi", None) if identifiers else None,
+        year=getattr(metadata, "year", None) if metadata else None,
+        arxiv_id=getattr(identifiers, "arxiv_id", None) if identifiers else None,
+    )
+
+
+def match_keys_for_reference(parsed_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    为解析后的引用数据（Unresolved 节点的 parsed_data）计算匹配键。
+
+    Args:
+        parsed_data: 引用解析结果字典
+
+    Returns:
+        匹配键字典
+    """
+    parsed_data = parsed_data if isinstance(parsed_data, dict) else {}
+    identifiers = parsed_data.get("identifiers") or {}
+
+    return build_match_keys(
+        title=parsed_data.get("title"),
+        authors=parsed_data.get("authors") or parsed_data.get("author"),
+        doi=parsed_data.get("doi") or identifiers.get("doi"),
+        year=parsed_data.get("year"),
+        arxiv_id=parsed_data.get("arxiv_id") or identifiers.get("arxiv_id"),
+    )
+
+
+def has_match_keys(data: Dict[str, Any]) -> bool:
+    """
+    判断字典（节点属性或候选数据）是否已包含预计算的匹配键。
+
+    Neo4j不存储null属性，因此只以 match_title 作为存在标记，
+    其余缺失字段按空值处理。
+    """
+    return isinstance(data, dict) and data.get("match_title") is not None
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+MinHash / LSH 近似重复检测工具 - Paper Parser 0.2
+
+- 将标题和作者转换为 shingle 集合（标题字符4-gram + 作者签名）
+- MinHash 签名的相等位比例是两个集合 Jaccard 相似度的无偏估计
+- LSH 将签名分为 b 个 band、每个 band r 行，任一 band 完全相同即成为候选，
+  查询代价与语料规模无关
+
+Jaccard 为 s 的两条记录成为候选的概率为 1 - (1 - s^r)^b，
+通过 choose_lsh_params 为给定阈值选择 (b, r)。
+"""
+
+import hashlib
+import random
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+# 梅森素数 2^61 - 1，用于通用哈希 (a·x + b) mod p
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 固定种子，保证不同进程、持久化的签名可以互相比较
+DEFAULT_SEED = 1
+
+
+def title_shingles(normalized_title: str, size: int = 4) -> Set[str]:
+    """
+    生成标题的字符 n-gram。
+
+    字符级 shingle 对拼写差异、单复数、连字符等小改动不敏感。
+
+    Args:
+        normalized_title: 已标准化的标题
+        size: n-gram 长度
+
+    Returns:
+        shingle 集合（带 "t:" 前缀）
+    """
+    if not normalized_title:
+        return set()
+    text = " ".join(normalized_title.split())
+    if len(text) <= size:
+        return {f"t:{text}"}
+    return {f"t:{text[i:i + size]}" for i in range(len(text) - size + 1)}
+
+
+def record_shingles(
+    normalized_title: str,
+    author_signatures: Optional[Iterable[str]] = None,
+    size: int = 4,
+) -> Set[str]:
+    """
+    生成一条文献的 shingle 集合（标题 + 作者签名）。
+
+    Args:
+        normalized_title: 已标准化的标题（match_title）
+        author_signatures: 作者签名（match_author_signatures）
+        size: 标题 n-gram 长度
+
+    Returns:
+        shingle 集合
+    """
+    shingles = title_shingles(normalized_title, size)
+    shingles.update(f"a:{signature}" for signature in author_signatures or [])
+    return shingles
+
+
+def jaccard(set1: Set[str], set2: Set[str]) -> float:
+    """精确 Jaccard 相似度"""
+    if not set1 and not set2:
+        return 0.0
+    return len(set1 & set2) / len(set1 | set2)
+
+
+class MinHasher:
+    """MinHash 签名生成器"""
+
+    def __init__(self, num_perm: int = 64, seed: int = DEFAULT_SEED):
+        """
+        Args:
+            num_perm: 哈希函数（签名长度）数量
+            seed: 随机种子
+        """
+        if num_perm <= 0:
+            raise ValueError("num_perm must be positive")
+        self.num_perm = num_perm
+        self.seed = seed
+        rng = random.Random(seed)
+        self._params = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    @staticmethod
+    def _hash(shingle: str) -> int:
+        return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+    def signature(self, shingles: Iterable[str]) -> List[int]:
+        """
+        计算 shingle 集合的签名。
+
+        Args:
+            shingles: shingle 集合
+
+        Returns:
+            长度为 num_perm 的整数列表；空集合返回空列表
+        """
+        hashes = [self._hash(shingle) for shingle in set(shingles)]
+        if not hashes:
+            return []
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._params
+        ]
+
+    @staticmethod
+    def estimate_jaccard(sig1: Sequence[int], sig2: Sequence[int]) -> float:
+        """用签名估算 Jaccard 相似度"""
+        if not sig1 or not sig2 or len(sig1) != len(sig2):
+            return 0.0
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    """Jaccard 为 similarity 的两条记录成为候选的概率"""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def choose_lsh_params(
+    threshold: float,
+    num_perm: int,
+    false_positive_weight: float = 0.5,
+    false_negative_weight: float = 0.5,
+) -> Tuple[int, int]:
+    """
+    为给定阈值选择 band 数 b 和每 band 行数 r（b·r ≤ num_perm）。
+
+    最小化阈值以下的候选概率积分（假阳性）与阈值以上的漏检概率积分
+    （假阴性）的加权和。
+
+    Args:
+        threshold: Jaccard 阈值 (0, 1)
+        num_perm: 签名长度
+        false_positive_weight: 假阳性权重
+        false_negative_weight: 假阴性权重
+
+    Returns:
+        (bands, rows)
+    """
+    if not 0 < threshold < 1:
+        raise ValueError("threshold must be between 0 and 1")
+
+    def integrate(func, low, high, steps=100):
+        width = (high - low) / steps
+        return sum(func(low + (i + 0.5) * width) for i in range(steps)) * width
+
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            fp = integrate(lambda s: candidate_probability(s, bands, rows), 0.0, threshold)
+            fn = integrate(lambda s: 1 - candidate_probability(s, bands, rows), threshold, 1.0)
+            error = false_positive_weight * fp + false_negative_weight * fn
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """基于 band 的 MinHash LSH 索引"""
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        num_perm: int = 64,
+        params: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Args:
+            threshold: 目标 Jaccard 阈值
+            num_perm: 签名长度（需与 MinHasher 一致）
+            params: 显式指定 (bands, rows)，默认按阈值自动选择
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = params or choose_lsh_params(threshold, num_perm)
+        self._tables: List[Dict[Tuple[int, ...], Set[Hashable]]] = [
+            defaultdict(set) for _ in range(self.bands)
+        ]
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+
+    def _band_keys(self, signature: Sequence[int]):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, tuple(signature[start:start + self.rows])
+
+    def insert(self, key: Hashable, signature: Sequence[int]) -> None:
+        """插入（或替换）一条记录"""
+        if len(signature) != self.num_perm:
+            return
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = tuple(signature)
+        for band, band_key in self._band_keys(signature):
+            self._tables[band][band_key].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """删除一条记录"""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            bucket = self._tables[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._tables[band][band_key]
+
+    def query(self, signature: Sequence[int]) -> Set[Hashable]:
+        """返回与签名至少共享一个 band 的所有记录"""
+        if len(signature) != self.num_perm:
+            return set()
+        candidates: Set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            bucket = self._tables[band].get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def query_ranked(
+        self,
+        signature: Sequence[int],
+        min_similarity: Optional[float] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        返回候选及其估算相似度，按相似度降序排列。
+
+        Args:
+            signature: 查询签名
+            min_similarity: 估算相似度下限，默认使用索引阈值
+
+        Returns:
+            (key, 估算Jaccard) 列表
+        """
+        floor = self.threshold if min_similarity is None else min_similarity
+        ranked = []
+        for key in self.query(signature):
+            similarity = MinHasher.estimate_jaccard(signature, self._signatures[key])
+            if similarity >= floor:
+                ranked.append((key, similarity))
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
+
+    def signature_of(self, key: Hashable) -> Optional[Tuple[int, ...]]:
+        """返回已索引记录的签名"""
+        return self._signatures.get(key)
+
+    def keys(self) -> List[Hashable]:
+        """所有已索引的记录"""
+        return list(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+URL规范化工具模块 - Paper Parser 0.2
+
+把同一篇论文的URL变体归一为同一个规范形式，用作URL映射缓存的键：
+- 协议统一为 https，主机名小写并去除 www. 前缀，去除片段和末尾斜杠
+- 去除跟踪参数（utm_*、fbclid、gclid 等），其余查询参数排序
+- arXiv: /pdf/ 与 /abs/ 统一为 /abs/，去除版本号和 .pdf 后缀
+- ACM: /doi/pdf/、/doi/abs/、/doi/full/ 统一为 /doi/
+- OpenReview: /pdf?id= 统一为 /forum?id=
+- DOI: dx.doi.org 统一为 doi.org，DOI 小写（DOI 不区分大小写）
+
+规范形式只用于比较和缓存，不用于实际请求。
+"""
+
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .match_keys import normalize_arxiv_id
+
+# 不影响页面内容的跟踪参数
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "_hsenc", "_hsmi",
+    "ref", "ref_src", "referrer", "source", "via", "share", "sharing", "cmpid", "campaign",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+ARXIV_PATH_PATTERN = re.compile(r"^/(?:abs|pdf)/(.+?)(?:\.pdf)?$", re.IGNORECASE)
+ACM_PATH_PATTERN = re.compile(r"^/doi/(?:pdf|abs|full|epdf|fullhtml)/", re.IGNORECASE)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: Optional[str]) -> str:
+    """
+    规范化URL
+
+    Args:
+        url: 原始URL（可以省略协议头）
+
+    Returns:
+        规范化后的URL，无法解析时返回空字符串
+    """
+    if not url or not isinstance(url, str):
+        return ""
+
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+    except ValueError:
+        return ""
+    if not host:
+        return ""
+
+    if host.startswith("www."):
+        host = host[4:]
+    path = re.sub(r"/{2,}", "/", parts.path or "").rstrip("/")
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k)]
+
+    if host in ("arxiv.org", "export.arxiv.org"):
+        host = "arxiv.org"
+        match = ARXIV_PATH_PATTERN.match(path)
+        if match:
+            path = "/abs/" + normalize_arxiv_id(match.group(1))
+            query = []
+    elif host == "dl.acm.org":
+        path = ACM_PATH_PATTERN.sub("/doi/", path)
+    elif host == "openreview.net" and path == "/pdf":
+        path = "/forum"
+    elif host in ("doi.org", "dx.doi.org"):
+        host = "doi.org"
+        path = path.lower()
+
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
@@ -5,87 +5,292 @@ This module implements graph query endpoints as specified in the 0.2 API design.
 Provides citation graph functionality powered by Neo4j relationship traversal.
 """
 
+import json
 import logging
-from typing import Dict, List, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.models.relationship import CitationGraphNode, InternalGraphRequest
+from literature_parser_backend.settings import Settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/graphs", tags=["关系图"])
 
+NODE_FIELDS = ["lid", "title", "year"]
+EDGELIST_FIELDS = ["from_lid", "to_lid", "confidence"]
+
 
 @router.get("", summary="Get internal literature relationship graph")
 async def get_literature_graph(
     lids: str = Query(
         ...,
         description="Comma-separated list of LIDs to analyze internal relationships for",
-        example="2017-vaswani-aayn-6a05,2019-do-gtpncr-72ef"
-    )
-) -> Dict[str, Any]:
+        examples=["2017-vaswani-aayn-6a05,2019-do-gtpncr-72ef"]
+    ),
+    format: str = Query(
+        "full",
+        pattern="^(full|edgelist)$",
+        description="'full' returns edge/node objects; 'edgelist' returns compact arrays"
+    ),
+) -> StreamingResponse:
     """
     Get internal relationship graph for specified literatures.
     
     This endpoint analyzes citation relationships ONLY between the specified literatures
-    (internal relationships only, no external connections).
+    (internal relationships only, no external connections). For large sets
+    (reading lists, lab libraries) use ``POST /graphs`` to avoid URL length limits.
     
     Args:
         lids: Comma-separated string of Literature IDs to analyze
+        format: Response format
+        
+    Returns:
+        Streamed graph data with edges (internal relationships), nodes and metadata
+        
+    Raises:
+        400: Invalid parameters
+        500: Internal server error
+    """
+    lid_list = [lid.strip() for lid in lids.split(",") if lid.strip()]
+    return await _internal_graph_response(lid_list, format)
+
+
+@router.post("", summary="Get internal relationship graph for a large LID set")
+async def post_literature_graph(request: InternalGraphRequest) -> StreamingResponse:
+    """
+    Get internal relationship graph for a set of literatures given in the body.
+    
+    Same response as ``GET /graphs``.
+    
+    Args:
+        request: LIDs and response format
         
     Returns:
-        Graph data structure with nodes (literatures) and edges (internal relationships)
+        Streamed graph data with edges, nodes and metadata
         
     Raises:
         400: Invalid parameters
         500: Internal server error
     """
+    lid_list = [lid.strip() for lid in request.lids if lid and lid.strip()]
+    return await _internal_graph_response(lid_list, request.format)
+
+
+async def _internal_graph_response(lid_list: List[str], fmt: str) -> StreamingResponse:
+    """Validate the LID set, run the query and start streaming the graph."""
+    lid_list = list(dict.fromkeys(lid_list))
+
+    if not lid_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one LID must be provided.",
+        )
+
+    max_lids = Settings().graph_max_lids
+    if len(lid_list) > max_lids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many LIDs requested. Maximum {max_lids} LIDs per graph request.",
+        )
+
+    logger.info(f"🕸️ Internal graph request for {len(lid_list)} LIDs ({fmt})")
+
+    rows = None
     try:
-        # Parse comma-separated LIDs
-        lid_list = [lid.strip() for lid in lids.split(",") if lid.strip()]
+        relationship_dao = RelationshipDAO.create_from_global_connection()
+        rows = relationship_dao.iter_internal_citation_graph(lid_list)
+        # Run the query before the 200 is sent, so a failing query is still a 500
+        try:
+            first_row: Optional[Dict[str, Any]] = await rows.__anext__()
+        except StopAsyncIteration:
+            first_row = None
+    except Exception as e:
+        if rows is not None:
+            await rows.aclose()
+        logger.error(f"❌ Error in graph request: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate literature graph: {e!s}",
+        ) from e
+
+    return StreamingResponse(
+        _stream_internal_graph(rows, lid_list, fmt, first_row=first_row),
+        media_type="application/json",
+    )
+
+
+def _iso(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+async def _chain_rows(
+    first_row: Optional[Dict[str, Any]],
+    rows: AsyncIterator[Dict[str, Any]],
+) -> AsyncIterator[Dict[str, Any]]:
+    if first_row is not None:
+        yield first_row
+    async for row in rows:
+        yield row
+
+
+async def _stream_internal_graph(
+    rows: AsyncIterator[Dict[str, Any]],
+    lid_list: List[str],
+    fmt: str,
+    first_row: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[str]:
+    """
+    Serialize the internal graph as JSON while the query result is consumed.
+    
+    Edges are written as they arrive; nodes and metadata follow once the
+    result is exhausted. The ``full`` format keeps the document of the
+    non-streaming endpoint (``CitationGraphNode`` nodes, ``target_lids``,
+    ``metadata.requested_lids``); ``edgelist`` is the opt-in compact form.
+    The query has already been started by the caller, so only a failure
+    midway is reported in the body: the document is still closed, with
+    ``metadata.status`` set to ``"error"``.
+    """
+    compact = fmt == "edgelist"
+    nodes: Dict[str, Dict[str, Any]] = {}
+    in_degree: Dict[str, int] = {}
+    total_edges = 0
+    error = None
+
+    yield '{"edges": ['
+    try:
+        async for row in _chain_rows(first_row, rows):
+            from_lid = row["lid"]
+            nodes[from_lid] = row
+            chunk = []
+            for to_lid, confidence, source, created_at in row["cites"]:
+                in_degree[to_lid] = in_degree.get(to_lid, 0) + 1
+                if compact:
+                    edge: Any = [from_lid, to_lid, confidence]
+                else:
+                    edge = {
+                        "from_lid": from_lid,
+                        "to_lid": to_lid,
+                        "confidence": confidence,
+                        "source": source,
+                        "created_at": _iso(created_at),
+                    }
+                chunk.append(json.dumps(edge, ensure_ascii=False))
+            if chunk:
+                yield ("," if total_edges else "") + ",".join(chunk)
+                total_edges += len(chunk)
+    except Exception as e:
+        logger.error(f"❌ Error in graph request: {e!s}")
+        error = f"Failed to generate literature graph: {e!s}"
+
+    if compact:
+        node_list: List[Any] = [[row["lid"], row["title"], row["year"]] for row in nodes.values()]
+    else:
+        node_list = [
+            CitationGraphNode(
+                lid=row["lid"],
+                title=row["title"],
+                year=row["year"],
+                in_degree=in_degree.get(row["lid"], 0),
+                out_degree=len(row["cites"]),
+            ).model_dump()
+            for row in nodes.values()
+        ]
+
+    metadata: Dict[str, Any] = {
+        "total_nodes": len(nodes),
+        "total_edges": total_edges,
+        "requested_lids": lid_list,
+        "total_requested": len(lid_list),
+        "missing_lids": [lid for lid in lid_list if lid not in nodes],
+        "relationship_type": "internal_only",
+        "format": fmt,
+        "api_version": "0.2",
+        "status": "error" if error else "success",
+    }
+    if compact:
+        metadata["node_fields"] = NODE_FIELDS
+        metadata["edge_fields"] = EDGELIST_FIELDS
+    if error:
+        metadata["error"] = error
+    else:
+        logger.info(f"✅ Graph query successful: {len(nodes)} nodes, {total_edges} edges")
+
+    yield (
+        '], "nodes": ' + json.dumps(node_list, ensure_ascii=False)
+        + ', "target_lids": ' + json.dumps(lid_list, ensure_ascii=False)
+        + ', "relationship_type": "internal_only"'
+        + ', "metadata": ' + json.dumps(metadata, ensure_ascii=False) + "}"
+    )
+
+
+@router.get("/neighborhood", summary="Get k-hop citation neighborhood")
+async def get_citation_neighborhood(
+    lids: str = Query(
+        ...,
+        description="Comma-separated list of center LIDs",
+        examples=["2017-vaswani-aayn-6a05"]
+    ),
+    depth: int = Query(2, ge=1, le=4, description="Maximum number of citation hops"),
+    min_confidence: float = Query(0.5, ge=0.0, le=1.0, description="Minimum edge confidence"),
+) -> Dict[str, Any]:
+    """
+    Get the citation neighborhood around the specified literatures.
+    
+    Follows citations in both directions up to ``depth`` hops, keeping only
+    edges with confidence >= ``min_confidence``. Very large neighborhoods are
+    truncated (``truncated`` is set in the response).
+    
+    Args:
+        lids: Comma-separated string of center Literature IDs
+        depth: Maximum number of hops
+        min_confidence: Minimum edge confidence
         
+    Returns:
+        Graph data structure with nodes and edges
+        
+    Raises:
+        400: Invalid parameters
+        500: Internal server error
+    """
+    try:
+        lid_list = [lid.strip() for lid in lids.split(",") if lid.strip()]
+
         if not lid_list:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="At least one LID must be provided.",
             )
 
-        if len(lid_list) > 20:  # Reasonable limit for graph analysis
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Too many LIDs requested. Maximum 20 LIDs per graph request.",
-            )
-
-        logger.info(f"🕸️ Internal graph request for {len(lid_list)} LIDs")
+        logger.info(f"🕸️ Neighborhood request for {len(lid_list)} LIDs (depth={depth})")
 
-        # Get internal citation graph using RelationshipDAO
         relationship_dao = RelationshipDAO.create_from_global_connection()
-        graph_data = await relationship_dao.get_internal_citation_graph(
-            target_lids=lid_list
+        graph_data = await relationship_dao.get_citation_graph(
+            center_lids=lid_list,
+            max_depth=depth,
+            min_confidence=min_confidence
         )
-        
-        # Enhance response with metadata
-        response = {
+
+        return {
             **graph_data,
             "metadata": {
                 "total_nodes": len(graph_data.get("nodes", [])),
                 "total_edges": len(graph_data.get("edges", [])),
-                "requested_lids": lid_list,
-                "total_requested": len(lid_list),
-                "relationship_type": "internal_only",
+                "truncated": graph_data.get("truncated", False),
                 "api_version": "0.2",
                 "status": "success"
             }
         }
-        
-        logger.info(f"✅ Graph query successful: {response['metadata']['total_nodes']} nodes, {response['metadata']['total_edges']} edges")
-        return response
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error in graph request: {e!s}")
+        logger.error(f"❌ Error in neighborhood request: {e!s}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate literature graph: {e!s}",
+            detail=f"Failed to generate citation neighborhood: {e!s}",
         ) from e
@@ -7,15 +7,25 @@ Includes convenient synchronous APIs for common use cases.
 
 import asyncio
 import logging
+import math
 from typing import List, Optional, Dict, Any
 
 from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 
-from literature_parser_backend.models.literature import LiteratureSummaryDTO, LiteratureCreateRequestDTO, LiteratureFulltextDTO
+from literature_parser_backend.models.literature import (
+    LiteratureCreateRequestDTO,
+    LiteratureFulltextDTO,
+    LiteratureSearchHitDTO,
+    LiteratureSearchResponseDTO,
+    LiteratureSummaryDTO,
+)
 from literature_parser_backend.db.dao import LiteratureDAO
 from literature_parser_backend.db.alias_dao import AliasDAO
-from literature_parser_backend.worker.tasks import process_literature_task
+from literature_parser_backend.models.task import TaskPriority
+from literature_parser_backend.services.search import InvalidCursorError, SearchQuery
+from literature_parser_backend.worker.admission import AdmissionRejected
+from literature_parser_backend.worker.queues import get_task_submitter
 from literature_parser_backend.worker.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -53,6 +63,35 @@ def _extract_celery_error_info(result) -> tuple[str, str]:
     return error_msg, error_type
 
 
+def _queued_response(task_id: str, wait_timeout: int, elapsed: float, estimated_wait: Optional[float]) -> JSONResponse:
+    """
+    202 response for a task the client should poll later.
+
+    ``estimated_wait`` is the queue wait estimated at submission; the
+    ``Retry-After`` header tells the client when polling is worthwhile.
+    """
+    remaining = (estimated_wait or 0) - elapsed
+    if elapsed < wait_timeout:
+        # Returned without waiting: the queue alone exceeds the wait timeout
+        body_status = "queued"
+        message = f"Task queued, estimated wait {estimated_wait:.0f}s exceeds wait_timeout of {wait_timeout}s"
+    else:
+        body_status = "processing_timeout"
+        message = f"Processing started but didn't complete within {wait_timeout}s"
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "status": body_status,
+            "message": message,
+            "task_id": task_id,
+            "wait_time_s": elapsed,
+            "estimated_wait_s": None if estimated_wait is None else round(max(remaining, 0), 1),
+            "suggestion": "Use GET /api/tasks/{task_id} to check status later"
+        },
+        headers={"Retry-After": str(max(5, math.ceil(remaining)))},
+    )
+
+
 def _extract_convenience_fields(literature) -> Dict[str, Any]:
     """
     Extract convenience fields from the literature model.
@@ -192,7 +231,11 @@ async def get_literature_by_doi(
         description="Maximum seconds to wait for processing if literature not found",
         ge=5,
         le=120
-    )
+    ),
+    priority: TaskPriority = Query(
+        TaskPriority.INTERACTIVE,
+        description="Queue lane for the processing task (the caller waits by default)",
+    ),
 ) -> Dict[str, Any]:
     """
     Get literature by DOI with automatic processing and synchronous waiting.
@@ -208,6 +251,7 @@ async def get_literature_by_doi(
     Args:
         value: DOI value to lookup
         wait_timeout: Maximum seconds to wait for processing (5-120)
+        priority: Queue lane for the processing task
         
     Returns:
         Literature data with processing status, or error if timeout
@@ -241,10 +285,14 @@ async def get_literature_by_doi(
             title="Processing..."  # Will be updated after processing
         )
         
-        # Start processing task
-        task = process_literature_task.delay(literature_data.model_dump())
+        # Start processing task (or reuse one in flight) unless the queue is overloaded
+        task = await get_task_submitter().submit_async(literature_data.model_dump(), priority)
         task_id = task.id
         
+        # Queue-aware timeout: don't hold the connection for a task that won't start in time
+        if task.estimated_wait is not None and task.estimated_wait > wait_timeout:
+            return _queued_response(task_id, wait_timeout, 0.0, task.estimated_wait)
+        
         logger.info(f"⏳ Waiting up to {wait_timeout}s for task {task_id}")
         
         # Wait for completion with timeout
@@ -254,16 +302,7 @@ async def get_literature_by_doi(
             elapsed = current_time - start_time
             
             if elapsed > wait_timeout:
-                return JSONResponse(
-                    status_code=status.HTTP_202_ACCEPTED,
-                    content={
-                        "status": "processing_timeout",
-                        "message": f"Processing started but didn't complete within {wait_timeout}s",
-                        "task_id": task_id,
-                        "wait_time_s": elapsed,
-                        "suggestion": "Use GET /api/tasks/{task_id} to check status later"
-                    }
-                )
+                return _queued_response(task_id, wait_timeout, elapsed, task.estimated_wait)
             
             # Check task status
             result = celery_app.AsyncResult(task_id)
@@ -309,6 +348,8 @@ async def get_literature_by_doi(
             # Wait a bit before checking again
             await asyncio.sleep(1.0)
             
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers) from e
     except Exception as e:
         logger.error(f"❌ Error in DOI lookup for {value}: {e}")
         raise HTTPException(
@@ -329,7 +370,11 @@ async def get_literature_by_title(
         description="Maximum seconds to wait for processing if literature not found",
         ge=5,
         le=120
-    )
+    ),
+    priority: TaskPriority = Query(
+        TaskPriority.INTERACTIVE,
+        description="Queue lane for the processing task (the caller waits by default)",
+    ),
 ) -> Dict[str, Any]:
     """
     Get literature by title with automatic processing and synchronous waiting.
@@ -339,6 +384,7 @@ async def get_literature_by_title(
     Args:
         value: Paper title to lookup
         wait_timeout: Maximum seconds to wait for processing (5-120)
+        priority: Queue lane for the processing task
         
     Returns:
         Literature data with processing status, or error if timeout
@@ -370,9 +416,12 @@ async def get_literature_by_title(
             identifiers={}
         )
         
-        task = process_literature_task.delay(literature_data.model_dump())
+        task = await get_task_submitter().submit_async(literature_data.model_dump(), priority)
         task_id = task.id
         
+        if task.estimated_wait is not None and task.estimated_wait > wait_timeout:
+            return _queued_response(task_id, wait_timeout, 0.0, task.estimated_wait)
+        
         logger.info(f"⏳ Waiting up to {wait_timeout}s for task {task_id}")
         
         # Similar waiting logic as DOI endpoint
@@ -382,16 +431,7 @@ async def get_literature_by_title(
             elapsed = current_time - start_time
             
             if elapsed > wait_timeout:
-                return JSONResponse(
-                    status_code=status.HTTP_202_ACCEPTED,
-                    content={
-                        "status": "processing_timeout",
-                        "message": f"Processing started but didn't complete within {wait_timeout}s",
-                        "task_id": task_id,
-                        "wait_time_s": elapsed,
-                        "suggestion": "Use GET /api/tasks/{task_id} to check status later"
-                    }
-                )
+                return _queued_response(task_id, wait_timeout, elapsed, task.estimated_wait)
             
             result = celery_app.AsyncResult(task_id)
             if result.ready():
@@ -434,6 +474,8 @@ async def get_literature_by_title(
             
             await asyncio.sleep(1.0)
             
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers) from e
     except Exception as e:
         logger.error(f"❌ Error in title lookup for '{value}': {e}")
         raise HTTPException(
@@ -442,6 +484,62 @@ async def get_literature_by_title(
         )
 
 
+@router.get("/search", summary="Search literature")
+async def search_literatures(
+    q: str = Query("", description="Search text matched against title, authors, venue and abstract"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    year_from: Optional[int] = Query(None, description="Earliest publication year"),
+    year_to: Optional[int] = Query(None, description="Latest publication year"),
+    venue: Optional[str] = Query(None, description="Venue substring (case-insensitive)"),
+) -> LiteratureSearchResponseDTO:
+    """
+    Full-text literature search with cursor pagination.
+
+    Title matches weigh more than author matches, which weigh more than venue
+    and abstract matches. An empty query lists literature matching the filters.
+
+    Raises:
+        400: Invalid cursor
+        500: Internal server error
+    """
+    try:
+        dao = LiteratureDAO.create_from_global_connection()
+        page = await dao.search(SearchQuery(
+            text=q,
+            limit=limit,
+            cursor=cursor,
+            year_from=year_from,
+            year_to=year_to,
+            venue=venue,
+        ))
+
+        return LiteratureSearchResponseDTO(
+            query=q,
+            results=[
+                LiteratureSearchHitDTO(
+                    lid=hit.lid,
+                    score=hit.score,
+                    title=hit.title,
+                    authors=hit.authors,
+                    year=hit.year,
+                    venue=hit.venue,
+                )
+                for hit in page.hits
+            ],
+            next_cursor=page.next_cursor,
+        )
+
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error searching literature for '{q}': {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {e!s}",
+        ) from e
+
+
 @router.get("/{lid}", summary="Get literature by LID")
 async def get_literature_by_lid(lid: str) -> LiteratureSummaryDTO:
     """
@@ -510,6 +608,7 @@ async def get_literature_by_lid(lid: str) -> LiteratureSummaryDTO:
             journal=convenience_data["journal"],
             doi=convenience_data["doi"],
             abstract=convenience_data["abstract"],
+            graph_metrics=literature.graph_metrics,
         )
 
         logger.info(f"Literature retrieved successfully: {lid}")
@@ -618,6 +717,7 @@ async def get_literatures_batch(
                         journal=convenience_data["journal"],
                         doi=convenience_data["doi"],
                         abstract=convenience_data["abstract"],
+                        graph_metrics=literature.graph_metrics,
                     )
                     results.append(summary)
                 else:
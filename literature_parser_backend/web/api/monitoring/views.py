@@ -1,5 +1,11 @@
+from typing import Any, Dict
+
 from fastapi import APIRouter
 
+from literature_parser_backend.services.circuit_breaker import get_upstream_health
+from literature_parser_backend.services.hedging import get_request_hedger
+from literature_parser_backend.services.rate_limiter import get_rate_limiter
+
 router = APIRouter()
 
 
@@ -10,3 +16,37 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get("/rate-limits")
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Per-upstream rate limiter metrics aggregated over all workers.
+
+    Includes configured rates, token acquisitions, how many had to wait and
+    for how long, requests rejected for exceeding the maximum wait, and 429
+    responses that paused a host.
+    """
+    return get_rate_limiter().get_stats()
+
+
+@router.get("/upstreams")
+def upstream_health_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Circuit breaker state and latency percentiles per external upstream.
+
+    Breakers and latency windows are kept per process, so this reports what
+    the API process itself has observed.
+    """
+    return get_upstream_health().get_stats()
+
+
+@router.get("/hedging")
+def hedging_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Hedged request counters per upstream, aggregated over all workers.
+
+    ``hedge_rate`` is the share of eligible requests that sent a duplicate;
+    ``hedge_wins`` counts duplicates that answered first.
+    """
+    return get_request_hedger().get_stats()
@@ -7,12 +7,13 @@ This module implements the unified resolution endpoint as specified in the 0.2 A
 import logging
 from typing import Dict, Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 
 from literature_parser_backend.models.literature import LiteratureCreateRequestDTO
-from literature_parser_backend.models.task import ComponentStatus
-from literature_parser_backend.worker.tasks import process_literature_task
+from literature_parser_backend.models.task import ComponentStatus, TaskPriority
+from literature_parser_backend.worker.admission import AdmissionRejected
+from literature_parser_backend.worker.queues import get_task_submitter
 from literature_parser_backend.db.alias_dao import AliasDAO
 from literature_parser_backend.db.dao import LiteratureDAO
 
@@ -70,6 +71,10 @@ def _is_literature_successfully_parsed(literature) -> bool:
 )
 async def resolve_literature(
     literature_data: LiteratureCreateRequestDTO,
+    priority: TaskPriority = Query(
+        TaskPriority.NORMAL,
+        description="Queue lane for the task: interactive, normal or bulk (bulk imports)",
+    ),
 ) -> JSONResponse:
     """
     Resolve external literature aliases (DOI, URL, etc.) to internal LIDs.
@@ -80,10 +85,12 @@ async def resolve_literature(
     
     Args:
         literature_data: Literature identifiers and metadata for resolution
+        priority: Queue lane for a newly created task
         
     Returns:
         - 200 OK: Literature already exists, with LID and resource URL
         - 202 Accepted: Task created for async resolution, with task_id and status URL
+        - 429 / 503: Queue overloaded, retry after the ``Retry-After`` header
     """
     try:
         effective_values = literature_data.get_effective_values()
@@ -129,17 +136,22 @@ async def resolve_literature(
                 logger.info(f"Literature {existing_lid} exists but not successfully parsed, creating new task")
                 # Continue to create new task below
 
-        # No alias match found, create asynchronous task
+        # No alias match found, create asynchronous task unless the queue is overloaded
         logger.info("Literature not found, creating resolution task")
-        task = process_literature_task.delay(effective_values)
+        try:
+            task = await get_task_submitter().submit_async(effective_values, priority)
+        except AdmissionRejected as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers) from e
 
-        logger.info(f"Resolution task {task.id} created.")
+        logger.info(f"Resolution task {task.id} created ({priority.value} lane).")
 
         return JSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content={
                 "message": "Literature resolution task created.",
                 "task_id": task.id,
+                "priority": priority.value,
+                "estimated_wait_s": None if task.estimated_wait is None else round(task.estimated_wait, 1),
                 "status_url": f"/api/tasks/{task.id}",  # New 0.2 API path
                 "stream_url": f"/api/tasks/{task.id}/stream"  # New 0.2 SSE path
             },
@@ -7,24 +7,52 @@ Uses plural form '/tasks' instead of singular '/task' for REST compliance.
 
 import json
 import logging
-from typing import Dict, AsyncGenerator, Optional
+from datetime import datetime
+from typing import Any, Dict, AsyncGenerator, Optional
 
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
 
-from literature_parser_backend.models.task import TaskStatusDTO, TaskExecutionStatus, TaskResultType, LiteratureProcessingStatus, TaskErrorInfo
+from literature_parser_backend.models.task import TaskStatusDTO, TaskExecutionStatus, TaskResultType, LiteratureProcessingStatus, TaskErrorInfo, LiteratureComponentStatus
 from literature_parser_backend.worker.celery_app import celery_app
 from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.services.task_status_hub import TaskStatusHub
+from literature_parser_backend.services.task_status_projection import get_task_status_projection
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tasks", tags=["任务跟踪"])
 
 
+# Celery的最终状态
+FINAL_STATES = ("SUCCESS", "FAILURE", "REVOKED")
+
+# 失败类结果类型对应的 (当前阶段, 错误信息)
+FAILED_RESULT_MESSAGES = {
+    TaskResultType.URL_NOT_FOUND: ("URL不存在 (404错误)", "URL不存在或返回404错误，请检查链接是否正确"),
+    TaskResultType.URL_ACCESS_FAILED: ("URL无法访问", "URL无法访问，可能是网络错误或超时"),
+    TaskResultType.PARSING_FAILED: ("内容解析失败", "内容解析失败，无法提取有效的论文信息"),
+}
+
+
+def _stage_from_components(overall_status: str, error_message: Optional[str],
+                           component_status: LiteratureComponentStatus) -> str:
+    """根据文献组件状态生成当前阶段的显示文本"""
+    if overall_status == "completed":
+        return "处理完成"
+    if overall_status == "failed":
+        return f"处理失败: {error_message or '未知错误'}"
+    for component in (component_status.references, component_status.content, component_status.metadata):
+        if component.status.value == "processing":
+            return component.stage
+    return "任务正在队列中等待"
+
+
 class SimpleStatusManager:
     """简化的状态管理器 - 替代已删除的UnifiedStatusManager"""
 
     def __init__(self):
         self.dao = LiteratureDAO.create_from_global_connection()
+        self.projection = get_task_status_projection()
 
     def _map_celery_status(self, celery_status: str, task_info: dict = None) -> TaskExecutionStatus:
         """映射Celery状态到标准任务执行状态"""
@@ -41,11 +69,136 @@ class SimpleStatusManager:
         
         return status_mapping.get(celery_status, TaskExecutionStatus.PENDING)
 
+    @staticmethod
+    def _literature_status_from_node(literature) -> LiteratureProcessingStatus:
+        """由文献节点的task_info创建LiteratureProcessingStatus"""
+        task_info = literature.task_info
+        current_time = datetime.now()
+        return LiteratureProcessingStatus(
+            literature_id=literature.lid,
+            overall_status=task_info.status,
+            overall_progress=task_info.component_status.get_overall_progress(),
+            component_status=task_info.component_status,
+            created_at=literature.created_at or current_time,
+            updated_at=literature.updated_at or current_time
+        )
+
+    async def _status_from_record(self, task_id: str, record: Dict[str, Any]) -> TaskStatusDTO:
+        """
+        由worker写入Redis的任务状态记录构建状态
+
+        进行中的任务只需这一次读取；任务结束后，如果记录中的组件状态不属于最终文献
+        （例如发现重复文献），才读取一次文献节点。
+        """
+        state = str(record.get("state", "PROGRESS")).upper()
+        final = state in FINAL_STATES
+        literature_id = record.get("literature_id")
+        error_message: Optional[str] = None
+
+        result_type: Optional[TaskResultType] = None
+        if record.get("result_type"):
+            try:
+                result_type = TaskResultType(record["result_type"])
+            except ValueError:
+                pass
+
+        literature_status_obj: Optional[LiteratureProcessingStatus] = None
+        components = record.get("components")
+        components_lid = record.get("components_literature_id")
+        # 任务结束后只有组件状态属于最终文献时才使用
+        if isinstance(components, dict) and components_lid and (not final or components_lid == literature_id):
+            component_status = LiteratureComponentStatus(**components)
+            current_time = datetime.now()
+            literature_status_obj = LiteratureProcessingStatus(
+                literature_id=components_lid,
+                overall_status=record.get("overall_status") or "processing",
+                overall_progress=component_status.get_overall_progress(),
+                component_status=component_status,
+                created_at=record.get("created_at") or current_time,
+                updated_at=record.get("updated_at") or current_time
+            )
+        elif final and literature_id:
+            literature = await self.dao.find_by_lid(literature_id)
+            if literature and literature.task_info:
+                literature_status_obj = self._literature_status_from_node(literature)
+
+        if state == "SUCCESS":
+            execution_status = TaskExecutionStatus.COMPLETED
+            overall_progress = 100
+            current_stage = "处理完成"
+            if result_type == TaskResultType.DUPLICATE:
+                current_stage = "文献已存在（重复）"
+            elif result_type in FAILED_RESULT_MESSAGES:
+                current_stage, error_message = FAILED_RESULT_MESSAGES[result_type]
+                execution_status = TaskExecutionStatus.FAILED
+        elif final:
+            execution_status = TaskExecutionStatus.FAILED
+            overall_progress = 0
+            current_stage = "任务正在等待"
+            if result_type in FAILED_RESULT_MESSAGES:
+                current_stage, error_message = FAILED_RESULT_MESSAGES[result_type]
+            else:
+                error = record.get("error")
+                error_message = error if isinstance(error, str) and error else "未知错误"
+        else:
+            execution_status = TaskExecutionStatus.PROCESSING
+            overall_progress = record.get("progress", 50)
+            current_stage = record.get("stage") or "任务正在处理中"
+            literature_id = None  # 与Celery路径一致：任务完成前不返回literature_id
+            if literature_status_obj:
+                component_status = literature_status_obj.component_status
+                component_errors = [
+                    c.error_info.get("error_message")
+                    for c in (component_status.metadata, component_status.content, component_status.references)
+                    if c.error_info
+                ]
+                overall_progress = literature_status_obj.overall_progress
+                current_stage = _stage_from_components(
+                    literature_status_obj.overall_status,
+                    component_errors[-1] if component_errors else None,
+                    component_status,
+                )
+            if record.get("url_validation_status") == "failed":
+                execution_status = TaskExecutionStatus.FAILED
+                error_message = record.get("url_validation_error") or "URL验证失败"
+                current_stage = f"验证失败: {error_message}"
+
+        error_info = None
+        if error_message:
+            error_info = TaskErrorInfo(
+                error_type="CeleryTaskError",
+                error_message=error_message
+            )
+
+        return TaskStatusDTO(
+            task_id=task_id,
+            execution_status=execution_status,
+            literature_status=literature_status_obj,
+            literature_id=literature_id,
+            result_type=result_type,
+            status=execution_status.value,
+            overall_progress=overall_progress,
+            current_stage=current_stage,
+            error_info=error_info
+        )
+
     async def get_unified_status(self, task_id: str) -> TaskStatusDTO:
         """获取统一的任务状态 - 修复版，总是返回TaskStatusDTO"""
         try:
+            # worker写入的任务状态记录：一次Redis读取
+            record = self.projection.read(task_id)
+            result = None
+            if record is not None:
+                if str(record.get("state", "PROGRESS")).upper() in FINAL_STATES:
+                    return await self._status_from_record(task_id, record)
+                # 最终记录可能写入失败：Celery已是最终状态时以Celery为准
+                result = celery_app.AsyncResult(task_id)
+                if result.state not in FINAL_STATES:
+                    return await self._status_from_record(task_id, record)
+
             # 从Celery获取任务状态
-            result = celery_app.AsyncResult(task_id)
+            if result is None:
+                result = celery_app.AsyncResult(task_id)
             
             execution_status = TaskExecutionStatus.PENDING
             literature_status_obj: Optional[LiteratureProcessingStatus] = None
@@ -82,18 +235,9 @@ class SimpleStatusManager:
                             # 根据任务结果类型显示具体信息
                             if result_type == TaskResultType.DUPLICATE:
                                 current_stage = "文献已存在（重复）"
-                            elif result_type == TaskResultType.URL_NOT_FOUND:
-                                current_stage = "URL不存在 (404错误)"
-                                execution_status = TaskExecutionStatus.FAILED
-                                error_message = "URL不存在或返回404错误，请检查链接是否正确"
-                            elif result_type == TaskResultType.URL_ACCESS_FAILED:
-                                current_stage = "URL无法访问"
+                            elif result_type in FAILED_RESULT_MESSAGES:
+                                current_stage, error_message = FAILED_RESULT_MESSAGES[result_type]
                                 execution_status = TaskExecutionStatus.FAILED
-                                error_message = "URL无法访问，可能是网络错误或超时"
-                            elif result_type == TaskResultType.PARSING_FAILED:
-                                current_stage = "内容解析失败"
-                                execution_status = TaskExecutionStatus.FAILED
-                                error_message = "内容解析失败，无法提取有效的论文信息"
                             
                         else:
                             # 正常情况下，Celery成功时，结果应该是dict
@@ -111,15 +255,8 @@ class SimpleStatusManager:
                         if result_type:
                             try:
                                 result_type_enum = TaskResultType(result_type)
-                                if result_type_enum == TaskResultType.URL_NOT_FOUND:
-                                    current_stage = "URL不存在 (404错误)"
-                                    error_message = "URL不存在或返回404错误，请检查链接是否正确"
-                                elif result_type_enum == TaskResultType.URL_ACCESS_FAILED:
-                                    current_stage = "URL无法访问"
-                                    error_message = "URL无法访问，可能是网络错误或超时"
-                                elif result_type_enum == TaskResultType.PARSING_FAILED:
-                                    current_stage = "内容解析失败"
-                                    error_message = "内容解析失败，无法提取有效的论文信息"
+                                if result_type_enum in FAILED_RESULT_MESSAGES:
+                                    current_stage, error_message = FAILED_RESULT_MESSAGES[result_type_enum]
                                 else:
                                     error_message = error_info_dict.get('error', str(result.result) or "未知错误")
                             except ValueError:
@@ -146,38 +283,14 @@ class SimpleStatusManager:
                 literature = await self.dao.find_by_lid(current_lit_id_for_db)
                 if literature and literature.task_info:
                     task_info = literature.task_info
-                    # 使用TaskInfoModel创建LiteratureProcessingStatus
-                    from datetime import datetime
-                    current_time = datetime.now()
-                    literature_status_obj = LiteratureProcessingStatus(
-                        literature_id=literature.lid,
-                        overall_status=task_info.status,
-                        overall_progress=task_info.component_status.get_overall_progress(),
-                        component_status=task_info.component_status,
-                        created_at=literature.created_at or current_time,
-                        updated_at=literature.updated_at or current_time
-                    )
+                    literature_status_obj = self._literature_status_from_node(literature)
                     
-                    # 仅当任务未完成时，才用数据库的进度覆盖
+                    # 仅当任务未完成时，才用数据库的进度和阶段信息覆盖
                     if not result.ready():
                         overall_progress = literature_status_obj.overall_progress
-                    
-                    # --- Start of inlined get_current_stage_display logic ---
-                    # 仅当任务未完成时，才用数据库的阶段信息覆盖
-                    if not result.ready():
-                        if task_info.status == "completed":
-                            current_stage = "处理完成"
-                        elif task_info.status == "failed":
-                            current_stage = f"处理失败: {task_info.error_message or '未知错误'}"
-                        elif task_info.component_status.references.status.value == "processing":
-                            current_stage = task_info.component_status.references.stage
-                        elif task_info.component_status.content.status.value == "processing":
-                            current_stage = task_info.component_status.content.stage
-                        elif task_info.component_status.metadata.status.value == "processing":
-                            current_stage = task_info.component_status.metadata.stage
-                        else:
-                            current_stage = "任务正在队列中等待"
-                    # --- End of inlined get_current_stage_display logic ---
+                        current_stage = _stage_from_components(
+                            task_info.status, task_info.error_message, task_info.component_status
+                        )
             
             # 仅在任务未就绪时，从Celery meta获取更详细的URL验证状态
             if not result.ready() and isinstance(result.info, dict):
@@ -226,6 +339,24 @@ class SimpleStatusManager:
             )
 
 
+def _is_final_status(task_status: TaskStatusDTO) -> bool:
+    """任务是否已结束（SSE流在最终状态后关闭）"""
+    return task_status.execution_status.value in ["completed", "failed"]
+
+
+# 每个API进程一个状态中心：每个task_id只跟踪一次，状态变化推送给所有订阅者
+_status_hub: Optional[TaskStatusHub] = None
+
+
+def get_task_status_hub() -> TaskStatusHub:
+    """获取进程内的任务状态中心"""
+    global _status_hub
+    if _status_hub is None:
+        status_manager = SimpleStatusManager()
+        _status_hub = TaskStatusHub(status_manager.get_unified_status, _is_final_status)
+    return _status_hub
+
+
 @router.get(
     "/{task_id}", 
     response_model=TaskStatusDTO, 
@@ -253,9 +384,11 @@ async def get_task_status(task_id: str) -> TaskStatusDTO:
         500: Internal server error
     """
     try:
-        # Use the simplified status manager
-        status_manager = SimpleStatusManager()
-        task_status = await status_manager.get_unified_status(task_id)
+        # 有SSE订阅的任务由状态中心保持最新，直接复用；否则查询一次
+        task_status = get_task_status_hub().latest(task_id)
+        if task_status is None:
+            status_manager = SimpleStatusManager()
+            task_status = await status_manager.get_unified_status(task_id)
         
         # 不再需要检查None，因为get_unified_status总是返回TaskStatusDTO
         
@@ -284,6 +417,8 @@ async def stream_task_status(task_id: str) -> StreamingResponse:
     - 'progress': Task progress updates with current stage and percentage
     - 'completed': Task completion with final results
     - 'failed': Task failure with error information
+    - 'error': The status could not be followed (queries keep failing, or no
+      final status within ``task_status_stream_timeout``); the stream closes
     
     Args:
         task_id: Unique identifier of the task to stream
@@ -306,63 +441,40 @@ async def stream_task_status(task_id: str) -> StreamingResponse:
         logger.info(f"Starting SSE stream for task: {task_id}")
         
         async def task_status_generator() -> AsyncGenerator[str, None]:
-            """Generate SSE events for task status updates."""
-            import asyncio
-            
-            status_manager = SimpleStatusManager()
-            previous_status = None
-            
-            while True:
-                try:
-                    current_status = await status_manager.get_unified_status(task_id)
-                    
-                    # 不再检查None，直接使用current_status
-                    
-                    # Only send updates when status changes
-                    if current_status != previous_status:
-                        if current_status.execution_status.value in ["completed", "failed"]:
-                            # Send final status and close connection
-                            event_type = "completed" if current_status.execution_status.value == "completed" else "failed"
-                            event_data = {
-                                "task_id": task_id,
-                                "status": current_status.execution_status.value,
-                                "progress": current_status.overall_progress,
-                                "stage": current_status.current_stage
-                            }
-                            
-                            if current_status.execution_status.value == "completed":
-                                event_data.update({
-                                    "literature_id": current_status.literature_id,
-                                    "resource_url": current_status.resource_url
-                                })
-                            elif current_status.error_info:
-                                # 将TaskErrorInfo对象序列化为字典
-                                event_data["error"] = current_status.error_info.model_dump()
-                            
-                            yield f"event: {event_type}\n"
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                            break
-                        else:
-                            # Send progress update
-                            event_data = {
-                                "task_id": task_id,
-                                "status": current_status.execution_status.value,
-                                "progress": current_status.overall_progress,
-                                "stage": current_status.current_stage
-                            }
-                            yield f"event: progress\n"
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                        
-                        previous_status = current_status
-                    
-                    # Wait before next poll
-                    await asyncio.sleep(1.0)
-                    
-                except Exception as e:
-                    logger.error(f"Error in SSE stream for task {task_id}: {e}")
-                    yield f"event: error\n"
-                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                    break
+            """Generate SSE events for task status updates (only on change, via the status hub)."""
+            try:
+                async for current_status in get_task_status_hub().subscribe(task_id):
+                    event_data = {
+                        "task_id": task_id,
+                        "status": current_status.execution_status.value,
+                        "progress": current_status.overall_progress,
+                        "stage": current_status.current_stage
+                    }
+
+                    if _is_final_status(current_status):
+                        # Send final status and close connection
+                        event_type = "completed" if current_status.execution_status.value == "completed" else "failed"
+                        if current_status.execution_status.value == "completed":
+                            event_data.update({
+                                "literature_id": current_status.literature_id,
+                                "resource_url": current_status.resource_url
+                            })
+                        elif current_status.error_info:
+                            # 将TaskErrorInfo对象序列化为字典
+                            event_data["error"] = current_status.error_info.model_dump()
+
+                        yield f"event: {event_type}\n"
+                        yield f"data: {json.dumps(event_data)}\n\n"
+                        break
+
+                    # Send progress update
+                    yield f"event: progress\n"
+                    yield f"data: {json.dumps(event_data)}\n\n"
+
+            except Exception as e:
+                logger.error(f"Error in SSE stream for task {task_id}: {e}")
+                yield f"event: error\n"
+                yield f"data: {json.dumps({'error': str(e)})}\n\n"
 
         return StreamingResponse(
             task_status_generator(),
@@ -10,6 +10,12 @@ from literature_parser_backend.db.neo4j import (
     connect_to_neo4j,
     disconnect_from_neo4j,
 )
+from literature_parser_backend.services.graph_cache import (
+    get_citation_graph_cache,
+)
+from literature_parser_backend.services.known_identifiers import (
+    get_known_identifier_filter,
+)
 
 
 @asynccontextmanager
@@ -28,12 +34,17 @@ async def lifespan_setup(
     # Initialize Neo4j connection
     try:
         logger.info("Initializing Neo4j connection...")
-        await connect_to_neo4j()
+        driver = await connect_to_neo4j()
         logger.info("Neo4j connection established successfully")
     except Exception as e:
         logger.error(f"Failed to connect to Neo4j: {e}")
         raise
 
+    # Known identifier filter is an optimization; start without it on failure
+    await get_known_identifier_filter().load(driver)
+    # Citation graph cache falls back to Cypher until loaded
+    await get_citation_graph_cache().load(driver)
+
     yield
 
     # Cleanup on shutdown
@@ -0,0 +1,260 @@
+"""
+Admission control for literature task intake.
+
+The intake endpoints used to enqueue unconditionally, so under bursts the
+Redis queues grew without bound, results expired (``celery_result_expires``)
+before clients read them and waiters timed out. Before sending a new task,
+``queues.TaskSubmitter`` now asks ``AdmissionController`` whether the task's
+lane can take more work (submissions reusing a task in flight skip the check):
+
+- queue depth: ``LLEN`` of the lane's Redis list (and kombu's priority
+  sub-lists)
+- worker throughput: tasks completed from the literature lanes per second
+  over the last ``admission_throughput_window`` seconds, counted in
+  per-minute Redis buckets by the worker (``record_completion``); like the
+  depth, this includes the maintenance tasks sharing the bulk lane
+- estimated wait: the lane's depth over its weighted share of the
+  throughput (see ``queues.WeightedQueueCycle``)
+
+A full lane is rejected with 429, and a capacity problem (estimated wait
+beyond ``admission_max_wait``, or a backlog with no completions at all)
+with 503; both carry ``Retry-After``. Admission fails open when Redis
+cannot be read, so the check never takes intake down on its own.
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ..models.task import TaskPriority
+from ..settings import Settings
+from .queues import LITERATURE_QUEUES, QUEUE_FOR_PRIORITY, queue_weights
+
+logger = logging.getLogger(__name__)
+
+# kombu's Redis transport keeps prioritized messages in "<queue><sep><priority>" lists
+KOMBU_PRIORITY_SEP = "\x06\x16"
+KOMBU_PRIORITY_STEPS = (3, 6, 9)
+
+
+@dataclass
+class AdmissionDecision:
+    """An admitted submission and the queue state it was admitted under."""
+
+    priority: TaskPriority
+    queue_depth: int = 0
+    throughput: Optional[float] = None  # tasks per second, None if unknown
+    estimated_wait: Optional[float] = None  # seconds until a worker picks the task up
+
+
+class AdmissionRejected(Exception):
+    """Raised when a lane cannot take more work right now."""
+
+    def __init__(self, status_code: int, reason: str, retry_after: int, estimated_wait: Optional[float] = None):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+        self.estimated_wait = estimated_wait
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Response headers for the rejection."""
+        return {"Retry-After": str(self.retry_after)}
+
+    @property
+    def detail(self) -> Dict[str, object]:
+        """Response body for the rejection."""
+        return {
+            "message": self.reason,
+            "retry_after_s": self.retry_after,
+            "estimated_wait_s": None if self.estimated_wait is None else round(self.estimated_wait, 1),
+        }
+
+
+class AdmissionController:
+    """Admits or rejects literature task submissions by lane load."""
+
+    THROUGHPUT_KEY_PREFIX = "literature_throughput:"
+    BUCKET_SECONDS = 60
+
+    def __init__(self, redis_client=None, settings: Optional[Settings] = None):
+        """
+        Initialize the controller.
+
+        Args:
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.settings = settings or Settings()
+        self.enabled = self.settings.admission_control_enabled
+        self.window = max(self.BUCKET_SECONDS, self.settings.admission_throughput_window)
+        # Results must still be there when the client comes to read them
+        self.max_wait = min(self.settings.admission_max_wait, self.settings.celery_result_expires // 2)
+        self.max_depth = {
+            TaskPriority.INTERACTIVE: self.settings.admission_max_interactive_depth,
+            TaskPriority.NORMAL: self.settings.admission_max_normal_depth,
+            TaskPriority.BULK: self.settings.admission_max_bulk_depth,
+        }
+        self.weights = queue_weights(self.settings)
+        self._redis = redis_client
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Tuple[float, Dict[str, int], Optional[float]]] = None
+        self.stats = {"admitted": 0, "rejected": 0}
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    def record_completion(self, now: Optional[float] = None) -> None:
+        """Count one task finished from a literature lane (called by the worker)."""
+        bucket = int((now or time.time()) // self.BUCKET_SECONDS)
+        key = f"{self.THROUGHPUT_KEY_PREFIX}{bucket}"
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.incr(key)
+            pipe.expire(key, self.window + 2 * self.BUCKET_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Failed to record task completion: {e}")
+
+    def _read_state(self, now: float) -> Tuple[Dict[str, int], Optional[float]]:
+        """Queue depths and throughput (tasks/s), from Redis."""
+        first_bucket = int((now - self.window) // self.BUCKET_SECONDS)
+        last_bucket = int(now // self.BUCKET_SECONDS)
+
+        pipe = self.redis.pipeline(transaction=False)
+        for queue in LITERATURE_QUEUES:
+            pipe.llen(queue)
+            for step in KOMBU_PRIORITY_STEPS:
+                pipe.llen(f"{queue}{KOMBU_PRIORITY_SEP}{step}")
+        for bucket in range(first_bucket, last_bucket + 1):
+            pipe.get(f"{self.THROUGHPUT_KEY_PREFIX}{bucket}")
+        values = pipe.execute()
+
+        per_queue = 1 + len(KOMBU_PRIORITY_STEPS)
+        depths = {
+            queue: sum(int(value or 0) for value in values[index * per_queue:(index + 1) * per_queue])
+            for index, queue in enumerate(LITERATURE_QUEUES)
+        }
+        completed = sum(int(value or 0) for value in values[len(LITERATURE_QUEUES) * per_queue:])
+        throughput = completed / (now - first_bucket * self.BUCKET_SECONDS)
+        return depths, throughput
+
+    def _state(self) -> Tuple[Dict[str, int], Optional[float]]:
+        """Cached queue state, refreshed at most every ``admission_snapshot_ttl`` seconds."""
+        now = time.time()
+        with self._lock:
+            if self._snapshot is not None and now - self._snapshot[0] < self.settings.admission_snapshot_ttl:
+                return self._snapshot[1], self._snapshot[2]
+        depths, throughput = self._read_state(now)
+        with self._lock:
+            self._snapshot = (now, depths, throughput)
+        return depths, throughput
+
+    def estimate_wait(self, priority: TaskPriority, depths: Dict[str, int], throughput: Optional[float]) -> Optional[float]:
+        """
+        Seconds until a new task in the lane is picked up.
+
+        Args:
+            priority: Lane of the task
+            depths: Queued tasks per queue
+            throughput: Completed tasks per second
+
+        Returns:
+            Estimated wait, or None if there is no throughput to estimate from
+        """
+        lane = QUEUE_FOR_PRIORITY[priority]
+        if not depths.get(lane):
+            return 0.0
+        if not throughput:
+            return None
+        # Weighted consumption: the lane gets its share among the lanes with work
+        busy = [queue for queue in LITERATURE_QUEUES if depths.get(queue) or queue == lane]
+        share = self.weights[lane] / sum(self.weights[queue] for queue in busy)
+        return depths[lane] / (throughput * share)
+
+    def admit(self, priority: TaskPriority = TaskPriority.NORMAL) -> AdmissionDecision:
+        """
+        Decide whether a new task may be submitted to a lane.
+
+        Args:
+            priority: Lane of the task
+
+        Returns:
+            The admission decision, with the estimated wait
+
+        Raises:
+            AdmissionRejected: The lane is full (429) or workers cannot keep up (503)
+        """
+        priority = TaskPriority(priority)
+        if not self.enabled:
+            return AdmissionDecision(priority)
+        try:
+            depths, throughput = self._state()
+        except Exception as e:
+            logger.debug(f"Admission check skipped, queue state unavailable: {e}")
+            return AdmissionDecision(priority)
+
+        lane = QUEUE_FOR_PRIORITY[priority]
+        depth = depths.get(lane, 0)
+        estimated_wait = self.estimate_wait(priority, depths, throughput)
+
+        if depth >= self.max_depth[priority]:
+            # Time until the lane drains back below its cap
+            excess = self.estimate_wait(priority, {**depths, lane: depth - self.max_depth[priority] + 1}, throughput)
+            self._reject(
+                429,
+                f"The {priority.value} queue is full ({depth} tasks waiting), please retry later",
+                excess,
+                estimated_wait,
+            )
+        if estimated_wait is None and depth >= self.settings.admission_stalled_depth:
+            self._reject(
+                503,
+                f"Workers are not processing tasks ({depth} waiting in the {priority.value} queue)",
+                None,
+                None,
+            )
+        if estimated_wait is not None and estimated_wait > self.max_wait:
+            self._reject(
+                503,
+                f"Estimated wait of {estimated_wait:.0f}s exceeds {self.max_wait}s, please retry later",
+                estimated_wait - self.max_wait,
+                estimated_wait,
+            )
+
+        with self._lock:
+            self.stats["admitted"] += 1
+            if self._snapshot is not None:
+                # Count this submission until the next refresh so a burst cannot overshoot the cap
+                self._snapshot[1][lane] = self._snapshot[1].get(lane, 0) + 1
+        return AdmissionDecision(priority, depth, throughput, estimated_wait)
+
+    def _reject(self, status_code: int, reason: str, retry_after: Optional[float], estimated_wait: Optional[float]):
+        with self._lock:
+            self.stats["rejected"] += 1
+        if retry_after is None:
+            retry_after = self.settings.admission_default_retry_after
+        retry_after = int(min(max(1, math.ceil(retry_after)), self.max_wait))
+        logger.warning(f"Admission rejected ({status_code}): {reason}")
+        raise AdmissionRejected(status_code, reason, retry_after, estimated_wait)
+
+
+# One instance per process
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide admission controller."""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
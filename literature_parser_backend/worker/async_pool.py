@@ -0,0 +1,293 @@
+"""
+Shared event loop for literature tasks.
+
+A literature task spends nearly all of its time waiting on external APIs and
+Neo4j, yet the default worker runs one task per process, each inside its own
+``asyncio.run`` loop. With ``worker_async_mode`` enabled the worker uses
+Celery's threads pool instead: every pool thread hands its task's coroutine
+to the single event loop owned by ``AsyncTaskRunner`` and waits for the
+result, so one process keeps ``worker_async_concurrency`` pipelines in flight.
+
+Celery's threads pool enforces neither time limits nor ``terminate=True``
+revokes, so the runner takes care of them:
+
+- soft time limits: each coroutine is cancelled once it exceeds its soft
+  time limit, and the task fails with ``SoftTimeLimitExceeded``
+- cancellation: revoked task IDs (``celery control revoke``) are checked
+  every second and the matching coroutines are cancelled
+- memory accounting: process RSS is sampled around each task, and new tasks
+  wait while RSS is above ``worker_async_max_memory_mb``
+
+Blocking calls inside the pipeline must go through ``asyncio.to_thread`` so
+they do not stall the other tasks on the loop.
+"""
+
+import asyncio
+import contextvars
+import logging
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional, Set
+
+from celery.exceptions import SoftTimeLimitExceeded, TaskRevokedError
+from celery.worker import state as worker_state
+
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# ID of the Celery task a coroutine belongs to. Celery's ``current_task`` is
+# thread-local and therefore empty on the shared loop.
+current_task_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_task_id", default=None
+)
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MiB (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * mmap.PAGESIZE / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+class AsyncTaskRunner:
+    """Runs the coroutines of concurrent Celery tasks on one event loop."""
+
+    REVOKE_CHECK_INTERVAL = 1.0
+    MEMORY_CHECK_INTERVAL = 0.5
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        initializer: Optional[Callable[[], Awaitable[None]]] = None,
+        finalizer: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            settings: Application settings
+            initializer: Coroutine function run on the loop once it starts
+            finalizer: Coroutine function run on the loop before it stops
+        """
+        self.settings = settings or Settings()
+        self.concurrency = max(1, self.settings.worker_async_concurrency)
+        self.max_memory_mb = self.settings.worker_async_max_memory_mb
+        self.initializer = initializer
+        self.finalizer = finalizer
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._revoked: Set[str] = set()
+        self._watchdog: Optional[asyncio.Task] = None
+        self.stats = {
+            "started": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "revoked": 0,
+            "peak_rss_mb": 0.0,
+        }
+
+    @property
+    def running(self) -> int:
+        """Number of tasks currently running on the loop."""
+        return len(self._running)
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread (once) and run the initializer on it."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # to_thread calls of all tasks share the loop's default executor
+                loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=2 * self.concurrency, thread_name_prefix="literature-io")
+                )
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._serve, args=(loop, ready), name="literature-loop", daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                if self.initializer is not None:
+                    asyncio.run_coroutine_threadsafe(self.initializer(), loop).result()
+                self._loop = loop
+                logger.info(f"Async task runner started (concurrency={self.concurrency})")
+            return self._loop
+
+    def _serve(self, loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        self._watchdog = loop.create_task(self._watch_revoked())
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def run(self, task_id: str, coro: Coroutine[Any, Any, Any], soft_time_limit: Optional[float] = None) -> Any:
+        """
+        Run a task's coroutine on the shared loop and wait for its result.
+
+        Called from Celery pool threads.
+
+        Args:
+            task_id: Celery task ID
+            coro: The task's coroutine
+            soft_time_limit: Seconds before the coroutine is cancelled
+                (defaults to ``celery_task_soft_time_limit``; 0 disables it)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            SoftTimeLimitExceeded: The coroutine exceeded its soft time limit
+            TaskRevokedError: The task was revoked while running
+        """
+        if soft_time_limit is None:
+            soft_time_limit = self.settings.celery_task_soft_time_limit
+        try:
+            loop = self.start()
+        except BaseException:
+            coro.close()
+            raise
+        future = asyncio.run_coroutine_threadsafe(self._supervise(task_id, coro, soft_time_limit), loop)
+        return future.result()
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a running task (thread-safe).
+
+        Args:
+            task_id: Celery task ID
+
+        Returns:
+            Whether the task was running
+        """
+        loop = self._loop
+        if loop is None or task_id not in self._running:
+            return False
+        loop.call_soon_threadsafe(self._cancel, task_id)
+        return True
+
+    def _cancel(self, task_id: str):
+        task = self._running.get(task_id)
+        if task is not None and task_id not in self._revoked:
+            self._revoked.add(task_id)
+            task.cancel()
+
+    async def _supervise(self, task_id: str, coro: Coroutine[Any, Any, Any], soft_time_limit: float) -> Any:
+        """Run one task with its time limit, cancellation and memory accounting."""
+        try:
+            await self._admit(task_id)
+        except BaseException:
+            coro.close()
+            raise
+
+        current_task_id.set(task_id)
+        self._running[task_id] = asyncio.current_task()
+        self.stats["started"] += 1
+        rss_before = current_rss_mb()
+        started = time.monotonic()
+        outcome = "failed"
+        try:
+            result = await asyncio.wait_for(coro, soft_time_limit or None)
+            outcome = "succeeded"
+            return result
+        except asyncio.TimeoutError:
+            outcome = "timed_out"
+            raise SoftTimeLimitExceeded(
+                f"Task {task_id} exceeded its soft time limit of {soft_time_limit}s"
+            ) from None
+        except asyncio.CancelledError:
+            if task_id not in self._revoked:
+                raise
+            outcome = "revoked"
+            raise TaskRevokedError(f"Task {task_id} was revoked") from None
+        finally:
+            self._running.pop(task_id, None)
+            self._revoked.discard(task_id)
+            rss_after = current_rss_mb()
+            self.stats[outcome] += 1
+            self.stats["peak_rss_mb"] = max(self.stats["peak_rss_mb"], rss_after)
+            logger.info(
+                f"Task {task_id} {outcome} in {time.monotonic() - started:.1f}s, "
+                f"RSS {rss_before:.0f} -> {rss_after:.0f} MiB ({self.running} running)"
+            )
+
+    async def _admit(self, task_id: str):
+        """Hold a new task while the process is over its memory budget."""
+        if self.max_memory_mb <= 0:
+            return
+        waiting = False
+        # A lone task is always admitted so the worker cannot stall
+        while self._running and current_rss_mb() > self.max_memory_mb:
+            if not waiting:
+                logger.warning(
+                    f"RSS above {self.max_memory_mb} MiB with {self.running} tasks running, "
+                    f"holding task {task_id}"
+                )
+                waiting = True
+            await asyncio.sleep(self.MEMORY_CHECK_INTERVAL)
+
+    async def _watch_revoked(self):
+        """Cancel running tasks whose IDs the worker has received revokes for."""
+        while True:
+            await asyncio.sleep(self.REVOKE_CHECK_INTERVAL)
+            for task_id in list(self._running):
+                if task_id in worker_state.revoked:
+                    logger.info(f"Task {task_id} was revoked, cancelling it")
+                    self._cancel(task_id)
+
+    def close(self, timeout: float = 10.0):
+        """Cancel running tasks, run the finalizer and stop the loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def shutdown():
+            tasks = list(self._running.values())
+            if self._watchdog is not None:
+                tasks.append(self._watchdog)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self.finalizer is not None:
+                await self.finalizer()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Async task runner did not shut down cleanly: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+        logger.info("Async task runner stopped")
+
+
+# One runner per worker process
+_runner: Optional[AsyncTaskRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_async_task_runner() -> AsyncTaskRunner:
+    """Get the process-wide task runner (pool threads may race to create it)."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            from .signals import close_process_resources, init_process_resources
+            _runner = AsyncTaskRunner(initializer=init_process_resources, finalizer=close_process_resources)
+        return _runner
+
+
+def close_async_task_runner():
+    """Stop the process-wide task runner if it was started."""
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        runner.close()
@@ -9,7 +9,9 @@ import logging
 
 from celery import Celery
 
+from ..services.graph_analytics import analytics_available
 from ..settings import Settings
+from .queues import BULK_QUEUE, NORMAL_QUEUE
 
 logger = logging.getLogger(__name__)
 
@@ -42,18 +44,62 @@ celery_app.conf.update(
     # Worker settings
     worker_prefetch_multiplier=settings.celery_worker_prefetch_multiplier,
     # Result backend settings
-    result_expires=3600,  # Results expire after 1 hour
+    result_expires=settings.celery_result_expires,
     result_persistent=True,
-    # Task routing
+    # Task routing (submit_literature_task picks the lane per request)
     task_routes={
-        "process_literature_task": {"queue": "literature"},
+        "process_literature_task": {"queue": NORMAL_QUEUE},
+        "reconcile_unresolved_task": {"queue": BULK_QUEUE},
+        "enrich_unresolved_task": {"queue": BULK_QUEUE},
+        "compute_graph_analytics_task": {"queue": BULK_QUEUE},
+    },
+    # Weighted consumption of the priority lanes (see worker.queues)
+    broker_transport_options={
+        "queue_order_strategy": "literature_parser_backend.worker.queues:WeightedQueueCycle",
     },
     # Include task modules
     include=[
         "literature_parser_backend.worker.tasks",
+        "literature_parser_backend.worker.reconciliation",
+        "literature_parser_backend.worker.reference_enrichment",
+        "literature_parser_backend.worker.graph_analytics",
     ],
 )
 
+
+
+def build_beat_schedule(settings: Settings) -> dict:
+    """
+    Periodic graph maintenance (requires a running `celery beat`).
+
+    The graph analytics job is only scheduled where numpy and scipy are
+    installed; they are not part of the locked dependencies, so an image
+    without them would otherwise run a job that can only skip.
+    """
+    beat_schedule = {}
+    if settings.unresolved_reconcile_interval > 0:
+        beat_schedule["reconcile-unresolved"] = {
+            "task": "reconcile_unresolved_task",
+            "schedule": float(settings.unresolved_reconcile_interval),
+        }
+    if settings.unresolved_enrich_interval > 0:
+        beat_schedule["enrich-unresolved"] = {
+            "task": "enrich_unresolved_task",
+            "schedule": float(settings.unresolved_enrich_interval),
+        }
+    if settings.graph_analytics_interval > 0:
+        if analytics_available():
+            beat_schedule["compute-graph-analytics"] = {
+                "task": "compute_graph_analytics_task",
+                "schedule": float(settings.graph_analytics_interval),
+            }
+        else:
+            logger.warning("Graph analytics not scheduled: numpy and scipy are not installed")
+    return beat_schedule
+
+
+celery_app.conf.beat_schedule = build_beat_schedule(settings)
+
 # Optional: Configure logging for Celery
 celery_app.conf.update(
     worker_log_format="[%(asctime)s: %(levelname)s/%(processName)s] %(message)s",
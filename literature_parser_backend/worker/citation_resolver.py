@@ -12,6 +12,11 @@ from datetime import datetime
 from literature_parser_backend.services.literature_matcher import FuzzyMatcher, MatchType
 from literature_parser_backend.db.dao import LiteratureDAO
 from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.services.resolution_cache import (
+    RESOLVED,
+    UNRESOLVED,
+    get_reference_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +62,8 @@ class CitationResolver:
         self.matcher = None  # Will be initialized with DAO
         self.literature_dao = None
         self.relationship_dao = None
+        self.cache = get_reference_cache()
+        self.cache_hits = 0
         
     async def initialize_with_dao(self, literature_dao: LiteratureDAO):
         """
@@ -124,7 +131,8 @@ class CitationResolver:
             "total_references": len(references),
             "resolved_citations": len(resolved_citations),
             "unresolved_references": len(unresolved_references),
-            "resolution_rate": len(resolved_citations) / len(references) if references else 0.0
+            "resolution_rate": len(resolved_citations) / len(references) if references else 0.0,
+            "cache_hits": self.cache_hits
         }
         
         logger.info(f"Task {self.task_id}: Citation resolution completed: {stats}")
@@ -165,6 +173,32 @@ class CitationResolver:
                     )
                 }
             
+            # Check the cross-task resolution cache before fuzzy matching
+            cache_key = self.cache.reference_key(parsed_ref)
+            cached = self.cache.get(cache_key)
+            if cached and cached.get("lid") != citing_lid:
+                self.cache_hits += 1
+                if cached["status"] == RESOLVED:
+                    logger.debug(f"Task {self.task_id}: Reference {reference_index + 1} resolved from cache to {cached['lid']}")
+                    return {
+                        "resolved": True,
+                        "citation": ResolvedCitation(
+                            citing_lid=citing_lid,
+                            cited_lid=cached["lid"],
+                            confidence=cached.get("confidence", 0.0),
+                            raw_reference=str(reference)
+                        )
+                    }
+                if cached["status"] == UNRESOLVED:
+                    logger.debug(f"Task {self.task_id}: Reference {reference_index + 1} known unresolved from cache")
+                    return {
+                        "resolved": False,
+                        "unresolved": UnresolvedReference(
+                            raw_text=str(reference),
+                            parsed_data=parsed_ref
+                        )
+                    }
+            
             # Attempt fuzzy matching
             matches = await self.matcher.find_matches(
                 source=parsed_ref,
@@ -176,6 +210,7 @@ class CitationResolver:
             if matches:
                 best_match = matches[0]
                 logger.debug(f"Task {self.task_id}: Reference {reference_index + 1} matched to {best_match.lid} (confidence: {best_match.confidence:.2f})")
+                self.cache.set_resolved(cache_key, best_match.lid, best_match.confidence)
                 
                 return {
                     "resolved": True,
@@ -240,11 +275,19 @@ class CitationResolver:
             if authors:
                 parsed["authors"] = authors
             
-            # Extract DOI
-            doi = reference_data.get("doi", "").strip()
+            # Extract identifiers (Semantic Scholar references carry them in externalIds)
+            external_ids = reference_data.get("externalIds") or {}
+            identifiers = {}
+            doi = (reference_data.get("doi") or external_ids.get("DOI") or "").strip()
             if doi:
                 parsed["doi"] = doi
-                parsed["identifiers"] = {"doi": doi}
+                identifiers["doi"] = doi
+            if external_ids.get("ArXiv"):
+                identifiers["arxiv_id"] = external_ids["ArXiv"]
+            if reference_data.get("paperId"):
+                identifiers["s2_paper_id"] = reference_data["paperId"]
+            if identifiers:
+                parsed["identifiers"] = identifiers
             
             # Extract year
             year = reference_data.get("year")
@@ -341,6 +384,22 @@ class CitationResolver:
                 citing_lid=citing_lid,
                 unresolved_citations=batch_citations
             )
+            
+            if not created_count:
+                # Nothing was written, so there is no placeholder to point the cache at
+                return
+            
+            # The DAO may have linked an existing placeholder instead of the generated one
+            for unresolved, citation in zip(unresolved_refs, batch_citations):
+                unresolved.placeholder_lid = citation["placeholder_lid"]
+            
+            # Remember negative results so other tasks skip fuzzy matching
+            for unresolved in unresolved_refs:
+                if unresolved.parsed_data:
+                    self.cache.set_unresolved(
+                        self.cache.reference_key(unresolved.parsed_data),
+                        unresolved.placeholder_lid
+                    )
                 
             logger.info(f"Task {self.task_id}: Successfully created {created_count} placeholder nodes")
             
@@ -361,25 +361,31 @@ class DataPipeline:
                     logger.info(f"📋 [数据管道] 检测到解析失败的文献标题: {metadata.title}，跳过去重检查")
                     return {'is_duplicate': False}
                 
-                candidates = await self.dao.find_by_title_fuzzy(metadata.title, limit=5)
-                for candidate in candidates:
-                    if candidate and candidate.metadata and candidate.metadata.title:
-                        # 同样检查候选文献是否也是解析失败的
-                        candidate_is_failed = any(indicator in candidate.metadata.title for indicator in failed_title_indicators)
-                        if candidate_is_failed:
-                            logger.info(f"📋 [数据管道] 跳过解析失败的候选文献: {candidate.metadata.title}")
-                            continue
-                            
-                        if self._is_title_match(metadata.title, candidate.metadata.title):
-                            # 进一步检查作者匹配
-                            metadata_authors = getattr(metadata, 'authors', None)
-                            candidate_authors = getattr(candidate.metadata, 'authors', None)
-                            if self._is_author_match(metadata_authors, candidate_authors):
-                                return {
-                                    'is_duplicate': True,
-                                    'existing_lid': candidate.lid,
-                                    'reason': f"标题+作者重复: {metadata.title[:50]}..."
-                                }
+                def is_duplicate(candidate) -> bool:
+                    if not (candidate and candidate.metadata and candidate.metadata.title):
+                        return False
+                    # 同样检查候选文献是否也是解析失败的
+                    candidate_is_failed = any(indicator in candidate.metadata.title for indicator in failed_title_indicators)
+                    if candidate_is_failed:
+                        logger.info(f"📋 [数据管道] 跳过解析失败的候选文献: {candidate.metadata.title}")
+                        return False
+                    if not self._is_title_match(metadata.title, candidate.metadata.title):
+                        return False
+                    # 进一步检查作者匹配
+                    metadata_authors = getattr(metadata, 'authors', None)
+                    candidate_authors = getattr(candidate.metadata, 'authors', None)
+                    return self._is_author_match(metadata_authors, candidate_authors)
+                
+                # 确认条件传给DAO：索引候选都未通过时，DAO会补充实时查询
+                candidates = await self.dao.find_near_duplicates(
+                    metadata.title, getattr(metadata, 'authors', None), limit=5, confirm=is_duplicate
+                )
+                if candidates:
+                    return {
+                        'is_duplicate': True,
+                        'existing_lid': candidates[0].lid,
+                        'reason': f"标题+作者重复: {metadata.title[:50]}..."
+                    }
             
             logger.info(f"✅ [数据管道] 去重检查完成，无重复")
             return {'is_duplicate': False}
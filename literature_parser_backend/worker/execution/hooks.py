@@ -12,6 +12,7 @@ from abc import ABC, abstractmethod
 
 from ...models.literature import MetadataModel
 from ...db.dao import LiteratureDAO
+from ...settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -102,12 +103,14 @@ class DeduplicationHook(Hook):
         
         # 基于标题+作者查重 (简化版)
         if metadata.title and metadata.authors:
-            title_matches = await self.dao.find_by_title_fuzzy(metadata.title, limit=5)
+            # 简单的作者匹配检查（作为确认条件传入，未确认时DAO会补充实时查询）
+            title_matches = await self.dao.find_near_duplicates(
+                metadata.title, metadata.authors, limit=5, exclude_lid=current_id,
+                confirm=lambda match: self._authors_match(metadata.authors, match.authors)
+            )
             for match in title_matches:
                 if match.lid != current_id and match.lid not in duplicates:
-                    # 简单的作者匹配检查
-                    if self._authors_match(metadata.authors, match.authors):
-                        duplicates.append(match.lid)
+                    duplicates.append(match.lid)
         
         return duplicates
     
@@ -680,6 +683,10 @@ class UnresolvedNodeUpgradeHook(Hook):
             if not literature_id:
                 return {'status': 'skipped', 'reason': 'Missing literature_id'}
             
+            if not Settings().unresolved_upgrade_inline:
+                # 由 reconcile_unresolved_task 定期批量升级
+                return {'status': 'skipped', 'reason': 'Deferred to reconciliation job'}
+            
             logger.info(f"⬆️ [Hook] 开始升级未解析节点: {literature_id}")
             
             # 获取新创建的文献
@@ -730,14 +737,14 @@ class UnresolvedNodeUpgradeHook(Hook):
                         
                         # 直接查找数据库中匹配的未解析节点
                         async with relationship_dao._get_session() as session:
-                            # 查找标题匹配的未解析节点
+                            # 查找标题匹配的未解析节点（基于预计算的 match_title 索引）
                             title_match_query = """
                             MATCH (u:Unresolved)
-                            WHERE u.parsed_title IS NOT NULL
+                            WHERE u.match_title = $match_title
                             RETURN u.lid as lid, u.parsed_title as title, u.parsed_year as year
                             """
                             
-                            result = await session.run(title_match_query)
+                            result = await session.run(title_match_query, match_title=normalized_title)
                             candidate_nodes = []
                             async for record in result:
                                 candidate_title = record["title"]
@@ -745,10 +752,7 @@ class UnresolvedNodeUpgradeHook(Hook):
                                 candidate_lid = record["lid"]
                                 
                                 if candidate_title:
-                                    candidate_normalized = normalize_title_for_matching(candidate_title)
-                                    
-                                    # 🎯 匹配条件：标题相同 + 年份相同或相近(±1年)
-                                    title_matches = candidate_normalized == normalized_title
+                                    # 🎯 匹配条件：标题相同(由 match_title 查询保证) + 年份相同或相近(±1年)
                                     year_matches = True  # 默认匹配
                                     
                                     if literature.metadata.year and candidate_year:
@@ -760,7 +764,7 @@ class UnresolvedNodeUpgradeHook(Hook):
                                         except (ValueError, TypeError):
                                             year_matches = True  # 年份解析失败时不作为阻断条件
                                     
-                                    if title_matches and year_matches:
+                                    if year_matches:
                                         candidate_nodes.append({
                                             "lid": candidate_lid,
                                             "title": candidate_title,
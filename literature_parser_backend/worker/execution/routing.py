@@ -8,6 +8,8 @@ import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from ...services.url_mapping.core.dispatch import HostSuffixIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +38,33 @@ class RouteManager:
         """初始化内置路由规则（只初始化一次）"""
         if not RouteManager._initialized:
             self.routes = self._load_builtin_routes()
+            self._build_route_index()
             RouteManager._initialized = True
+
+    def _build_route_index(self):
+        """
+        构建路由分派表
+
+        路由模式按主机名后缀编入索引，依赖映射结果的DOI/ArXiv路由和通配符路由单独列出，
+        determine_route 只需一次查表，而不是对所有路由做子串扫描。
+        """
+        self._route_order = {id(route): i for i, route in enumerate(sorted(self.routes, key=lambda r: r.priority))}
+        self._route_index: HostSuffixIndex[Route] = HostSuffixIndex()
+        self._doi_routes: List[Route] = []
+        self._arxiv_routes: List[Route] = []
+        self._wildcard_route: Optional[Route] = None
+
+        for route in self.routes:
+            for pattern in route.patterns:
+                if pattern == "*":
+                    if self._wildcard_route is None:
+                        self._wildcard_route = route
+                else:
+                    self._route_index.add(pattern, route)
+            if "doi" in route.name:
+                self._doi_routes.append(route)
+            if "arxiv" in route.name:
+                self._arxiv_routes.append(route)
     
     @classmethod
     def get_instance(cls):
@@ -137,15 +165,21 @@ class RouteManager:
         Returns:
             选中的路由
         """
-        url_lower = url.lower()
-        
-        # 按优先级排序，优先匹配高优先级路由
-        sorted_routes = sorted(self.routes, key=lambda r: r.priority)
-        
-        for route in sorted_routes:
-            if self._matches_route(url_lower, route, mapping_result):
-                logger.info(f"🎯 URL路由决策: {url} → {route.name} (处理器: {route.processors})")
-                return route
+        # 候选路由：主机名命中的路由 + 映射结果满足特殊条件的路由 + 通配符路由
+        candidates = self._route_index.lookup(url)
+        if mapping_result:
+            if mapping_result.get("doi"):
+                candidates += self._doi_routes
+            if mapping_result.get("arxiv_id"):
+                candidates += self._arxiv_routes
+        if self._wildcard_route:
+            candidates.append(self._wildcard_route)
+
+        if candidates:
+            # 按优先级选择，同优先级保持定义顺序
+            route = min(candidates, key=lambda r: self._route_order[id(r)])
+            logger.info(f"🎯 URL路由决策: {url} → {route.name} (处理器: {route.processors})")
+            return route
                 
         # 应该不会到这里，因为有通配符路由
         logger.warning(f"未找到匹配路由，使用默认路由: {url}")
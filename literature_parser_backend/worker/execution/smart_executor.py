@@ -175,9 +175,8 @@ class SmartExecutor:
                 # 异步处理器
                 result = await processor.process(identifier_data)
             else:
-                # 同步处理器，在线程池中执行
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, processor.process, identifier_data)
+                # 同步处理器，在线程池中执行（to_thread会传递上下文变量）
+                result = await asyncio.to_thread(processor.process, identifier_data)
             
             execution_time = (datetime.now() - start_time).total_seconds()
             context.mark_processor_executed(processor.name, execution_time)
@@ -234,9 +233,8 @@ class SmartExecutor:
                 # 异步处理器
                 result = await processor.process(identifier_data)
             else:
-                # 同步处理器，在线程池中执行
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, processor.process, identifier_data)
+                # 同步处理器，在线程池中执行（to_thread会传递上下文变量）
+                result = await asyncio.to_thread(processor.process, identifier_data)
             
             execution_time = (datetime.now() - start_time).total_seconds()
             context.mark_processor_executed(processor.name, execution_time)
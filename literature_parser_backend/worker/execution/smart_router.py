@@ -10,7 +10,10 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from ...services.circuit_breaker import get_upstream_health
+from ...services.upstreams import upstream_for_processor
 from ...services.url_mapping import get_url_mapping_service
+from ...services.url_mapping.extractors.page_cache import PageCache
 from ..metadata.registry import get_global_registry
 from ..metadata.base import IdentifierData
 from .routing import RouteManager
@@ -80,15 +83,18 @@ class SmartRouter:
         start_time = datetime.now()
         
         try:
+            # 任务级页面缓存：URL适配器与站点解析处理器共享同一次页面抓取和解析
+            page_cache = PageCache()
+
             # 阶段1: URL映射 - 提取基础标识符
-            mapping_result = await self._perform_url_mapping(url)
+            mapping_result = await self._perform_url_mapping(url, page_cache)
             
             # 阶段2: 路由决策 - 选择最优处理路径
             route = self.route_manager.determine_route(url, mapping_result)
             logger.info(f"🎯 [智能路由] 选择路由: {route.name} (处理器: {route.processors})")
             
             # 阶段3: 执行选定的处理器获取原始数据
-            raw_data = await self._execute_processors(route, source_data, mapping_result)
+            raw_data = await self._execute_processors(route, source_data, mapping_result, page_cache)
             
             # 🔧 检查raw_data是否有效
             if not raw_data:
@@ -137,12 +143,12 @@ class SmartRouter:
                 'fallback_to_legacy': True
             }
     
-    async def _perform_url_mapping(self, url: str) -> Optional[Dict]:
+    async def _perform_url_mapping(self, url: str, page_cache: Optional[PageCache] = None) -> Optional[Dict]:
         """执行URL映射 - 复用现有服务"""
         try:
             logger.debug(f"🔍 [智能路由] URL映射: {url}")
             # 🔧 修复：URL映射服务的map_url是异步方法，需要await
-            mapping_result = await self.url_mapping_service.map_url(url)
+            mapping_result = await self.url_mapping_service.map_url(url, page_cache=page_cache)
             
             if mapping_result and mapping_result.is_successful():
                 result_dict = mapping_result.to_dict()
@@ -156,11 +162,12 @@ class SmartRouter:
             logger.warning(f"⚠️ [智能路由] URL映射失败: {url}, 错误: {e}")
             return None
     
-    async def _execute_processors(self, route, source_data: Dict, mapping_result: Optional[Dict]) -> Dict[str, Any]:
+    async def _execute_processors(self, route, source_data: Dict, mapping_result: Optional[Dict],
+                                  page_cache: Optional[PageCache] = None) -> Dict[str, Any]:
         """执行处理器获取原始数据 - 不涉及数据库操作"""
         
         # 准备标识符数据
-        identifier_data = self._prepare_identifier_data(source_data, mapping_result)
+        identifier_data = self._prepare_identifier_data(source_data, mapping_result, page_cache)
         
         # 获取可用的处理器
         # available_processors = self._get_available_processors(route.processors, identifier_data)
@@ -533,13 +540,19 @@ class SmartRouter:
             return existing_id
     
     def _get_next_available_processor(self, processors, used_processors, identifier_data):
-        """获取下一个可用且未用过的处理器（按列表顺序）"""
+        """获取下一个可用且未用过的处理器（按列表顺序，跳过上游已熔断的处理器）"""
         logger.debug(f"🔍 寻找可用处理器: 总数={len(processors)}, 已用={list(used_processors)}")
+        upstream_health = get_upstream_health()
         
         for processor in processors:
             if processor.name in used_processors:
                 logger.debug(f"⏭️ 跳过已使用处理器: {processor.name}")
                 continue
+            
+            upstream = upstream_for_processor(processor.name)
+            if not upstream_health.is_available(upstream):
+                logger.info(f"⚡ 跳过处理器 {processor.name}: 上游 {upstream} 已熔断")
+                continue
                 
             can_handle = processor.can_handle(identifier_data)
             logger.debug(f"🤔 检查处理器 {processor.name}: can_handle={can_handle}")
@@ -569,8 +582,8 @@ class SmartRouter:
                 result = await processor.process(identifier_data)
             else:
                 import asyncio
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, processor.process, identifier_data)
+                # to_thread propagates context variables (e.g. request hedging)
+                result = await asyncio.to_thread(processor.process, identifier_data)
             
             # 确保结果包含处理器名称
             if result:
@@ -603,7 +616,8 @@ class SmartRouter:
             authors=identifier_data.authors,
             source_data=identifier_data.source_data,
             pdf_content=identifier_data.pdf_content,
-            file_path=identifier_data.file_path
+            file_path=identifier_data.file_path,
+            page_cache=identifier_data.page_cache
         )
         
         # 从结果中更新字段（如果identifier_data中还没有这些信息）
@@ -647,7 +661,8 @@ class SmartRouter:
         
         return updated_data
 
-    def _prepare_identifier_data(self, source_data: Dict, mapping_result: Optional[Dict]) -> IdentifierData:
+    def _prepare_identifier_data(self, source_data: Dict, mapping_result: Optional[Dict],
+                                 page_cache: Optional[PageCache] = None) -> IdentifierData:
         """准备标识符数据"""
         
         # 基础标识符
@@ -656,7 +671,8 @@ class SmartRouter:
             arxiv_id=source_data.get("arxiv_id"),
             pmid=source_data.get("pmid"),
             url=source_data.get("url"),
-            source_data=source_data
+            source_data=source_data,
+            page_cache=page_cache
         )
         
         # 从URL映射结果中提取增强信息
@@ -0,0 +1,146 @@
+"""
+Offline citation graph analytics job.
+
+Exports the whole Literature→Literature CITES graph, computes PageRank,
+in-degree percentiles and co-citation / bibliographic-coupling top-k on
+sparse matrices (see ``services.graph_analytics``), and writes the results
+back as ``graph_*`` node properties, which the literature API returns as
+``graph_metrics``.
+
+Requires numpy and scipy in the worker running it. They are not in the
+locked dependencies, so beat only schedules the job where they are installed
+(``celery_app.build_beat_schedule``); run by hand without them, the job logs
+an error and does nothing.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from celery import Task
+
+from ..db.dao import LiteratureDAO
+from ..db.neo4j import close_task_connection, create_task_connection
+from ..db.relationship_dao import RelationshipDAO
+from ..services.graph_analytics import (
+    analytics_available,
+    compute_graph_analytics,
+    iter_node_properties,
+)
+from ..settings import Settings
+from .celery_app import celery_app
+from .job_lock import JobLock
+
+logger = logging.getLogger(__name__)
+
+
+class GraphAnalyticsJob:
+    """Full recomputation of graph signals, guarded by a per-run Redis lock."""
+
+    LOCK_KEY = "analytics:graph:lock"
+
+    def __init__(
+        self,
+        dao: LiteratureDAO,
+        relationship_dao: RelationshipDAO,
+        redis_client=None,
+        settings: Optional[Settings] = None,
+    ):
+        """
+        Initialize the job.
+
+        Args:
+            dao: Literature DAO (writes node properties)
+            relationship_dao: Relationship DAO (exports the graph)
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.dao = dao
+        self.relationship_dao = relationship_dao
+        self.settings = settings or Settings()
+        self.lock = JobLock(
+            self.LOCK_KEY, self.lock_ttl, "Graph analytics", redis_client=redis_client, settings=self.settings
+        )
+
+    @property
+    def lock_ttl(self) -> int:
+        """Lock TTL: the current phase's budget plus one phase of slack."""
+        return 2 * self.settings.graph_analytics_phase_budget
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Recompute and store all graph signals.
+
+        Returns:
+            Run statistics
+        """
+        if not analytics_available():
+            logger.error("Graph analytics skipped: numpy and scipy are not installed")
+            return {"skipped": True, "error": "numpy/scipy not installed"}
+
+        if not self.lock.acquire():
+            logger.info("Graph analytics already running, skipping")
+            return {"skipped": True}
+
+        try:
+            started = datetime.now()
+            computed_at = started.isoformat()
+
+            lids, edges = await self.relationship_dao.export_citation_graph()
+            self.lock.renew()
+            # CPU-bound; keep the event loop (and the Neo4j connection) responsive
+            analytics = await asyncio.to_thread(
+                compute_graph_analytics,
+                lids,
+                edges,
+                top_k=self.settings.graph_analytics_top_k,
+                min_confidence=self.settings.graph_analytics_min_confidence,
+                damping=self.settings.graph_analytics_damping,
+            )
+
+            self.lock.renew()
+
+            rows = list(iter_node_properties(analytics, computed_at))
+            updated = await self.dao.write_graph_metrics(rows)
+            self.lock.renew()
+            cleared = await self.dao.clear_stale_graph_metrics(computed_at)
+
+            stats = {
+                "nodes": len(analytics["lids"]),
+                "edges": len(edges),
+                "updated": updated,
+                "cleared": cleared,
+                "computed_at": computed_at,
+                "duration_seconds": round((datetime.now() - started).total_seconds(), 2),
+            }
+            logger.info(
+                f"Graph analytics complete: {stats['nodes']} nodes, {stats['edges']} edges "
+                f"in {stats['duration_seconds']}s"
+            )
+            return stats
+
+        finally:
+            self.lock.release()
+
+
+async def _compute_graph_analytics_async() -> Dict[str, Any]:
+    client = None
+    try:
+        client, database = await create_task_connection()
+        dao = LiteratureDAO.create_from_task_connection(database)
+        relationship_dao = RelationshipDAO(database=database)
+        return await GraphAnalyticsJob(dao, relationship_dao).run()
+    finally:
+        if client:
+            await close_task_connection(client)
+
+
+@celery_app.task(bind=True, name="compute_graph_analytics_task")
+def compute_graph_analytics_task(self: Task) -> Dict[str, Any]:
+    """Celery task entry point for the graph analytics job."""
+    try:
+        return asyncio.run(_compute_graph_analytics_async())
+    except Exception as e:
+        logger.error(f"Graph analytics task {self.request.id} failed: {e}", exc_info=True)
+        return {"error": str(e)}
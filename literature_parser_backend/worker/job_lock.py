@@ -0,0 +1,100 @@
+"""
+Redis lock for periodic maintenance jobs.
+
+Each run takes the lock with its own token and a TTL covering one unit of
+work, and renews it between units, so a long run keeps the lock while a
+crashed one releases it within the TTL. Renewal and release are
+compare-and-set scripts: a run whose lock expired and was taken over by
+another run can neither extend nor delete the new holder's lock. When Redis
+is unavailable the job runs unlocked rather than not at all.
+"""
+
+import logging
+import uuid
+from typing import Optional
+
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Only the run holding the lock token may renew or release it
+RENEW_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class JobLock:
+    """Per-run lock on ``key``, owned through a random token."""
+
+    def __init__(self, key: str, ttl: int, name: str, redis_client=None, settings: Optional[Settings] = None):
+        """
+        Initialize the lock.
+
+        Args:
+            key: Lock key
+            ttl: Seconds the lock lasts without renewal
+            name: Job name for log messages
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.key = key
+        self.ttl = ttl
+        self.name = name
+        self.settings = settings or Settings()
+        self._redis = redis_client
+        self.token: Optional[str] = None
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    def acquire(self) -> bool:
+        """
+        Take the lock.
+
+        Returns:
+            False if another run holds the lock
+        """
+        token = uuid.uuid4().hex
+        try:
+            if not self.redis.set(self.key, token, nx=True, ex=self.ttl):
+                return False
+        except Exception as e:
+            logger.warning(f"{self.name} lock unavailable, running unlocked: {e}")
+            return True
+        self.token = token
+        return True
+
+    def renew(self) -> None:
+        """Extend the lock for the next unit of work, if this run owns it."""
+        if self.token is None:
+            return
+        try:
+            self.redis.eval(RENEW_LOCK_SCRIPT, 1, self.key, self.token, self.ttl)
+        except Exception as e:
+            logger.warning(f"Failed to renew {self.name} lock: {e}")
+
+    def release(self) -> None:
+        """Release the lock, if this run owns it."""
+        if self.token is None:
+            return
+        try:
+            self.redis.eval(RELEASE_LOCK_SCRIPT, 1, self.key, self.token)
+        except Exception as e:
+            logger.warning(f"Failed to release {self.name} lock: {e}")
+        finally:
+            self.token = None
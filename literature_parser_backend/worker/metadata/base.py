@@ -49,6 +49,7 @@ class IdentifierData:
     source_data: Optional[Dict[str, Any]] = None
     pdf_content: Optional[bytes] = None
     file_path: Optional[str] = None  # Local file path
+    page_cache: Optional[Any] = None  # Task-scoped PageCache shared with URL mapping
 
 
 @dataclass
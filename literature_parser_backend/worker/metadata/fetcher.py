@@ -10,6 +10,7 @@ import asyncio
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...models.literature import MetadataModel
+from ...services.url_mapping.extractors.page_cache import PageCache
 from ...settings import Settings
 from .base import IdentifierData, MetadataProcessor, ProcessorResult, ProcessorType
 from .registry import get_global_registry
@@ -107,10 +108,7 @@ class MetadataFetcher:
                 
                 # Run synchronous processors in a thread pool to avoid blocking the event loop
                 if not asyncio.iscoroutinefunction(processor.process):
-                    loop = asyncio.get_running_loop()
-                    result = await loop.run_in_executor(
-                        None, processor.process, identifier_data
-                    )
+                    result = await asyncio.to_thread(processor.process, identifier_data)
                 else:
                     result = await processor.process(identifier_data)
                 
@@ -166,7 +164,8 @@ class MetadataFetcher:
             arxiv_id=identifiers.get("arxiv_id"),
             pmid=identifiers.get("pmid"),
             pdf_content=pdf_content,
-            source_data=source_data
+            source_data=source_data,
+            page_cache=PageCache()
         )
         
         # Extract URL-based identifiers
@@ -3,15 +3,16 @@
 
 使用 requests 和 BeautifulSoup 直接从网页HTML中提取元数据，
 不再依赖上层的 URLMappingService，避免逻辑循环。
+同一任务内优先复用 IdentifierData.page_cache 中已抓取的页面和DOM。
+先只读取<head>，meta标签不完整时才下载完整页面应用站点CSS选择器规则。
 """
 
 import logging
-import requests
-from bs4 import BeautifulSoup
 from typing import Any, Dict, List, Optional, Tuple
 import re
 
 from ....models.literature import AuthorModel, MetadataModel
+from ....services.url_mapping.extractors.page_cache import PageCache
 from ..base import IdentifierData, MetadataProcessor, ProcessorResult, ProcessorType
 
 logger = logging.getLogger(__name__)
@@ -106,13 +107,12 @@ class SiteParserProcessor(MetadataProcessor):
     
     def __init__(self, settings=None):
         super().__init__(settings)
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'Referer': 'https://www.google.com/'
-        })
+        }
 
     @property
     def name(self) -> str:
@@ -152,71 +152,77 @@ class SiteParserProcessor(MetadataProcessor):
             
             rules = SITE_RULES[domain]
             
-            try:
-                response = self.session.get(identifiers.url, timeout=15)
-                response.raise_for_status()
-                html_content = response.text
-            except requests.HTTPError as e:
-                # 检查HTTP状态码
-                if response.status_code == 404:
-                    return ProcessorResult(success=False, error="url_not_found", source=self.name)
-                elif response.status_code >= 500:
-                    return ProcessorResult(success=False, error="url_access_failed", source=self.name)
-                else:
-                    return ProcessorResult(success=False, error=f"HTTP error {response.status_code}: {e}", source=self.name)
-            except requests.RequestException as e:
-                return ProcessorResult(success=False, error="url_access_failed", source=self.name)
+            page_cache = identifiers.page_cache if identifiers.page_cache is not None else PageCache()
 
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # 先只读取<head>：meta标签已包含所需字段时无需下载完整页面
+            page = page_cache.fetch(identifiers.url, timeout=15, headers=self.headers, head_only=True)
+            error = self._fetch_error(page)
+            if error:
+                return ProcessorResult(success=False, error=error, source=self.name)
 
-            # Defensive extraction for each field
-            title, authors, abstract, year, venue = "Unknown Title", [], None, None, None
-            try:
-                title = soup.select_one(rules['title']).get_text(strip=True) if soup.select_one(rules['title']) else "Unknown Title"
-            except Exception as e:
-                logger.warning(f"[SiteParserV2] Failed to parse title for {identifiers.url}: {e}")
+            head_fields = self._extract_from_meta_tags(page.soup, identifiers.url)
+            if page.head_only and not self._head_is_sufficient(*head_fields):
+                # 站点规则的CSS选择器位于<body>，回退到下载完整页面
+                logger.info(f"[SiteParserV2] <head> meta标签不完整，下载完整页面: {identifiers.url}")
+                page = page_cache.fetch(identifiers.url, timeout=15, headers=self.headers)
+                error = self._fetch_error(page)
+                if error:
+                    return ProcessorResult(success=False, error=error, source=self.name)
+
+            soup = page.soup
+
+            if page.head_only:
+                logger.info(f"[SiteParserV2] 仅使用<head> meta标签: {identifiers.url}")
+                title, authors, abstract, year, venue = head_fields
+            else:
+                # Defensive extraction for each field
+                title, authors, abstract, year, venue = "Unknown Title", [], None, None, None
+                try:
+                    title = soup.select_one(rules['title']).get_text(strip=True) if soup.select_one(rules['title']) else "Unknown Title"
+                except Exception as e:
+                    logger.warning(f"[SiteParserV2] Failed to parse title for {identifiers.url}: {e}")
             
-            try:
-                authors_elements = soup.select(rules['authors'])
-                authors = [AuthorModel(name=el.get_text(strip=True)) for el in authors_elements]
-            except Exception as e:
-                logger.warning(f"[SiteParserV2] Failed to parse authors for {identifiers.url}: {e}")
+                try:
+                    authors_elements = soup.select(rules['authors'])
+                    authors = [AuthorModel(name=el.get_text(strip=True)) for el in authors_elements]
+                except Exception as e:
+                    logger.warning(f"[SiteParserV2] Failed to parse authors for {identifiers.url}: {e}")
 
-            try:
-                abstract = soup.select_one(rules['abstract']).get_text(strip=True) if soup.select_one(rules['abstract']) else None
-            except Exception as e:
-                logger.warning(f"[SiteParserV2] Failed to parse abstract for {identifiers.url}: {e}")
+                try:
+                    abstract = soup.select_one(rules['abstract']).get_text(strip=True) if soup.select_one(rules['abstract']) else None
+                except Exception as e:
+                    logger.warning(f"[SiteParserV2] Failed to parse abstract for {identifiers.url}: {e}")
             
-            try:
-                year_text = soup.select_one(rules['year']).get_text(strip=True) if soup.select_one(rules['year']) else ''
-                year_match = re.search(r'\b(19|20)\d{2}\b', year_text)
-                year = year_match.group(0) if year_match else None
-            except Exception as e:
-                logger.warning(f"[SiteParserV2] Failed to parse year for {identifiers.url}: {e}")
+                try:
+                    year_text = soup.select_one(rules['year']).get_text(strip=True) if soup.select_one(rules['year']) else ''
+                    year_match = re.search(r'\b(19|20)\d{2}\b', year_text)
+                    year = year_match.group(0) if year_match else None
+                except Exception as e:
+                    logger.warning(f"[SiteParserV2] Failed to parse year for {identifiers.url}: {e}")
 
-            try:
-                venue = soup.select_one(rules['venue']).get_text(strip=True) if soup.select_one(rules['venue']) else None
-            except Exception as e:
-                logger.warning(f"[SiteParserV2] Failed to parse venue for {identifiers.url}: {e}")
+                try:
+                    venue = soup.select_one(rules['venue']).get_text(strip=True) if soup.select_one(rules['venue']) else None
+                except Exception as e:
+                    logger.warning(f"[SiteParserV2] Failed to parse venue for {identifiers.url}: {e}")
 
-            # 🆕 如果规则提取失败或结果不完整，尝试meta标签回退
-            if (title == "Unknown Title" or not authors or not abstract or not year or not venue):
-                logger.info(f"[SiteParserV2] 规则提取不完整，尝试meta标签回退: {identifiers.url}")
-                meta_title, meta_authors, meta_abstract, meta_year, meta_venue = self._extract_from_meta_tags(soup, identifiers.url)
+                # 🆕 如果规则提取失败或结果不完整，尝试meta标签回退
+                if (title == "Unknown Title" or not authors or not abstract or not year or not venue):
+                    logger.info(f"[SiteParserV2] 规则提取不完整，尝试meta标签回退: {identifiers.url}")
+                    meta_title, meta_authors, meta_abstract, meta_year, meta_venue = self._extract_from_meta_tags(soup, identifiers.url)
                 
-                # 用更好的数据替换空缺字段
-                if title == "Unknown Title" and meta_title != "Unknown Title":
-                    title = meta_title
-                if not authors and meta_authors:
-                    authors = meta_authors
-                if not abstract and meta_abstract:
-                    abstract = meta_abstract
-                if not year and meta_year:
-                    year = meta_year
-                if not venue and meta_venue:
-                    venue = meta_venue
+                    # 用更好的数据替换空缺字段
+                    if title == "Unknown Title" and meta_title != "Unknown Title":
+                        title = meta_title
+                    if not authors and meta_authors:
+                        authors = meta_authors
+                    if not abstract and meta_abstract:
+                        abstract = meta_abstract
+                    if not year and meta_year:
+                        year = meta_year
+                    if not venue and meta_venue:
+                        venue = meta_venue
                     
-                logger.info(f"[SiteParserV2] Meta标签增强完成，作者: {len(authors)}个")
+                    logger.info(f"[SiteParserV2] Meta标签增强完成，作者: {len(authors)}个")
 
             # 🆕 提取DOI和其他标识符
             extracted_identifiers = self._extract_identifiers(soup, identifiers.url)
@@ -251,6 +257,21 @@ class SiteParserProcessor(MetadataProcessor):
             logger.error(f"[SiteParserV2] Exception during processing {identifiers.url}: {e}", exc_info=True)
             return ProcessorResult(success=False, error=f"An unexpected error occurred: {e}", source=self.name)
             
+    def _fetch_error(self, page) -> Optional[str]:
+        """把页面获取失败映射为处理器错误（url_not_found / url_access_failed）"""
+        if page.success:
+            return None
+        if page.status_code == 404:
+            return "url_not_found"
+        if page.status_code is None or page.status_code >= 500:
+            return "url_access_failed"
+        return f"HTTP error {page.status_code}: {page.result.error_message}"
+
+    @staticmethod
+    def _head_is_sufficient(title, authors, abstract, year, venue) -> bool:
+        """<head> meta标签是否已包含标题、作者、年份和摘要"""
+        return title != "Unknown Title" and bool(authors) and bool(year) and bool(abstract)
+
     def _extract_from_meta_tags(self, soup, url: str):
         """从meta标签中提取数据（学术网站的标准方式）"""
         title = "Unknown Title"
@@ -0,0 +1,306 @@
+"""
+Priority lanes for literature tasks.
+
+Literature tasks are split over three queues so a user waiting on
+``/by-doi`` no longer sits behind a bulk import:
+
+- ``literature_interactive``: a client is synchronously waiting for the result
+- ``literature``: normal asynchronous submissions (the original queue)
+- ``literature_bulk``: bulk imports and periodic maintenance
+
+Workers consume the lanes with weighted fairness rather than strict
+priority: ``WeightedQueueCycle`` is plugged into the Redis transport as its
+``queue_order_strategy``, so while every lane has a backlog the fetches are
+split by the configured weights (6:3:1 by default), and an idle lane's share
+goes to the others.
+
+``TaskSubmitter`` also lets an interactive request jump ahead of
+work already queued for the same literature: a submission whose aliases
+match a task that is still queued in a slower lane is sent to the faster
+lane, and the queued copy later resolves as a cheap duplicate. A matching
+task that is already running, or queued in a lane at least as fast, is
+reused instead of submitting the same literature twice. Celery reports lost
+tasks (worker crash before ack, purged queue, expired result) as ``PENDING``
+too, so a ``PENDING`` task is only reused for ``task_submission_pending_grace``
+seconds after its submission; tasks that reached a worker are ``STARTED`` or
+later (``task_track_started``).
+
+Admission control (``admission.AdmissionController``) runs inside ``submit``,
+after the reuse check: a submission coalesced onto a task that is already
+queued or running adds no work, so it is never rejected or counted as new
+queue depth.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.alias import AliasType, extract_aliases_from_source
+from ..models.task import TaskPriority
+from ..settings import Settings
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE_QUEUE = "literature_interactive"
+NORMAL_QUEUE = "literature"
+BULK_QUEUE = "literature_bulk"
+
+# In the order workers should list them (``--queues``)
+LITERATURE_QUEUES = (INTERACTIVE_QUEUE, NORMAL_QUEUE, BULK_QUEUE)
+
+QUEUE_FOR_PRIORITY = {
+    TaskPriority.INTERACTIVE: INTERACTIVE_QUEUE,
+    TaskPriority.NORMAL: NORMAL_QUEUE,
+    TaskPriority.BULK: BULK_QUEUE,
+}
+
+# Lower rank = faster lane
+PRIORITY_RANK = {
+    TaskPriority.INTERACTIVE: 0,
+    TaskPriority.NORMAL: 1,
+    TaskPriority.BULK: 2,
+}
+
+# Aliases identifying the literature of a submission, most specific first
+SUBMISSION_ALIAS_ORDER = (
+    AliasType.DOI,
+    AliasType.ARXIV,
+    AliasType.PMID,
+    AliasType.URL,
+    AliasType.PDF_URL,
+    AliasType.TITLE,
+)
+
+
+def queue_weights(settings: Optional[Settings] = None) -> Dict[str, int]:
+    """Consumption weight of each literature queue."""
+    settings = settings or Settings()
+    return {
+        INTERACTIVE_QUEUE: max(1, settings.task_queue_interactive_weight),
+        NORMAL_QUEUE: max(1, settings.task_queue_normal_weight),
+        BULK_QUEUE: max(1, settings.task_queue_bulk_weight),
+    }
+
+
+class WeightedQueueCycle:
+    """
+    Queue order strategy for kombu's Redis transport.
+
+    kombu issues ``BRPOP`` over the queues in the order returned by
+    ``consume`` and reports the queue each message came from to ``rotate``.
+    On every delivery the competing queues earn credit in proportion to their
+    weight and the queue that delivered pays their total, so the queue with
+    the most credit is asked first (smooth weighted round-robin). Queues
+    ordered before the delivering one were empty and sit the round out, and
+    credit is bounded, so an idle lane neither skews the others' shares nor
+    monopolizes the worker once it becomes busy.
+    """
+
+    def __init__(self, it=None, weights: Optional[Dict[str, int]] = None):
+        self.items = it if it is not None else []
+        self.weights = weights if weights is not None else queue_weights()
+        self.credit: Dict[str, int] = {}
+        self._order: List[str] = []
+
+    def _weight(self, queue: str) -> int:
+        return self.weights.get(queue, 1)
+
+    def update(self, it):
+        """Update the consumed queues."""
+        self.items[:] = it
+
+    def consume(self, n: int) -> List[str]:
+        """Queues to ask, in order."""
+        self._order = sorted(
+            self.items[:n],
+            key=lambda queue: (-self.credit.get(queue, 0), -self._weight(queue)),
+        )
+        return list(self._order)
+
+    def rotate(self, last_used: str):
+        """Account for a message delivered from ``last_used``."""
+        if last_used not in self.items:
+            return
+        order = self._order if last_used in self._order else self.items
+        competing = [queue for queue in order[order.index(last_used):] if queue in self.items]
+        total = sum(self._weight(queue) for queue in competing)
+        for queue in competing:
+            credit = self.credit.get(queue, 0) + self._weight(queue)
+            if queue == last_used:
+                credit -= total
+            self.credit[queue] = max(-total, min(total, credit))
+
+
+def submission_aliases(source: Dict[str, Any]) -> List[str]:
+    """
+    Keys identifying the literature a submission refers to.
+
+    Args:
+        source: Task source data (flat, or with a nested ``identifiers`` dict)
+
+    Returns:
+        ``<alias type>:<normalized value>`` keys, most specific first
+    """
+    flat = dict(source.get("identifiers") or {})
+    flat.update({key: value for key, value in source.items() if value})
+    aliases = extract_aliases_from_source(flat)
+    return [f"{alias_type.value}:{aliases[alias_type]}" for alias_type in SUBMISSION_ALIAS_ORDER if alias_type in aliases]
+
+
+@dataclass
+class Submission:
+    """A literature task that was submitted, or reused for a repeat submission."""
+
+    result: Any  # celery AsyncResult
+    reused: bool = False
+    estimated_wait: Optional[float] = None  # seconds, from admission; None if reused or unknown
+
+    @property
+    def id(self) -> str:
+        """Task ID."""
+        return self.result.id
+
+
+class TaskSubmitter:
+    """Sends literature tasks to their lane and coalesces repeat submissions."""
+
+    KEY_PREFIX = "literature_submission:"
+
+    def __init__(self, redis_client=None, settings: Optional[Settings] = None, admission=None):
+        """
+        Initialize the submitter.
+
+        Args:
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+            admission: AdmissionController (defaults to the process-wide one)
+        """
+        self.settings = settings or Settings()
+        self.ttl = self.settings.task_submission_ttl
+        self.pending_grace = self.settings.task_submission_pending_grace
+        self._redis = redis_client
+        self._admission = admission
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    @property
+    def admission(self):
+        """Lazily resolve the process-wide admission controller."""
+        if self._admission is None:
+            from .admission import get_admission_controller
+            self._admission = get_admission_controller()
+        return self._admission
+
+    def submit(self, source: Dict[str, Any], priority: TaskPriority = TaskPriority.NORMAL) -> Submission:
+        """
+        Submit a literature task in the lane of its priority.
+
+        Args:
+            source: Task source data
+            priority: Lane to submit to
+
+        Returns:
+            The new task, or the matching queued or running task that is reused
+
+        Raises:
+            AdmissionRejected: A new task is needed but its lane is overloaded
+        """
+        from .celery_app import celery_app
+        from .tasks import process_literature_task
+
+        priority = TaskPriority(priority)
+        keys = submission_aliases(source)
+
+        pending = self._find_pending(keys)
+        if pending is not None:
+            task_id, pending_priority, submitted_at = pending
+            result = celery_app.AsyncResult(task_id)
+            state = result.state
+            if state == "PENDING" and time.time() - submitted_at > self.pending_grace:
+                # Not picked up within the grace period: possibly lost, never reuse it
+                logger.info(f"Task {task_id} for {keys[0]} still PENDING after {self.pending_grace}s, submitting anew")
+                self._forget(keys, task_id)
+            elif state not in ("SUCCESS", "FAILURE", "REVOKED"):
+                if state != "PENDING" or PRIORITY_RANK[pending_priority] <= PRIORITY_RANK[priority]:
+                    logger.info(f"Reusing {pending_priority.value} task {task_id} ({state}) for {keys[0]}")
+                    return Submission(result, reused=True)
+                logger.info(
+                    f"Task {task_id} for {keys[0]} is still queued in the {pending_priority.value} lane, "
+                    f"submitting ahead of it in the {priority.value} lane"
+                )
+
+        decision = self.admission.admit(priority)
+        result = process_literature_task.apply_async(
+            args=(source,),
+            kwargs={"interactive": priority == TaskPriority.INTERACTIVE},
+            queue=QUEUE_FOR_PRIORITY[priority],
+        )
+        self._register(keys, result.id, priority)
+        return Submission(result, estimated_wait=decision.estimated_wait)
+
+    async def submit_async(self, source: Dict[str, Any], priority: TaskPriority = TaskPriority.NORMAL) -> Submission:
+        """
+        ``submit`` for API handlers, run in a worker thread.
+
+        Submitting talks to Redis and the broker synchronously (lookups,
+        admission, ``apply_async``), which must not block the event loop.
+        """
+        return await asyncio.to_thread(self.submit, source, priority)
+
+    def _find_pending(self, keys: List[str]) -> Optional[Tuple[str, TaskPriority, float]]:
+        if not keys:
+            return None
+        try:
+            entries = self.redis.mget([self.KEY_PREFIX + key for key in keys])
+        except Exception as e:
+            logger.debug(f"Failed to look up pending submissions: {e}")
+            return None
+        for entry in entries:
+            if not entry:
+                continue
+            try:
+                data = json.loads(entry)
+                # Entries without a submission time predate the grace period and count as old
+                return data["task_id"], TaskPriority(data["priority"]), float(data.get("submitted_at", 0))
+            except (TypeError, ValueError, KeyError):
+                continue
+        return None
+
+    def _register(self, keys: List[str], task_id: str, priority: TaskPriority):
+        if not keys:
+            return
+        entry = json.dumps({"task_id": task_id, "priority": priority.value, "submitted_at": time.time()})
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.set(self.KEY_PREFIX + key, entry, ex=self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Failed to register submission of task {task_id}: {e}")
+
+    def _forget(self, keys: List[str], task_id: str):
+        try:
+            self.redis.delete(*[self.KEY_PREFIX + key for key in keys])
+        except Exception as e:
+            logger.debug(f"Failed to drop the registration of task {task_id}: {e}")
+
+
+# One instance per process
+_submitter: Optional[TaskSubmitter] = None
+
+
+def get_task_submitter() -> TaskSubmitter:
+    """Get the process-wide task submitter."""
+    global _submitter
+    if _submitter is None:
+        _submitter = TaskSubmitter()
+    return _submitter
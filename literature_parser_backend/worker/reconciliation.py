@@ -0,0 +1,204 @@
+"""
+Unresolved → Literature reconciliation job.
+
+Joins every :Unresolved placeholder to :Literature by precomputed match keys
+in set-based batches, re-points CITES edges in bulk and deletes the merged
+placeholders. This is the maintenance counterpart of the per-paper upgrade in
+the ingest task: it catches matches the per-paper pass missed (e.g. a
+placeholder created after the literature was ingested) and, with
+``unresolved_upgrade_inline`` disabled, replaces it entirely.
+
+Progress is checkpointed in Redis after every batch, so an interrupted pass
+resumes where it stopped instead of rescanning from the start.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from celery import Task
+
+from ..db.dao import LiteratureDAO
+from ..db.neo4j import close_task_connection, create_task_connection
+from ..db.relationship_dao import RelationshipDAO
+from ..settings import Settings
+from .celery_app import celery_app
+from .job_lock import JobLock
+
+logger = logging.getLogger(__name__)
+
+class UnresolvedReconciler:
+    """Resumable, batched reconciliation of placeholders with literature."""
+
+    CHECKPOINT_KEY = "reconcile:unresolved:checkpoint"
+    LOCK_KEY = "reconcile:unresolved:lock"
+
+    def __init__(
+        self,
+        dao: LiteratureDAO,
+        relationship_dao: RelationshipDAO,
+        redis_client=None,
+        settings: Optional[Settings] = None,
+    ):
+        """
+        Initialize the reconciler.
+
+        Args:
+            dao: Literature DAO (used to backfill missing match keys)
+            relationship_dao: Relationship DAO running the set-based queries
+            redis_client: Redis client (defaults to the shared client)
+            settings: Application settings
+        """
+        self.dao = dao
+        self.relationship_dao = relationship_dao
+        self.settings = settings or Settings()
+        self.batch_size = self.settings.unresolved_reconcile_batch_size
+        self.batch_budget = self.settings.unresolved_reconcile_batch_budget
+        self._redis = redis_client
+        self.lock = JobLock(
+            self.LOCK_KEY, self.lock_ttl, "Reconciliation", redis_client=redis_client, settings=self.settings
+        )
+
+    @property
+    def redis(self):
+        """Lazily resolve the shared Redis client."""
+        if self._redis is None:
+            from ..db.redis_client import get_redis_client
+            self._redis = get_redis_client(self.settings)
+        return self._redis
+
+    # ========== Checkpoint ==========
+
+    def load_checkpoint(self) -> Dict[str, Any]:
+        """Load the current pass position, or a fresh one."""
+        try:
+            raw = self.redis.get(self.CHECKPOINT_KEY)
+            if raw:
+                return json.loads(raw)
+        except Exception as e:
+            logger.warning(f"Failed to load reconciliation checkpoint, starting a new pass: {e}")
+        return self._new_checkpoint()
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Persist the pass position after a committed batch."""
+        try:
+            self.redis.set(self.CHECKPOINT_KEY, json.dumps(checkpoint))
+        except Exception as e:
+            logger.warning(f"Failed to save reconciliation checkpoint: {e}")
+
+    def clear_checkpoint(self) -> None:
+        """Forget the pass position so the next run starts from the beginning."""
+        try:
+            self.redis.delete(self.CHECKPOINT_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to clear reconciliation checkpoint: {e}")
+
+    @staticmethod
+    def _new_checkpoint() -> Dict[str, Any]:
+        return {
+            "after_lid": "",
+            "started_at": datetime.now().isoformat(),
+            "scanned": 0,
+            "merged": 0,
+            "upgraded_relationships": 0,
+        }
+
+    # ========== Lock ==========
+
+    @property
+    def lock_ttl(self) -> int:
+        """Lock TTL: the current batch's budget plus one batch of slack."""
+        return 2 * self.batch_budget
+
+    # ========== Run ==========
+
+    async def run(self, max_batches: Optional[int] = None, reset: bool = False) -> Dict[str, Any]:
+        """
+        Run (or resume) a reconciliation pass.
+
+        Args:
+            max_batches: Stop after this many batches, leaving the checkpoint
+                in place for the next run (None runs to the end of the pass)
+            reset: Discard any existing checkpoint first
+
+        Returns:
+            Pass statistics, with ``completed`` set when the pass finished
+        """
+        if not self.lock.acquire():
+            logger.info("Reconciliation already running, skipping")
+            return {"skipped": True}
+
+        try:
+            if reset:
+                self.clear_checkpoint()
+            checkpoint = self.load_checkpoint()
+
+            if not checkpoint["after_lid"]:
+                # Nodes written before match keys existed cannot be joined
+                await self.dao.backfill_match_keys()
+                await self.relationship_dao.backfill_unresolved_match_keys()
+                self.lock.renew()
+
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                pairs, last_lid, scanned = await self.relationship_dao.find_reconcilable_unresolved(
+                    after_lid=checkpoint["after_lid"],
+                    batch_size=self.batch_size,
+                )
+                if not scanned:
+                    logger.info(
+                        f"Reconciliation pass complete: scanned {checkpoint['scanned']}, "
+                        f"merged {checkpoint['merged']} placeholders, "
+                        f"re-pointed {checkpoint['upgraded_relationships']} relationships"
+                    )
+                    self.clear_checkpoint()
+                    return {**checkpoint, "completed": True}
+
+                upgrade = await self.relationship_dao.bulk_upgrade_unresolved(pairs)
+
+                checkpoint["after_lid"] = last_lid
+                checkpoint["scanned"] += scanned
+                checkpoint["merged"] += len(upgrade["merged_lids"])
+                checkpoint["upgraded_relationships"] += upgrade["upgraded_relationships"]
+                self.save_checkpoint(checkpoint)
+                self.lock.renew()
+                batches += 1
+
+                if upgrade["merged_lids"]:
+                    logger.info(
+                        f"Reconciled {len(upgrade['merged_lids'])}/{scanned} placeholders "
+                        f"(up to {last_lid})"
+                    )
+
+            return {**checkpoint, "completed": False}
+
+        finally:
+            self.lock.release()
+
+
+async def _reconcile_unresolved_async(max_batches: Optional[int], reset: bool) -> Dict[str, Any]:
+    client = None
+    try:
+        client, database = await create_task_connection()
+        dao = LiteratureDAO.create_from_task_connection(database)
+        relationship_dao = RelationshipDAO(database=database)
+        return await UnresolvedReconciler(dao, relationship_dao).run(max_batches=max_batches, reset=reset)
+    finally:
+        if client:
+            await close_task_connection(client)
+
+
+@celery_app.task(bind=True, name="reconcile_unresolved_task")
+def reconcile_unresolved_task(
+    self: Task,
+    max_batches: Optional[int] = None,
+    reset: bool = False,
+) -> Dict[str, Any]:
+    """Celery task entry point for the reconciliation job."""
+    try:
+        return asyncio.run(_reconcile_unresolved_async(max_batches, reset))
+    except Exception as e:
+        logger.error(f"Reconciliation task {self.request.id} failed: {e}", exc_info=True)
+        return {"error": str(e), "completed": False}
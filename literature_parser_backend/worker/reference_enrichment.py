@@ -0,0 +1,271 @@
+"""
+Bulk reference enrichment through the Semantic Scholar batch API.
+
+Two places need metadata for many known identifiers at once:
+
+- reference lists from CrossRef, where many entries carry only a DOI; they
+  are resolved with one ``/paper/batch`` request per 500 DOIs instead of one
+  CrossRef request per reference (``lookup_dois``).
+- :Unresolved placeholders that carry a DOI, arXiv id or Semantic Scholar
+  paper id but little else; a periodic pass fills in title/authors/year and
+  recomputes their match keys so the reconciliation job can merge them
+  (``enrich_unresolved``).
+
+arXiv ids Semantic Scholar does not know are looked up with one arXiv
+``id_list`` query per 100 ids.
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from celery import Task
+
+from ..db.neo4j import close_task_connection, create_task_connection
+from ..db.relationship_dao import RelationshipDAO
+from ..services.arxiv_api import ArXivAPIClient
+from ..services.semantic_scholar import SemanticScholarClient
+from ..settings import Settings
+from ..utils.match_keys import normalize_arxiv_id, normalize_doi
+from .celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+# arXiv-minted DOIs, e.g. 10.48550/arXiv.1706.03762
+ARXIV_DOI_PATTERN = re.compile(r"^10\.48550/arxiv\.(.+)$", re.IGNORECASE)
+
+
+def arxiv_id_from_doi(doi: Optional[str]) -> Optional[str]:
+    """Extract the arXiv id from an arXiv-minted DOI."""
+    match = ARXIV_DOI_PATTERN.match(normalize_doi(doi))
+    return normalize_arxiv_id(match.group(1)) if match else None
+
+
+def _author_names(paper: Dict[str, Any]) -> List[str]:
+    return [author["name"] for author in paper.get("authors") or [] if author.get("name")]
+
+
+def reference_from_paper(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert parsed Semantic Scholar paper data to parsed reference data.
+
+    Args:
+        paper: Output of ``SemanticScholarClient._parse_paper_data``
+
+    Returns:
+        Dict in the format produced by ``CitationResolver._parse_reference_data``
+    """
+    external_ids = paper.get("externalIds") or {}
+    identifiers = {"s2_paper_id": paper.get("paperId")}
+    if external_ids.get("DOI"):
+        identifiers["doi"] = external_ids["DOI"]
+    if external_ids.get("ArXiv"):
+        identifiers["arxiv_id"] = external_ids["ArXiv"]
+
+    reference = {
+        "title": paper.get("title"),
+        "authors": _author_names(paper),
+        "year": paper.get("year"),
+        "journal": paper.get("venue"),
+        "doi": external_ids.get("DOI"),
+        "identifiers": {k: v for k, v in identifiers.items() if v},
+    }
+    return {k: v for k, v in reference.items() if v}
+
+
+def reference_from_arxiv(arxiv_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert ``ArXivAPIClient`` metadata to parsed reference data.
+
+    Args:
+        arxiv_data: Output of ``ArXivAPIClient.get_metadata_batch``
+
+    Returns:
+        Dict in the format produced by ``CitationResolver._parse_reference_data``
+    """
+    identifiers = {"arxiv_id": arxiv_data.get("arxiv_id"), "doi": arxiv_data.get("doi")}
+    reference = {
+        "title": arxiv_data.get("title"),
+        "authors": arxiv_data.get("authors") or [],
+        "year": arxiv_data.get("year"),
+        "journal": arxiv_data.get("journal_ref"),
+        "doi": arxiv_data.get("doi"),
+        "identifiers": {k: v for k, v in identifiers.items() if v},
+    }
+    return {k: v for k, v in reference.items() if v}
+
+
+class ReferenceEnricher:
+    """Fills in reference metadata for known identifiers in bulk."""
+
+    def __init__(
+        self,
+        s2_client: Optional[SemanticScholarClient] = None,
+        settings: Optional[Settings] = None,
+        arxiv_client: Optional[ArXivAPIClient] = None,
+    ):
+        """
+        Initialize the enricher.
+
+        Args:
+            s2_client: Semantic Scholar client (created when omitted)
+            settings: Application settings
+            arxiv_client: arXiv API client (created when omitted)
+        """
+        self.settings = settings or Settings()
+        self.s2_client = s2_client or SemanticScholarClient(self.settings)
+        self.arxiv_client = arxiv_client or ArXivAPIClient(self.settings)
+        self.batch_size = self.settings.unresolved_enrich_batch_size
+
+    def lookup_dois(self, dois: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve DOI-only references in one batch.
+
+        Suitable as ``doi_resolver`` for ``CrossRefClient.get_references``.
+
+        Args:
+            dois: DOIs to look up
+
+        Returns:
+            Mapping of lower-case DOI to title/authors/year/venue
+        """
+        dois = [doi for doi in dois if doi]
+        papers = self.s2_client.get_papers_batch([f"DOI:{doi}" for doi in dois])
+
+        references: Dict[str, Dict[str, Any]] = {}
+        for identifier, paper in papers.items():
+            references[normalize_doi(identifier[len("DOI:"):])] = reference_from_paper(paper)
+
+        # arXiv-minted DOIs Semantic Scholar missed
+        missing = {normalize_doi(doi) for doi in dois} - set(references)
+        arxiv_ids = {arxiv_id_from_doi(doi): doi for doi in missing}
+        arxiv_ids.pop(None, None)
+        if arxiv_ids:
+            for arxiv_id, arxiv_data in self.arxiv_client.get_metadata_batch(list(arxiv_ids)).items():
+                references[arxiv_ids[arxiv_id]] = reference_from_arxiv(arxiv_data)
+
+        enhanced: Dict[str, Dict[str, Any]] = {}
+        for doi, reference in references.items():
+            if not reference.get("title"):
+                continue
+            data = {
+                "title": reference["title"],
+                "authors": reference.get("authors"),
+                "year": reference.get("year"),
+                "venue": reference.get("journal"),
+            }
+            enhanced[doi] = {k: v for k, v in data.items() if v}
+        return enhanced
+
+    async def enrich_unresolved(
+        self,
+        relationship_dao: RelationshipDAO,
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Enrich :Unresolved placeholders that carry a DOI, arXiv id or S2 paper id.
+
+        Every scanned placeholder is marked ``enriched_at``, so ids Semantic
+        Scholar does not know are not looked up again.
+
+        Args:
+            relationship_dao: Relationship DAO
+            max_batches: Stop after this many batches (None runs to the end)
+
+        Returns:
+            Statistics with ``scanned``, ``enriched``, ``requests`` and ``completed``
+        """
+        stats = {"scanned": 0, "enriched": 0, "requests": 0, "completed": False}
+        after_lid = ""
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            nodes = await relationship_dao.find_enrichable_unresolved(
+                after_lid=after_lid,
+                batch_size=self.batch_size,
+            )
+            if not nodes:
+                stats["completed"] = True
+                break
+
+            lookup_ids = {}
+            for node in nodes:
+                if node["s2_paper_id"]:
+                    lookup_ids[node["lid"]] = node["s2_paper_id"]
+                elif node["doi"]:
+                    lookup_ids[node["lid"]] = f"DOI:{node['doi']}"
+                elif node["arxiv_id"]:
+                    lookup_ids[node["lid"]] = f"ARXIV:{node['arxiv_id']}"
+
+            papers = await asyncio.to_thread(self.s2_client.get_papers_batch, list(lookup_ids.values()))
+            stats["requests"] += 1
+            found = {
+                lid: reference_from_paper(papers[identifier])
+                for lid, identifier in lookup_ids.items()
+                if identifier in papers
+            }
+
+            # Fall back to arXiv for arXiv ids Semantic Scholar missed
+            arxiv_ids = {}
+            for node in nodes:
+                arxiv_id = node["arxiv_id"] or arxiv_id_from_doi(node["doi"])
+                if node["lid"] not in found and arxiv_id:
+                    arxiv_ids[node["lid"]] = arxiv_id
+            if arxiv_ids:
+                arxiv_papers = await asyncio.to_thread(
+                    self.arxiv_client.get_metadata_batch, list(arxiv_ids.values())
+                )
+                stats["requests"] += 1
+                for lid, arxiv_id in arxiv_ids.items():
+                    if arxiv_id in arxiv_papers:
+                        found[lid] = reference_from_arxiv(arxiv_papers[arxiv_id])
+
+            updates = []
+            for node in nodes:
+                enriched = found.get(node["lid"])
+                parsed_data = None
+                if enriched:
+                    # Keep what the reference itself said, fill in the gaps
+                    parsed_data = {**enriched, **node["parsed_data"]}
+                    parsed_data["identifiers"] = {
+                        **enriched.get("identifiers", {}),
+                        **(node["parsed_data"].get("identifiers") or {}),
+                    }
+                updates.append({"lid": node["lid"], "parsed_data": parsed_data})
+
+            stats["enriched"] += await relationship_dao.apply_unresolved_enrichment(updates)
+            stats["scanned"] += len(nodes)
+            after_lid = nodes[-1]["lid"]
+            batches += 1
+
+        logger.info(
+            f"Unresolved enrichment: scanned {stats['scanned']}, enriched {stats['enriched']} "
+            f"with {stats['requests']} batch requests"
+        )
+        return stats
+
+
+async def _enrich_unresolved_async(max_batches: Optional[int]) -> Dict[str, Any]:
+    client = None
+    try:
+        client, database = await create_task_connection()
+        relationship_dao = RelationshipDAO(database=database)
+        return await ReferenceEnricher().enrich_unresolved(relationship_dao, max_batches=max_batches)
+    finally:
+        if client:
+            await close_task_connection(client)
+
+
+@celery_app.task(bind=True, name="enrich_unresolved_task")
+def enrich_unresolved_task(self: Task, max_batches: Optional[int] = None) -> Dict[str, Any]:
+    """Celery task entry point; triggers reconciliation when anything was enriched."""
+    try:
+        stats = asyncio.run(_enrich_unresolved_async(max_batches))
+        if stats["enriched"]:
+            from .reconciliation import reconcile_unresolved_task
+            reconcile_unresolved_task.delay()
+        return stats
+    except Exception as e:
+        logger.error(f"Enrichment task {self.request.id} failed: {e}", exc_info=True)
+        return {"error": str(e), "completed": False}
@@ -13,6 +13,7 @@ from ..services.grobid import GrobidClient
 from ..services.semantic_scholar import SemanticScholarClient
 from ..services.crossref import CrossRefClient
 from ..settings import Settings
+from .reference_enrichment import ReferenceEnricher
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class ReferencesFetcher:
         self.semantic_scholar_client = SemanticScholarClient(settings)
         self.crossref_client = CrossRefClient(settings)
         self.grobid_client = GrobidClient(settings)
+        self.enricher = ReferenceEnricher(self.semantic_scholar_client, self.settings)
 
     def fetch_references_waterfall(
         self,
@@ -126,7 +128,11 @@ class ReferencesFetcher:
         if not references and identifiers.get("doi"):
             logger.info("Falling back to CrossRef for reference extraction.")
             try:
-                crossref_refs = self.crossref_client.get_references(identifiers["doi"])
+                # DOI-only references are resolved in one Semantic Scholar batch
+                crossref_refs = self.crossref_client.get_references(
+                    identifiers["doi"],
+                    doi_resolver=self.enricher.lookup_dois,
+                )
                 if crossref_refs:
                     raw_data["crossref"] = crossref_refs
                     for ref_data in crossref_refs:
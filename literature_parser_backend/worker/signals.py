@@ -7,39 +7,73 @@ and clean up resources when workers start and terminate.
 
 import asyncio
 import logging
+from typing import Optional
+
 from celery.signals import (
-    worker_init, worker_process_init, worker_shutdown, worker_process_shutdown
+    task_postrun, worker_init, worker_process_init, worker_shutdown, worker_process_shutdown
 )
 
 from literature_parser_backend.db.neo4j import (
     connect_to_neo4j,
     disconnect_from_neo4j,
 )
+from literature_parser_backend.services.known_identifiers import get_known_identifier_filter
+from literature_parser_backend.services.near_duplicates import get_near_duplicate_index
+from literature_parser_backend.services.task_status_projection import get_task_status_projection
 from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker.admission import get_admission_controller
+from literature_parser_backend.worker.async_pool import close_async_task_runner
+from literature_parser_backend.worker.queues import LITERATURE_QUEUES
 
 logger = logging.getLogger(__name__)
 
+async def init_process_resources():
+    """
+    Connect Neo4j and load the per-process lookup structures.
+
+    Must run on the event loop the process's tasks use the driver from.
+    """
+    try:
+        logger.info("Initializing Neo4j connection for worker process...")
+        driver = await connect_to_neo4j()
+        logger.info("Neo4j connection established for worker process")
+        
+        # Load the known identifier Bloom filter so definite misses skip Neo4j
+        await get_known_identifier_filter().load(driver)
+        
+        # Load the near-duplicate index used for ingest deduplication
+        await get_near_duplicate_index().load(driver)
+    except Exception as e:
+        logger.error(f"Failed to connect to Neo4j in worker process: {e}")
+        # Continue execution even if database connection fails
+        # Tasks will fail individually with proper error handling
+
+
+async def close_process_resources():
+    """Close the per-process Neo4j connection."""
+    try:
+        logger.info("Closing Neo4j connection for worker process...")
+        await disconnect_from_neo4j()
+        logger.info("Neo4j connection closed for worker process")
+    except Exception as e:
+        logger.error(f"Error closing Neo4j connection in worker process: {e}")
+
+
 @worker_process_init.connect
 def init_worker_process(sender=None, **kwargs):
     """
     Initialize resources when a worker process starts.
     
     This runs in each worker process and is the right place to initialize
-    per-process resources like database connections.
+    per-process resources like database connections. The async worker mode
+    (threads pool) sends no such signal; its runner initializes the same
+    resources on its own event loop (see ``async_pool``).
     """
     logger.info("Initializing worker process resources...")
     
     # Initialize Neo4j connection using asyncio
     loop = asyncio.get_event_loop()
-    try:
-        logger.info("Initializing Neo4j connection for worker process...")
-        # Run the async connect function in the event loop
-        loop.run_until_complete(connect_to_neo4j())
-        logger.info("Neo4j connection established for worker process")
-    except Exception as e:
-        logger.error(f"Failed to connect to Neo4j in worker process: {e}")
-        # Continue execution even if database connection fails
-        # Tasks will fail individually with proper error handling
+    loop.run_until_complete(init_process_resources())
     
     logger.info("Worker process initialization completed")
 
@@ -52,12 +86,41 @@ def cleanup_worker_process(sender=None, **kwargs):
     
     # Close Neo4j connection using asyncio
     loop = asyncio.get_event_loop()
-    try:
-        logger.info("Closing Neo4j connection for worker process...")
-        # Run the async disconnect function in the event loop
-        loop.run_until_complete(disconnect_from_neo4j())
-        logger.info("Neo4j connection closed for worker process")
-    except Exception as e:
-        logger.error(f"Error closing Neo4j connection in worker process: {e}")
+    loop.run_until_complete(close_process_resources())
     
-    logger.info("Worker process cleanup completed")
\ No newline at end of file
+    logger.info("Worker process cleanup completed")
+
+
+@worker_shutdown.connect
+def close_async_worker(sender=None, **kwargs):
+    """Stop the shared event loop of the async worker mode, if it was started."""
+    close_async_task_runner()
+
+
+def _task_queue(task) -> Optional[str]:
+    """Queue a task was delivered from, falling back to its configured route."""
+    delivery_info = getattr(getattr(task, "request", None), "delivery_info", None) or {}
+    queue = delivery_info.get("routing_key")
+    if queue:
+        return queue
+    routes = getattr(getattr(task, "app", None), "conf", {}).get("task_routes") or {}
+    return (routes.get(getattr(task, "name", None)) or {}).get("queue")
+
+
+@task_postrun.connect
+def record_task_finished(sender=None, task_id=None, task=None, retval=None, state=None, **kwargs):
+    """
+    Record a finished task.
+
+    Every task taken from a literature lane counts towards worker
+    throughput, because admission control's queue depth counts every task
+    in those lanes, maintenance tasks in the bulk lane included. The final
+    task status record is only written for literature tasks; Celery stores
+    the result before ``task_postrun`` fires, so both the record and the
+    Celery result are final when subscribers are woken.
+    """
+    if _task_queue(task) in LITERATURE_QUEUES:
+        # Worker throughput feeds admission control on the intake endpoints
+        get_admission_controller().record_completion()
+    if getattr(task, "name", None) == "process_literature_task":
+        get_task_status_projection().record_final(task_id, state, retval)
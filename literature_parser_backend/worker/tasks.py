@@ -11,7 +11,7 @@ import logging
 # from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
-from celery import Task, current_task
+from celery import Task
 
 from ..db.dao import LiteratureDAO
 from ..db.neo4j import close_task_connection, create_task_connection
@@ -25,11 +25,15 @@ from ..models.task import (
     TaskResultType,
 )
 from ..services import GrobidClient
+from ..services.hedging import hedged_requests
 from ..services.lid_generator import LIDGenerator
+from ..services.task_status_projection import get_task_status_projection
 from ..db.alias_dao import AliasDAO
 from ..models.alias import AliasType, extract_aliases_from_source
 from .execution.smart_router import SmartRouter
 from ..utils.title_matching import MatchingMode, TitleMatchingUtils
+from ..settings import Settings
+from .async_pool import get_async_task_runner
 from .celery_app import celery_app
 from .content_fetcher import ContentFetcher
 from .deduplication import WaterfallDeduplicator
@@ -194,24 +198,17 @@ class TaskStatusManager:
         self.url_validation_info = None
 
     def update_task_progress(self, stage: str, progress: int, literature_id: str = None):
-        """更新Celery任务进度（轻量级信息）"""
-        meta = {
-            "literature_id": literature_id,
-            "current_stage": stage,
-            "progress": progress
-        }
-
-        # 如果有URL验证信息，添加到meta中
-        if self.url_validation_info:
-            meta.update({
-                "url_validation_status": self.url_validation_info.get("status"),
-                "url_validation_error": self.url_validation_info.get("error"),
-                "original_url": self.url_validation_info.get("original_url"),
-            })
-
-        current_task.update_state(
+        """更新任务进度（只写入合并写入的任务状态记录，Celery结果后端只保存最终状态）"""
+        url_validation_info = self.url_validation_info or {}
+        get_task_status_projection().update(
+            self.task_id,
             state="PROGRESS",
-            meta=meta
+            stage=stage,
+            progress=progress,
+            literature_id=literature_id,
+            url_validation_status=url_validation_info.get("status"),
+            url_validation_error=url_validation_info.get("error"),
+            original_url=url_validation_info.get("original_url"),
         )
 
     def set_url_validation_info(self, url_validation_info: Dict[str, Any]):
@@ -220,22 +217,29 @@ class TaskStatusManager:
 
     def fail_task_with_url_validation_error(self, error_info, original_url: str = None):
         """因URL验证失败而终止任务"""
-        # 不使用FAILURE状态，而是使用PROGRESS状态来避免Celery序列化问题
-        meta = {
-            "error": error_info.error_message,
-            "error_type": error_info.error_type,
-            "error_category": error_info.error_category,
-            "url_validation_status": "failed",
-            "url_validation_error": error_info.error_message,
-            "original_url": original_url,
-            "url_validation_details": error_info.url_validation_details,
-            "task_failed": True,  # 标记任务失败
-        }
+        # 记录为进行中的URL验证失败，状态接口据此返回失败
+        get_task_status_projection().update(
+            self.task_id,
+            state="PROGRESS",
+            url_validation_status="failed",
+            url_validation_error=error_info.error_message,
+            original_url=original_url,
+        )
 
-        current_task.update_state(
-            state="PROGRESS",  # 使用PROGRESS而不是FAILURE
-            meta=meta
+    async def update_component_status(self, dao: LiteratureDAO, literature_id: str, component: str,
+                                      **kwargs) -> Dict[str, Any]:
+        """更新文献组件状态，并同步到Redis中的任务状态记录"""
+        overall_status = await dao.update_enhanced_component_status(
+            literature_id=literature_id, component=component, **kwargs
         )
+        if isinstance(overall_status, dict) and overall_status.get("component_status"):
+            get_task_status_projection().update(
+                self.task_id,
+                components=overall_status["component_status"],
+                components_literature_id=literature_id,
+                overall_status=overall_status.get("overall_status"),
+            )
+        return overall_status
 
     def complete_task(self, result_type: TaskResultType, literature_id: str) -> Dict[str, Any]:
         """完成任务并返回结果"""
@@ -492,14 +496,14 @@ async def _upgrade_matching_unresolved_nodes(
                 # 直接查找数据库中匹配的未解析节点
                 try:
                     async with relationship_dao._get_session() as session:
-                        # 查找标题匹配的未解析节点
+                        # 查找标题匹配的未解析节点（基于预计算的 match_title 索引）
                         title_match_query = """
                         MATCH (u:Unresolved)
-                        WHERE u.parsed_title IS NOT NULL
+                        WHERE u.match_title = $match_title
                         RETURN u.lid as lid, u.parsed_title as title, u.parsed_year as year
                         """
                         
-                        result = await session.run(title_match_query)
+                        result = await session.run(title_match_query, match_title=normalized_title)
                         candidate_nodes = []
                         async for record in result:
                             candidate_title = record["title"]
@@ -507,10 +511,7 @@ async def _upgrade_matching_unresolved_nodes(
                             candidate_lid = record["lid"]
                             
                             if candidate_title:
-                                candidate_normalized = normalize_title_for_matching(candidate_title)
-                                
-                                # 🎯 匹配条件：标题相同 + 年份相同或相近(±1年，考虑不同数据源的年份差异)
-                                title_matches = candidate_normalized == normalized_title
+                                # 🎯 匹配条件：标题相同(由 match_title 查询保证) + 年份相同或相近(±1年，考虑不同数据源的年份差异)
                                 year_matches = True  # 默认匹配
                                 
                                 if literature.metadata.year and candidate_year:
@@ -522,7 +523,7 @@ async def _upgrade_matching_unresolved_nodes(
                                     except (ValueError, TypeError):
                                         year_matches = True  # 年份解析失败时不作为阻断条件
                                 
-                                if title_matches and year_matches:
+                                if year_matches:
                                     candidate_nodes.append({
                                         "lid": candidate_lid,
                                         "title": candidate_title,
@@ -650,21 +651,11 @@ async def _check_and_handle_post_metadata_duplicate(
 
     # 2. If no DOI match, check by title similarity
     if not existing_lit and metadata and metadata.title:
-        # Use fuzzy search to get candidates, then a more precise similarity check
-        candidates = await dao.find_by_title_fuzzy(metadata.title, limit=5)
-        logger.info(f"🕵️‍♂️ [Secondary Dedup] Found {len(candidates)} candidates by fuzzy title search for '{metadata.title}'")
-        
-        # Filter out the current placeholder to avoid self-matching
-        candidates = [cand for cand in candidates if cand.lid != placeholder_lid]
-        logger.info(f"🕵️‍♂️ [Secondary Dedup] After filtering out placeholder {placeholder_lid}: {len(candidates)} candidates remain")
-        
-        # 🔍 Debug: 列出所有候选文献详情
-        for i, cand in enumerate(candidates):
-            logger.info(f"🕵️‍♂️ [Secondary Dedup]   Candidate {i+1}: LID={cand.lid}, Title='{cand.metadata.title if cand.metadata else 'N/A'}'")
-        for cand_lit in candidates:
+        def is_duplicate(cand_lit) -> bool:
+            """A more precise similarity check than the candidate lookup."""
             if not cand_lit or not cand_lit.metadata or not cand_lit.metadata.title:
                 logger.warning(f"🕵️‍♂️ [Secondary Dedup] Skipping invalid candidate: {cand_lit}")
-                continue
+                return False
             
             logger.info(f"🕵️‍♂️ [Secondary Dedup]  - Comparing with candidate {cand_lit.lid} ('{cand_lit.metadata.title}')")
             # Use a standard, balanced matching mode
@@ -672,22 +663,31 @@ async def _check_and_handle_post_metadata_duplicate(
                 cand_lit.metadata.title, metadata.title, mode=MatchingMode.STANDARD
             )
             logger.info(f"🕵️‍♂️ [Secondary Dedup]  - Title match result: {is_match}")
+            if not is_match:
+                return False
             
-            if is_match:
-                # As an extra precaution, check year difference for non-DOI matches
-                if metadata.year and cand_lit.metadata.year:
-                    try:
-                        year_diff = abs(int(metadata.year) - int(cand_lit.metadata.year))
-                        logger.info(f"🕵️‍♂️ [Secondary Dedup]  - Year difference: {year_diff}")
-                        if year_diff > 2:  # Allow up to 2 years difference
-                            logger.info(f"🕵️‍♂️ [Secondary Dedup]  - Year difference too large, skipping.")
-                            continue  # Likely a different version, not a duplicate
-                    except (ValueError, TypeError):
-                        pass  # Ignore if year is not a valid integer
-                
-                logger.info(f"✅ [Secondary Dedup] Match found: {cand_lit.lid}")
-                existing_lit = cand_lit
-                break  # Found a match
+            # As an extra precaution, check year difference for non-DOI matches
+            if metadata.year and cand_lit.metadata.year:
+                try:
+                    year_diff = abs(int(metadata.year) - int(cand_lit.metadata.year))
+                    logger.info(f"🕵️‍♂️ [Secondary Dedup]  - Year difference: {year_diff}")
+                    if year_diff > 2:  # Allow up to 2 years difference
+                        logger.info(f"🕵️‍♂️ [Secondary Dedup]  - Year difference too large, skipping.")
+                        return False  # Likely a different version, not a duplicate
+                except (ValueError, TypeError):
+                    pass  # Ignore if year is not a valid integer
+            return True
+        
+        # Near-duplicate index candidates confirmed by the check above; the DAO adds
+        # the live title query when no index candidate is confirmed
+        candidates = await dao.find_near_duplicates(
+            metadata.title, metadata.authors, limit=5, exclude_lid=placeholder_lid, confirm=is_duplicate
+        )
+        logger.info(f"🕵️‍♂️ [Secondary Dedup] Found {len(candidates)} confirmed candidates for '{metadata.title}'")
+        
+        if candidates:
+            existing_lit = candidates[0]
+            logger.info(f"✅ [Secondary Dedup] Match found: {existing_lit.lid}")
     
     if not existing_lit:
         logger.info("🕵️‍♂️ [Secondary Dedup] No duplicate found after all checks.")
@@ -913,7 +913,8 @@ async def _process_literature_async(
             
             # 🚨 关键修复：设置元数据组件状态为 success，确保引用解析依赖检查通过
             logger.info(f"🔧 Task {task_id}: 为智能路由设置元数据组件状态为 success")
-            await dao.update_enhanced_component_status(
+            await task_manager.update_component_status(
+                dao,
                 literature_id=literature_id,
                 component="metadata",
                 status="success",
@@ -967,7 +968,8 @@ async def _process_literature_async(
         # Check dependencies before proceeding
         deps_met = await dao.check_component_dependencies(literature_id, "references")
         if not deps_met:
-            await dao.update_enhanced_component_status(
+            await task_manager.update_component_status(
+                dao,
                 literature_id=literature_id,
                 component="references",
                 status="waiting",
@@ -978,7 +980,8 @@ async def _process_literature_async(
             )
             logger.info("References fetch waiting for dependencies")
         else:
-            await dao.update_enhanced_component_status(
+            await task_manager.update_component_status(
+                dao,
                 literature_id=literature_id,
                 component="references",
                 status="processing",
@@ -989,7 +992,8 @@ async def _process_literature_async(
             )
 
             references_fetcher = ReferencesFetcher()
-            references_result = references_fetcher.fetch_references_waterfall(
+            references_result = await asyncio.to_thread(
+                references_fetcher.fetch_references_waterfall,
                 identifiers=identifiers.model_dump(),
                 pdf_content=None, # PDF content is handled later
             )
@@ -1004,7 +1008,8 @@ async def _process_literature_async(
 
             # Check if references fetch was actually successful with improved logic
             if references and len(references) > 0:
-                overall_status = await dao.update_enhanced_component_status(
+                overall_status = await task_manager.update_component_status(
+                    dao,
                     literature_id=literature_id,
                     component="references",
                     status="success",
@@ -1048,7 +1053,8 @@ async def _process_literature_async(
                         "attempted_sources": ["Semantic Scholar", "GROBID"],
                     },
                 }
-                overall_status = await dao.update_enhanced_component_status(
+                overall_status = await task_manager.update_component_status(
+                    dao,
                     literature_id=literature_id,
                     component="references",
                     status="failed",
@@ -1125,9 +1131,10 @@ async def _process_literature_async(
         task_manager.update_task_progress("记录别名映射", 85, literature_id)
         await _record_alias_mappings(literature, source, dao, task_id)
         
-        # 🆕 检查并升级匹配的未解析节点
-        task_manager.update_task_progress("升级未解析节点", 90, literature_id)
-        await _upgrade_matching_unresolved_nodes(literature, dao, task_id)
+        # 🆕 检查并升级匹配的未解析节点（关闭时由 reconcile_unresolved_task 批量处理）
+        if Settings().unresolved_upgrade_inline:
+            task_manager.update_task_progress("升级未解析节点", 90, literature_id)
+            await _upgrade_matching_unresolved_nodes(literature, dao, task_id)
         
         # 🎯 先返回核心任务完成状态，让用户立即看到结果
         task_manager.update_task_progress("核心任务完成", 95, literature_id)
@@ -1208,8 +1215,13 @@ async def _process_literature_async(
 
 
 @celery_app.task(bind=True, name="process_literature_task")
-def process_literature_task(self: Task, source: Dict[str, Any]) -> Dict[str, Any]:
-    """Celery task entry point for literature processing."""
+def process_literature_task(self: Task, source: Dict[str, Any], interactive: bool = False) -> Dict[str, Any]:
+    """
+    Celery task entry point for literature processing.
+
+    ``interactive`` marks tasks a client is synchronously waiting for; their
+    external metadata calls are hedged (see ``services.hedging``).
+    """
     try:
         # 🔍 DEBUG: Check what data Worker receives from API
         logger.info("🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢🟢")
@@ -1225,7 +1237,17 @@ def process_literature_task(self: Task, source: Dict[str, Any]) -> Dict[str, Any
             logger.info(f"📋 [WORKER] ❌ No 'identifiers' field in source data!")
             
         # Important: run the async function and get the dictionary result
-        result_dict = asyncio.run(_process_literature_async(self.request.id, source))
+        with hedged_requests(interactive):
+            if Settings().worker_async_mode:
+                # 在进程共享的事件循环上与其他任务并发执行
+                soft_time_limit = (self.request.timelimit or (None, None))[1]
+                result_dict = get_async_task_runner().run(
+                    self.request.id,
+                    _process_literature_async(self.request.id, source),
+                    soft_time_limit=soft_time_limit,
+                )
+            else:
+                result_dict = asyncio.run(_process_literature_async(self.request.id, source))
         return result_dict
     except Exception as e:
         # 导入自定义异常类型和结果类型
@@ -14,6 +14,8 @@ from ..models.literature import (
     IdentifiersModel,
     MetadataModel,
 )
+from ..services.task_status_projection import get_task_status_projection
+from .async_pool import current_task_id
 
 
 def update_task_status(
@@ -21,23 +23,23 @@ def update_task_status(
     progress: Optional[int] = None,
     details: Optional[str] = None,
 ) -> None:
-    """Update the current task's status with stage information."""
-    if current_task:
-        meta: Dict[str, Any] = {
-            "stage": stage,
-            "timestamp": datetime.now().isoformat(),
-        }
-        if progress is not None:
-            meta["progress"] = progress
-        if details:
-            meta["details"] = details
-
-        current_task.update_state(
-            state="PROGRESS",
-            meta={"stage": stage, "progress": progress, "details": details},
+    """
+    Update the current task's status with stage information.
+
+    Progress only goes to the coalesced task status record; the Celery
+    result backend keeps just the started and final states.
+
+    Celery's ``current_task`` is thread-local, so coroutines running on the
+    shared event loop of the async worker mode are identified through
+    ``async_pool.current_task_id`` instead.
+    """
+    task_id = current_task.request.id if current_task else current_task_id.get()
+    if task_id:
+        get_task_status_projection().update(
+            task_id, state="PROGRESS", stage=stage, progress=progress
         )
         logger.info(
-            f"Task {current_task.request.id}: {stage} - {details or 'In progress'}",
+            f"Task {task_id}: {stage} - {details or 'In progress'}",
         )
 
 
@@ -112,12 +114,14 @@ def extract_authoritative_identifiers(
                     }
                 }
             else:
-                # 对其他域名进行URL验证
-                from ..services.url_mapping.core.service import URLMappingService
-                temp_service = URLMappingService(enable_url_validation=True)
-
-                # 直接使用URL验证功能
-                if not temp_service._validate_url(source["url"]):
+                # 对其他域名进行URL验证（共享验证服务：连接池复用、结论缓存；
+                # 同时携带pdf_url时两者并发验证）
+                from ..services.url_mapping.core.validation import get_url_validation_service
+                verdicts = get_url_validation_service().validate_many(
+                    urls=[source["url"], source.get("pdf_url")]
+                )["urls"]
+
+                if not verdicts[source["url"]]:
                     # URL验证失败，记录详细信息并抛出异常
                     url_validation_info = {
                         "status": "failed",
@@ -139,6 +143,8 @@ def extract_authoritative_identifiers(
                             "validation_time": datetime.now().isoformat(),
                         }
                     }
+                    if source.get("pdf_url") in verdicts:
+                        url_validation_info["validation_details"]["pdf_url_accessible"] = verdicts[source["pdf_url"]]
 
             # 使用新版本的URL映射服务（支持PDF重定向）
             from ..services.url_mapping import get_url_mapping_service
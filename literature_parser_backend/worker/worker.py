@@ -14,7 +14,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from literature_parser_backend.settings import Settings
 from literature_parser_backend.worker.celery_app import celery_app
+from literature_parser_backend.worker.queues import LITERATURE_QUEUES
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +28,19 @@ logging.basicConfig(
 def main() -> None:
     """Entry point for starting the Celery worker."""
     # This is a simple wrapper for the Celery CLI.
+    settings = Settings()
+    if settings.worker_async_mode:
+        # One process, many tasks: pool threads hand their coroutines to a
+        # shared event loop (see worker.async_pool)
+        pool_args = ["--pool=threads", f"--concurrency={settings.worker_async_concurrency}"]
+    else:
+        pool_args = ["--concurrency=1"]  # Single process for literature processing
     celery_app.worker_main(
         [
             "worker",
             "--loglevel=debug",
-            "--concurrency=1",  # Single process for literature processing
-            "--queues=literature",  # Only process literature queue
+            *pool_args,
+            f"--queues={','.join(LITERATURE_QUEUES)}",  # Only process the literature lanes
             "--hostname=literature-worker@%h",
         ],
     )
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+为已有的 Literature / Unresolved 节点回填预计算匹配键
+
+新写入的节点会在创建时自动计算 match_* 属性；本脚本用于处理
+引入匹配键之前创建的旧节点，可重复执行（只处理缺少 match_title 的节点）。
+"""
+
+import asyncio
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.db.neo4j import connect_to_neo4j, create_indexes, disconnect_from_neo4j
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+
+
+async def main():
+    """回填匹配键"""
+    print("🔧 开始回填匹配键...")
+
+    await connect_to_neo4j()
+    try:
+        await create_indexes()
+
+        literature_dao = LiteratureDAO()
+        relationship_dao = RelationshipDAO()
+
+        literature_count = await literature_dao.backfill_match_keys()
+        print(f"📚 Literature 节点已回填: {literature_count}")
+
+        unresolved_count = await relationship_dao.backfill_unresolved_match_keys()
+        print(f"🔗 Unresolved 节点已回填: {unresolved_count}")
+
+        print("✅ 匹配键回填完成")
+    finally:
+        await disconnect_from_neo4j()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
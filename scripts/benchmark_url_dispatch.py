@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+URL分派微基准
+
+对比两种方式为URL选择适配器和路由的耗时：
+- 线性扫描：对每个适配器调用 can_handle、对每条路由做子串匹配（原实现）
+- 分派表：URLMappingService.candidate_adapters + RouteManager.determine_route 的主机名查表
+
+URL语料从给定文件中用正则提取，可以是纯文本URL列表，也可以是 requests.jsonl 之类的任意文本文件。
+
+用法:
+    python scripts/benchmark_url_dispatch.py
+    python scripts/benchmark_url_dispatch.py requests.jsonl tests/fixtures/url_corpus.txt --rounds 2000
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+
+# 添加项目路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from literature_parser_backend.services.url_mapping import URLMappingService
+from literature_parser_backend.worker.execution.routing import RouteManager
+
+URL_PATTERN = re.compile(r"https?://[^\s\"'<>\\]+")
+
+DEFAULT_CORPUS = [
+    os.path.join(PROJECT_ROOT, "requests.jsonl"),
+    os.path.join(PROJECT_ROOT, "tests", "fixtures", "url_corpus.txt"),
+]
+
+
+def load_corpus(paths):
+    """从文件中提取去重后的URL"""
+    urls = []
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"⚠️ 语料文件不存在，跳过: {path}")
+            continue
+        with open(path, encoding="utf-8") as f:
+            urls.extend(url.rstrip(".,;") for url in URL_PATTERN.findall(f.read()))
+    return list(dict.fromkeys(urls))
+
+
+def linear_dispatch(service, route_manager, url):
+    """原实现：两次线性扫描适配器 + 路由子串扫描"""
+    specialized = [a for a in service.adapters if a.name != "generic"]
+    generic = [a for a in service.adapters if a.name == "generic"]
+    adapters = [a for a in specialized + generic if a.can_handle(url)]
+    url_lower = url.lower()
+    for route in sorted(route_manager.routes, key=lambda r: r.priority):
+        if route_manager._matches_route(url_lower, route, None):
+            return adapters, route
+    return adapters, route_manager.routes[-1]
+
+
+def indexed_dispatch(service, route_manager, url):
+    """分派表：一次主机名查表"""
+    specialized, generic = service.candidate_adapters(url)
+    return specialized + generic, route_manager.determine_route(url)
+
+
+def run(func, service, route_manager, urls, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            func(service, route_manager, url)
+    return (time.perf_counter() - start) / (rounds * len(urls))
+
+
+def main(paths, rounds):
+    # determine_route 每次都会记录INFO日志，基准中关闭以免日志开销掩盖分派开销
+    logging.disable(logging.INFO)
+
+    urls = load_corpus(paths)
+    if not urls:
+        print("❌ 语料为空")
+        return
+
+    service = URLMappingService()
+    route_manager = RouteManager()
+
+    mismatches = []
+    for url in urls:
+        old_adapters, old_route = linear_dispatch(service, route_manager, url)
+        new_adapters, new_route = indexed_dispatch(service, route_manager, url)
+        if [a.name for a in old_adapters] != [a.name for a in new_adapters] or old_route is not new_route:
+            mismatches.append((url, old_route.name, new_route.name))
+
+    linear = run(linear_dispatch, service, route_manager, urls, rounds)
+    indexed = run(indexed_dispatch, service, route_manager, urls, rounds)
+
+    print(f"📚 URL语料: {len(urls)} 条, {len(service.adapters)} 个适配器, {len(route_manager.routes)} 条路由, {rounds} 轮")
+    print(f"🐢 线性扫描: {linear * 1e6:.2f} µs/URL")
+    print(f"🚀 分派表:   {indexed * 1e6:.2f} µs/URL ({linear / indexed:.1f}x)")
+    if mismatches:
+        print(f"⚠️ {len(mismatches)} 条URL结果不同（线性扫描按子串匹配，分派表只看主机名）:")
+        for url, old_route, new_route in mismatches:
+            print(f"   {url}: {old_route} → {new_route}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmark URL adapter and route dispatch")
+    parser.add_argument("corpus", nargs="*", default=DEFAULT_CORPUS)
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.corpus, args.rounds)
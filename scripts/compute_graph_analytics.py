@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+手动运行引用图分析任务（PageRank、入度百分位、共被引、文献耦合）
+
+与定时的 compute_graph_analytics_task 相同，结果写回 Literature 节点的 graph_* 属性。
+需要安装 numpy 和 scipy。
+
+用法:
+    python scripts/compute_graph_analytics.py
+"""
+
+import asyncio
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.db.neo4j import connect_to_neo4j, disconnect_from_neo4j
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.worker.graph_analytics import GraphAnalyticsJob
+
+
+async def main():
+    """运行引用图分析"""
+    print("📈 开始计算引用图指标...")
+
+    await connect_to_neo4j()
+    try:
+        stats = await GraphAnalyticsJob(LiteratureDAO(), RelationshipDAO()).run()
+
+        if stats.get("skipped"):
+            print(f"⏭️ 已跳过: {stats.get('error', '已有分析任务在运行')}")
+            return
+
+        print(f"🕸️ 节点数: {stats['nodes']}，边数: {stats['edges']}")
+        print(f"✍️ 已写回: {stats['updated']}，清理过期: {stats['cleared']}")
+        print(f"✅ 完成，用时 {stats['duration_seconds']} 秒")
+    finally:
+        await disconnect_from_neo4j()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
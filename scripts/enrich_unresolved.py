@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+手动运行未解析节点批量补全任务
+
+通过 Semantic Scholar /paper/batch 接口，为带有DOI、arXiv ID或S2 paperId的 :Unresolved
+占位符补全标题/作者/年份并重算匹配键，之后可运行对账任务将其合并到 :Literature。
+
+用法:
+    python scripts/enrich_unresolved.py                  # 补全全部待处理占位符
+    python scripts/enrich_unresolved.py --max-batches 2
+    python scripts/enrich_unresolved.py --reconcile      # 补全后立即运行对账
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.db.neo4j import connect_to_neo4j, create_indexes, disconnect_from_neo4j
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.worker.reconciliation import UnresolvedReconciler
+from literature_parser_backend.worker.reference_enrichment import ReferenceEnricher
+
+
+async def main(max_batches, reconcile):
+    """运行补全"""
+    print("🔧 开始批量补全未解析节点...")
+
+    await connect_to_neo4j()
+    try:
+        await create_indexes()
+
+        relationship_dao = RelationshipDAO()
+        stats = await ReferenceEnricher().enrich_unresolved(relationship_dao, max_batches=max_batches)
+
+        print(f"🔍 已扫描占位符: {stats['scanned']}")
+        print(f"📝 已补全占位符: {stats['enriched']}")
+        print(f"🌐 批量请求次数: {stats['requests']}")
+        print("✅ 补全完成" if stats["completed"] else "⏸️ 已达到批次上限，再次运行可继续")
+
+        if reconcile and stats["enriched"]:
+            result = await UnresolvedReconciler(LiteratureDAO(), relationship_dao).run()
+            if not result.get("skipped"):
+                print(f"🔗 对账合并占位符: {result['merged']}")
+    finally:
+        await disconnect_from_neo4j()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Enrich :Unresolved placeholders via the Semantic Scholar batch API")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--reconcile", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.max_batches, args.reconcile))
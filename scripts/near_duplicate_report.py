@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+MinHash-LSH 近似重复检测的精确率/召回率报告
+
+在带标注的文献对上，对比不同阈值下 LSH 候选生成与现有
+TitleMatchingUtils 标准模式匹配的效果，用于调整 near_duplicate_threshold。
+
+用法:
+    python scripts/near_duplicate_report.py
+    python scripts/near_duplicate_report.py path/to/pairs.json --num-perm 128
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.services.near_duplicates import evaluate_pairs
+from literature_parser_backend.utils.minhash import choose_lsh_params
+from literature_parser_backend.utils.title_matching import MatchingMode, TitleMatchingUtils
+
+DEFAULT_PAIRS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests", "fixtures", "near_duplicate_pairs.json",
+)
+THRESHOLDS = (0.3, 0.4, 0.5, 0.6, 0.7, 0.8)
+
+
+def title_matching_baseline(pairs):
+    """现有标题匹配规则（标准模式）的精确率/召回率"""
+    tp = fp = fn = 0
+    for pair in pairs:
+        predicted = TitleMatchingUtils.is_acceptable_match(
+            pair["a"]["title"], pair["b"]["title"], mode=MatchingMode.STANDARD
+        )
+        if pair["duplicate"]:
+            tp += predicted
+            fn += not predicted
+        else:
+            fp += predicted
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    return precision, recall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precision/recall of MinHash-LSH dedup candidates")
+    parser.add_argument("pairs", nargs="?", default=DEFAULT_PAIRS, help="Labeled pairs JSON file")
+    parser.add_argument("--num-perm", type=int, default=64)
+    args = parser.parse_args()
+
+    with open(args.pairs, encoding="utf-8") as f:
+        pairs = json.load(f)
+
+    duplicates = sum(1 for pair in pairs if pair["duplicate"])
+    print(f"📊 标注对: {len(pairs)} (重复 {duplicates}, 非重复 {len(pairs) - duplicates}), num_perm={args.num_perm}")
+    print()
+    print(f"{'方法':<24}{'bands x rows':<14}{'精确率':>8}{'召回率':>8}")
+    print("-" * 56)
+
+    for threshold in THRESHOLDS:
+        bands, rows = choose_lsh_params(threshold, args.num_perm)
+        report = evaluate_pairs(pairs, threshold, args.num_perm)
+        print(f"{f'LSH @ {threshold}':<24}{f'{bands} x {rows}':<14}{report['precision']:>8.3f}{report['recall']:>8.3f}")
+
+    precision, recall = title_matching_baseline(pairs)
+    print(f"{'TitleMatching STANDARD':<24}{'-':<14}{precision:>8.3f}{recall:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+将所有文献写入当前配置的检索后端（search_backend）
+
+neo4j 后端直接读取节点上的原生检索属性，只需先运行 backfill_match_keys.py；
+切换到 elasticsearch 或重建其索引后，使用本脚本全量导入。
+
+用法:
+    python scripts/rebuild_search_index.py
+    python scripts/rebuild_search_index.py --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.db.neo4j import connect_to_neo4j, create_indexes, disconnect_from_neo4j
+from literature_parser_backend.services.search import get_search_backend
+
+
+async def main(batch_size):
+    """全量重建检索索引"""
+    backend = get_search_backend()
+    print(f"🔎 开始重建检索索引 (后端: {backend.name})...")
+
+    await connect_to_neo4j()
+    try:
+        await create_indexes()
+
+        indexed = await LiteratureDAO().reindex_search(batch_size=batch_size)
+
+        print(f"📚 已写入 {indexed} 篇文献")
+        print("✅ 检索索引重建完成")
+    finally:
+        await backend.close()
+        await disconnect_from_neo4j()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the literature search index")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+重新计算所有节点的引用计数（cites_count / cited_by_count 等）
+
+写入路径会在同一事务中维护计数；此脚本用于初始化旧数据或修复计数偏差。
+
+用法:
+    python scripts/recompute_citation_counters.py
+    python scripts/recompute_citation_counters.py --batch-size 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.db.neo4j import connect_to_neo4j, create_indexes, disconnect_from_neo4j
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+
+
+async def main(batch_size):
+    """重新计算引用计数"""
+    print("🔢 开始重新计算引用计数...")
+
+    await connect_to_neo4j()
+    try:
+        await create_indexes()
+
+        counts = await RelationshipDAO().recompute_citation_counters(batch_size=batch_size)
+
+        print(f"📚 Literature 节点: {counts['literature']}")
+        print(f"❓ Unresolved 节点: {counts['unresolved']}")
+        print("✅ 引用计数已更新")
+    finally:
+        await disconnect_from_neo4j()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute materialized citation counters")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+手动运行 Unresolved → Literature 对账任务
+
+与定时的 reconcile_unresolved_task 使用同一套检查点，中断后再次运行会从上次位置继续。
+
+用法:
+    python scripts/reconcile_unresolved.py            # 继续/开始一轮对账
+    python scripts/reconcile_unresolved.py --reset    # 丢弃检查点，从头开始
+    python scripts/reconcile_unresolved.py --max-batches 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.db.neo4j import connect_to_neo4j, create_indexes, disconnect_from_neo4j
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.worker.reconciliation import UnresolvedReconciler
+
+
+async def main(max_batches, reset):
+    """运行对账"""
+    print("🔧 开始对账未解析节点...")
+
+    await connect_to_neo4j()
+    try:
+        await create_indexes()
+
+        reconciler = UnresolvedReconciler(LiteratureDAO(), RelationshipDAO())
+        stats = await reconciler.run(max_batches=max_batches, reset=reset)
+
+        if stats.get("skipped"):
+            print("⏭️ 已有对账任务在运行")
+            return
+
+        print(f"🔍 已扫描占位符: {stats['scanned']}")
+        print(f"🔗 已合并占位符: {stats['merged']}")
+        print(f"↪️ 已迁移引用关系: {stats['upgraded_relationships']}")
+        print("✅ 本轮对账完成" if stats["completed"] else f"⏸️ 已暂停于 {stats['after_lid']}，再次运行可继续")
+    finally:
+        await disconnect_from_neo4j()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile :Unresolved placeholders with :Literature")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--reset", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.max_batches, args.reset))
@@ -36,7 +36,7 @@ def main():
         "worker",
         "--loglevel=info",
         "--concurrency=1",
-        "--queues=literature",
+        "--queues=literature_interactive,literature,literature_bulk",
         "--hostname=literature-worker@%h",
     ]
 
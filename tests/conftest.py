@@ -0,0 +1,203 @@
+"""
+测试共用的Redis替身
+
+In-memory stand-ins for the synchronous Redis client, shared by the unit
+tests instead of each test module carrying its own copy. Only the commands
+the services actually use are implemented; values are stored as the
+decoded strings the shared client returns.
+"""
+
+import fnmatch
+import queue
+
+import pytest
+
+from literature_parser_backend.worker.job_lock import RELEASE_LOCK_SCRIPT, RENEW_LOCK_SCRIPT
+
+
+class FakePubSub:
+    """Pattern subscription fed by ``FakeRedis.publish``."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.patterns = []
+        self.messages = queue.Queue()
+
+    def psubscribe(self, pattern):
+        self.patterns.append(pattern)
+        self.redis.subscribers.append(self)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        if self in self.redis.subscribers:
+            self.redis.subscribers.remove(self)
+
+
+class FakePipeline:
+    """Buffers commands and runs them on ``execute``, like a non-transactional pipeline."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+
+        def queue_command(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue_command
+
+    def execute(self):
+        self.redis.executes += 1
+        commands, self.commands = self.commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+def renew_lock(redis, keys, args):
+    """Python equivalent of ``job_lock.RENEW_LOCK_SCRIPT``."""
+    if redis.get(keys[0]) != args[0]:
+        return 0
+    return redis.expire(keys[0], args[1])
+
+
+def release_lock(redis, keys, args):
+    """Python equivalent of ``job_lock.RELEASE_LOCK_SCRIPT``."""
+    if redis.get(keys[0]) != args[0]:
+        return 0
+    return redis.delete(keys[0])
+
+
+class FakeRedis:
+    """
+    In-memory Redis.
+
+    ``data`` holds strings, ``hashes`` and ``lists`` the other types, and
+    ``ttls`` the last expiry set per key. Lua scripts are not interpreted:
+    ``eval`` runs the Python equivalent registered in ``scripts`` (the job
+    lock scripts are registered from the start).
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+        self.lists = {}
+        self.ttls = {}
+        self.published = []
+        self.subscribers = []
+        self.scripts = {RENEW_LOCK_SCRIPT: renew_lock, RELEASE_LOCK_SCRIPT: release_lock}
+        self.executes = 0
+
+    # Strings
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    # Keys
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            for store in (self.data, self.hashes, self.lists):
+                if store.pop(key, None) is not None:
+                    removed += 1
+            self.ttls.pop(key, None)
+        return removed
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return True
+
+    # Hashes
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = dict(mapping or {})
+        if field is not None:
+            fields[field] = value
+        self.hashes.setdefault(key, {}).update(fields)
+        return len(fields)
+
+    def hsetnx(self, key, field, value):
+        record = self.hashes.setdefault(key, {})
+        if field in record:
+            return 0
+        record[field] = value
+        return 1
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    # Lists
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def fill(self, key, count):
+        """Test helper: make a list (e.g. a Celery queue) ``count`` items long."""
+        self.lists[key] = ["message"] * count
+
+    # Pub/sub
+    def publish(self, channel, payload):
+        self.published.append((channel, payload))
+        receivers = 0
+        for pubsub in list(self.subscribers):
+            for pattern in pubsub.patterns:
+                if fnmatch.fnmatchcase(channel, pattern):
+                    pubsub.messages.put({"type": "pmessage", "pattern": pattern, "channel": channel, "data": payload})
+                    receivers += 1
+                    break
+        return receivers
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    # Pipelines and scripts
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def eval(self, script, numkeys, *args):
+        return self.scripts[script](self, list(args[:numkeys]), list(args[numkeys:]))
+
+
+class BrokenRedis:
+    """A Redis client whose every command fails as if the server were down."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        return fail
+
+
+@pytest.fixture
+def fake_redis():
+    """A fresh in-memory Redis."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def fake_redis_factory():
+    """Create further independent in-memory Redis instances."""
+    return FakeRedis
+
+
+@pytest.fixture
+def broken_redis():
+    """A Redis client that is down."""
+    return BrokenRedis()
@@ -0,0 +1,141 @@
+"""
+测试任务入口的准入控制
+
+This module tests wait estimation from queue depth and worker throughput,
+and the 429/503 rejections with Retry-After under overload.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from literature_parser_backend.models.task import TaskPriority
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker.admission import (
+    KOMBU_PRIORITY_SEP,
+    AdmissionController,
+    AdmissionRejected,
+)
+from literature_parser_backend.worker import signals
+from literature_parser_backend.worker.celery_app import celery_app
+from literature_parser_backend.worker.queues import BULK_QUEUE, INTERACTIVE_QUEUE, NORMAL_QUEUE
+
+
+def make_controller(redis, **overrides):
+    settings = Settings(**{"admission_snapshot_ttl": 0.0, **overrides})
+    return AdmissionController(redis_client=redis, settings=settings)
+
+
+def record_completions(controller, per_second, window=300):
+    """Spread completions evenly over the throughput window."""
+    now = time.time()
+    total = int(per_second * window)
+    for index in range(total):
+        controller.record_completion(now - window + (index + 0.5) * window / total)
+
+
+class TestAdmissionController:
+    """Test suite for AdmissionController."""
+
+    def test_estimated_wait_uses_weighted_share(self, fake_redis):
+        """Test that the wait reflects the lane's share of worker throughput."""
+        redis = fake_redis
+        controller = make_controller(redis)
+        record_completions(controller, per_second=1.0)
+        redis.fill(NORMAL_QUEUE, 30)
+        redis.fill(f"{NORMAL_QUEUE}{KOMBU_PRIORITY_SEP}3", 6)
+        redis.fill(BULK_QUEUE, 100)
+
+        normal = controller.admit(TaskPriority.NORMAL)
+        interactive = controller.admit(TaskPriority.INTERACTIVE)
+
+        assert normal.queue_depth == 36
+        assert normal.throughput == pytest.approx(1.0, rel=0.25)
+        # normal competes with bulk only: share 3/4
+        assert normal.estimated_wait == pytest.approx(36 / (normal.throughput * 0.75))
+        assert interactive.estimated_wait == 0.0
+        assert controller.stats["admitted"] == 2
+
+    def test_full_lane_rejected_with_429(self, fake_redis):
+        """Test the per-lane depth cap and the Retry-After until it drains."""
+        redis = fake_redis
+        controller = make_controller(redis, admission_max_interactive_depth=10)
+        record_completions(controller, per_second=1.0)
+        redis.fill(INTERACTIVE_QUEUE, 15)
+
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.admit(TaskPriority.INTERACTIVE)
+
+        rejection = excinfo.value
+        assert rejection.status_code == 429
+        # 6 tasks over the cap drain at the full throughput (no other lane is busy)
+        assert rejection.headers == {"Retry-After": str(rejection.retry_after)}
+        assert 5 <= rejection.retry_after <= 9
+        assert rejection.detail["estimated_wait_s"] == pytest.approx(15, rel=0.25)
+        assert controller.admit(TaskPriority.NORMAL).estimated_wait == 0.0
+
+    def test_overload_rejected_with_503(self, fake_redis, fake_redis_factory):
+        """Test rejections for an over-long wait and for stalled workers."""
+        redis = fake_redis
+        controller = make_controller(redis, admission_max_wait=1800, celery_result_expires=600)
+        assert controller.max_wait == 300
+
+        record_completions(controller, per_second=0.1)
+        redis.fill(NORMAL_QUEUE, 60)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.admit(TaskPriority.NORMAL)
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.retry_after == 300
+
+        stalled = make_controller(fake_redis_factory(), admission_stalled_depth=5)
+        stalled.redis.fill(BULK_QUEUE, 4)
+        assert stalled.admit(TaskPriority.BULK).estimated_wait is None
+        stalled.redis.fill(BULK_QUEUE, 5)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            stalled.admit(TaskPriority.BULK)
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.retry_after == Settings().admission_default_retry_after
+
+    def test_snapshot_counts_admitted_burst(self, fake_redis):
+        """Test that a burst within one snapshot cannot overshoot the cap."""
+        redis = fake_redis
+        controller = make_controller(redis, admission_snapshot_ttl=60.0, admission_max_normal_depth=3)
+
+        for _ in range(3):
+            controller.admit(TaskPriority.NORMAL)
+        with pytest.raises(AdmissionRejected):
+            controller.admit(TaskPriority.NORMAL)
+        assert redis.executes == 1
+
+    def test_fails_open(self, fake_redis, broken_redis):
+        """Test that admission never blocks intake when Redis is down or it is disabled."""
+        decision = make_controller(broken_redis).admit(TaskPriority.INTERACTIVE)
+        assert decision.estimated_wait is None
+
+        fake_redis.fill(NORMAL_QUEUE, 10_000)
+        assert make_controller(fake_redis, admission_control_enabled=False).admit().queue_depth == 0
+        make_controller(broken_redis).record_completion()
+
+    def test_completions_counted_for_every_lane_task(self, monkeypatch, fake_redis):
+        """Test that maintenance tasks in the bulk lane count towards throughput, like they count in depth."""
+        controller = make_controller(fake_redis)
+        finals = []
+        monkeypatch.setattr(signals, "get_admission_controller", lambda: controller)
+        monkeypatch.setattr(
+            signals, "get_task_status_projection",
+            lambda: SimpleNamespace(record_final=lambda task_id, state, retval: finals.append(task_id)),
+        )
+
+        def finish(name, routing_key=None):
+            request = SimpleNamespace(delivery_info={"routing_key": routing_key} if routing_key else {})
+            task = SimpleNamespace(name=name, request=request, app=celery_app)
+            signals.record_task_finished(task_id=f"{name}-id", task=task, state="SUCCESS")
+
+        finish("process_literature_task", INTERACTIVE_QUEUE)
+        finish("reconcile_unresolved_task", BULK_QUEUE)
+        finish("compute_graph_analytics_task")  # routed to the bulk lane by task_routes
+        finish("unrelated_task", "celery")
+
+        assert sum(int(value) for value in fake_redis.data.values()) == 3
+        assert finals == ["process_literature_task-id"]
@@ -0,0 +1,133 @@
+"""
+测试arXiv批量 id_list 查询
+
+This module tests that many arXiv ids are fetched with one streamed Atom
+query and that reference enrichment falls back to arXiv for ids Semantic
+Scholar does not know.
+"""
+
+import asyncio
+import io
+
+from literature_parser_backend.services.arxiv_api import ArXivAPIClient
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker.reference_enrichment import ReferenceEnricher
+
+
+def _entry(arxiv_id, title):
+    return f"""
+  <entry>
+    <id>http://arxiv.org/abs/{arxiv_id}v2</id>
+    <published>2017-06-12T17:57:34Z</published>
+    <title>{title}</title>
+    <summary>An abstract.</summary>
+    <author><name>Ashish Vaswani</name></author>
+    <author><name>Noam Shazeer</name></author>
+    <arxiv:doi>10.1/{arxiv_id}</arxiv:doi>
+    <category term="cs.CL"/>
+  </entry>"""
+
+
+def _feed(*entries):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        + "".join(entries)
+        + "</feed>"
+    ).encode()
+
+
+class FakeStreamResponse:
+    def __init__(self, body):
+        self.status_code = 200
+        self.raw = io.BytesIO(body)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeArXivRequestManager:
+    """Serves an Atom feed for the requested id_list from a catalogue."""
+
+    def __init__(self, catalogue):
+        self.catalogue = catalogue
+        self.calls = []
+        self.responses = []
+
+    def get(self, url, request_type, params=None, timeout=None, stream=False):
+        ids = params["id_list"].split(",")
+        self.calls.append(ids)
+        entries = [_entry(i, self.catalogue[i]) for i in ids if i in self.catalogue]
+        response = FakeStreamResponse(_feed(*entries))
+        self.responses.append(response)
+        return response
+
+
+def _client(manager):
+    client = ArXivAPIClient(Settings())
+    client.request_manager = manager
+    return client
+
+
+class TestArXivBatch:
+    """Test suite for batched arXiv metadata queries."""
+
+    def test_many_ids_one_query(self):
+        """Test that ids share one id_list query and map back to the input form."""
+        manager = FakeArXivRequestManager({
+            "1706.03762": "Attention Is All You\n  Need",
+            "1810.04805": "BERT",
+        })
+
+        papers = _client(manager).get_metadata_batch(["arXiv:1706.03762v5", "1810.04805", "9999.99999"])
+
+        assert manager.calls == [["1706.03762", "1810.04805", "9999.99999"]]
+        assert set(papers) == {"arXiv:1706.03762v5", "1810.04805"}
+        assert papers["arXiv:1706.03762v5"]["title"] == "Attention Is All You Need"
+        assert papers["1810.04805"]["authors"] == ["Ashish Vaswani", "Noam Shazeer"]
+        assert all(response.closed for response in manager.responses)
+
+    def test_chunks_and_single_lookup(self, monkeypatch):
+        """Test chunking by ID_LIST_BATCH_SIZE and get_metadata on the same path."""
+        monkeypatch.setattr(ArXivAPIClient, "ID_LIST_BATCH_SIZE", 2)
+        manager = FakeArXivRequestManager({"2001.00001": "A", "2001.00002": "B", "2001.00003": "C"})
+        client = _client(manager)
+
+        assert len(client.get_metadata_batch(["2001.00001", "2001.00002", "2001.00003"])) == 3
+        assert client.get_metadata("2001.00002")["year"] == 2017
+        assert manager.calls == [["2001.00001", "2001.00002"], ["2001.00003"], ["2001.00002"]]
+
+    def test_enrichment_falls_back_to_arxiv(self):
+        """Test that arXiv ids Semantic Scholar misses are batched to arXiv."""
+
+        class EmptyS2:
+            def get_papers_batch(self, identifiers):
+                return {}
+
+        class FakeRelationshipDAO:
+            def __init__(self):
+                self.nodes = [
+                    {"lid": "unresolved-1", "doi": None, "arxiv_id": "1706.03762", "s2_paper_id": None,
+                     "parsed_data": {}},
+                    {"lid": "unresolved-2", "doi": "10.48550/arxiv.1810.04805", "arxiv_id": None,
+                     "s2_paper_id": None, "parsed_data": {}},
+                ]
+                self.updates = []
+
+            async def find_enrichable_unresolved(self, after_lid="", batch_size=500):
+                return [node for node in self.nodes if node["lid"] > after_lid]
+
+            async def apply_unresolved_enrichment(self, updates):
+                self.updates.extend(updates)
+                return sum(1 for u in updates if u["parsed_data"])
+
+        manager = FakeArXivRequestManager({"1706.03762": "Attention", "1810.04805": "BERT"})
+        dao = FakeRelationshipDAO()
+
+        enricher = ReferenceEnricher(EmptyS2(), arxiv_client=_client(manager))
+        stats = asyncio.run(enricher.enrich_unresolved(dao))
+
+        assert stats["enriched"] == 2 and stats["requests"] == 2
+        assert manager.calls == [["1706.03762", "1810.04805"]]
+        assert [u["parsed_data"]["title"] for u in dao.updates] == ["Attention", "BERT"]
@@ -0,0 +1,126 @@
+"""
+测试异步worker模式的共享事件循环
+
+This module tests that concurrent tasks run on one event loop, and that soft
+time limits, revokes and the memory budget are enforced by the runner.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded, TaskRevokedError
+from celery.worker import state as worker_state
+
+from literature_parser_backend.worker import async_pool
+from literature_parser_backend.worker.async_pool import AsyncTaskRunner, current_task_id
+from literature_parser_backend.settings import Settings
+
+
+def make_runner(**overrides):
+    runner = AsyncTaskRunner(settings=Settings(**{"worker_async_concurrency": 8, **overrides}))
+    runner.REVOKE_CHECK_INTERVAL = 0.01
+    runner.MEMORY_CHECK_INTERVAL = 0.01
+    return runner
+
+
+async def pipeline(delay, seen):
+    """Stands in for _process_literature_async."""
+    seen.append((current_task_id.get(), threading.get_ident()))
+    await asyncio.sleep(delay)
+    return {"task_id": current_task_id.get()}
+
+
+class TestAsyncTaskRunner:
+    """Test suite for AsyncTaskRunner."""
+
+    def test_tasks_share_one_loop_concurrently(self):
+        """Test that tasks from several pool threads overlap on one loop thread."""
+        runner = make_runner()
+        seen = []
+        try:
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                futures = [pool.submit(runner.run, f"t{i}", pipeline(0.2, seen)) for i in range(5)]
+                results = [future.result() for future in futures]
+            elapsed = time.monotonic() - started
+        finally:
+            runner.close()
+
+        assert results == [{"task_id": f"t{i}"} for i in range(5)]
+        assert elapsed < 0.6
+        assert len({thread for _, thread in seen}) == 1
+        assert runner.stats["started"] == runner.stats["succeeded"] == 5
+        assert runner.running == 0
+
+    def test_soft_time_limit_cancels_coroutine(self):
+        """Test that an overrunning task is cancelled and fails with SoftTimeLimitExceeded."""
+        runner = make_runner()
+        cleaned_up = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            finally:
+                cleaned_up.append(True)
+
+        try:
+            with pytest.raises(SoftTimeLimitExceeded):
+                runner.run("slow", slow(), soft_time_limit=0.05)
+            assert runner.run("fast", pipeline(0, []), soft_time_limit=0.5) == {"task_id": "fast"}
+        finally:
+            runner.close()
+
+        assert cleaned_up == [True]
+        assert runner.stats["timed_out"] == 1
+
+    def test_revoked_task_is_cancelled(self):
+        """Test that revoking one task cancels only that task."""
+        runner = make_runner()
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                revoked = pool.submit(runner.run, "revoked", asyncio.sleep(5), 10)
+                kept = pool.submit(runner.run, "kept", pipeline(0.2, []), 10)
+                while runner.running < 2:
+                    time.sleep(0.005)
+                worker_state.revoked.add("revoked")
+                with pytest.raises(TaskRevokedError):
+                    revoked.result(timeout=2)
+                assert kept.result(timeout=2) == {"task_id": "kept"}
+        finally:
+            worker_state.revoked.discard("revoked")
+            runner.close()
+
+        assert runner.stats["revoked"] == 1
+
+    def test_errors_propagate_and_memory_budget_holds_tasks(self, monkeypatch):
+        """Test exception propagation and that new tasks wait while over the memory budget."""
+        runner = make_runner(worker_async_max_memory_mb=100)
+        rss = {"value": 50.0}
+        monkeypatch.setattr(async_pool, "current_rss_mb", lambda: rss["value"])
+
+        async def boom():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                runner.run("boom", boom())
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(runner.run, "first", pipeline(0.3, []), 10)
+                while runner.running < 1:
+                    time.sleep(0.005)
+                rss["value"] = 150.0
+                held = pool.submit(runner.run, "held", pipeline(0, []), 10)
+                time.sleep(0.1)
+                assert not held.done() and runner.running == 1
+                rss["value"] = 80.0
+                assert held.result(timeout=2) == {"task_id": "held"}
+                first.result(timeout=2)
+        finally:
+            runner.close()
+
+        assert runner.stats["failed"] == 1
+        assert runner.stats["peak_rss_mb"] == 80.0
@@ -0,0 +1,62 @@
+"""
+测试布隆过滤器和已知标识符过滤键
+
+This module tests the Bloom filter used to skip lookups for unknown identifiers.
+"""
+
+from literature_parser_backend.services.known_identifiers import (
+    alias_filter_key,
+    literature_filter_keys,
+)
+from literature_parser_backend.utils.bloom_filter import BloomFilter
+from literature_parser_backend.utils.match_keys import build_match_keys
+
+
+class TestBloomFilter:
+    """Test suite for the Bloom filter."""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as present."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"doi:10.1000/{i}" for i in range(1000)]
+        bloom.update(items)
+
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+
+    def test_false_positive_rate_near_target(self):
+        """Test that the observed false-positive rate stays near the target."""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        bloom.update(f"known:{i}" for i in range(5000))
+
+        false_positives = sum(f"unknown:{i}" in bloom for i in range(20000))
+
+        assert false_positives / 20000 < 0.03
+
+    def test_memory_budget_caps_size(self):
+        """Test that the bit array never exceeds the memory budget."""
+        bloom = BloomFilter(capacity=10_000_000, error_rate=0.001, max_bytes=1024)
+
+        assert bloom.size_bytes <= 1024
+        assert bloom.hash_count >= 1
+
+
+class TestKnownIdentifierKeys:
+    """Test suite for filter key construction."""
+
+    def test_literature_filter_keys(self):
+        """Test that identifiers, title and title tokens are all indexed."""
+        keys = literature_filter_keys(build_match_keys(
+            title="Attention Is All You Need",
+            doi="10.48550/arXiv.1706.03762",
+            arxiv_id="1706.03762v5",
+        ))
+
+        assert "doi:10.48550/arxiv.1706.03762" in keys
+        assert "arxiv:1706.03762" in keys
+        assert "title:attention is all you need" in keys
+        assert "tok:attention" in keys
+
+    def test_alias_filter_key(self):
+        """Test alias key format."""
+        assert alias_filter_key("url", "https://example.org/a") == "alias:url:https://example.org/a"
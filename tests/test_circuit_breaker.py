@@ -0,0 +1,177 @@
+"""
+测试上游熔断器与自适应超时
+
+This module tests breaker state transitions, percentile-based timeouts,
+their integration in ExternalRequestManager and processor skipping in
+SmartRouter.
+"""
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from literature_parser_backend.services import circuit_breaker as circuit_breaker_module
+from literature_parser_backend.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitOpenError,
+    UpstreamHealth,
+)
+from literature_parser_backend.services.request_manager import ExternalRequestManager, RequestType
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker.execution import smart_router as smart_router_module
+from literature_parser_backend.worker.execution.smart_router import SmartRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FailingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        raise RequestsConnectionError("connection refused")
+
+
+class NoopLimiter:
+    def limit_for_url(self, url):
+        return None
+
+
+class FakeProcessor:
+    def __init__(self, name):
+        self.name = name
+
+    def can_handle(self, identifier_data):
+        return True
+
+
+class FakeIdentifierData:
+    title = doi = arxiv_id = url = None
+    authors = []
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module, "time", fake)
+    return fake
+
+
+def _health(**overrides):
+    settings = dict(circuit_breaker_failure_threshold=3, circuit_breaker_reset_timeout=30.0)
+    settings.update(overrides)
+    return UpstreamHealth(Settings(**settings))
+
+
+class TestCircuitBreaker:
+    """Test suite for breaker transitions."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that the threshold opens the circuit and a success resets the count."""
+        health = _health()
+        health.record_failure("crossref")
+        health.record_failure("crossref")
+        health.record_success("crossref", 0.2)
+        health.record_failure("crossref")
+        health.record_failure("crossref")
+        assert health.breaker("crossref").state == CLOSED
+
+        health.record_failure("crossref")
+        assert health.breaker("crossref").state == OPEN
+        with pytest.raises(CircuitOpenError):
+            health.before_call("crossref")
+
+    def test_half_open_allows_single_probe(self, clock):
+        """Test that one probe is let through after the reset timeout."""
+        health = _health()
+        for _ in range(3):
+            health.record_failure("arxiv")
+
+        clock.now += 30
+        assert health.is_available("arxiv")
+        health.before_call("arxiv")
+        assert health.breaker("arxiv").state == HALF_OPEN
+        assert not health.is_available("arxiv")
+        with pytest.raises(CircuitOpenError):
+            health.before_call("arxiv")
+
+        health.record_failure("arxiv")
+        assert health.breaker("arxiv").state == OPEN
+
+        clock.now += 30
+        health.before_call("arxiv")
+        health.record_success("arxiv", 0.1)
+        assert health.breaker("arxiv").state == CLOSED
+
+    def test_adaptive_timeout(self):
+        """Test percentile × multiplier clamped to [min, requested]."""
+        health = _health(adaptive_timeout_min_samples=10, adaptive_timeout_min=1.0)
+        assert health.timeout_for("crossref", 40) == 40
+
+        for i in range(100):
+            health.record_success("crossref", 0.5 if i < 98 else 2.0)
+        assert health.timeout_for("crossref", 40) == pytest.approx(4.0)
+
+        for _ in range(100):
+            health.record_success("crossref", 0.1)
+        assert health.timeout_for("crossref", 40) == 1.0
+
+    def test_timeouts_raise_the_window(self):
+        """Test that timed-out calls count as latency samples."""
+        health = _health(adaptive_timeout_min_samples=5, adaptive_timeout_min=1.0)
+        for _ in range(5):
+            health.record_success("crossref", 0.5)
+        for _ in range(5):
+            health.record_failure("crossref", timed_out_after=1.0)
+
+        assert health.timeout_for("crossref", 40) == pytest.approx(2.0)
+
+
+class TestIntegration:
+    """Test suite for request manager and router integration."""
+
+    def test_open_circuit_skips_the_network(self):
+        """Test that calls fail fast once the breaker is open."""
+        manager = ExternalRequestManager(Settings())
+        manager.rate_limiter = NoopLimiter()
+        manager.upstream_health = _health()
+        manager.external_session = FailingSession()
+
+        for _ in range(3):
+            with pytest.raises(RequestsConnectionError):
+                manager.get("https://api.semanticscholar.org/graph/v1/paper/x", RequestType.EXTERNAL)
+        with pytest.raises(CircuitOpenError):
+            manager.get("https://api.semanticscholar.org/graph/v1/paper/x", RequestType.EXTERNAL)
+
+        assert manager.external_session.calls == 3
+
+    def test_router_skips_processor_with_open_circuit(self, monkeypatch):
+        """Test that SmartRouter moves on to the next processor."""
+        health = _health()
+        for _ in range(3):
+            health.record_failure("semantic_scholar")
+        monkeypatch.setattr(smart_router_module, "get_upstream_health", lambda: health)
+
+        router = SmartRouter.__new__(SmartRouter)
+        processors = [FakeProcessor("Semantic Scholar"), FakeProcessor("CrossRef")]
+
+        chosen = router._get_next_available_processor(processors, set(), FakeIdentifierData())
+
+        assert chosen.name == "CrossRef"
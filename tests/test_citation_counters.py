@@ -0,0 +1,150 @@
+"""
+测试物化引用计数的事务维护
+
+This module checks that CITES writes refresh the counters of the touched
+endpoints inside the same transaction.
+"""
+
+import asyncio
+
+import pytest
+
+from literature_parser_backend.db import relationship_dao as relationship_dao_module
+from literature_parser_backend.db.base_dao import (
+    REFRESH_LITERATURE_COUNTERS,
+    REFRESH_UNRESOLVED_COUNTERS,
+    citation_counter_set,
+)
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+
+
+class FakeResult:
+    def __init__(self, record=None, records=None):
+        self.record = record
+        self.records = records or []
+
+    async def single(self):
+        return self.record
+
+    async def consume(self):
+        return None
+
+    def __aiter__(self):
+        async def gen():
+            for record in self.records:
+                yield record
+        return gen()
+
+
+class FakeTx:
+    """Records every statement with the transaction it ran in."""
+
+    def __init__(self, log, tx_id, responder):
+        self.log = log
+        self.tx_id = tx_id
+        self.responder = responder
+
+    async def run(self, query, **params):
+        self.log.append((self.tx_id, query, params))
+        return self.responder(query, params)
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **params):
+        return await FakeTx(self.driver.log, None, self.driver.responder).run(query, **params)
+
+    async def execute_write(self, work, *args, **kwargs):
+        self.driver.tx_count += 1
+        return await work(FakeTx(self.driver.log, self.driver.tx_count, self.driver.responder), *args, **kwargs)
+
+
+class FakeDriver:
+    def __init__(self, responder):
+        self.log = []
+        self.tx_count = 0
+        self.responder = responder
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+
+class NullGraphCache:
+    def record_edges(self, edges):
+        pass
+
+    def record_detached(self, lids):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _no_graph_cache(monkeypatch):
+    monkeypatch.setattr(relationship_dao_module, "get_citation_graph_cache", NullGraphCache)
+
+
+def _refreshes(log):
+    return [
+        (tx_id, "literature" if query == REFRESH_LITERATURE_COUNTERS else "unresolved", params["lids"])
+        for tx_id, query, params in log
+        if query in (REFRESH_LITERATURE_COUNTERS, REFRESH_UNRESOLVED_COUNTERS)
+    ]
+
+
+class TestCitationCounters:
+    """Test suite for counter maintenance on write."""
+
+    def test_counter_clause_counts_by_label(self):
+        """Test that resolved and unresolved citations are counted separately."""
+        clause = citation_counter_set("n")
+
+        assert "(n)-[:CITES]->(:Literature)" in clause
+        assert "(n)-[:CITES]->(:Unresolved)" in clause
+        assert "n.cited_by_count = COUNT { (n)<-[:CITES]-() }" in clause
+
+    def test_citation_refreshes_both_endpoints_in_same_transaction(self):
+        """Test create_citation_relationship."""
+        driver = FakeDriver(lambda q, p: FakeResult({"created_at": "now", "confidence": 0.9, "source": "x"}))
+        dao = RelationshipDAO(database=driver)
+
+        assert asyncio.run(dao.create_citation_relationship("a", "b")) is True
+
+        merge_tx = driver.log[0][0]
+        assert _refreshes(driver.log) == [(merge_tx, "literature", ["a", "b"])]
+
+    def test_batch_unresolved_refreshes_citing_and_placeholders(self):
+        """Test batch_create_unresolved_citations with an in-batch duplicate title."""
+        driver = FakeDriver(lambda q, p: FakeResult({"created_count": 1, "relationship_count": 1}))
+        dao = RelationshipDAO(database=driver)
+        citations = [
+            {"placeholder_lid": "u1", "reference_data": {"parsed_data": {"title": "Deep Learning"}}},
+            {"placeholder_lid": "u2", "reference_data": {"parsed_data": {"title": "Deep learning."}}},
+            {"placeholder_lid": "u3", "reference_data": {"parsed_data": {"title": "Graph Networks"}}},
+        ]
+
+        asyncio.run(dao.batch_create_unresolved_citations("a", citations))
+
+        assert driver.tx_count == 1
+        refreshes = _refreshes(driver.log)
+        assert refreshes[0] == (1, "literature", ["a"])
+        assert refreshes[1][0] == 1 and sorted(refreshes[1][2]) == ["u1", "u3"]
+
+    def test_delete_refreshes_former_neighbors(self):
+        """Test that neighbors are collected before the delete and refreshed after it."""
+        def responder(query, params):
+            if "literature_lids" in query:
+                return FakeResult({"literature_lids": ["b", "c"], "unresolved_lids": ["u1"]})
+            return FakeResult({"deleted_count": 3})
+
+        driver = FakeDriver(responder)
+        dao = RelationshipDAO(database=driver)
+
+        assert asyncio.run(dao.delete_relationships_for_literature("a")) == 3
+        assert _refreshes(driver.log) == [(1, "literature", ["b", "c", "a"]), (1, "unresolved", ["u1"])]
@@ -0,0 +1,154 @@
+"""
+测试引用图离线分析
+
+This module tests PageRank, percentiles and co-citation / bibliographic
+coupling top-k computed on sparse matrices, and the job's run lock.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+pytest.importorskip("scipy")
+
+from literature_parser_backend.services.graph_analytics import (
+    compute_graph_analytics,
+    iter_node_properties,
+    percentile_ranks,
+)
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker.celery_app import build_beat_schedule
+from literature_parser_backend.worker.graph_analytics import GraphAnalyticsJob
+
+# The worker package re-exports the Celery instance under the module's name
+celery_app_module = sys.modules[build_beat_schedule.__module__]
+
+# p1 and p2 both cite a and b; p3 cites a only. "lonely" has no edges.
+LIDS = ["p1", "p2", "p3", "a", "b", "lonely"]
+EDGES = [
+    ("p1", "a", 0.9, "grobid"),
+    ("p1", "b", 0.9, "grobid"),
+    ("p2", "a", 0.8, "crossref"),
+    ("p2", "b", 0.4, "crossref"),
+    ("p3", "a", None, None),
+]
+
+
+def _by_lid(analytics, key):
+    return dict(zip(analytics["lids"], analytics[key]))
+
+
+class TestGraphAnalytics:
+    """Test suite for the offline graph signals."""
+
+    def test_pagerank_favors_cited_papers(self):
+        """Test that scores form a distribution led by the most-cited paper."""
+        analytics = compute_graph_analytics(LIDS, EDGES)
+        scores = _by_lid(analytics, "pagerank")
+
+        assert abs(sum(scores.values()) - 1.0) < 1e-9
+        assert scores["a"] > scores["b"] > scores["p1"]
+        assert scores["p1"] == pytest.approx(scores["lonely"])
+
+    def test_co_citation_and_coupling(self):
+        """Test AᵀA (cited together) and AAᵀ (shared references) top-k."""
+        analytics = compute_graph_analytics(LIDS, EDGES)
+        co_cited = _by_lid(analytics, "co_cited")
+        coupled = _by_lid(analytics, "coupled")
+
+        assert co_cited["a"] == [("b", 2)]
+        assert coupled["p1"] == [("p2", 2), ("p3", 1)]
+        assert co_cited["lonely"] == [] and coupled["lonely"] == []
+
+    def test_min_confidence_drops_weak_edges(self):
+        """Test that weak and confidence-less edges are excluded when filtering."""
+        analytics = compute_graph_analytics(LIDS, EDGES, min_confidence=0.5)
+
+        assert _by_lid(analytics, "in_degree") == {"p1": 0, "p2": 0, "p3": 0, "a": 2, "b": 1, "lonely": 0}
+
+    def test_percentiles_tie_low(self):
+        """Test that tied values share the lowest percentile."""
+        assert list(percentile_ranks([0, 0, 0, 5])) == [0.0, 0.0, 0.0, 100.0]
+
+    def test_node_properties(self):
+        """Test the flattened Neo4j properties."""
+        analytics = compute_graph_analytics(LIDS, EDGES, top_k=1)
+        rows = {row["lid"]: row["props"] for row in iter_node_properties(analytics, "2026-01-01T00:00:00")}
+
+        assert rows["p1"]["graph_coupled_lids"] == ["p2"]
+        assert rows["p1"]["graph_coupled_counts"] == [2]
+        assert rows["a"]["graph_in_degree"] == 3
+        assert rows["a"]["graph_in_degree_percentile"] == 100.0
+        assert rows["a"]["graph_analytics_at"] == "2026-01-01T00:00:00"
+
+
+class TestGraphAnalyticsSchedule:
+    """Test suite for scheduling the analytics job."""
+
+    def test_scheduled_only_with_numpy_and_scipy(self, monkeypatch):
+        """Test that beat does not schedule a job that could only skip."""
+        settings = Settings(graph_analytics_interval=3600)
+        assert "compute-graph-analytics" in build_beat_schedule(settings)
+
+        monkeypatch.setattr(celery_app_module, "analytics_available", lambda: False)
+        schedule = build_beat_schedule(settings)
+        assert "compute-graph-analytics" not in schedule
+        assert "reconcile-unresolved" in schedule
+
+
+class FakeAnalyticsDAO:
+    """Records written metrics; ``during_export`` runs inside the export."""
+
+    def __init__(self, during_export=None):
+        self.during_export = during_export
+        self.rows = []
+
+    async def export_citation_graph(self):
+        if self.during_export:
+            self.during_export()
+        return LIDS, EDGES
+
+    async def write_graph_metrics(self, rows):
+        self.rows.extend(rows)
+        return len(rows)
+
+    async def clear_stale_graph_metrics(self, computed_at):
+        return 0
+
+
+class TestGraphAnalyticsJob:
+    """Test suite for the analytics job's run lock."""
+
+    def make_job(self, redis, dao):
+        return GraphAnalyticsJob(dao, dao, redis_client=redis, settings=Settings(graph_analytics_phase_budget=60))
+
+    def test_lock_renewed_per_phase_and_released(self, fake_redis):
+        """Test that a run holds a per-run token, renews it between phases and releases it."""
+        ttls = []
+        dao = FakeAnalyticsDAO(during_export=lambda: ttls.append(fake_redis.ttls[GraphAnalyticsJob.LOCK_KEY]))
+
+        stats = asyncio.run(self.make_job(fake_redis, dao).run())
+
+        assert stats["nodes"] == len(LIDS) and len(dao.rows) == len(LIDS)
+        assert ttls == [120]
+        assert GraphAnalyticsJob.LOCK_KEY not in fake_redis.data
+
+    def test_never_releases_another_runs_lock(self, fake_redis):
+        """Test that a concurrent run is skipped and an expired, taken-over lock is left to its new owner."""
+        fake_redis.set(GraphAnalyticsJob.LOCK_KEY, "other-worker")
+        assert asyncio.run(self.make_job(fake_redis, FakeAnalyticsDAO()).run()) == {"skipped": True}
+        assert fake_redis.get(GraphAnalyticsJob.LOCK_KEY) == "other-worker"
+
+        fake_redis.delete(GraphAnalyticsJob.LOCK_KEY)
+        dao = FakeAnalyticsDAO(during_export=lambda: fake_redis.set(GraphAnalyticsJob.LOCK_KEY, "other-worker"))
+        asyncio.run(self.make_job(fake_redis, dao).run())
+
+        assert fake_redis.get(GraphAnalyticsJob.LOCK_KEY) == "other-worker"
+        assert fake_redis.ttls[GraphAnalyticsJob.LOCK_KEY] is None
+
+    def test_runs_unlocked_without_redis(self, broken_redis):
+        """Test that a Redis outage does not stop the job."""
+        dao = FakeAnalyticsDAO()
+        asyncio.run(self.make_job(broken_redis, dao).run())
+        assert len(dao.rows) == len(LIDS)
@@ -0,0 +1,125 @@
+"""
+测试 CSR 引用图缓存
+
+This module tests the CSR graph layout, k-hop neighborhood queries and the
+stream-synced overlay of the citation graph cache.
+"""
+
+import asyncio
+
+from literature_parser_backend.services.graph_cache import CitationGraphCache
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.utils.csr_graph import CSRGraph
+
+EDGES = [
+    ("a", "b", 0.9, "grobid"),
+    ("b", "c", 0.8, "grobid"),
+    ("c", "d", 0.9, "crossref"),
+    ("e", "a", 0.3, "grobid"),
+    ("f", "b", None, None),
+]
+
+
+class FakeStreamRedis:
+    """Minimal Redis stand-in for the sequenced stream."""
+
+    def __init__(self):
+        self.entries = []
+        self.seq = 0
+
+    def eval(self, script, numkeys, stream_key, seq_key, payload, maxlen):
+        self.seq += 1
+        self.entries.append((f"{self.seq}-0", {"seq": str(self.seq), "payload": payload}))
+        return self.seq
+
+    def xrevrange(self, key, count=1):
+        return self.entries[-1:]
+
+    def get(self, key):
+        return str(self.seq)
+
+    def xread(self, streams, count=None):
+        last = int(list(streams.values())[0].split("-")[0])
+        pending = [entry for entry in self.entries if int(entry[0].split("-")[0]) > last][:count]
+        return [("stream", pending)] if pending else []
+
+
+def _cache(edges=EDGES, **overrides):
+    cache = CitationGraphCache(redis_client=FakeStreamRedis(), settings=Settings(**overrides))
+    cache._graph = CSRGraph(edges)
+    cache._ready = True
+    cache._loaded_at = float("inf")
+    return cache
+
+
+def _k_hop(cache, centers, depth, min_confidence=0.5, max_nodes=None):
+    return asyncio.run(cache.k_hop(centers, depth, min_confidence, max_nodes=max_nodes))
+
+
+class TestCSRGraph:
+    """Test suite for the CSR layout."""
+
+    def test_degrees_and_edges(self):
+        """Test that both adjacency directions index the same edges."""
+        graph = CSRGraph(EDGES)
+        b = graph.index_of("b")
+
+        assert graph.node_count == 6
+        assert graph.edge_count == 5
+        assert graph.out_degree(b) == 1
+        assert graph.in_degree(b) == 2
+        assert sorted(graph.iter_edges()) == sorted(EDGES)
+
+    def test_incident_edges_filter_confidence(self):
+        """Test that low-confidence and missing-confidence edges are pruned."""
+        graph = CSRGraph(EDGES)
+        neighbors = {graph.lids[n] for n, _ in graph.incident_edges(graph.index_of("b"), 0.5)}
+
+        assert neighbors == {"a", "c"}
+
+
+class TestCitationGraphCache:
+    """Test suite for k-hop queries and incremental updates."""
+
+    def test_depth_limits_neighborhood(self):
+        """Test that only edges within max_depth hops are returned."""
+        result = _k_hop(_cache(), ["a"], 2)
+
+        assert result["distances"] == {"a": 0, "b": 1, "c": 2}
+        assert sorted(edge[:2] for edge in result["edges"]) == [("a", "b"), ("b", "c")]
+        assert result["truncated"] is False
+
+    def test_confidence_threshold(self):
+        """Test that lowering the threshold follows weaker edges."""
+        result = _k_hop(_cache(), ["a"], 1, min_confidence=0.2)
+
+        assert set(result["distances"]) == {"a", "b", "e"}
+
+    def test_overlay_add_and_detach(self):
+        """Test that recorded changes are applied from the stream before querying."""
+        cache = _cache()
+        cache.record_edges([("d", "x", 0.95, "crossref")])
+        assert "x" in _k_hop(cache, ["c"], 2)["distances"]
+
+        cache.record_detached(["b"])
+        result = _k_hop(cache, ["a"], 3)
+        assert result["distances"] == {"a": 0}
+        assert result["edges"] == []
+
+    def test_max_nodes_truncates(self):
+        """Test that expansion stops at the node budget."""
+        edges = [("hub", f"p{i}", 0.9, "grobid") for i in range(10)]
+        result = _k_hop(_cache(edges), ["hub"], 1, max_nodes=4)
+
+        assert len(result["distances"]) == 4
+        assert result["truncated"] is True
+
+    def test_stream_gap_bypasses_cache(self):
+        """Test that trimmed stream entries make the cache fall back to Cypher."""
+        cache = _cache()
+        cache.record_edges([("d", "x", 0.95, "crossref")])
+        cache.stream.redis.entries.pop(0)
+        cache.record_edges([("x", "y", 0.95, "crossref")])
+
+        assert _k_hop(cache, ["a"], 2) is None
+        assert cache.ready is False
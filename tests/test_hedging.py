@@ -0,0 +1,121 @@
+"""
+测试对冲请求
+
+This module tests when a duplicate request is sent, which answer wins and
+how the hedge budget caps duplicates.
+"""
+
+import threading
+
+from literature_parser_backend.services.circuit_breaker import UpstreamHealth
+from literature_parser_backend.services.hedging import RequestHedger, hedged_requests
+from literature_parser_backend.settings import Settings
+
+
+class DownRedis:
+    def pipeline(self, transaction=False):
+        raise ConnectionError("redis down")
+
+    def hgetall(self, key):
+        raise ConnectionError("redis down")
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ScriptedSender:
+    """First call blocks until released; later calls answer immediately."""
+
+    def __init__(self, first_status=200, hedge_status=200):
+        self.release = threading.Event()
+        self.first_status = first_status
+        self.hedge_status = hedge_status
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            self.release.wait(5)
+            return FakeResponse(self.first_status, "primary")
+        return FakeResponse(self.hedge_status, "hedge")
+
+
+def _hedger(**overrides):
+    settings = dict(adaptive_timeout_min_samples=5, hedging_min_delay=0.01, hedging_budget_burst=1.0)
+    settings.update(overrides)
+    settings = Settings(**settings)
+    health = UpstreamHealth(settings)
+    for _ in range(10):
+        health.record_success("crossref", 0.01)
+    return RequestHedger(health, settings, redis_client=DownRedis())
+
+
+class TestRequestHedger:
+    """Test suite for hedged requests."""
+
+    def test_only_active_contexts_hedge(self):
+        """Test that hedging needs an active context and latency samples."""
+        hedger = _hedger()
+
+        assert hedger.delay_for("crossref") is None
+        with hedged_requests():
+            assert hedger.delay_for("crossref") == 0.01
+            assert hedger.delay_for("arxiv") is None
+
+    def test_hedge_wins_when_primary_is_slow(self):
+        """Test that the faster duplicate is returned and counted."""
+        hedger = _hedger()
+        sender = ScriptedSender()
+
+        response = hedger.call("crossref", 0.01, sender)
+        sender.release.set()
+
+        assert response.body == "hedge"
+        assert hedger.local_stats["crossref"] == {"requests": 1, "hedged": 1, "hedge_wins": 1}
+
+    def test_invalid_hedge_falls_back_to_primary(self):
+        """Test that a 5xx duplicate does not win."""
+        hedger = _hedger()
+        sender = ScriptedSender(hedge_status=503)
+        threading.Timer(0.1, sender.release.set).start()
+
+        response = hedger.call("crossref", 0.01, sender)
+
+        assert response.body == "primary"
+        assert "hedge_wins" not in hedger.local_stats["crossref"]
+
+    def test_budget_caps_hedges(self):
+        """Test that hedges stop once the budget is spent."""
+        hedger = _hedger(hedging_budget_ratio=0.0)
+
+        first = ScriptedSender()
+        threading.Timer(0.1, first.release.set).start()
+        hedger.call("crossref", 0.01, first)
+
+        second = ScriptedSender()
+        threading.Timer(0.1, second.release.set).start()
+        response = hedger.call("crossref", 0.01, second)
+
+        assert response.body == "primary" and second.calls == 1
+        assert hedger.local_stats["crossref"]["budget_denied"] == 1
+
+    def test_rate_limit_blocks_hedge(self):
+        """Test that no duplicate is sent without an immediate rate-limit token."""
+        hedger = _hedger()
+        sender = ScriptedSender()
+        threading.Timer(0.1, sender.release.set).start()
+
+        response = hedger.call("crossref", 0.01, sender, can_send_hedge=lambda: False)
+
+        assert response.body == "primary" and sender.calls == 1
+        assert hedger.local_stats["crossref"]["rate_limited"] == 1
@@ -0,0 +1,103 @@
+"""
+测试内部关系图流式输出
+
+This module tests the streamed JSON serialization of GET/POST /graphs.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.web.api import graphs
+from literature_parser_backend.web.api.graphs import _stream_internal_graph
+
+ROWS = [
+    {"lid": "a", "title": "Paper A", "year": 2017, "cites": [["b", 0.9, "grobid", "2024-01-01T00:00:00"]]},
+    {"lid": "b", "title": "Paper B", "year": 2018, "cites": [["c", 0.8, "crossref", None]]},
+    {"lid": "c", "title": "Paper C", "year": None, "cites": []},
+]
+
+
+class FakeRelationshipDAO:
+    """Yields fixed rows, optionally failing after some of them."""
+
+    def __init__(self, rows, fail_after=None):
+        self.rows = rows
+        self.fail_after = fail_after
+
+    async def iter_internal_citation_graph(self, target_lids):
+        for i, row in enumerate(self.rows):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise RuntimeError("connection lost")
+            yield row
+
+
+def _collect(dao, lids, fmt):
+    async def run():
+        rows = dao.iter_internal_citation_graph(lids)
+        return "".join([chunk async for chunk in _stream_internal_graph(rows, lids, fmt)])
+    return json.loads(asyncio.run(run()))
+
+
+def _respond(monkeypatch, dao, lids, fmt="full"):
+    """Run the endpoint helper and read the whole streamed body."""
+    monkeypatch.setattr(RelationshipDAO, "create_from_global_connection", classmethod(lambda cls: dao))
+
+    async def run():
+        response = await graphs._internal_graph_response(lids, fmt)
+        return "".join([chunk async for chunk in response.body_iterator])
+    return json.loads(asyncio.run(run()))
+
+
+class TestInternalGraphStream:
+    """Test suite for the streamed graph document."""
+
+    def test_full_format(self):
+        """Test that edges, nodes with in-set degrees and metadata are emitted."""
+        data = _collect(FakeRelationshipDAO(ROWS), ["a", "b", "c", "x"], "full")
+
+        assert [(e["from_lid"], e["to_lid"]) for e in data["edges"]] == [("a", "b"), ("b", "c")]
+        nodes = {n["lid"]: n for n in data["nodes"]}
+        assert nodes["b"]["in_degree"] == 1 and nodes["b"]["out_degree"] == 1
+        assert set(nodes["a"]) == {"lid", "title", "authors", "year", "journal", "in_degree", "out_degree"}
+        assert data["target_lids"] == ["a", "b", "c", "x"]
+        assert data["relationship_type"] == "internal_only"
+        assert data["metadata"]["requested_lids"] == ["a", "b", "c", "x"]
+        assert data["metadata"]["total_edges"] == 2
+        assert data["metadata"]["missing_lids"] == ["x"]
+        assert data["metadata"]["status"] == "success"
+
+    def test_edgelist_format(self):
+        """Test the compact array format."""
+        data = _collect(FakeRelationshipDAO(ROWS), ["a", "b", "c"], "edgelist")
+
+        assert data["edges"] == [["a", "b", 0.9], ["b", "c", 0.8]]
+        assert data["nodes"][0] == ["a", "Paper A", 2017]
+        assert data["metadata"]["edge_fields"] == ["from_lid", "to_lid", "confidence"]
+
+    def test_error_still_closes_document(self):
+        """Test that a failing query yields valid JSON flagged as an error."""
+        data = _collect(FakeRelationshipDAO(ROWS, fail_after=1), ["a", "b", "c"], "full")
+
+        assert len(data["edges"]) == 1
+        assert data["metadata"]["status"] == "error"
+
+    def test_endpoint_streams_after_first_row(self, monkeypatch):
+        """Test that the row fetched before responding is part of the document."""
+        data = _respond(monkeypatch, FakeRelationshipDAO(ROWS), ["a", "b", "c"])
+
+        assert [n["lid"] for n in data["nodes"]] == ["a", "b", "c"]
+        assert len(data["edges"]) == 2
+
+        empty = _respond(monkeypatch, FakeRelationshipDAO([]), ["x"])
+        assert empty["nodes"] == [] and empty["metadata"]["missing_lids"] == ["x"]
+
+    def test_query_failure_is_500(self, monkeypatch):
+        """Test that a query failing before the first row is an HTTP 500, not a 200 document."""
+        with pytest.raises(HTTPException) as excinfo:
+            _respond(monkeypatch, FakeRelationshipDAO(ROWS, fail_after=0), ["a", "b", "c"])
+
+        assert excinfo.value.status_code == 500
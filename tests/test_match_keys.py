@@ -0,0 +1,141 @@
+"""
+测试预计算匹配键 (match keys) 及匹配策略对其的使用
+
+This module tests match key computation and the matcher fast paths that consume them.
+"""
+
+import asyncio
+
+from literature_parser_backend.models.literature import (
+    AuthorModel,
+    IdentifiersModel,
+    LiteratureModel,
+    MetadataModel,
+)
+from literature_parser_backend.services.literature_matcher import FuzzyMatcher, MatchType
+from literature_parser_backend.utils.match_keys import (
+    build_match_keys,
+    has_match_keys,
+    match_keys_for_literature,
+    match_keys_for_reference,
+    normalize_arxiv_id,
+    normalize_doi,
+)
+
+
+class TestMatchKeys:
+    """Test suite for match key computation."""
+
+    def test_build_match_keys(self):
+        """Test that all keys are normalized consistently."""
+        keys = build_match_keys(
+            title="Attention Is All You Need!",
+            authors=[{"name": "Ashish Vaswani"}, "Shazeer, Noam"],
+            doi="https://doi.org/10.48550/ARXIV.1706.03762",
+            year="2017",
+            arxiv_id="arXiv:1706.03762v5",
+        )
+
+        assert keys["match_title"] == "attention is all you need"
+        assert keys["match_title_tokens"] == ["all", "attention", "need", "you"]
+        assert keys["match_author_signatures"] == ["shazeer_n", "vaswani_a"]
+        assert keys["match_doi"] == "10.48550/arxiv.1706.03762"
+        assert keys["match_arxiv_id"] == "1706.03762"
+        assert keys["match_year"] == 2017
+
+    def test_empty_input(self):
+        """Test that missing fields produce empty, Neo4j-safe values."""
+        keys = build_match_keys()
+
+        assert keys["match_title"] == ""
+        assert keys["match_title_tokens"] == []
+        assert keys["match_author_signatures"] == []
+        assert keys["match_doi"] == ""
+        assert keys["match_year"] is None
+
+    def test_identifier_normalization(self):
+        """Test DOI and ArXiv ID prefix handling."""
+        assert normalize_doi("doi:10.1000/ABC") == "10.1000/abc"
+        assert normalize_doi(None) == ""
+        assert normalize_arxiv_id("https://arxiv.org/abs/2301.00001v2") == "2301.00001"
+
+    def test_literature_and_reference_keys_agree(self):
+        """Test that a literature and a reference to it share the same keys."""
+        literature = LiteratureModel(
+            lid="2017-vaswani-aayn-a1b2",
+            identifiers=IdentifiersModel(doi="10.1000/XYZ"),
+            metadata=MetadataModel(
+                title="Attention Is All You Need",
+                authors=[AuthorModel(name="Ashish Vaswani")],
+                year=2017,
+            ),
+        )
+        reference = {
+            "title": "Attention is all you need.",
+            "authors": [{"name": "A. Vaswani"}],
+            "doi": "10.1000/xyz",
+            "year": 2017,
+        }
+
+        lit_keys = match_keys_for_literature(literature)
+        ref_keys = match_keys_for_reference(reference)
+
+        assert has_match_keys(lit_keys)
+        assert lit_keys["match_title"] == ref_keys["match_title"]
+        assert lit_keys["match_doi"] == ref_keys["match_doi"]
+        assert lit_keys["match_author_signatures"] == ref_keys["match_author_signatures"]
+
+
+class _CandidateDAO:
+    """Minimal DAO returning precomputed match-key candidates."""
+
+    def __init__(self, candidates):
+        self.candidates = candidates
+        self.calls = []
+
+    async def get_match_candidates(self, doi="", arxiv_id="", title_tokens=None, limit=200):
+        self.calls.append({"doi": doi, "arxiv_id": arxiv_id, "title_tokens": title_tokens})
+        return self.candidates
+
+
+class TestFuzzyMatcherWithMatchKeys:
+    """Test suite for FuzzyMatcher consuming stored match keys."""
+
+    def setup_method(self):
+        """Set up a candidate that only carries stored match keys."""
+        candidate = build_match_keys(
+            title="Attention Is All You Need",
+            authors=["Ashish Vaswani", "Noam Shazeer"],
+            year=2017,
+        )
+        candidate["lid"] = "2017-vaswani-aayn-a1b2"
+        self.dao = _CandidateDAO([candidate])
+        self.matcher = FuzzyMatcher(dao=self.dao)
+
+    def test_citation_match_uses_keys(self):
+        """Test that a reference resolves against key-only candidates."""
+        matches = asyncio.run(self.matcher.find_matches(
+            source={
+                "title": "Attention is all you need",
+                "authors": ["Vaswani, Ashish", "Shazeer, Noam"],
+                "year": 2017,
+            },
+            match_type=MatchType.CITATION,
+            threshold=0.6,
+        ))
+
+        assert len(matches) == 1
+        assert matches[0].lid == "2017-vaswani-aayn-a1b2"
+        assert matches[0].match_details["title"]["similarity"] == 1.0
+        assert matches[0].match_details["authors"]["similarity"] == 1.0
+        assert self.dao.calls[0]["title_tokens"] == ["all", "attention", "need", "you"]
+
+    def test_unrelated_reference_does_not_match(self):
+        """Test that an unrelated reference is rejected."""
+        matches = asyncio.run(self.matcher.find_matches(
+            source={"title": "Deep Residual Learning for Image Recognition", "year": 2016},
+            match_type=MatchType.CITATION,
+            threshold=0.6,
+        ))
+
+        assert matches == []
@@ -0,0 +1,240 @@
+"""
+测试 MinHash-LSH 近似重复检测
+
+This module tests MinHash signatures, the LSH index, the corpus-wide
+duplicate sweep and candidate precision/recall on labeled pairs.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from literature_parser_backend.db import dao as dao_module
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.services.near_duplicates import (
+    NearDuplicateIndex,
+    evaluate_pairs,
+    find_duplicate_groups,
+    signature_for_match_keys,
+)
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.utils.match_keys import build_match_keys
+from literature_parser_backend.utils.minhash import (
+    MinHasher,
+    MinHashLSH,
+    candidate_probability,
+    choose_lsh_params,
+    jaccard,
+    record_shingles,
+)
+
+PAIRS_FILE = Path(__file__).parent / "fixtures" / "near_duplicate_pairs.json"
+
+
+def _signature(title, authors=None):
+    return signature_for_match_keys(build_match_keys(title=title, authors=authors), num_perm=64)
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    def __aiter__(self):
+        async def gen():
+            for record in self.records:
+                yield record
+        return gen()
+
+
+class FakeSession:
+    """Returns the stored literature whose LIDs are asked for."""
+
+    def __init__(self, stored):
+        self.stored = stored
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, lids=(), **params):
+        return FakeResult([{"lit": lid} for lid in lids if lid in self.stored])
+
+
+def make_lookup(monkeypatch, stored, fuzzy):
+    """A DAO over ``stored`` LIDs whose live fuzzy query returns ``fuzzy``, and a ready index."""
+    index = NearDuplicateIndex(Settings(near_duplicate_num_perm=64))
+    index._ready = True
+    index._last_refresh = time.monotonic()
+    monkeypatch.setattr(dao_module, "get_near_duplicate_index", lambda: index)
+
+    dao = object.__new__(LiteratureDAO)
+    dao.driver = None
+    dao.fuzzy_calls = 0
+
+    async def find_by_title_fuzzy(title, limit=10):
+        dao.fuzzy_calls += 1
+        return [_literature(lid) for lid in fuzzy]
+
+    monkeypatch.setattr(dao, "_get_session", lambda **kwargs: FakeSession(stored))
+    monkeypatch.setattr(dao, "_neo4j_node_to_literature_model", _literature)
+    monkeypatch.setattr(dao, "find_by_title_fuzzy", find_by_title_fuzzy)
+    return dao, index
+
+
+def _literature(lid):
+    return SimpleNamespace(lid=lid)
+
+
+class TestMinHash:
+    """Test suite for signatures and LSH banding."""
+
+    def test_signature_estimates_jaccard(self):
+        """Test that the signature agreement tracks the exact Jaccard similarity."""
+        set1 = record_shingles("deep residual learning for image recognition", ["he_k", "sun_j"])
+        set2 = record_shingles("deep residual learning for image recogniton", ["he_k", "sun_j"])
+        hasher = MinHasher(num_perm=256)
+
+        estimate = MinHasher.estimate_jaccard(hasher.signature(set1), hasher.signature(set2))
+
+        assert abs(estimate - jaccard(set1, set2)) < 0.1
+
+    def test_signatures_are_deterministic(self):
+        """Test that separately created hashers agree (signatures are persisted)."""
+        shingles = record_shingles("attention is all you need")
+        assert MinHasher(num_perm=32).signature(shingles) == MinHasher(num_perm=32).signature(shingles)
+
+    def test_lsh_params_respect_budget(self):
+        """Test that chosen bands x rows fit the signature and put the S-curve near the threshold."""
+        bands, rows = choose_lsh_params(0.5, 64)
+
+        assert bands * rows <= 64
+        assert candidate_probability(0.8, bands, rows) > 0.99
+        assert candidate_probability(0.2, bands, rows) < 0.1
+
+    def test_insert_query_remove(self):
+        """Test index maintenance."""
+        lsh = MinHashLSH(threshold=0.5, num_perm=64)
+        lsh.insert("2017-vaswani-aayn-a1b2", _signature("Attention Is All You Need"))
+        lsh.insert("2016-silver-mgg-c3d4", _signature("Mastering the Game of Go with Deep Neural Networks"))
+
+        query = _signature("Attention is all you need.")
+        assert [key for key, _ in lsh.query_ranked(query)] == ["2017-vaswani-aayn-a1b2"]
+
+        lsh.remove("2017-vaswani-aayn-a1b2")
+        assert lsh.query_ranked(query) == []
+        assert len(lsh) == 1
+
+
+class TestDuplicateSweep:
+    """Test suite for the offline corpus-wide sweep."""
+
+    def test_groups_near_duplicates(self):
+        """Test that variants of the same paper end up in one group."""
+        records = [
+            ("a", _signature("Attention Is All You Need", ["Ashish Vaswani"])),
+            ("b", _signature("Attention is All you Need", ["Vaswani, Ashish"])),
+            ("c", _signature("Attention is all you need.")),
+            ("d", _signature("Deep Residual Learning for Image Recognition", ["Kaiming He"])),
+        ]
+
+        assert find_duplicate_groups(records, threshold=0.5, num_perm=64) == [["a", "b", "c"]]
+
+    def test_verify_rejects_pairs(self):
+        """Test that the exact check can veto candidate pairs."""
+        records = [
+            ("a", _signature("Attention Is All You Need")),
+            ("b", _signature("Attention Is All You Need")),
+        ]
+
+        assert find_duplicate_groups(records, num_perm=64, verify=lambda x, y: False) == []
+
+
+class TestPrecisionRecall:
+    """Precision/recall of LSH candidates on the labeled title-matching pairs."""
+
+    def setup_method(self):
+        """Load the labeled pairs."""
+        self.pairs = json.loads(PAIRS_FILE.read_text(encoding="utf-8"))
+
+    def test_default_threshold_keeps_all_duplicates(self):
+        """Test that candidate generation at the default threshold loses no known duplicate."""
+        report = evaluate_pairs(self.pairs, threshold=0.5, num_perm=64)
+
+        assert report["recall"] == 1.0
+        assert report["precision"] >= 0.85
+
+    def test_higher_threshold_trades_recall(self):
+        """Test that raising the threshold never increases recall."""
+        low = evaluate_pairs(self.pairs, threshold=0.5, num_perm=64)
+        high = evaluate_pairs(self.pairs, threshold=0.8, num_perm=64)
+
+        assert high["recall"] <= low["recall"]
+        assert high["precision"] >= low["precision"]
+
+
+class TestNearDuplicateLookup:
+    """Test suite for index lookups and the live-query fallback."""
+
+    TITLE = "Attention Is All You Need"
+
+    def test_placeholders_are_not_indexed(self):
+        """Test that nodes still being processed get no signature."""
+        assert _signature("Processing...") == []
+        assert _signature("Unknown Title") == []
+
+        index = NearDuplicateIndex(Settings(near_duplicate_num_perm=64))
+        index.add("2025-processing-0000", _signature("Processing..."))
+        assert len(index.lsh) == 0
+
+    def test_confirmed_index_hit_skips_live_query(self, monkeypatch):
+        """Test that a confirmed candidate from a fresh index needs no fulltext query."""
+        dao, index = make_lookup(monkeypatch, stored={"2017-vaswani-aayn-a1b2"}, fuzzy=[])
+        index.add("2017-vaswani-aayn-a1b2", _signature(self.TITLE))
+
+        found = asyncio.run(dao.find_near_duplicates(self.TITLE, confirm=lambda lit: True))
+
+        assert [lit.lid for lit in found] == ["2017-vaswani-aayn-a1b2"]
+        assert dao.fuzzy_calls == 0
+
+    def test_rejected_index_hit_falls_back(self, monkeypatch):
+        """Test that a duplicate written elsewhere is found when the index candidate is rejected."""
+        dao, index = make_lookup(
+            monkeypatch, stored={"2017-other-version-0000"}, fuzzy=["2017-other-version-0000", "2017-other-process-0000"],
+        )
+        index.add("2017-other-version-0000", _signature(self.TITLE))
+
+        found = asyncio.run(dao.find_near_duplicates(self.TITLE, confirm=lambda lit: lit.lid == "2017-other-process-0000"))
+        assert [lit.lid for lit in found] == ["2017-other-process-0000"]
+
+        # Without a confirmation rule any index hit may be rejected, so the live query always runs
+        found = asyncio.run(dao.find_near_duplicates(self.TITLE))
+        assert [lit.lid for lit in found] == ["2017-other-version-0000", "2017-other-process-0000"]
+        assert dao.fuzzy_calls == 2
+
+    def test_miss_and_vanished_candidates_fall_back(self, monkeypatch):
+        """Test the live query for another process's write, and that deleted LIDs leave the index."""
+        dao, index = make_lookup(monkeypatch, stored=set(), fuzzy=["2017-other-process-0000"])
+        index.add("2017-deleted-elsewhere-0000", _signature(self.TITLE))
+
+        found = asyncio.run(dao.find_near_duplicates(self.TITLE, exclude_lid="2025-current-0000"))
+
+        assert [lit.lid for lit in found] == ["2017-other-process-0000"]
+        assert "2017-deleted-elsewhere-0000" not in index.lsh
+        assert index.stats["removed"] == 1
+
+    def test_stale_index_merges_live_candidates(self, monkeypatch):
+        """Test that failing refreshes keep the live query in the loop."""
+        dao, index = make_lookup(
+            monkeypatch, stored={"2017-vaswani-aayn-a1b2"},
+            fuzzy=["2017-vaswani-aayn-a1b2", "2017-other-process-0000"],
+        )
+        index.add("2017-vaswani-aayn-a1b2", _signature(self.TITLE))
+        index._last_refresh -= 3 * index.settings.near_duplicate_refresh_interval
+
+        found = asyncio.run(dao.find_near_duplicates(self.TITLE))
+
+        assert [lit.lid for lit in found] == ["2017-vaswani-aayn-a1b2", "2017-other-process-0000"]
@@ -0,0 +1,193 @@
+"""
+测试任务级页面缓存
+
+This module tests that URL adapters and Site Parser V2 share one fetch and
+one parse of the same page within a task.
+"""
+
+import asyncio
+
+import requests
+
+from literature_parser_backend.services.url_mapping.adapters.neurips import scrape_neurips_page
+from literature_parser_backend.services.url_mapping.extractors.page_cache import PageCache
+from literature_parser_backend.services.url_mapping.extractors.page_parser import PageParser
+from literature_parser_backend.worker.metadata.base import IdentifierData
+from literature_parser_backend.worker.metadata.processors.site_parser import SiteParserProcessor
+
+NEURIPS_URL = "https://proceedings.neurips.cc/paper/2017/hash/3f5ee243-Abstract.html"
+
+NEURIPS_HTML = """
+<html><head>
+  <meta name="citation_title" content="Attention Is All You Need">
+  <meta name="citation_author" content="Ashish Vaswani">
+  <meta name="citation_author" content="Noam Shazeer">
+</head><body>
+  <h4 class="title">Attention Is All You Need</h4>
+  <p class="authors">Ashish Vaswani</p>
+  <div class="abstract"><p>The dominant sequence transduction models.</p></div>
+  <div class="shared-header-information"><h5>NeurIPS 2017</h5></div>
+</body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, url, status_code=200, text=""):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.headers = {"Content-Type": "text/html"}
+        self.encoding = "ISO-8859-1"
+        self.bytes_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        body = self.text.encode("utf-8")
+        for start in range(0, len(body), chunk_size):
+            self.bytes_read += len(body[start:start + chunk_size])
+            yield body[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeGet:
+    """Stands in for requests.get and records every request."""
+
+    def __init__(self, pages, redirects=None):
+        self.pages = pages
+        self.redirects = redirects or {}
+        self.calls = []
+        self.responses = []
+
+    def __call__(self, url, headers=None, timeout=None, stream=False):
+        self.calls.append((url, stream))
+        final_url = self.redirects.get(url, url)
+        if final_url not in self.pages:
+            response = FakeResponse(final_url, 404)
+        else:
+            response = FakeResponse(final_url, 200, self.pages[final_url])
+        self.responses.append(response)
+        return response
+
+
+class TestPageCache:
+    """Test suite for the task-scoped page cache."""
+
+    def test_single_fetch_and_lazy_parse(self, monkeypatch):
+        """Test that repeated and redirected lookups reuse one fetch and one DOM."""
+        fake_get = FakeGet({NEURIPS_URL: NEURIPS_HTML}, redirects={"https://doi.example/x": NEURIPS_URL})
+        monkeypatch.setattr(requests, "get", fake_get)
+        cache = PageCache()
+
+        page = cache.fetch("https://doi.example/x")
+        assert page.final_url == NEURIPS_URL
+        assert page._soup is None
+        assert page.soup is page.soup
+
+        assert cache.fetch("https://doi.example/x") is page
+        assert cache.get(NEURIPS_URL) is page
+        assert PageParser.fetch_page_with_details(NEURIPS_URL, page_cache=cache).content == NEURIPS_HTML
+        assert fake_get.calls == [("https://doi.example/x", False)]
+        assert cache.fetches == 1
+
+    def test_failures_are_cached(self, monkeypatch):
+        """Test that a missing page is requested once and keeps its error type."""
+        fake_get = FakeGet({})
+        monkeypatch.setattr(requests, "get", fake_get)
+        cache = PageCache()
+
+        first = cache.fetch(NEURIPS_URL)
+        second = cache.fetch(NEURIPS_URL)
+
+        assert first is second and not first.success
+        assert first.result.error_type == "url_not_found"
+        assert first.soup is None
+        assert len(fake_get.calls) == 1
+
+    def test_adapter_and_site_parser_share_page(self, monkeypatch):
+        """Test that the NeurIPS adapter and Site Parser V2 share one request."""
+        fake_get = FakeGet({NEURIPS_URL: NEURIPS_HTML})
+        monkeypatch.setattr(requests, "get", fake_get)
+        cache = PageCache()
+
+        mapping = asyncio.run(scrape_neurips_page(NEURIPS_URL, {"page_cache": cache}))
+        assert mapping.title == "Attention Is All You Need"
+
+        processor = SiteParserProcessor()
+        result = processor.process(IdentifierData(url=NEURIPS_URL, page_cache=cache))
+
+        assert result.success
+        assert result.metadata.title == "Attention Is All You Need"
+        assert fake_get.calls == [(NEURIPS_URL, False)]
+
+    def test_head_only_stops_at_head(self, monkeypatch):
+        """Test that head-only fetches stop reading after </head> and close the stream."""
+        body = "<p>" + "x" * 200_000 + "</p>"
+        html = NEURIPS_HTML.replace("<div class=\"abstract\">", body + "<div class=\"abstract\">")
+        fake_get = FakeGet({NEURIPS_URL: html})
+        monkeypatch.setattr(requests, "get", fake_get)
+
+        result = PageParser.fetch_page_with_details(NEURIPS_URL, head_only=True)
+
+        response = fake_get.responses[0]
+        assert result.success and result.truncated
+        assert "</head>" in result.content
+        assert "abstract" not in result.content
+        assert response.bytes_read < 2 * PageParser.HEAD_CHUNK_SIZE
+        assert response.closed
+        assert fake_get.calls == [(NEURIPS_URL, True)]
+
+    def test_head_only_respects_byte_cap(self, monkeypatch):
+        """Test that a page without </head> is cut at the byte cap."""
+        html = "<html><head><title>t</title>" + "<meta name=\"x\" content=\"y\">" * 20_000
+        fake_get = FakeGet({NEURIPS_URL: html})
+        monkeypatch.setattr(requests, "get", fake_get)
+
+        result = PageParser.fetch_page_with_details(NEURIPS_URL, head_only=True)
+
+        assert result.truncated
+        assert len(result.content.encode("utf-8")) <= PageParser.HEAD_MAX_BYTES
+
+    def test_head_entry_is_upgraded_by_full_fetch(self, monkeypatch):
+        """Test that a full fetch replaces a head-only entry and then serves both kinds."""
+        fake_get = FakeGet({NEURIPS_URL: NEURIPS_HTML})
+        monkeypatch.setattr(requests, "get", fake_get)
+        cache = PageCache()
+
+        head = cache.fetch(NEURIPS_URL, head_only=True)
+        assert head.head_only and head.soup.find("meta", attrs={"name": "citation_title"})
+        assert cache.fetch(NEURIPS_URL, head_only=True) is head
+
+        full = cache.fetch(NEURIPS_URL)
+        assert not full.head_only and full.soup.find("div", class_="abstract")
+        assert cache.fetch(NEURIPS_URL, head_only=True) is full
+        assert fake_get.calls == [(NEURIPS_URL, True), (NEURIPS_URL, False)]
+
+    def test_site_parser_uses_head_when_meta_is_complete(self, monkeypatch):
+        """Test that Site Parser V2 skips the body when the head has every field."""
+        head = """<html><head>
+          <meta name="citation_title" content="Attention Is All You Need">
+          <meta name="citation_author" content="Ashish Vaswani">
+          <meta name="citation_publication_date" content="2017/12/04">
+          <meta name="citation_abstract" content="The dominant sequence transduction models.">
+        </head>"""
+        fake_get = FakeGet({"https://www.nature.com/articles/s41586-017-0001": head + "<body>" + "x" * 100_000 + "</body></html>"})
+        monkeypatch.setattr(requests, "get", fake_get)
+
+        result = SiteParserProcessor().process(IdentifierData(url="https://www.nature.com/articles/s41586-017-0001"))
+
+        assert result.success
+        assert result.metadata.year == 2017
+        assert fake_get.calls == [("https://www.nature.com/articles/s41586-017-0001", True)]
+
+    def test_site_parser_falls_back_to_full_page(self, monkeypatch):
+        """Test that Site Parser V2 downloads the body when the head lacks fields."""
+        fake_get = FakeGet({NEURIPS_URL: NEURIPS_HTML})
+        monkeypatch.setattr(requests, "get", fake_get)
+
+        result = SiteParserProcessor().process(IdentifierData(url=NEURIPS_URL))
+
+        assert result.success
+        assert result.metadata.abstract
+        assert fake_get.calls == [(NEURIPS_URL, True), (NEURIPS_URL, False)]
@@ -0,0 +1,159 @@
+"""
+测试外部API的按主机限流
+
+This module tests the local token bucket fallback, Retry-After parsing and
+the 429 handling of ExternalRequestManager.
+"""
+
+import pytest
+
+from literature_parser_backend.services import rate_limiter as rate_limiter_module
+from literature_parser_backend.services.rate_limiter import (
+    HostRateLimiter,
+    RateLimitExceeded,
+    parse_retry_after,
+)
+from literature_parser_backend.services.request_manager import ExternalRequestManager, RequestType
+from literature_parser_backend.settings import Settings
+
+
+class DownRedis:
+    """Redis client whose every call fails."""
+
+    def register_script(self, script):
+        raise ConnectionError("redis down")
+
+    def hgetall(self, key):
+        raise ConnectionError("redis down")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.events = []
+
+    def limit_for_url(self, url):
+        return "crossref" if "crossref" in url else None
+
+    def acquire(self, name, max_wait=None):
+        self.events.append(("acquire", name))
+        return 0.0
+
+    def block(self, name, seconds):
+        self.events.append(("block", name, seconds))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", fake)
+    return fake
+
+
+def _limiter(**overrides):
+    return HostRateLimiter(Settings(**overrides), redis_client=DownRedis())
+
+
+class TestHostRateLimiter:
+    """Test suite for the per-host token buckets."""
+
+    def test_hosts_map_to_limits(self):
+        """Test host suffix matching."""
+        limiter = _limiter()
+
+        assert limiter.limit_for_url("https://api.crossref.org/works/10.1/x") == "crossref"
+        assert limiter.limit_for_url("http://export.arxiv.org/api/query") == "arxiv"
+        assert limiter.limit_for_url("https://www.semanticscholar.org/paper/x") is None
+
+    def test_semantic_scholar_rate_depends_on_api_key(self):
+        """Test that an API key selects the keyed rate."""
+        assert _limiter(semantic_scholar_api_key="").limits["semantic_scholar"][0] == 0.3
+        assert _limiter(semantic_scholar_api_key="k").limits["semantic_scholar"][0] == 1.0
+
+    def test_arxiv_spacing(self, clock):
+        """Test that consecutive arXiv calls are spaced by the configured interval."""
+        limiter = _limiter()
+
+        waits = [limiter.acquire("arxiv") for _ in range(3)]
+
+        assert waits == [0.0, pytest.approx(3.0), pytest.approx(3.0)]
+        assert limiter.get_stats()["arxiv"]["waited"] == 2
+
+    def test_block_honors_retry_after_and_max_wait(self, clock):
+        """Test that a block delays the next call and long waits fail fast."""
+        limiter = _limiter(rate_limit_max_wait=10.0)
+
+        limiter.block("crossref", 5.0)
+        assert limiter.acquire("crossref") == pytest.approx(5.0)
+
+        limiter.block("crossref", 120.0)
+        with pytest.raises(RateLimitExceeded):
+            limiter.acquire("crossref")
+        assert limiter.get_stats()["crossref"]["rejected"] == 1
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds, HTTP-date and malformed headers."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRequestManagerThrottling:
+    """Test suite for 429 handling in ExternalRequestManager."""
+
+    def test_retry_after_blocks_host_then_retries(self):
+        """Test that a 429 publishes Retry-After and the retry acquires again."""
+        manager = ExternalRequestManager(Settings())
+        manager.rate_limiter = RecordingLimiter()
+        manager.external_session = FakeSession([FakeResponse(429, {"Retry-After": "2"}), FakeResponse(200)])
+
+        response = manager.get("https://api.crossref.org/works/x", RequestType.EXTERNAL)
+
+        assert response.status_code == 200
+        assert manager.rate_limiter.events == [
+            ("acquire", "crossref"),
+            ("block", "crossref", 2.0),
+            ("acquire", "crossref"),
+        ]
+
+    def test_internal_requests_are_not_limited(self):
+        """Test that internal requests bypass the limiter."""
+        manager = ExternalRequestManager(Settings())
+        manager.rate_limiter = RecordingLimiter()
+        manager.internal_session = FakeSession([FakeResponse(200)])
+
+        manager.get("http://api.crossref.org.internal/x", RequestType.INTERNAL)
+
+        assert manager.rate_limiter.events == []
@@ -0,0 +1,157 @@
+"""
+测试未解析节点对账任务
+
+This module tests batching and checkpoint/resume behaviour of the reconciliation job.
+"""
+
+import asyncio
+
+import pytest
+
+from literature_parser_backend.db.relationship_dao import RelationshipDAO
+from literature_parser_backend.worker.reconciliation import UnresolvedReconciler
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    def __aiter__(self):
+        async def gen():
+            for record in self.records:
+                yield record
+        return gen()
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **params):
+        self.driver.queries.append(query)
+        return FakeResult(self.driver.records)
+
+
+class FakeDriver:
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+
+class FakeLiteratureDAO:
+    async def backfill_match_keys(self):
+        return 0
+
+
+class FakeRelationshipDAO:
+    """Serves placeholders in LID order; even-numbered ones have a match."""
+
+    def __init__(self, count):
+        self.placeholders = [f"unresolved-{i:04d}" for i in range(count)]
+        self.merged = []
+
+    async def backfill_unresolved_match_keys(self):
+        return 0
+
+    async def find_reconcilable_unresolved(self, after_lid="", batch_size=500):
+        page = [lid for lid in self.placeholders if lid > after_lid][:batch_size]
+        pairs = [
+            {"placeholder_lid": lid, "literature_lid": "2020-x-y-0000"}
+            for lid in page if int(lid[-4:]) % 2 == 0
+        ]
+        return pairs, (page[-1] if page else None), len(page)
+
+    async def bulk_upgrade_unresolved(self, pairs):
+        lids = [pair["placeholder_lid"] for pair in pairs]
+        self.merged.extend(lids)
+        self.placeholders = [lid for lid in self.placeholders if lid not in lids]
+        return {"merged_lids": lids, "upgraded_relationships": len(lids)}
+
+
+class TestUnresolvedReconciler:
+    """Test suite for the reconciliation job."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_redis):
+        """Create a reconciler over fake DAOs with a small batch size."""
+        self.redis = fake_redis
+        self.relationship_dao = FakeRelationshipDAO(count=10)
+        self.reconciler = UnresolvedReconciler(
+            FakeLiteratureDAO(), self.relationship_dao, redis_client=self.redis
+        )
+        self.reconciler.batch_size = 3
+
+    def test_full_pass(self):
+        """Test that a full pass merges every match and clears the checkpoint."""
+        stats = asyncio.run(self.reconciler.run())
+
+        assert stats["completed"] is True
+        assert stats["scanned"] == 10
+        assert stats["merged"] == 5
+        assert UnresolvedReconciler.CHECKPOINT_KEY not in self.redis.data
+        assert UnresolvedReconciler.LOCK_KEY not in self.redis.data
+
+    def test_resume_from_checkpoint(self):
+        """Test that a stopped pass resumes after the last committed batch."""
+        first = asyncio.run(self.reconciler.run(max_batches=2))
+        assert first["completed"] is False
+        assert first["after_lid"] == "unresolved-0005"
+
+        second = asyncio.run(self.reconciler.run())
+        assert second["completed"] is True
+        assert second["scanned"] == 10
+        assert sorted(self.relationship_dao.merged) == [f"unresolved-{i:04d}" for i in range(0, 10, 2)]
+
+    def test_concurrent_run_is_skipped(self):
+        """Test that a second run does nothing while the lock is held."""
+        self.redis.set(UnresolvedReconciler.LOCK_KEY, "1")
+
+        assert asyncio.run(self.reconciler.run()) == {"skipped": True}
+        assert self.relationship_dao.merged == []
+        assert self.redis.get(UnresolvedReconciler.LOCK_KEY) == "1"
+
+    def test_lock_ttl_follows_batch_budget_and_release_is_owner_only(self):
+        """Test that the lock is renewed per batch and never released once taken over."""
+        find = self.relationship_dao.find_reconcilable_unresolved
+        seen_ttls = []
+
+        async def find_then_lose_lock(after_lid="", batch_size=500):
+            seen_ttls.append(self.redis.ttls[UnresolvedReconciler.LOCK_KEY])
+            if after_lid:
+                # The lock expired and another worker took it over
+                self.redis.set(UnresolvedReconciler.LOCK_KEY, "other-worker")
+            return await find(after_lid, batch_size)
+
+        self.relationship_dao.find_reconcilable_unresolved = find_then_lose_lock
+        asyncio.run(self.reconciler.run(max_batches=2))
+
+        assert seen_ttls == [2 * self.reconciler.batch_budget] * 2
+        assert self.redis.get(UnresolvedReconciler.LOCK_KEY) == "other-worker"
+
+
+class TestFindReconcilableUnresolved:
+    """Test suite for the placeholder/literature join."""
+
+    def test_untitled_placeholders_stay_separate(self):
+        """Test that placeholders without a title key are only matched by DOI."""
+        driver = FakeDriver([
+            {"placeholder_lid": "unresolved-a", "match_title": "", "by_doi": False, "literature_lid": "2020-x-untitled-0000"},
+            {"placeholder_lid": "unresolved-b", "match_title": None, "by_doi": False, "literature_lid": "2020-x-untitled-0000"},
+            {"placeholder_lid": "unresolved-c", "match_title": "", "by_doi": True, "literature_lid": "2019-doi-match-0000"},
+        ])
+        dao = RelationshipDAO(database=driver)
+
+        pairs, last_lid, scanned = asyncio.run(dao.find_reconcilable_unresolved())
+
+        assert "u.match_title IS NOT NULL AND u.match_title <> ''" in driver.queries[0]
+        assert pairs == [{"placeholder_lid": "unresolved-c", "literature_lid": "2019-doi-match-0000"}]
+        assert (last_lid, scanned) == ("unresolved-c", 3)
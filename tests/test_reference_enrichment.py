@@ -0,0 +1,168 @@
+"""
+测试Semantic Scholar批量接口与引用批量补全
+
+This module tests chunked /paper/batch lookups, paginated references,
+batched DOI completion of CrossRef references and the Unresolved
+enrichment pass.
+"""
+
+import asyncio
+
+from literature_parser_backend.services.crossref import CrossRefClient
+from literature_parser_backend.services.semantic_scholar import SemanticScholarClient
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker.reference_enrichment import ReferenceEnricher
+
+
+def _paper(paper_id, doi=None, title=None):
+    return {
+        "paperId": paper_id,
+        "title": title or f"Paper {paper_id}",
+        "year": 2020,
+        "venue": "NeurIPS",
+        "authors": [{"authorId": "1", "name": "Ada Lovelace"}],
+        "externalIds": {"DOI": doi} if doi else {},
+    }
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        raise AssertionError("unexpected status")
+
+
+class FakeS2RequestManager:
+    """Answers /paper/batch from a catalogue and pages references."""
+
+    def __init__(self, catalogue=None, references=None):
+        self.catalogue = catalogue or {}
+        self.references = references or []
+        self.calls = []
+
+    def post(self, url, request_type, params=None, json=None, timeout=None):
+        self.calls.append(("POST", url, json["ids"]))
+        return FakeResponse([self.catalogue.get(i) for i in json["ids"]])
+
+    def get(self, url, request_type, params=None, timeout=None):
+        offset, limit = int(params["offset"]), int(params["limit"])
+        self.calls.append(("GET", url, offset, limit))
+        page = self.references[offset:offset + limit]
+        payload = {"offset": offset, "data": [{"citedPaper": p} for p in page]}
+        if offset + limit < len(self.references):
+            payload["next"] = offset + limit
+        return FakeResponse(payload)
+
+
+def _client(manager):
+    client = SemanticScholarClient(Settings())
+    client.request_manager = manager
+    return client
+
+
+class TestSemanticScholarBatch:
+    """Test suite for the batch and paginated endpoints."""
+
+    def test_batch_chunks_and_skips_unknown(self, monkeypatch):
+        """Test that ids are sent in chunks and nulls are dropped."""
+        monkeypatch.setattr(SemanticScholarClient, "BATCH_SIZE", 2)
+        manager = FakeS2RequestManager(catalogue={
+            "DOI:10.1/a": _paper("a", "10.1/a"),
+            "DOI:10.1/c": _paper("c", "10.1/c"),
+        })
+
+        papers = _client(manager).get_papers_batch(["10.1/a", "10.1/b", "10.1/c", "10.1/a"])
+
+        assert [call[2] for call in manager.calls] == [["DOI:10.1/a", "DOI:10.1/b"], ["DOI:10.1/c"]]
+        assert set(papers) == {"10.1/a", "10.1/c"}
+        assert papers["10.1/a"]["paperId"] == "a"
+
+    def test_references_are_paginated(self, monkeypatch):
+        """Test that references are fetched until the last page."""
+        monkeypatch.setattr(SemanticScholarClient, "REFERENCES_PAGE_SIZE", 100)
+        manager = FakeS2RequestManager(references=[_paper(f"p{i}") for i in range(250)])
+
+        references = _client(manager).get_references("10.1/root")
+
+        assert len(references) == 250
+        assert [call[2] for call in manager.calls] == [0, 100, 200]
+
+    def test_reference_limit_caps_pages(self, monkeypatch):
+        """Test that an explicit limit stops paging early."""
+        monkeypatch.setattr(SemanticScholarClient, "REFERENCES_PAGE_SIZE", 100)
+        manager = FakeS2RequestManager(references=[_paper(f"p{i}") for i in range(250)])
+
+        references = _client(manager).get_references("10.1/root", limit=150)
+
+        assert len(references) == 150
+        assert [call[2:] for call in manager.calls] == [(0, 100), (100, 50)]
+
+
+class TestReferenceEnrichment:
+    """Test suite for bulk reference enrichment."""
+
+    def test_crossref_doi_only_references_use_one_batch(self, monkeypatch):
+        """Test that DOI-only CrossRef references are completed by the resolver."""
+        crossref = CrossRefClient(Settings())
+        monkeypatch.setattr(crossref, "_get_work_by_doi", lambda doi: {"reference": [
+            {"DOI": "10.1/A"},
+            {"DOI": "10.1/b"},
+            {"article-title": "Has a title", "year": "2019"},
+        ]})
+        single_lookups = []
+        monkeypatch.setattr(crossref, "_enhance_reference_with_doi", lambda doi: single_lookups.append(doi))
+
+        enricher = ReferenceEnricher(_client(FakeS2RequestManager(catalogue={
+            "DOI:10.1/A": _paper("a", "10.1/A", title="Batch resolved"),
+        })))
+        references = crossref.get_references("10.1/root", doi_resolver=enricher.lookup_dois)
+
+        assert [ref["title"] for ref in references] == ["Batch resolved", "Has a title"]
+        assert references[0]["authors"] == [{"full_name": "Ada Lovelace"}]
+        assert single_lookups == ["10.1/b"]
+
+    def test_enrich_unresolved_fills_gaps(self):
+        """Test that placeholders are enriched once and misses are marked."""
+
+        class FakeRelationshipDAO:
+            def __init__(self):
+                self.nodes = [
+                    {"lid": "unresolved-1", "doi": "10.1/a", "arxiv_id": None, "s2_paper_id": None,
+                     "parsed_data": {"doi": "10.1/a", "title": "Original title"}},
+                    {"lid": "unresolved-2", "doi": None, "arxiv_id": None, "s2_paper_id": "s2b",
+                     "parsed_data": {}},
+                    {"lid": "unresolved-3", "doi": "10.1/missing", "arxiv_id": None, "s2_paper_id": None,
+                     "parsed_data": {}},
+                ]
+                self.updates = []
+
+            async def find_enrichable_unresolved(self, after_lid="", batch_size=500):
+                return [node for node in self.nodes if node["lid"] > after_lid][:batch_size]
+
+            async def apply_unresolved_enrichment(self, updates):
+                self.updates.extend(updates)
+                enriched = [u["lid"] for u in updates]
+                self.nodes = [node for node in self.nodes if node["lid"] not in enriched]
+                return sum(1 for u in updates if u["parsed_data"])
+
+        dao = FakeRelationshipDAO()
+        manager = FakeS2RequestManager(catalogue={
+            "DOI:10.1/a": _paper("s2a", "10.1/a", title="S2 title"),
+            "s2b": _paper("s2b", "10.1/b"),
+        })
+
+        enricher = ReferenceEnricher(_client(manager), arxiv_client=object())
+        stats = asyncio.run(enricher.enrich_unresolved(dao))
+
+        assert stats == {"scanned": 3, "enriched": 2, "requests": 1, "completed": True}
+        updates = {u["lid"]: u["parsed_data"] for u in dao.updates}
+        assert updates["unresolved-1"]["title"] == "Original title"
+        assert updates["unresolved-1"]["authors"] == ["Ada Lovelace"]
+        assert updates["unresolved-1"]["identifiers"]["s2_paper_id"] == "s2a"
+        assert updates["unresolved-2"]["doi"] == "10.1/b"
+        assert updates["unresolved-3"] is None
@@ -0,0 +1,172 @@
+"""
+测试跨任务引用解析缓存
+
+This module tests the reference resolution cache (local tier), its invalidation
+rules, and that callers cache the LIDs actually written.
+"""
+
+import asyncio
+
+from literature_parser_backend.db.dao import LiteratureDAO
+from literature_parser_backend.services import resolution_cache
+from literature_parser_backend.services.resolution_cache import (
+    RESOLVED,
+    UNRESOLVED,
+    LocalLRUCache,
+    ReferenceResolutionCache,
+)
+from literature_parser_backend.utils.match_keys import build_match_keys
+from literature_parser_backend.worker.citation_resolver import CitationResolver, UnresolvedReference
+
+
+class TestLocalLRUCache:
+    """Test suite for the per-worker LRU tier."""
+
+    def test_eviction_order(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LocalLRUCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expiry(self):
+        """Test that expired entries are treated as misses."""
+        cache = LocalLRUCache(max_size=10, ttl=60)
+        cache.set("a", 1, ttl=-1)
+
+        assert cache.get("a") is None
+
+
+class TestReferenceResolutionCache:
+    """Test suite for reference resolution caching."""
+
+    def setup_method(self):
+        """Create a cache that only uses the local tier."""
+        self.cache = ReferenceResolutionCache(use_redis=False)
+
+    def test_reference_key_prefers_doi(self):
+        """Test that DOI keys take precedence over title keys."""
+        assert self.cache.reference_key({"title": "X", "doi": "DOI:10.1/ABC"}) == "doi:10.1/abc"
+        assert self.cache.reference_key({"title": "Attention Is All You Need!", "year": 2017}) == (
+            "title:attention is all you need:2017"
+        )
+        assert self.cache.reference_key({}) is None
+
+    def test_positive_and_negative_entries(self):
+        """Test storing and reading back both kinds of entries."""
+        self.cache.set_resolved("doi:10.1/abc", "2017-vaswani-aayn-a1b2", 0.9)
+        self.cache.set_unresolved("title:unknown paper:", "unresolved-12345678")
+
+        assert self.cache.get("doi:10.1/abc") == {
+            "status": RESOLVED, "lid": "2017-vaswani-aayn-a1b2", "confidence": 0.9,
+        }
+        assert self.cache.get("title:unknown paper:")["status"] == UNRESOLVED
+
+    def test_new_literature_invalidates_matching_negatives(self):
+        """Test that writing a literature drops negatives for its title and neighbouring years."""
+        for key in ("title:attention is all you need:2016", "title:attention is all you need:"):
+            self.cache.set_unresolved(key, "unresolved-12345678")
+        self.cache.set_unresolved("title:another paper:2017", "unresolved-87654321")
+
+        self.cache.invalidate_for_target(build_match_keys(title="Attention Is All You Need", year=2017))
+
+        assert self.cache.get("title:attention is all you need:2016") is None
+        assert self.cache.get("title:attention is all you need:") is None
+        assert self.cache.get("title:another paper:2017") is not None
+
+    def test_invalidate_lid(self):
+        """Test that upgrading a placeholder drops entries pointing at it."""
+        self.cache.set_unresolved("title:a:", "unresolved-12345678")
+        self.cache.set_unresolved("title:b:", "unresolved-12345678")
+        self.cache.set_resolved("title:c:", "2020-smith-abc-0001", 0.8)
+
+        assert self.cache.invalidate_lid("unresolved-12345678") == 2
+        assert self.cache.get("title:a:") is None
+        assert self.cache.get("title:c:") is not None
+
+
+class FakeRelationshipDAO:
+    """Links references titled "Known Paper" to an existing placeholder, like the title dedup does."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    async def batch_create_unresolved_citations(self, citing_lid, unresolved_citations):
+        if self.fail:
+            return 0
+        for citation in unresolved_citations:
+            if citation["reference_data"]["parsed_data"]["title"] == "Known Paper":
+                citation["placeholder_lid"] = "unresolved-existing"
+        return len({citation["placeholder_lid"] for citation in unresolved_citations})
+
+
+class FakeWriteSession:
+    """Runs ``execute_write`` callbacks against a canned delete result."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute_write(self, work):
+        return {"deleted_count": 1}
+
+
+class TestCacheCallers:
+    """Test suite for the cache entries written and dropped by the resolver and the DAO."""
+
+    def make_resolver(self, dao):
+        resolver = CitationResolver(task_id="t1")
+        resolver.cache = ReferenceResolutionCache(use_redis=False)
+        resolver.relationship_dao = dao
+        return resolver
+
+    def test_unresolved_entry_points_at_reused_placeholder(self):
+        """Test that a reference linked to an existing Unresolved node caches that node's LID."""
+        resolver = self.make_resolver(FakeRelationshipDAO())
+        known = UnresolvedReference("[1] Known Paper", {"title": "Known Paper"})
+        new = UnresolvedReference("[2] New Paper", {"title": "New Paper"})
+
+        asyncio.run(resolver._create_unresolved_placeholders("2020-citing-0000", [known, new]))
+
+        assert known.placeholder_lid == "unresolved-existing"
+        assert resolver.cache.get(resolver.cache.reference_key(known.parsed_data))["lid"] == "unresolved-existing"
+        new_entry = resolver.cache.get(resolver.cache.reference_key(new.parsed_data))
+        assert new_entry["lid"] == new.placeholder_lid != "unresolved-existing"
+
+    def test_failed_write_caches_nothing(self):
+        """Test that no negative entry points at a placeholder that was never written."""
+        resolver = self.make_resolver(FakeRelationshipDAO(fail=True))
+        reference = UnresolvedReference("[1] New Paper", {"title": "New Paper"})
+
+        asyncio.run(resolver._create_unresolved_placeholders("2020-citing-0000", [reference]))
+
+        assert resolver.cache.get(resolver.cache.reference_key(reference.parsed_data)) is None
+
+    def test_delete_literature_drops_positive_entries(self, monkeypatch):
+        """Test that deleting a literature invalidates resolutions pointing at it."""
+        cache = ReferenceResolutionCache(use_redis=False)
+        cache.set_resolved("doi:10.1/deleted", "2020-smith-abc-0001", 0.9)
+        cache.set_resolved("doi:10.1/kept", "2021-jones-xyz-0002", 0.9)
+        monkeypatch.setattr(resolution_cache, "get_reference_cache", lambda: cache)
+
+        dao = object.__new__(LiteratureDAO)
+        dao.driver = None
+        monkeypatch.setattr(dao, "_get_session", lambda **kwargs: FakeWriteSession())
+        monkeypatch.setattr(dao, "_record_graph_detached", lambda lid: None)
+        monkeypatch.setattr(dao, "_remove_near_duplicate", lambda lid: None)
+
+        async def delete_search_document(lid):
+            return None
+
+        monkeypatch.setattr(dao, "_delete_search_document", delete_search_document)
+
+        assert asyncio.run(dao.delete_literature("2020-smith-abc-0001"))
+        assert cache.get("doi:10.1/deleted") is None
+        assert cache.get("doi:10.1/kept") is not None
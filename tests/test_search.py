@@ -0,0 +1,164 @@
+"""
+测试文献检索子系统
+
+This module tests field boosts, filters and keyset pagination on the
+in-process backend, and the query building of the Neo4j backend.
+"""
+
+import asyncio
+
+import pytest
+
+from literature_parser_backend.services.search import (
+    InMemorySearchBackend,
+    InvalidCursorError,
+    Neo4jSearchBackend,
+    SearchQuery,
+    build_lucene_query,
+    build_search_document,
+    search_node_properties,
+    tokenize_query,
+)
+from literature_parser_backend.services.search.neo4j_backend import FALLBACK_QUERY, FULLTEXT_QUERY
+
+METADATA = {
+    "a": {"title": "Attention Is All You Need", "authors": [{"name": "Ashish Vaswani"}], "year": 2017,
+          "journal": "Advances in Neural Information Processing Systems"},
+    "b": {"title": "Neural Machine Translation", "authors": [{"name": "Dzmitry Bahdanau"}], "year": 2015,
+          "journal": "ICLR", "abstract": "We use attention to align and translate."},
+    "c": {"title": "Graph Attention Networks", "authors": [{"name": "Petar Velickovic"}], "year": 2018,
+          "journal": "ICLR"},
+    "d": {"title": "Deep Residual Learning", "authors": [{"name": "Kaiming He"}], "year": 2016,
+          "journal": "CVPR"},
+}
+
+
+def _backend():
+    backend = InMemorySearchBackend()
+    asyncio.run(backend.index_documents([build_search_document(lid, m) for lid, m in METADATA.items()]))
+    return backend
+
+
+def _search(backend, **kwargs):
+    return asyncio.run(backend.search(SearchQuery(**kwargs)))
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    def __aiter__(self):
+        async def gen():
+            for record in self.records:
+                yield record
+        return gen()
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **params):
+        self.driver.calls.append((query, params))
+        if query == FULLTEXT_QUERY and self.driver.fulltext_error:
+            raise RuntimeError("There is no such fulltext schema index: literature_search")
+        return FakeResult(self.driver.records)
+
+
+class FakeDriver:
+    def __init__(self, records, fulltext_error=False):
+        self.records = records
+        self.fulltext_error = fulltext_error
+        self.calls = []
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+
+class TestSearch:
+    """Test suite for the search subsystem."""
+
+    def test_title_outranks_abstract(self):
+        """Test that a title match scores above an abstract-only match."""
+        page = _search(_backend(), text="attention")
+
+        assert [hit.lid for hit in page.hits] == ["a", "c", "b"]
+        assert page.hits[0].authors == ["Ashish Vaswani"]
+
+    def test_year_and_venue_filters(self):
+        """Test year range and case-insensitive venue substring filters."""
+        backend = _backend()
+
+        assert [hit.lid for hit in _search(backend, text="attention", year_from=2016).hits] == ["a", "c"]
+        assert [hit.lid for hit in _search(backend, text="", venue="iclr").hits] == ["b", "c"]
+
+    def test_cursor_pages_are_disjoint_and_complete(self):
+        """Test that following next_cursor walks every hit exactly once."""
+        backend = _backend()
+        seen, cursor = [], None
+        while True:
+            page = _search(backend, text="", limit=3, cursor=cursor)
+            seen.extend(hit.lid for hit in page.hits)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == ["a", "b", "c", "d"]
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        with pytest.raises(InvalidCursorError):
+            _search(_backend(), text="attention", cursor="not-a-cursor")
+
+    def test_query_terms_cannot_inject_lucene_syntax(self):
+        """Test that operators and special characters are stripped from terms."""
+        terms = tokenize_query('title:"x" OR (y*) AND z~')
+
+        assert terms == ["title", "x", "or", "y", "and", "z"]
+        assert build_lucene_query(["deep", "learning"], {"title": 3.0, "authors": 2.0}) == (
+            "display_title:(deep learning)^3.0 search_authors:(deep learning)^2.0"
+        )
+
+    def test_node_properties(self):
+        """Test the native properties written to Literature nodes."""
+        props = search_node_properties(build_search_document("a", METADATA["a"]))
+
+        assert props["search_authors"] == "Ashish Vaswani"
+        assert props["search_venue_key"] == "advances in neural information processing systems"
+
+    def test_neo4j_backend_fetches_one_extra_row(self):
+        """Test limit + 1 fetching and cursor creation from the last hit."""
+        records = [
+            {"lid": lid, "score": score, "title": "", "authors": "A; B", "year": None, "venue": None}
+            for lid, score in [("a", 2.0), ("b", 1.5), ("c", 1.0)]
+        ]
+        driver = FakeDriver(records)
+
+        page = asyncio.run(Neo4jSearchBackend().search(SearchQuery(text="attention", limit=2), driver=driver))
+
+        query, params = driver.calls[0]
+        assert query == FULLTEXT_QUERY and params["fetch"] == 3
+        assert [hit.lid for hit in page.hits] == ["a", "b"]
+        assert page.hits[0].authors == ["A", "B"]
+
+        asyncio.run(Neo4jSearchBackend().search(
+            SearchQuery(text="attention", limit=2, cursor=page.next_cursor), driver=driver
+        ))
+        assert driver.calls[1][1]["after_score"] == 1.5 and driver.calls[1][1]["after_lid"] == "b"
+
+    def test_neo4j_fallback_is_parameterized(self):
+        """Test that the fallback passes words as a parameter instead of query text."""
+        driver = FakeDriver([], fulltext_error=True)
+
+        asyncio.run(Neo4jSearchBackend().search(SearchQuery(text="it's deep"), driver=driver))
+
+        query, params = driver.calls[-1]
+        assert query == FALLBACK_QUERY
+        assert "deep" in params["words"]
+        assert "deep" not in query
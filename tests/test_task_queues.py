@@ -0,0 +1,206 @@
+"""
+测试任务优先级通道
+
+This module tests weighted consumption of the interactive, normal and bulk
+queues, and that submissions for the same literature are coalesced or jump
+ahead of a slower lane.
+"""
+
+import asyncio
+import json
+import threading
+from collections import Counter
+
+import pytest
+
+from literature_parser_backend.models.task import TaskPriority
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.worker import queues
+from literature_parser_backend.worker.admission import AdmissionController, AdmissionRejected
+from literature_parser_backend.worker.celery_app import celery_app
+from literature_parser_backend.worker.queues import (
+    BULK_QUEUE,
+    INTERACTIVE_QUEUE,
+    LITERATURE_QUEUES,
+    NORMAL_QUEUE,
+    TaskSubmitter,
+    WeightedQueueCycle,
+    submission_aliases,
+)
+from literature_parser_backend.worker.tasks import process_literature_task
+
+
+def drain(cycle, backlog, fetches):
+    """Simulate kombu: take from the first non-empty queue in cycle order."""
+    served = []
+    for _ in range(fetches):
+        queue = next(q for q in cycle.consume(len(cycle.items)) if backlog[q] > 0)
+        backlog[queue] -= 1
+        cycle.rotate(queue)
+        served.append(queue)
+    return served
+
+
+class FakeResult:
+    def __init__(self, task_id, state="PENDING"):
+        self.id = task_id
+        self.state = state
+
+
+class FakeBroker:
+    """Records apply_async calls and serves task states."""
+
+    def __init__(self):
+        self.sent = []
+        self.states = {}
+
+    def apply_async(self, args=None, kwargs=None, queue=None):
+        task_id = f"task-{len(self.sent) + 1}"
+        self.sent.append({
+            "task_id": task_id, "args": args, "kwargs": kwargs, "queue": queue, "thread": threading.get_ident(),
+        })
+        return FakeResult(task_id)
+
+    def async_result(self, task_id):
+        return FakeResult(task_id, self.states.get(task_id, "PENDING"))
+
+
+def make_submitter(monkeypatch, redis, **overrides):
+    broker = FakeBroker()
+    monkeypatch.setattr(process_literature_task, "apply_async", broker.apply_async)
+    monkeypatch.setattr(celery_app, "AsyncResult", broker.async_result)
+    settings = Settings(**{"admission_snapshot_ttl": 0.0, **overrides})
+    admission = AdmissionController(redis_client=redis, settings=settings)
+    return TaskSubmitter(redis_client=redis, settings=settings, admission=admission), broker
+
+
+class TestWeightedQueueCycle:
+    """Test suite for WeightedQueueCycle."""
+
+    def test_backlogged_lanes_share_by_weight(self):
+        """Test that fetches are split 6:3:1 and interleaved, not strictly prioritized."""
+        cycle = WeightedQueueCycle(list(LITERATURE_QUEUES))
+        backlog = {queue: 1000 for queue in LITERATURE_QUEUES}
+
+        served = drain(cycle, backlog, 100)
+
+        assert Counter(served) == {INTERACTIVE_QUEUE: 60, NORMAL_QUEUE: 30, BULK_QUEUE: 10}
+        assert served[0] == INTERACTIVE_QUEUE
+        assert BULK_QUEUE in served[:10]
+
+    def test_idle_lane_share_goes_to_others(self):
+        """Test work conservation and that idle credit is bounded."""
+        cycle = WeightedQueueCycle(list(LITERATURE_QUEUES))
+        backlog = {INTERACTIVE_QUEUE: 0, NORMAL_QUEUE: 1000, BULK_QUEUE: 1000}
+
+        served = drain(cycle, backlog, 400)
+        assert Counter(served) == {NORMAL_QUEUE: 300, BULK_QUEUE: 100}
+        assert cycle.credit[INTERACTIVE_QUEUE] <= 10
+
+        # A burst of interactive work is served first, and at its weighted share
+        backlog[INTERACTIVE_QUEUE] = 1000
+        served = drain(cycle, backlog, 20)
+        assert served[0] == INTERACTIVE_QUEUE
+        assert Counter(served) == {INTERACTIVE_QUEUE: 12, NORMAL_QUEUE: 6, BULK_QUEUE: 2}
+
+
+class TestTaskSubmitter:
+    """Test suite for TaskSubmitter."""
+
+    def test_submission_aliases_normalized(self):
+        """Test that nested and flat sources yield the same keys, most specific first."""
+        flat = submission_aliases({"url": "https://arxiv.org/abs/1706.03762", "doi": "10.48550/ARXIV.1706.03762"})
+        nested = submission_aliases({"identifiers": {"doi": "10.48550/arXiv.1706.03762"}, "url": None})
+
+        assert flat[0] == nested[0] == "doi:10.48550/arxiv.1706.03762"
+        assert flat[1].startswith("url:")
+
+    def test_lane_routing_and_coalescing(self, monkeypatch, fake_redis):
+        """Test that tasks go to their lane and repeat submissions reuse the queued task."""
+        submitter, broker = make_submitter(monkeypatch, fake_redis)
+
+        bulk = submitter.submit({"doi": "10.1000/xyz"}, TaskPriority.BULK)
+        again = submitter.submit({"doi": "10.1000/XYZ"}, TaskPriority.BULK)
+        other = submitter.submit({"arxiv_id": "1706.03762"}, TaskPriority.INTERACTIVE)
+
+        assert again.id == bulk.id
+        assert [(sent["queue"], sent["kwargs"]["interactive"]) for sent in broker.sent] == [
+            (BULK_QUEUE, False),
+            (INTERACTIVE_QUEUE, True),
+        ]
+        assert other.id == "task-2"
+        assert submitter.redis.ttls["literature_submission:doi:10.1000/xyz"] == Settings().task_submission_ttl
+
+    def test_interactive_jumps_ahead_of_queued_bulk_task(self, monkeypatch, fake_redis):
+        """Test that a faster lane overtakes a queued task but reuses a running one."""
+        submitter, broker = make_submitter(monkeypatch, fake_redis)
+
+        bulk = submitter.submit({"doi": "10.1000/queued"}, TaskPriority.BULK)
+        interactive = submitter.submit({"doi": "10.1000/queued"}, TaskPriority.INTERACTIVE)
+        assert interactive.id != bulk.id
+        assert broker.sent[-1]["queue"] == INTERACTIVE_QUEUE
+
+        running = submitter.submit({"doi": "10.1000/running"}, TaskPriority.BULK)
+        broker.states[running.id] = "PROGRESS"
+        assert submitter.submit({"doi": "10.1000/running"}, TaskPriority.INTERACTIVE).id == running.id
+
+        broker.states[running.id] = "FAILURE"
+        retry = submitter.submit({"doi": "10.1000/running"}, TaskPriority.NORMAL)
+        assert retry.id != running.id
+        assert broker.sent[-1]["queue"] == NORMAL_QUEUE
+
+    def test_redis_errors_do_not_block_submission(self, monkeypatch, broken_redis):
+        """Test that submissions still go out when Redis is unavailable."""
+        submitter, broker = make_submitter(monkeypatch, broken_redis)
+        assert submitter.submit({"doi": "10.1000/xyz"}).id == "task-1"
+        assert broker.sent[0]["queue"] == queues.NORMAL_QUEUE
+
+    def test_stale_pending_task_is_not_reused(self, monkeypatch, fake_redis):
+        """Test that a task still PENDING after the grace period is treated as lost and resubmitted."""
+        submitter, broker = make_submitter(monkeypatch, fake_redis)
+        key = "literature_submission:doi:10.1000/lost"
+
+        lost = submitter.submit({"doi": "10.1000/lost"}, TaskPriority.NORMAL)
+        entry = json.loads(fake_redis.data[key])
+        entry["submitted_at"] -= submitter.pending_grace + 1
+        fake_redis.data[key] = json.dumps(entry)
+
+        retry = submitter.submit({"doi": "10.1000/lost"}, TaskPriority.NORMAL)
+        assert retry.id != lost.id
+        assert json.loads(fake_redis.data[key])["task_id"] == retry.id
+
+        # Running tasks are reused however long ago they were submitted
+        broker.states[retry.id] = "STARTED"
+        entry = json.loads(fake_redis.data[key])
+        entry["submitted_at"] -= submitter.pending_grace + 1
+        fake_redis.data[key] = json.dumps(entry)
+        assert submitter.submit({"doi": "10.1000/lost"}, TaskPriority.NORMAL).id == retry.id
+        assert len(broker.sent) == 2
+
+    def test_admission_only_for_new_tasks(self, monkeypatch, fake_redis):
+        """Test that a full lane rejects new tasks but not submissions reusing one in flight."""
+        submitter, broker = make_submitter(monkeypatch, fake_redis, admission_max_normal_depth=5)
+
+        queued = submitter.submit({"doi": "10.1000/queued"}, TaskPriority.NORMAL)
+        assert not queued.reused and queued.estimated_wait == 0.0
+        fake_redis.fill(NORMAL_QUEUE, 5)
+
+        again = submitter.submit({"doi": "10.1000/queued"}, TaskPriority.NORMAL)
+        assert again.reused and again.id == queued.id
+        with pytest.raises(AdmissionRejected) as excinfo:
+            submitter.submit({"doi": "10.1000/other"}, TaskPriority.NORMAL)
+
+        assert excinfo.value.status_code == 429
+        assert len(broker.sent) == 1
+        assert submitter.admission.stats == {"admitted": 1, "rejected": 1}
+
+    def test_submit_async_runs_off_the_event_loop(self, monkeypatch, fake_redis):
+        """Test that API handlers submit (Redis, admission, broker) from a worker thread."""
+        submitter, broker = make_submitter(monkeypatch, fake_redis)
+
+        async def run():
+            return await submitter.submit_async({"doi": "10.1000/async"}, TaskPriority.INTERACTIVE), threading.get_ident()
+
+        submission, loop_thread = asyncio.run(run())
+        assert submission.id == "task-1"
+        assert broker.sent[0]["thread"] != loop_thread
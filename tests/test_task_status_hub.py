@@ -0,0 +1,172 @@
+"""
+测试任务状态中心
+
+This module tests that the status hub queries each task once for all of its
+subscribers, is woken by status events, falls back to polling without Redis
+pub/sub, and ends streams whose status cannot be followed.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from literature_parser_backend.services.task_status_hub import (
+    TaskStatusHub,
+    TaskStatusUnavailable,
+    publish_task_status,
+)
+from literature_parser_backend.settings import Settings
+
+
+class FakeStatusSource:
+    """Returns scripted statuses; a status is final once it reaches 100."""
+
+    def __init__(self):
+        self.progress = 0
+        self.calls = 0
+        self.error = None
+
+    async def fetch(self, task_id):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return {"task_id": task_id, "progress": self.progress}
+
+    @staticmethod
+    def is_final(status):
+        return status["progress"] >= 100
+
+
+def make_hub(source, redis_client, **overrides):
+    settings = Settings(**{"task_status_poll_interval": 0.01, "task_status_fallback_interval": 30.0, **overrides})
+    return TaskStatusHub(source.fetch, source.is_final, redis_client=redis_client, settings=settings)
+
+
+async def collect(hub, task_id, results):
+    async for status in hub.subscribe(task_id):
+        results.append(status["progress"])
+
+
+async def wait_until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+
+class TestTaskStatusHub:
+    """Test suite for TaskStatusHub."""
+
+    def test_subscribers_share_one_tracker_woken_by_events(self, fake_redis):
+        """Test that events drive refreshes and every subscriber sees each change once."""
+        redis = fake_redis
+        source = FakeStatusSource()
+        hub = make_hub(source, redis)
+
+        async def scenario():
+            first, second = [], []
+            tasks = [asyncio.create_task(collect(hub, "t1", first)), asyncio.create_task(collect(hub, "t1", second))]
+            await wait_until(lambda: first and second and hub._listening)
+            assert hub.latest("t1") == {"task_id": "t1", "progress": 0}
+
+            for progress in (50, 100):
+                source.progress = progress
+                publish_task_status("t1", redis_client=redis, progress=progress)
+                await wait_until(lambda: first[-1] == progress and second[-1] == progress)
+
+            await asyncio.wait_for(asyncio.gather(*tasks), 2.0)
+            return first, second
+
+        try:
+            first, second = asyncio.run(scenario())
+        finally:
+            hub.close()
+
+        assert first == second == [0, 50, 100]
+        assert source.calls == 3
+        assert hub.latest("t1") is None
+
+    def test_falls_back_to_polling_without_pubsub(self, broken_redis):
+        """Test that trackers poll when Redis pub/sub is unavailable."""
+        source = FakeStatusSource()
+        hub = make_hub(source, broken_redis)
+
+        async def scenario():
+            results = []
+            task = asyncio.create_task(collect(hub, "t2", results))
+            await wait_until(lambda: results == [0])
+            source.progress = 100
+            await asyncio.wait_for(task, 2.0)
+            return results
+
+        try:
+            assert asyncio.run(scenario()) == [0, 100]
+        finally:
+            hub.close()
+        assert not hub._listening
+
+    def test_late_subscriber_gets_current_status(self):
+        """Test that a new subscriber immediately receives the tracked status."""
+        source = FakeStatusSource()
+        hub = make_hub(source, None, task_status_hub_enabled=False)
+
+        async def scenario():
+            first, late = [], []
+            task = asyncio.create_task(collect(hub, "t3", first))
+            await wait_until(lambda: first == [0])
+            calls = source.calls
+            late_task = asyncio.create_task(collect(hub, "t3", late))
+            await wait_until(lambda: late == [0])
+            assert source.calls - calls <= 1
+            source.progress = 100
+            await asyncio.wait_for(asyncio.gather(task, late_task), 2.0)
+            return late
+
+        assert asyncio.run(scenario()) == [0, 100]
+
+    def test_repeated_failures_end_the_stream(self):
+        """Test that subscribers get an error after consecutive failed queries and a new subscriber starts over."""
+        source = FakeStatusSource()
+        source.error = RuntimeError("neo4j down")
+        hub = make_hub(source, None, task_status_hub_enabled=False, task_status_max_failures=3)
+
+        async def scenario():
+            first, second = [], []
+            with pytest.raises(TaskStatusUnavailable, match="after 3 failed queries"):
+                await asyncio.wait_for(asyncio.gather(collect(hub, "t5", first), collect(hub, "t5", second)), 2.0)
+            assert source.calls == 3 and hub.stats["failed"] == 1
+
+            source.error = None
+            source.progress = 100
+            await asyncio.wait_for(collect(hub, "t5", second), 2.0)
+            return first, second
+
+        assert asyncio.run(scenario()) == ([], [100])
+
+    def test_stream_timeout(self):
+        """Test that a subscriber stops waiting when no final status arrives in time."""
+        source = FakeStatusSource()
+        hub = make_hub(source, None, task_status_hub_enabled=False, task_status_stream_timeout=0.1)
+
+        async def scenario():
+            results = []
+            with pytest.raises(TaskStatusUnavailable, match="No final status"):
+                await asyncio.wait_for(collect(hub, "t6", results), 2.0)
+            return results
+
+        assert asyncio.run(scenario()) == [0]
+        assert hub.latest("t6") is None
+
+    def test_publish_is_best_effort(self, fake_redis, broken_redis):
+        """Test that events are published per task and Redis errors are swallowed."""
+        redis = fake_redis
+        publish_task_status("t4", redis_client=redis, stage="解析元数据", progress=40)
+
+        channel, payload = redis.published[0]
+        assert channel == "task_status:t4"
+        assert json.loads(payload) == {"task_id": "t4", "stage": "解析元数据", "progress": 40}
+
+        publish_task_status("t4", redis_client=broken_redis)
+        publish_task_status(None, redis_client=redis)
+        assert len(redis.published) == 1
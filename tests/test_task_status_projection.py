@@ -0,0 +1,232 @@
+"""
+测试Redis中的任务状态记录
+
+This module tests coalesced status writes from the worker and building the
+task status DTO from a single record read.
+"""
+
+import asyncio
+import json
+import time
+
+from literature_parser_backend.models.task import TaskExecutionStatus, TaskResultType
+from literature_parser_backend.services.task_status_projection import TaskStatusProjection
+from literature_parser_backend.settings import Settings
+from literature_parser_backend.web.api.tasks import SimpleStatusManager
+from literature_parser_backend.worker.celery_app import celery_app
+
+
+class FakeDAO:
+    def __init__(self):
+        self.calls = 0
+
+    async def find_by_lid(self, lid):
+        self.calls += 1
+        return None
+
+
+class FakeAsyncResult:
+    """A Celery result in a fixed state."""
+
+    def __init__(self, state, value=None):
+        self.state = self.status = state
+        self.result = self.info = value
+
+    def ready(self):
+        return self.state in ("SUCCESS", "FAILURE", "REVOKED")
+
+    def successful(self):
+        return self.state == "SUCCESS"
+
+    def get(self):
+        return self.result
+
+
+def make_projection(redis, interval=0.05, **overrides):
+    settings = Settings(task_status_coalesce_interval=interval, **overrides)
+    return TaskStatusProjection(redis_client=redis, settings=settings)
+
+
+def fail_writes(redis, count):
+    """Make the next ``count`` pipeline executions fail."""
+    pipeline = redis.pipeline
+    failures = [count]
+
+    def flaky_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        if failures[0] > 0:
+            failures[0] -= 1
+
+            def fail():
+                raise ConnectionError("redis down")
+
+            pipe.execute = fail
+        return pipe
+
+    redis.pipeline = flaky_pipeline
+
+
+def make_manager(projection):
+    manager = object.__new__(SimpleStatusManager)
+    manager.dao = FakeDAO()
+    manager.projection = projection
+    return manager
+
+
+COMPONENTS = {
+    "metadata": {"status": "success", "stage": "元数据获取成功", "progress": 100},
+    "content": {"status": "pending", "stage": "等待开始", "progress": 0},
+    "references": {"status": "processing", "stage": "正在获取参考文献", "progress": 20},
+}
+
+
+class TestTaskStatusProjection:
+    """Test suite for TaskStatusProjection and the record-based status."""
+
+    def test_rapid_updates_are_coalesced(self, fake_redis):
+        """Test that bursts of updates become one write plus a trailing write."""
+        redis = fake_redis
+        projection = make_projection(redis)
+
+        for progress, stage in ((85, "记录别名映射"), (90, "升级未解析节点"), (95, "核心任务完成")):
+            projection.update("t1", state="PROGRESS", stage=stage, progress=progress)
+        assert redis.executes == 1
+        assert projection.read("t1")["stage"] == "记录别名映射"
+
+        time.sleep(0.2)
+        record = projection.read("t1")
+        assert redis.executes == 2
+        assert record["stage"] == "核心任务完成" and record["progress"] == 95
+        assert "created_at" in record and redis.ttls["task_status_record:t1"] == Settings().task_status_record_ttl
+        assert [json.loads(event)["task_id"] for _, event in redis.published] == ["t1", "t1"]
+
+    def test_final_record_written_immediately(self, fake_redis):
+        """Test that the final record bypasses coalescing and ends tracking."""
+        redis = fake_redis
+        projection = make_projection(redis, interval=60)
+
+        projection.update("t2", state="PROGRESS", stage="任务开始", progress=0)
+        projection.update("t2", state="PROGRESS", stage="解析元数据", progress=30)
+        projection.record_final("t2", "SUCCESS", {"result_type": TaskResultType.CREATED, "literature_id": "2017-vaswani-aayn-1234"})
+
+        record = projection.read("t2")
+        assert record["state"] == "SUCCESS"
+        assert record["result_type"] == "created"
+        assert record["stage"] == "解析元数据"
+        assert "t2" not in projection._pending
+        assert redis.executes == 2
+
+    def test_failed_final_write_is_retried(self, fake_redis):
+        """Test that a final record that fails to write is kept and retried."""
+        redis = fake_redis
+        projection = make_projection(redis, interval=0.01)
+        fail_writes(redis, 2)
+
+        projection.record_final("t7", "SUCCESS", {"result_type": "created", "literature_id": "lid-1"})
+        assert projection.read("t7") is None
+        assert "t7" in projection._pending
+
+        time.sleep(0.3)
+        assert projection.read("t7")["state"] == "SUCCESS"
+        assert "t7" not in projection._pending
+        assert projection.stats["errors"] == 2
+
+    def test_final_write_given_up_after_retries(self, fake_redis):
+        """Test that an unreachable Redis does not keep a final record pending forever."""
+        redis = fake_redis
+        projection = make_projection(redis, interval=0.01, task_status_final_retries=1)
+        fail_writes(redis, 10)
+
+        projection.record_final("t8", "FAILURE", RuntimeError("boom"))
+        time.sleep(0.2)
+
+        assert "t8" not in projection._pending
+        assert projection.stats["dropped"] == 1
+
+    def test_writes_happen_outside_the_lock_in_order(self, fake_redis):
+        """Test that Redis is called without the lock, and an update during a write goes out after it."""
+        redis = fake_redis
+        projection = make_projection(redis, interval=0)
+        pipeline = redis.pipeline
+        locked = []
+
+        def pipeline_checking_lock(*args, **kwargs):
+            pipe = pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            def execute_unlocked():
+                locked.append(projection._lock.locked())
+                if len(locked) == 1:
+                    # Another update for the task arrives while the first write is in flight
+                    projection.update("t9", stage="解析元数据", progress=30)
+                    assert redis.executes == 0
+                return execute()
+
+            pipe.execute = execute_unlocked
+            return pipe
+
+        redis.pipeline = pipeline_checking_lock
+        projection.update("t9", state="PROGRESS", stage="任务开始", progress=0)
+
+        assert locked == [False, False]
+        assert redis.executes == 2
+        assert projection.read("t9")["stage"] == "解析元数据"
+        assert projection._pending["t9"].seq == 2
+
+    def test_stale_record_defers_to_final_celery_state(self, fake_redis, monkeypatch):
+        """Test that a record whose final write was lost does not hide the finished task."""
+        redis = fake_redis
+        projection = make_projection(redis, interval=0)
+        manager = make_manager(projection)
+        projection.update("t10", state="PROGRESS", stage="解析元数据", progress=30)
+        monkeypatch.setattr(
+            celery_app, "AsyncResult",
+            lambda task_id: FakeAsyncResult("SUCCESS", {"result_type": "created", "literature_id": "lid-1"}),
+        )
+
+        status = asyncio.run(manager.get_unified_status("t10"))
+
+        assert status.execution_status == TaskExecutionStatus.COMPLETED
+        assert status.literature_id == "lid-1"
+
+    def test_in_progress_status_from_record(self, fake_redis, monkeypatch):
+        """Test that an in-progress status needs only the record."""
+        redis = fake_redis
+        monkeypatch.setattr(celery_app, "AsyncResult", lambda task_id: FakeAsyncResult("STARTED"))
+        projection = make_projection(redis, interval=0)
+        manager = make_manager(projection)
+        projection.update("t3", state="PROGRESS", stage="解析元数据", progress=30)
+        projection.update("t3", components=COMPONENTS, components_literature_id="lid-1", overall_status="processing")
+
+        status = asyncio.run(manager.get_unified_status("t3"))
+
+        assert status.execution_status == TaskExecutionStatus.PROCESSING
+        assert status.current_stage == "正在获取参考文献"
+        assert status.overall_progress == 40
+        assert status.literature_status.literature_id == "lid-1"
+        assert status.literature_id is None
+        assert manager.dao.calls == 0
+
+    def test_final_statuses_from_record(self, fake_redis):
+        """Test result-type mapping and the single node read on completion."""
+        redis = fake_redis
+        projection = make_projection(redis, interval=0)
+        manager = make_manager(projection)
+
+        projection.update("t4", components=COMPONENTS, components_literature_id="lid-1")
+        projection.record_final("t4", "SUCCESS", {"result_type": "duplicate", "literature_id": "lid-existing"})
+        status = asyncio.run(manager.get_unified_status("t4"))
+        assert status.execution_status == TaskExecutionStatus.COMPLETED
+        assert status.current_stage == "文献已存在（重复）"
+        assert status.literature_id == "lid-existing"
+        assert manager.dao.calls == 1
+
+        projection.record_final("t5", "SUCCESS", {"result_type": "url_not_found", "literature_id": None})
+        status = asyncio.run(manager.get_unified_status("t5"))
+        assert status.execution_status == TaskExecutionStatus.FAILED
+        assert status.error_info.error_message == "URL不存在或返回404错误，请检查链接是否正确"
+
+        projection.record_final("t6", "FAILURE", RuntimeError("boom"))
+        status = asyncio.run(manager.get_unified_status("t6"))
+        assert status.execution_status == TaskExecutionStatus.FAILED
+        assert status.error_info.error_message == "boom"
@@ -0,0 +1,96 @@
+"""
+测试URL主机名分派表
+
+This module tests host-suffix dispatch for URL adapters and routes against
+the linear can_handle / substring scan it replaces, over the URL corpus in
+tests/fixtures/url_corpus.txt.
+"""
+
+import os
+
+from literature_parser_backend.services.url_mapping import URLMappingService
+from literature_parser_backend.services.url_mapping.core.dispatch import HostSuffixIndex
+from literature_parser_backend.services.url_mapping.strategies.regex_strategy import RegexStrategy
+from literature_parser_backend.worker.execution.routing import RouteManager
+
+CORPUS = os.path.join(os.path.dirname(__file__), "fixtures", "url_corpus.txt")
+
+
+def _corpus():
+    with open(CORPUS, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _linear_route(route_manager, url, mapping_result=None):
+    for route in sorted(route_manager.routes, key=lambda r: r.priority):
+        if route_manager._matches_route(url.lower(), route, mapping_result):
+            return route
+
+
+class TestHostSuffixIndex:
+    """Test suite for the host-suffix index."""
+
+    def test_suffix_and_path_prefix(self):
+        """Test that subdomains match and path prefixes are enforced."""
+        index = HostSuffixIndex()
+        index.add("nature.com/articles", "nature")
+        index.add("ieee.org", "ieee")
+        index.add("arxiv.org", "arxiv")
+
+        assert index.lookup("https://www.nature.com/articles/nature14539") == ["nature"]
+        assert index.lookup("https://www.nature.com/subjects/physics") == []
+        assert index.lookup("ieeexplore.ieee.org/document/7780459") == ["ieee"]
+        assert index.lookup("https://example.com/?ref=arxiv.org") == []
+        assert index.lookup("not a url") == []
+
+
+class TestDispatch:
+    """Test suite for adapter and route dispatch."""
+
+    def test_adapters_match_linear_scan(self):
+        """Test that table lookup finds the same adapters, in order, as can_handle."""
+        service = URLMappingService()
+
+        for url in _corpus():
+            if "?ref=" in url:
+                continue
+            linear = [a.name for a in service.adapters if a.name != "generic" and a.can_handle(url)]
+            specialized, generic = service.candidate_adapters(url)
+            assert [a.name for a in specialized] == linear, url
+            assert [a.name for a in generic] == ["generic"]
+
+    def test_routes_match_linear_scan(self):
+        """Test that routes agree with the substring scan, with and without mapping results."""
+        route_manager = RouteManager()
+
+        for url in _corpus():
+            if "?ref=" in url:
+                continue
+            for mapping_result in (None, {"doi": "10.1/x"}, {"arxiv_id": "1706.03762"}):
+                expected = _linear_route(route_manager, url, mapping_result)
+                assert route_manager.determine_route(url, mapping_result) is expected, (url, mapping_result)
+
+    def test_host_only_matching(self):
+        """Test that a domain in the query string no longer selects an adapter or route."""
+        url = "https://example.com/paper?ref=arxiv.org/abs/1706.03762"
+
+        assert URLMappingService().candidate_adapters(url)[0] == []
+        assert RouteManager().determine_route(url).name == "standard_waterfall"
+
+    def test_add_adapter_rebuilds_table(self):
+        """Test that adapters added at runtime are dispatched."""
+        service = URLMappingService()
+        plos = service.get_adapter_by_name("plos")
+        service.remove_adapter("plos")
+        assert service.candidate_adapters("https://journals.plos.org/plosone/article?id=1")[0] == []
+
+        service.add_adapter(plos)
+        assert service.candidate_adapters("https://journals.plos.org/plosone/article?id=1")[0] == [plos]
+
+    def test_regex_patterns_are_shared(self):
+        """Test that strategies with the same pattern share one compiled regex."""
+        first = RegexStrategy("a", {"doi": r"doi\.org/(10\..+)"})
+        second = RegexStrategy("b", {"doi": r"doi\.org/(10\..+)"})
+
+        assert first._compiled["doi"] is second._compiled["doi"]
+        assert first._compiled["doi"].search("https://DOI.org/10.1/x").group(1) == "10.1/x"
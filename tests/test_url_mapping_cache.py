@@ -0,0 +1,127 @@
+"""
+测试URL映射缓存
+
+This module tests URL canonicalization and that URLMappingService.map_url
+answers known URL variants from the cache without running any adapter.
+"""
+
+import asyncio
+import json
+
+from literature_parser_backend.services.url_mapping import URLAdapter, URLMappingResult, URLMappingService
+from literature_parser_backend.services.url_mapping.core.cache import URLMappingCache
+from literature_parser_backend.utils.url_canonical import canonicalize_url
+
+
+class CountingAdapter(URLAdapter):
+    """Maps arXiv URLs without network access and counts calls."""
+
+    def __init__(self, successful=True):
+        super().__init__()
+        self.calls = []
+        self.successful = successful
+
+    @property
+    def name(self):
+        return "arxiv"
+
+    @property
+    def supported_domains(self):
+        return ["arxiv.org"]
+
+    def can_handle(self, url):
+        return "arxiv.org" in url.lower()
+
+    def _register_strategies(self):
+        pass
+
+    async def extract_identifiers(self, url, enable_validation=False, strict_validation=False, page_cache=None):
+        self.calls.append(url)
+        if not self.successful:
+            return URLMappingResult(source_adapter=self.name)
+        return URLMappingResult(arxiv_id="1706.03762", title="Attention Is All You Need",
+                                source_adapter=self.name, identifiers={"arxiv_id": "1706.03762"})
+
+
+def _service(adapter, cache=None):
+    return URLMappingService(adapters=[adapter], cache=cache or URLMappingCache(use_redis=False))
+
+
+class TestCanonicalizeURL:
+    """Test suite for URL canonicalization."""
+
+    def test_arxiv_variants(self):
+        """Test that /pdf/, versions and tracking params collapse to one /abs/ URL."""
+        variants = [
+            "https://arxiv.org/abs/1706.03762",
+            "http://www.arxiv.org/abs/1706.03762v5?utm_source=twitter",
+            "https://arxiv.org/pdf/1706.03762v2.pdf",
+            "export.arxiv.org/abs/1706.03762/",
+        ]
+        assert {canonicalize_url(url) for url in variants} == {"https://arxiv.org/abs/1706.03762"}
+
+    def test_publisher_variants(self):
+        """Test ACM, OpenReview and DOI rules and that meaningful params are kept."""
+        assert canonicalize_url("https://dl.acm.org/doi/pdf/10.1145/3065386") == "https://dl.acm.org/doi/10.1145/3065386"
+        assert canonicalize_url("https://openreview.net/pdf?id=abc&fbclid=x") == "https://openreview.net/forum?id=abc"
+        assert canonicalize_url("https://dx.doi.org/10.1038/NATURE12345") == "https://doi.org/10.1038/nature12345"
+        assert canonicalize_url("https://ieeexplore.ieee.org/stamp/stamp.jsp?tp=&arnumber=1#x") == \
+            "https://ieeexplore.ieee.org/stamp/stamp.jsp?arnumber=1&tp="
+        assert canonicalize_url("") == ""
+
+
+class TestURLMappingCache:
+    """Test suite for cached URL mapping."""
+
+    def test_variant_hits_cache(self):
+        """Test that a URL variant is answered from the cache with its own redirect info."""
+        adapter = CountingAdapter()
+        service = _service(adapter)
+
+        first = asyncio.run(service.map_url("https://arxiv.org/abs/1706.03762"))
+        second = asyncio.run(service.map_url("https://arxiv.org/pdf/1706.03762v3.pdf?utm_source=x"))
+
+        assert len(adapter.calls) == 1
+        assert first.original_url is None
+        assert second.arxiv_id == "1706.03762" and second.title == "Attention Is All You Need"
+        assert second.original_url == "https://arxiv.org/pdf/1706.03762v3.pdf?utm_source=x"
+        assert second.canonical_url == "https://arxiv.org/abs/1706.03762v3"
+        assert second.page_cache is not None
+
+        second.identifiers["arxiv_id"] = "mutated"
+        assert asyncio.run(service.map_url("arxiv.org/abs/1706.03762")).identifiers["arxiv_id"] == "1706.03762"
+
+    def test_failures_and_validation_modes_are_separate(self):
+        """Test that failed mappings are not cached and validation mode is part of the key."""
+        failing = CountingAdapter(successful=False)
+        service = _service(failing)
+        asyncio.run(service.map_url("https://arxiv.org/abs/1706.03762"))
+        asyncio.run(service.map_url("https://arxiv.org/abs/1706.03762"))
+        assert len(failing.calls) == 2
+
+        adapter = CountingAdapter()
+        service = _service(adapter)
+        asyncio.run(service.map_url("https://arxiv.org/abs/1706.03762"))
+        asyncio.run(service.map_url("https://arxiv.org/abs/1706.03762", enable_validation=True))
+        asyncio.run(service.map_url("https://arxiv.org/abs/1706.03762", use_cache=False))
+        assert len(adapter.calls) == 3
+
+    def test_redis_tier_is_shared(self, fake_redis):
+        """Test that another worker's cache finds the entry in Redis."""
+        redis = fake_redis
+        asyncio.run(_service(CountingAdapter(), URLMappingCache(redis_client=redis)).map_url(
+            "https://arxiv.org/abs/1706.03762"))
+
+        stored = json.loads(redis.data["urlmap:https://arxiv.org/abs/1706.03762"])
+        assert stored["arxiv_id"] == "1706.03762" and "original_url" not in stored
+        assert redis.ttls["urlmap:https://arxiv.org/abs/1706.03762"] == 7 * 24 * 3600
+
+        other_worker = CountingAdapter()
+        cache = URLMappingCache(redis_client=redis)
+        result = asyncio.run(_service(other_worker, cache).map_url("https://arxiv.org/abs/1706.03762v1"))
+
+        assert result.arxiv_id == "1706.03762" and other_worker.calls == []
+        assert cache.stats["redis_hits"] == 1
+
+        cache.invalidate("https://arxiv.org/pdf/1706.03762")
+        assert redis.data == {}
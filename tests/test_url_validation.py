@@ -0,0 +1,126 @@
+"""
+测试共享的URL与标识符验证服务
+
+This module tests verdict caching, the HEAD-to-GET fallback and concurrent
+validation of several URLs and identifiers.
+"""
+
+import threading
+import time
+
+import requests
+
+from literature_parser_backend.services.url_mapping.core.validation import URLValidationService
+from literature_parser_backend.settings import Settings
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text=""):
+        self.status_code = status_code
+        self.text = text
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Stands in for requests.Session and records every request."""
+
+    def __init__(self, head_status=None, get_status=None, delay=0.0, error=None):
+        self.head_status = head_status or {}
+        self.get_status = get_status or {}
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _request(self, method, url, statuses):
+        with self._lock:
+            self.calls.append((method, url))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return FakeResponse(statuses.get(url, 200))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def head(self, url, **kwargs):
+        return self._request("HEAD", url, self.head_status)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, self.get_status)
+
+
+def make_service(session):
+    return URLValidationService(settings=Settings(), session=session)
+
+
+class TestURLValidationService:
+    """Test suite for URLValidationService."""
+
+    def test_url_verdict_cached_by_canonical_url(self):
+        """Test that URL variants of one page share a single check."""
+        session = FakeSession()
+        service = make_service(session)
+
+        assert service.validate_url("https://arxiv.org/pdf/1706.03762v5.pdf")
+        assert service.validate_url("http://www.arxiv.org/abs/1706.03762?utm_source=x")
+
+        assert len(session.calls) == 1
+        assert service.stats == {"hits": 1, "checks": 1}
+
+    def test_head_rejected_falls_back_to_get(self):
+        """Test that a 405 on HEAD is retried with GET."""
+        url = "https://example.org/paper"
+        session = FakeSession(head_status={url: 405})
+        service = make_service(session)
+
+        assert service.validate_url(url)
+        assert session.calls == [("HEAD", url), ("GET", url)]
+
+    def test_network_errors_are_not_cached(self):
+        """Test that uncertain verdicts are checked again on the next request."""
+        session = FakeSession(error=requests.exceptions.ConnectionError("down"))
+        service = make_service(session)
+
+        assert not service.validate_url("https://example.org/paper")
+        assert service.validate_doi("10.1000/xyz")  # 网络错误时视为存在
+        assert not service.validate_url("https://example.org/paper")
+        assert len(session.calls) == 3
+
+    def test_identifier_verdicts_normalized(self):
+        """Test that DOI case and arXiv versions map to one cached verdict."""
+        session = FakeSession(get_status={"https://api.crossref.org/works/10.1000/MISSING": 404})
+        service = make_service(session)
+
+        assert not service.validate_doi("10.1000/MISSING")
+        assert not service.validate_doi("10.1000/missing")
+        assert service.validate_arxiv_id("1706.03762v5")
+        assert service.validate_arxiv_id("1706.03762")
+        assert len(session.calls) == 2
+
+    def test_validate_many_runs_concurrently(self):
+        """Test that several URLs and identifiers are validated in parallel."""
+        session = FakeSession(delay=0.05, head_status={"https://example.org/b": 404})
+        service = make_service(session)
+
+        results = service.validate_many(
+            urls=["https://example.org/a", "https://example.org/b", "https://example.org/a"],
+            dois=["10.1000/xyz"],
+            arxiv_ids=["2301.00001"],
+        )
+
+        assert results == {
+            "urls": {"https://example.org/a": True, "https://example.org/b": False},
+            "dois": {"10.1000/xyz": True},
+            "arxiv_ids": {"2301.00001": True},
+        }
+        assert len(session.calls) == 4
+        assert session.max_active > 1